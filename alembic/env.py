@@ -1,6 +1,7 @@
 """Alembic environment configuration for async SQLAlchemy migrations."""
 
 import asyncio
+import re
 from logging.config import fileConfig
 
 # Register GeoAlchemy2 types for spatial column support in autogenerate
@@ -15,14 +16,17 @@ from voter_api.models.agenda_item import AgendaItem  # noqa: F401
 from voter_api.models.analysis_result import AnalysisResult  # noqa: F401
 from voter_api.models.analysis_run import AnalysisRun  # noqa: F401
 from voter_api.models.audit_log import AuditLog  # noqa: F401
+from voter_api.models.background_job import BackgroundJob  # noqa: F401
 from voter_api.models.base import Base
 
 # Import all models so they are registered with Base.metadata
+from voter_api.models.absentee_ballot_stat import AbsenteeBallotStat  # noqa: F401
 from voter_api.models.boundary import Boundary  # noqa: F401
 from voter_api.models.county_district import CountyDistrict  # noqa: F401
 from voter_api.models.county_metadata import CountyMetadata  # noqa: F401
 from voter_api.models.elected_official import ElectedOfficial, ElectedOfficialSource  # noqa: F401
 from voter_api.models.election import Election, ElectionCountyResult, ElectionResult  # noqa: F401
+from voter_api.models.election_participation_stats import ElectionParticipationStats  # noqa: F401
 from voter_api.models.export_job import ExportJob  # noqa: F401
 from voter_api.models.geocoded_location import GeocodedLocation  # noqa: F401
 from voter_api.models.geocoder_cache import GeocoderCache  # noqa: F401
@@ -36,6 +40,7 @@ from voter_api.models.meeting_video_embed import MeetingVideoEmbed  # noqa: F401
 from voter_api.models.precinct_metadata import PrecinctMetadata  # noqa: F401
 from voter_api.models.user import User  # noqa: F401
 from voter_api.models.voter import Voter  # noqa: F401
+from voter_api.models.voter_filter_facet import VoterFilterFacet  # noqa: F401
 from voter_api.models.voter_history import VoterHistory  # noqa: F401
 
 config = context.config
@@ -58,6 +63,14 @@ def _get_schema() -> str | None:
     return settings.database_schema
 
 
+_VOTER_HISTORY_PARTITION = re.compile(r"^voter_history_(y\d{4}|default)$")
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:  # type: ignore[no-untyped-def]
+    """Hide voter_history partitions (created at runtime) from autogenerate."""
+    return not (type_ == "table" and reflected and name is not None and _VOTER_HISTORY_PARTITION.match(name))
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = get_url()
@@ -68,6 +81,7 @@ def run_migrations_offline() -> None:
         "literal_binds": True,
         "dialect_opts": {"paramstyle": "named"},
         "compare_type": True,
+        "include_object": include_object,
     }
     if schema is not None:
         configure_kwargs["version_table_schema"] = schema
@@ -84,6 +98,7 @@ def do_run_migrations(connection) -> None:  # type: ignore[no-untyped-def]
         "connection": connection,
         "target_metadata": target_metadata,
         "compare_type": True,
+        "include_object": include_object,
     }
     if schema is not None:
         connection.execute(text(f'SET search_path TO "{schema}", public'))
@@ -0,0 +1,29 @@
+"""add records_deduplicated to import_jobs
+
+Revision ID: a7e4c1d8f352
+Revises: f5d9b3c7e241
+Create Date: 2026-10-19
+
+Counts rows an import dropped because a later row in the same chunk had
+the same key (the absentee COPY loader keeps the last occurrence), so
+they are no longer reported as unchanged.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7e4c1d8f352"
+down_revision: str | None = "f5d9b3c7e241"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("import_jobs", sa.Column("records_deduplicated", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("import_jobs", "records_deduplicated")
@@ -0,0 +1,55 @@
+"""create voter_filter_facets rollup table
+
+Revision ID: a8d5e2c4f613
+Revises: f1c7a3e9b284
+Create Date: 2026-10-18
+
+Precomputed voter counts grouped by the search filter dropdown columns,
+so ``GET /voters/filters`` reads a few thousand rows instead of running
+eight ``SELECT DISTINCT`` scans over ``voters``. Populated here from the
+existing voters; voter imports replace the rows of the counties they touch.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d5e2c4f613"
+down_revision: str | None = "f1c7a3e9b284"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_FACET_COLUMNS = (
+    "county, status, congressional_district, state_senate_district, state_house_district, "
+    "county_precinct, county_commission_district, school_board_district"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "voter_filter_facets",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("county", sa.String(length=100), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("congressional_district", sa.String(length=10), nullable=True),
+        sa.Column("state_senate_district", sa.String(length=10), nullable=True),
+        sa.Column("state_house_district", sa.String(length=10), nullable=True),
+        sa.Column("county_precinct", sa.String(length=20), nullable=True),
+        sa.Column("county_commission_district", sa.String(length=10), nullable=True),
+        sa.Column("school_board_district", sa.String(length=10), nullable=True),
+        sa.Column("voter_count", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_voter_filter_facets_county", "voter_filter_facets", ["county"])
+    op.execute(
+        f"INSERT INTO voter_filter_facets ({_FACET_COLUMNS}, voter_count) "
+        f"SELECT {_FACET_COLUMNS}, count(*) FROM voters GROUP BY {_FACET_COLUMNS}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_voter_filter_facets_county", table_name="voter_filter_facets")
+    op.drop_table("voter_filter_facets")
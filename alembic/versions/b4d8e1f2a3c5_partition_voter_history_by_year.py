@@ -0,0 +1,203 @@
+"""partition voter_history by election year
+
+Revision ID: b4d8e1f2a3c5
+Revises: 030_gin_mismatch_details
+Create Date: 2026-10-18
+
+Rebuilds voter_history as a natively RANGE-partitioned table on
+election_date with one partition per calendar year
+(``voter_history_y2024`` …) plus a DEFAULT partition. Date-scoped
+participation queries and election resolution tiers then prune to a
+single partition, and re-imports can TRUNCATE fully superseded partitions
+instead of running large DELETEs.
+
+PostgreSQL requires the partition key in every unique constraint, so the
+primary key becomes (id, election_date). uq_voter_history_participation
+already contains election_date and is kept unchanged for ON CONFLICT.
+
+Also installs ``voter_history_ensure_partition(year)``, which the import
+pipeline calls before loading rows for a year. It creates the yearly
+partition and migrates any rows for that year out of the DEFAULT partition.
+
+The upgrade copies every existing row; on large databases schedule it in a
+maintenance window.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "b4d8e1f2a3c5"
+down_revision: str | None = "030_gin_mismatch_details"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = (
+    "id, voter_registration_number, county, election_date, election_type, "
+    "normalized_election_type, party, ballot_style, absentee, provisional, supplemental, "
+    "election_id, election_event_id, import_job_id, created_at"
+)
+
+_INDEXES: list[tuple[str, str]] = [
+    ("idx_voter_history_reg_num", "voter_registration_number"),
+    ("idx_voter_history_election_date", "election_date"),
+    ("idx_voter_history_election_type", "election_type"),
+    ("idx_voter_history_county", "county"),
+    ("idx_voter_history_import_job_id", "import_job_id"),
+    ("idx_voter_history_date_type", "election_date, normalized_election_type"),
+    ("idx_voter_history_election_id", "election_id"),
+    ("idx_voter_history_election_event_id", "election_event_id"),
+]
+
+_CREATE_TABLE = """
+    CREATE TABLE {name} (
+        id UUID NOT NULL DEFAULT gen_random_uuid(),
+        voter_registration_number VARCHAR(20) NOT NULL,
+        county VARCHAR(100) NOT NULL,
+        election_date DATE NOT NULL,
+        election_type VARCHAR(50) NOT NULL,
+        normalized_election_type VARCHAR(20) NOT NULL,
+        party VARCHAR(50),
+        ballot_style VARCHAR(100),
+        absentee BOOLEAN NOT NULL DEFAULT false,
+        provisional BOOLEAN NOT NULL DEFAULT false,
+        supplemental BOOLEAN NOT NULL DEFAULT false,
+        election_id UUID,
+        election_event_id UUID,
+        import_job_id UUID NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+        CONSTRAINT {pkey} PRIMARY KEY ({pkey_columns}),
+        CONSTRAINT {uq} UNIQUE (voter_registration_number, election_date, election_type),
+        CONSTRAINT {fk_prefix}_election_id FOREIGN KEY (election_id)
+            REFERENCES elections (id) ON DELETE SET NULL,
+        CONSTRAINT {fk_prefix}_election_event_id FOREIGN KEY (election_event_id)
+            REFERENCES election_events (id) ON DELETE SET NULL,
+        CONSTRAINT {fk_prefix}_import_job_id FOREIGN KEY (import_job_id)
+            REFERENCES import_jobs (id) ON DELETE CASCADE
+    ){partition_clause}
+"""
+
+_ENSURE_PARTITION_FN = """
+    CREATE OR REPLACE FUNCTION voter_history_ensure_partition(p_year integer)
+    RETURNS text
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        part_name text := format('voter_history_y%s', p_year);
+        lo date := make_date(p_year, 1, 1);
+        hi date := make_date(p_year + 1, 1, 1);
+    BEGIN
+        IF to_regclass(part_name) IS NOT NULL THEN
+            RETURN part_name;
+        END IF;
+
+        -- Serialize concurrent importers creating the same year.
+        PERFORM pg_advisory_xact_lock(hashtext('voter_history_partition'), p_year);
+        IF to_regclass(part_name) IS NOT NULL THEN
+            RETURN part_name;
+        END IF;
+
+        -- Build the partition standalone, move any rows for the year out of
+        -- the DEFAULT partition, then attach (ATTACH fails if DEFAULT still
+        -- holds rows in range).
+        EXECUTE format('CREATE TABLE %I (LIKE voter_history INCLUDING DEFAULTS)', part_name);
+        EXECUTE format(
+            'INSERT INTO %I SELECT * FROM voter_history_default '
+            'WHERE election_date >= %L AND election_date < %L',
+            part_name, lo, hi
+        );
+        EXECUTE format(
+            'DELETE FROM voter_history_default WHERE election_date >= %L AND election_date < %L',
+            lo, hi
+        );
+        EXECUTE format(
+            'ALTER TABLE %I ADD CONSTRAINT %I CHECK (election_date >= %L AND election_date < %L)',
+            part_name, part_name || '_range', lo, hi
+        );
+        EXECUTE format(
+            'ALTER TABLE voter_history ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            part_name, lo, hi
+        );
+        -- The CHECK only exists to let ATTACH skip its validation scan.
+        EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', part_name, part_name || '_range');
+        RETURN part_name;
+    END;
+    $$
+"""
+
+
+def upgrade() -> None:
+    # 1. Move the existing table aside and free up constraint/index names.
+    op.execute("ALTER TABLE voter_history RENAME TO voter_history_unpartitioned")
+    for name, _ in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute("ALTER TABLE voter_history_unpartitioned DROP CONSTRAINT uq_voter_history_participation")
+    op.execute("ALTER TABLE voter_history_unpartitioned RENAME CONSTRAINT voter_history_pkey TO voter_history_old_pkey")
+    op.execute("ALTER TABLE voter_history_unpartitioned DROP CONSTRAINT IF EXISTS fk_voter_history_election_id")
+    op.execute("ALTER TABLE voter_history_unpartitioned DROP CONSTRAINT IF EXISTS fk_voter_history_election_event_id")
+
+    # 2. Partitioned parent + DEFAULT partition + one partition per existing year.
+    op.execute(
+        _CREATE_TABLE.format(
+            name="voter_history",
+            pkey="voter_history_pkey",
+            pkey_columns="id, election_date",
+            uq="uq_voter_history_participation",
+            fk_prefix="fk_voter_history",
+            partition_clause=" PARTITION BY RANGE (election_date)",
+        )
+    )
+    op.execute("CREATE TABLE voter_history_default PARTITION OF voter_history DEFAULT")
+    op.execute(_ENSURE_PARTITION_FN)
+    op.execute(
+        """
+        SELECT voter_history_ensure_partition(y::integer)
+        FROM (
+            SELECT DISTINCT EXTRACT(YEAR FROM election_date) AS y
+            FROM voter_history_unpartitioned
+        ) years
+        ORDER BY y
+        """
+    )
+
+    # 3. Copy rows (routed to their yearly partitions) and drop the old table.
+    op.execute(
+        f"INSERT INTO voter_history ({_COLUMNS}) SELECT {_COLUMNS} FROM voter_history_unpartitioned"  # noqa: S608
+    )
+    op.execute("DROP TABLE voter_history_unpartitioned")
+
+    # 4. Partitioned indexes (cascade to every current and future partition).
+    for name, columns in _INDEXES:
+        op.execute(f"CREATE INDEX {name} ON voter_history ({columns})")
+
+    op.execute("ANALYZE voter_history")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE voter_history RENAME TO voter_history_partitioned")
+    for name, _ in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute("ALTER TABLE voter_history_partitioned DROP CONSTRAINT uq_voter_history_participation")
+    op.execute("ALTER TABLE voter_history_partitioned RENAME CONSTRAINT voter_history_pkey TO voter_history_part_pkey")
+    op.execute("ALTER TABLE voter_history_partitioned DROP CONSTRAINT fk_voter_history_election_id")
+    op.execute("ALTER TABLE voter_history_partitioned DROP CONSTRAINT fk_voter_history_election_event_id")
+    op.execute("ALTER TABLE voter_history_partitioned DROP CONSTRAINT fk_voter_history_import_job_id")
+
+    op.execute(
+        _CREATE_TABLE.format(
+            name="voter_history",
+            pkey="voter_history_pkey",
+            pkey_columns="id",
+            uq="uq_voter_history_participation",
+            fk_prefix="fk_voter_history",
+            partition_clause="",
+        )
+    )
+    op.execute(
+        f"INSERT INTO voter_history ({_COLUMNS}) SELECT {_COLUMNS} FROM voter_history_partitioned"  # noqa: S608
+    )
+    op.execute("DROP TABLE voter_history_partitioned CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS voter_history_ensure_partition(integer)")
+
+    for name, columns in _INDEXES:
+        op.execute(f"CREATE INDEX {name} ON voter_history ({columns})")
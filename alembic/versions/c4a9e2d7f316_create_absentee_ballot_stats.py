@@ -0,0 +1,48 @@
+"""create absentee_ballot_stats rollup table
+
+Revision ID: c4a9e2d7f316
+Revises: b3e7f1a9c052
+Create Date: 2026-10-18
+
+Precomputed absentee application counts by county, application status
+and party, so ``GET /absentee/stats`` reads a few thousand rows instead
+of running four aggregate scans over ``absentee_ballot_applications``.
+Populated here from the existing applications; absentee imports replace
+the rows of the counties they touch.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a9e2d7f316"
+down_revision: str | None = "b3e7f1a9c052"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_STAT_COLUMNS = "county, application_status, party"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "absentee_ballot_stats",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("county", sa.String(length=100), nullable=False),
+        sa.Column("application_status", sa.String(length=50), nullable=True),
+        sa.Column("party", sa.String(length=50), nullable=True),
+        sa.Column("application_count", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_absentee_ballot_stats_county", "absentee_ballot_stats", ["county"])
+    op.execute(
+        f"INSERT INTO absentee_ballot_stats ({_STAT_COLUMNS}, application_count) "
+        f"SELECT {_STAT_COLUMNS}, count(*) FROM absentee_ballot_applications GROUP BY {_STAT_COLUMNS}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_absentee_ballot_stats_county", table_name="absentee_ballot_stats")
+    op.drop_table("absentee_ballot_stats")
@@ -0,0 +1,35 @@
+"""create election_participation_stats rollup table
+
+Revision ID: c7e2a9d41f60
+Revises: b4d8e1f2a3c5
+Create Date: 2026-10-18 10:12:40.218311
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2a9d41f60"
+down_revision: str | None = "b4d8e1f2a3c5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "election_participation_stats",
+        sa.Column("election_id", sa.UUID(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("is_stale", sa.Boolean(), server_default="false", nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("stale_since", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["election_id"], ["elections.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("election_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("election_participation_stats")
@@ -0,0 +1,29 @@
+"""add row_hash to absentee_ballot_applications
+
+Revision ID: d6b1f8c3a427
+Revises: c4a9e2d7f316
+Create Date: 2026-10-19
+
+Hash of the imported columns, written by the COPY loader so that
+re-importing the daily full absentee file only rewrites rows that
+changed. Existing rows start NULL and are hashed on their next import.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d6b1f8c3a427"
+down_revision: str | None = "c4a9e2d7f316"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("absentee_ballot_applications", sa.Column("row_hash", sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("absentee_ballot_applications", "row_hash")
@@ -0,0 +1,91 @@
+"""add canonical district key columns to voters and boundaries
+
+Revision ID: d9a3f6b1c2e4
+Revises: c7e2a9d41f60
+Create Date: 2026-10-18
+
+Adds STORED generated ``*_key`` columns holding each district identifier
+with whitespace and (for numeric values) leading zeros stripped, so "5",
+"05" and "005" share one key. Stats, election resolution, search, and
+boundary analysis match on these with a single indexed equality instead of
+expanding zero-padded IN-lists.
+
+All voter columns are added in one ALTER TABLE so the table is rewritten
+once; on large databases schedule it in a maintenance window.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9a3f6b1c2e4"
+down_revision: str | None = "c7e2a9d41f60"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (source column, varchar width)
+_VOTER_DISTRICT_COLUMNS: list[tuple[str, int]] = [
+    ("congressional_district", 10),
+    ("state_senate_district", 10),
+    ("state_house_district", 10),
+    ("judicial_district", 10),
+    ("county_commission_district", 10),
+    ("school_board_district", 10),
+    ("city_council_district", 50),
+    ("municipal_school_board_district", 10),
+    ("water_board_district", 10),
+    ("super_council_district", 10),
+    ("super_commissioner_district", 10),
+    ("super_school_board_district", 10),
+    ("fire_district", 10),
+]
+
+_VOTER_INDEXES: list[tuple[str, str]] = [
+    ("ix_voters_congressional_district_key", "congressional_district_key"),
+    ("ix_voters_state_senate_district_key", "state_senate_district_key"),
+    ("ix_voters_state_house_district_key", "state_house_district_key"),
+    ("ix_voters_judicial_district_key", "judicial_district_key"),
+    ("ix_voters_county_commission_district_key", "county, county_commission_district_key"),
+    ("ix_voters_school_board_district_key", "county, school_board_district_key"),
+    ("ix_voters_city_council_district_key", "city_council_district_key"),
+]
+
+
+def _key_expr(column: str) -> str:
+    # Mirrors voter_api.lib.normalize.district_key_sql (inlined so the
+    # migration does not change if the application code does).
+    return (
+        f"CASE WHEN btrim({column}) ~ '^[0-9]+$' "
+        f"THEN COALESCE(NULLIF(ltrim(btrim({column}), '0'), ''), '0') "
+        f"ELSE NULLIF(btrim({column}), '') END"
+    )
+
+
+def upgrade() -> None:
+    add_columns = ", ".join(
+        f"ADD COLUMN {column}_key VARCHAR({width}) GENERATED ALWAYS AS ({_key_expr(column)}) STORED"
+        for column, width in _VOTER_DISTRICT_COLUMNS
+    )
+    op.execute(f"ALTER TABLE voters {add_columns}")
+    for name, columns in _VOTER_INDEXES:
+        op.execute(f"CREATE INDEX {name} ON voters ({columns})")
+
+    op.execute(
+        "ALTER TABLE boundaries ADD COLUMN boundary_identifier_key VARCHAR(50) "
+        f"GENERATED ALWAYS AS ({_key_expr('boundary_identifier')}) STORED"
+    )
+    op.execute("CREATE INDEX ix_boundaries_type_identifier_key ON boundaries (boundary_type, boundary_identifier_key)")
+
+    op.execute("ANALYZE voters")
+    op.execute("ANALYZE boundaries")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_boundaries_type_identifier_key")
+    op.execute("ALTER TABLE boundaries DROP COLUMN IF EXISTS boundary_identifier_key")
+
+    for name, _ in _VOTER_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    drop_columns = ", ".join(f"DROP COLUMN IF EXISTS {column}_key" for column, _ in _VOTER_DISTRICT_COLUMNS)
+    op.execute(f"ALTER TABLE voters {drop_columns}")
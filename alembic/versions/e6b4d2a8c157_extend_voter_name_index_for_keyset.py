@@ -0,0 +1,34 @@
+"""extend voter name index with id for keyset pagination
+
+Revision ID: e6b4d2a8c157
+Revises: d9a3f6b1c2e4
+Create Date: 2026-10-18
+
+Rebuilds ``ix_voters_name_search`` on ``(last_name, first_name, id)`` so
+voter search can order by a unique key and page with a row-value
+comparison (``WHERE (last_name, first_name, id) > (...)``) served directly
+by the index, instead of scanning and discarding ``OFFSET`` rows.
+
+Note: on an already-populated production database, consider running the
+``CREATE INDEX`` manually with ``CONCURRENTLY`` to avoid table locks.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b4d2a8c157"
+down_revision: str | None = "d9a3f6b1c2e4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_voters_name_search")
+    op.execute("CREATE INDEX ix_voters_name_search ON voters (last_name, first_name, id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_voters_name_search")
+    op.execute("CREATE INDEX ix_voters_name_search ON voters (last_name, first_name)")
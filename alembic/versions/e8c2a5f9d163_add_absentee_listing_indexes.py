@@ -0,0 +1,49 @@
+"""add composite listing indexes to absentee_ballot_applications
+
+Revision ID: e8c2a5f9d163
+Revises: d6b1f8c3a427
+Create Date: 2026-10-19
+
+Adds ``(filter columns..., created_at, id)`` indexes for the absentee list
+endpoint's common filter combinations so both ``OFFSET`` pages and keyset
+cursors (``WHERE (created_at, id) < (...)``) read rows in order from the
+index. The composites lead with ``county`` / ``application_status``, so the
+single-column indexes on those columns are dropped as redundant.
+
+Note: on an already-populated production database, consider running the
+``CREATE INDEX`` statements manually with ``CONCURRENTLY`` to avoid table locks.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8c2a5f9d163"
+down_revision: str | None = "d6b1f8c3a427"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "absentee_ballot_applications"
+
+_LISTING_INDEXES = {
+    "ix_aba_created": ["created_at", "id"],
+    "ix_aba_county_created": ["county", "created_at", "id"],
+    "ix_aba_county_status_created": ["county", "application_status", "created_at", "id"],
+    "ix_aba_county_party_created": ["county", "party", "created_at", "id"],
+    "ix_aba_status_created": ["application_status", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in _LISTING_INDEXES.items():
+        op.create_index(name, _TABLE, columns)
+    op.drop_index("ix_aba_county", table_name=_TABLE)
+    op.drop_index("ix_aba_application_status", table_name=_TABLE)
+
+
+def downgrade() -> None:
+    op.create_index("ix_aba_application_status", _TABLE, ["application_status"])
+    op.create_index("ix_aba_county", _TABLE, ["county"])
+    for name in reversed(list(_LISTING_INDEXES)):
+        op.drop_index(name, table_name=_TABLE)
@@ -0,0 +1,47 @@
+"""add normalized search_name column and trigram index to voters
+
+Revision ID: f1c7a3e9b284
+Revises: e6b4d2a8c157
+Create Date: 2026-10-18
+
+Adds a STORED generated ``search_name`` column holding first, middle and
+last name lowercased with punctuation collapsed to single spaces (and a
+leading space, so word-prefix matches are ``LIKE '% tok%'``). A GiST
+trigram index on it serves both the word-prefix filters and
+nearest-neighbour ordering by word similarity, so ranked type-ahead lookups
+stop after ``LIMIT`` rows instead of ranking every match.
+
+The column is generated by PostgreSQL, so the import pipeline maintains it
+without writing it. Adding it rewrites the voters table; on large databases
+schedule it in a maintenance window and consider building the index
+manually with ``CONCURRENTLY``.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c7a3e9b284"
+down_revision: str | None = "e6b4d2a8c157"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Mirrors voter_api.lib.normalize.search_name_sql (inlined so the migration
+# does not change if the application code does).
+_SEARCH_NAME_EXPR = (
+    "' ' || btrim(regexp_replace(lower(coalesce(first_name, '') || ' ' || coalesce(middle_name, '') "
+    "|| ' ' || coalesce(last_name, '')), '[^a-z0-9]+', ' ', 'g'))"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(f"ALTER TABLE voters ADD COLUMN search_name TEXT GENERATED ALWAYS AS ({_SEARCH_NAME_EXPR}) STORED")
+    op.execute("CREATE INDEX ix_voters_search_name_trgm ON voters USING GIST (search_name gist_trgm_ops)")
+    op.execute("ANALYZE voters")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_voters_search_name_trgm")
+    op.execute("ALTER TABLE voters DROP COLUMN IF EXISTS search_name")
@@ -0,0 +1,38 @@
+"""create rate_limit_buckets table
+
+Revision ID: f5d9b3c7e241
+Revises: e8c2a5f9d163
+Create Date: 2026-10-19
+
+Token buckets for ``RATE_LIMIT_BACKEND=postgres``, shared by every API
+worker and pod. The table is ``UNLOGGED``: losing it in a crash only
+resets the limits. ``updated_at`` is indexed for purging idle buckets.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f5d9b3c7e241"
+down_revision: str | None = "e8c2a5f9d163"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("tokens", sa.Double(), nullable=False),
+        sa.Column("updated_at", sa.Double(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+        prefixes=["UNLOGGED"],
+    )
+    op.create_index("ix_rate_limit_buckets_updated_at", "rate_limit_buckets", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rate_limit_buckets_updated_at", table_name="rate_limit_buckets")
+    op.drop_table("rate_limit_buckets")
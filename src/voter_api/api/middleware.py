@@ -1,15 +1,17 @@
-"""CORS, rate limiting, and security headers middleware."""
+"""CORS, rate limiting, security headers, and query instrumentation middleware."""
 
 import time
-from collections import defaultdict
 from typing import Any
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from loguru import logger
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.types import ASGIApp
 
 from voter_api.core.config import Settings
+from voter_api.core.instrumentation import RequestMetrics, request_metrics, start_request_stats, stop_request_stats
+from voter_api.core.rate_limit import MemoryRateLimitBackend, RateLimitBackend
 
 _DEFAULT_TRUSTED_HEADERS = ["CF-Connecting-IP", "X-Forwarded-For", "X-Real-IP"]
 
@@ -85,10 +87,12 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Simple in-memory rate limiting middleware.
+    """Token-bucket rate limiting per client IP.
 
-    Limits requests per IP address with a sliding window approach.
-    Uses proxy headers to identify real client IPs behind reverse proxies.
+    Each client may burst up to ``requests_per_minute`` requests, refilled
+    at that rate. Uses proxy headers to identify real client IPs behind
+    reverse proxies. Buckets live in ``backend`` (see
+    :mod:`voter_api.core.rate_limit`); by default a process-local LRU.
     """
 
     def __init__(
@@ -96,11 +100,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         requests_per_minute: int = 60,
         trusted_proxy_headers: list[str] | None = None,
+        backend: RateLimitBackend | None = None,
     ) -> None:
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
         self.trusted_proxy_headers = trusted_proxy_headers
-        self._request_counts: dict[str, list[float]] = defaultdict(list)
+        self.backend = backend if backend is not None else MemoryRateLimitBackend()
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         """Check rate limit and process request.
@@ -116,18 +121,79 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         client_ip = get_client_ip(request, self.trusted_proxy_headers)
-        now = time.time()
-        window_start = now - 60.0
-
-        # Clean old entries
-        self._request_counts[client_ip] = [t for t in self._request_counts[client_ip] if t > window_start]
-
-        if len(self._request_counts[client_ip]) >= self.requests_per_minute:
+        if not await self.backend.hit(client_ip, self.requests_per_minute, time.time()):
             return Response(
                 content='{"detail":"Rate limit exceeded"}',
                 status_code=429,
                 media_type="application/json",
             )
-
-        self._request_counts[client_ip].append(now)
         return await call_next(request)
+
+
+class QueryInstrumentationMiddleware(BaseHTTPMiddleware):
+    """Attribute SQL statements to requests and report them.
+
+    Records per-route histograms, logs a warning when one normalized
+    statement runs at least ``n_plus_one_threshold`` times in a request,
+    and with ``server_timing`` adds a ``Server-Timing`` header (``db`` time
+    with the statement count, and ``app`` total time). Requires the engine
+    to be instrumented with
+    :func:`voter_api.core.instrumentation.instrument_engine`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        n_plus_one_threshold: int = 25,
+        metrics: RequestMetrics | None = None,
+        server_timing: bool = False,
+    ) -> None:
+        super().__init__(app)
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.server_timing = server_timing
+        self.metrics = metrics if metrics is not None else request_metrics
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        """Collect SQL statistics while the request is handled.
+
+        Args:
+            request: The incoming request.
+            call_next: The next middleware/handler.
+
+        Returns:
+            The response, with a Server-Timing header when enabled.
+        """
+        stats, token = start_request_stats()
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            stop_request_stats(token)
+        duration = time.perf_counter() - start
+
+        # Route templates keep label cardinality bounded (no raw IDs).
+        route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+
+        if self.server_timing:
+            response.headers.append(
+                "Server-Timing",
+                f'db;dur={stats.total_seconds * 1000:.1f};desc="{stats.count} queries", app;dur={duration * 1000:.1f}',
+            )
+        self.metrics.observe_request(
+            method=request.method,
+            route=route,
+            status=response.status_code,
+            duration_seconds=duration,
+            stats=stats,
+        )
+
+        if self.n_plus_one_threshold > 0:
+            for statement, count in stats.repeated(self.n_plus_one_threshold):
+                logger.warning(
+                    "Possible N+1: {} {} executed the same statement {} times: {}",
+                    request.method,
+                    route,
+                    count,
+                    statement,
+                )
+        return response
@@ -0,0 +1,193 @@
+"""Serialized response cache for public election results endpoints.
+
+Election-night traffic polls the same handful of elections whose data only
+changes when results are refreshed. This module keeps the serialized JSON
+(plus a gzip-compressed copy) of each results view in worker memory, keyed
+by election, view, and a version token derived from the election row
+(see ``election_service.get_results_version``). A refresh bumps the token, so
+stale payloads are never served even by workers that did not perform the
+refresh. Responses carry a strong ``ETag`` and honor ``If-None-Match``.
+"""
+
+import gzip
+import hashlib
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from voter_api.core.cache import LRUCache
+from voter_api.schemas.election import (
+    ElectionResultFeatureCollection,
+    ElectionResultsResponse,
+    PrecinctElectionResultFeatureCollection,
+    RawElectionResultsResponse,
+)
+from voter_api.services import election_service
+
+type _ResultsModel = (
+    ElectionResultsResponse
+    | RawElectionResultsResponse
+    | ElectionResultFeatureCollection
+    | PrecinctElectionResultFeatureCollection
+)
+
+# Payloads smaller than this are sent uncompressed.
+_GZIP_MIN_BYTES = 1024
+_GZIP_LEVEL = 6
+
+ACTIVE_MAX_AGE = 60
+FINALIZED_MAX_AGE = 86400
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    """A serialized response body with its compressed form and ETag."""
+
+    body: bytes
+    gzip_body: bytes | None
+    etag: str
+    media_type: str
+    max_age: int
+
+
+def build_payload(body: bytes, media_type: str, *, status: str) -> CachedPayload:
+    """Compress and fingerprint a serialized response body.
+
+    Args:
+        body: Serialized JSON body.
+        media_type: Response media type.
+        status: Election status, which selects the ``Cache-Control`` max-age.
+
+    Returns:
+        CachedPayload ready to be stored and served.
+    """
+    gzip_body = gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0) if len(body) >= _GZIP_MIN_BYTES else None
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    max_age = ACTIVE_MAX_AGE if status == "active" else FINALIZED_MAX_AGE
+    return CachedPayload(body=body, gzip_body=gzip_body, etag=etag, media_type=media_type, max_age=max_age)
+
+
+class ResultsResponseCache:
+    """LRU cache of results payloads keyed by (election_id, view, version).
+
+    Storing a new version for an (election_id, view) pair drops the older
+    versions immediately so superseded payloads do not linger until eviction.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self._cache: LRUCache[tuple[uuid.UUID, str, str], CachedPayload] = LRUCache(max_entries=max_entries)
+
+    def get(self, election_id: uuid.UUID, view: str, version: str) -> CachedPayload | None:
+        """Return the cached payload for this exact version, if present."""
+        return self._cache.get((election_id, view, version))
+
+    def put(self, election_id: uuid.UUID, view: str, version: str, payload: CachedPayload) -> None:
+        """Store a payload, discarding other versions of the same view."""
+        self._cache.invalidate_where(lambda k: k[0] == election_id and k[1] == view and k[2] != version)
+        self._cache.set((election_id, view, version), payload)
+
+    def invalidate(self, election_id: uuid.UUID) -> int:
+        """Drop every cached view of an election.
+
+        Returns:
+            Number of entries removed.
+        """
+        return self._cache.invalidate_where(lambda k: k[0] == election_id)
+
+    def clear(self) -> None:
+        """Drop all cached payloads."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count and hit/miss counters."""
+        return self._cache.stats()
+
+
+# Singleton instance for the application
+results_cache = ResultsResponseCache()
+
+
+def _accepts_gzip(request: Request) -> bool:
+    accept = request.headers.get("accept-encoding", "")
+    return any(part.split(";")[0].strip().lower() == "gzip" for part in accept.split(","))
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def render_cached(request: Request, payload: CachedPayload) -> Response:
+    """Build an HTTP response for a cached payload.
+
+    Returns ``304 Not Modified`` when the client's ``If-None-Match`` matches,
+    and the pre-compressed body when the client accepts gzip.
+
+    Args:
+        request: The incoming request (for conditional/encoding headers).
+        payload: The cached payload to serve.
+
+    Returns:
+        Response with ``ETag``, ``Cache-Control`` and ``Vary`` headers set.
+    """
+    headers = {
+        "Cache-Control": f"public, max-age={payload.max_age}",
+        "ETag": payload.etag,
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request, payload.etag):
+        return Response(status_code=304, headers=headers)
+    if payload.gzip_body is not None and _accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=payload.gzip_body, media_type=payload.media_type, headers=headers)
+    return Response(content=payload.body, media_type=payload.media_type, headers=headers)
+
+
+async def serve_cached_results(
+    request: Request,
+    session: AsyncSession,
+    election_id: uuid.UUID,
+    view: str,
+    build: Callable[[], Awaitable[_ResultsModel | None]],
+    *,
+    media_type: str = "application/json",
+) -> Response:
+    """Serve a results view from cache, rebuilding it only when its version changed.
+
+    A single indexed lookup of the election's version token replaces the full
+    results assembly on cache hits, so DB load no longer scales with viewers.
+
+    Args:
+        request: The incoming request.
+        session: Async database session.
+        election_id: The election UUID.
+        view: Cache discriminator for the endpoint (and its parameters).
+        build: Coroutine factory producing the response model on a miss; the
+            model must expose the election ``status``.
+        media_type: Response media type.
+
+    Returns:
+        The cached (or freshly built) response.
+
+    Raises:
+        HTTPException: 404 if the election does not exist.
+    """
+    version = await election_service.get_results_version(session, election_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Election not found.")
+
+    payload = results_cache.get(election_id, view, version)
+    if payload is None:
+        model = await build()
+        if model is None:
+            raise HTTPException(status_code=404, detail="Election not found.")
+        payload = build_payload(model.model_dump_json().encode(), media_type, status=model.status)
+        results_cache.put(election_id, view, version, payload)
+
+    return render_cached(request, payload)
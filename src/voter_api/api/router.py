@@ -2,8 +2,14 @@
 
 from fastapi import APIRouter, FastAPI
 
-from voter_api.api.middleware import RateLimitMiddleware, SecurityHeadersMiddleware, setup_cors
+from voter_api.api.middleware import (
+    QueryInstrumentationMiddleware,
+    RateLimitMiddleware,
+    SecurityHeadersMiddleware,
+    setup_cors,
+)
 from voter_api.core.config import Settings
+from voter_api.core.rate_limit import create_rate_limit_backend
 
 
 def create_router(settings: Settings) -> APIRouter:
@@ -72,4 +78,12 @@ def setup_middleware(app: FastAPI, settings: Settings) -> None:
         RateLimitMiddleware,
         requests_per_minute=settings.rate_limit_per_minute,
         trusted_proxy_headers=settings.trusted_proxy_header_list,
+        backend=create_rate_limit_backend(settings),
     )
+    if settings.instrumentation_enabled:
+        # Added last so it is outermost and times the whole middleware stack.
+        app.add_middleware(
+            QueryInstrumentationMiddleware,
+            n_plus_one_threshold=settings.n_plus_one_threshold,
+            server_timing=settings.server_timing_enabled,
+        )
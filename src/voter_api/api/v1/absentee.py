@@ -6,9 +6,9 @@ GET /absentee/{ballot_app_id} (detail).
 
 import math
 import uuid
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from voter_api.core.dependencies import get_async_session, require_role
@@ -33,17 +33,61 @@ async def list_absentee_ballots(
     application_status: str | None = None,
     ballot_status: str | None = None,
     party: str | None = None,
+    cursor: str | None = Query(
+        None,
+        description="Opaque next_cursor from a previous response; pages by keyset and ignores page",
+        max_length=1000,
+    ),
+    count: Literal["exact", "estimate", "capped"] = Query(
+        "exact",
+        description=(
+            "How to compute pagination.total: exact COUNT(*), planner estimate, "
+            "or a count capped at 10,000 (see total_is_exact)"
+        ),
+    ),
 ) -> PaginatedAbsenteeResponse:
-    """List absentee ballot applications with optional filters (admin/analyst only)."""
-    records, total = await absentee_service.query_absentee_ballots(
-        session,
-        county=county,
-        application_status=application_status,
-        ballot_status=ballot_status,
-        party=party,
-        page=pagination.page,
-        page_size=pagination.page_size,
-    )
+    """List absentee ballot applications with optional filters (admin/analyst only).
+
+    Every response carries ``next_cursor``; following it instead of
+    incrementing ``page`` keeps deep pages as cheap as the first. Broad
+    filters can pass ``count=estimate`` or ``count=capped`` to skip the
+    exact count over the whole filtered set.
+    """
+    filters = {
+        "county": county,
+        "application_status": application_status,
+        "ballot_status": ballot_status,
+        "party": party,
+    }
+    if cursor is None and count == "exact":
+        records, total = await absentee_service.query_absentee_ballots(
+            session,
+            **filters,
+            page=pagination.page,
+            page_size=pagination.page_size,
+        )
+        total_is_exact = True
+        has_more = bool(records) and pagination.page * pagination.page_size < total
+        next_cursor = absentee_service.encode_absentee_cursor(records[-1]) if has_more else None
+    else:
+        try:
+            result = await absentee_service.query_absentee_ballots_keyset(
+                session,
+                **filters,
+                cursor=cursor,
+                page=pagination.page,
+                page_size=pagination.page_size,
+                count_mode=count,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        records, total, total_is_exact, next_cursor = (
+            result.records,
+            result.total,
+            result.total_is_exact,
+            result.next_cursor,
+        )
+
     return PaginatedAbsenteeResponse(
         items=[AbsenteeBallotDetailResponse.model_validate(r) for r in records],
         pagination=PaginationMeta(
@@ -52,6 +96,8 @@ async def list_absentee_ballots(
             page_size=pagination.page_size,
             total_pages=max(1, math.ceil(total / pagination.page_size)),
         ),
+        next_cursor=next_cursor,
+        total_is_exact=total_is_exact,
     )
 
 
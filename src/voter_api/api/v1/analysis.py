@@ -5,8 +5,7 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from voter_api.core.background import task_runner
-from voter_api.core.database import get_session_factory
+from voter_api.core.background import get_task_runner
 from voter_api.core.dependencies import get_async_session, require_role
 from voter_api.models.user import User
 from voter_api.schemas.analysis import (
@@ -27,7 +26,6 @@ from voter_api.services.analysis_service import (
     get_analysis_run,
     list_analysis_results,
     list_analysis_runs,
-    process_analysis_run,
 )
 
 analysis_router = APIRouter(prefix="/analysis", tags=["analysis"])
@@ -51,16 +49,7 @@ async def trigger_analysis_run(
     )
 
     # Submit background processing
-    async def _run_analysis() -> None:
-        factory = get_session_factory()
-        async with factory() as bg_session:
-            from voter_api.services.analysis_service import get_analysis_run as get_run
-
-            bg_run = await get_run(bg_session, run.id)
-            if bg_run:
-                await process_analysis_run(bg_session, bg_run, county=request.county)
-
-    task_runner.submit_task(_run_analysis())
+    await get_task_runner().submit_job("analysis", {"run_id": str(run.id), "county": request.county})
 
     return AnalysisRunResponse.model_validate(run)
 
@@ -3,7 +3,7 @@
 POST /auth/login, POST /auth/refresh, GET /auth/me,
 GET /users, POST /users, GET /users/{user_id},
 PATCH /users/{user_id}, DELETE /users/{user_id},
-GET /health, GET /info,
+GET /health, GET /info, GET /metrics,
 password reset, user invites, TOTP, and passkey endpoints.
 """
 
@@ -138,6 +138,24 @@ async def info(
     }
 
 
+@router.get("/metrics", status_code=200, include_in_schema=False)
+async def metrics(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> Response:
+    """Return per-route request histograms and password hashing metrics in Prometheus text format.
+
+    Disabled (404) unless ``METRICS_ENABLED`` is set.
+    """
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    from voter_api.core.hashing import get_password_hasher
+    from voter_api.core.instrumentation import request_metrics
+
+    content = request_metrics.render() + get_password_hasher().render()
+    return Response(content=content, media_type="text/plain; version=0.0.4")
+
+
 # ── Auth ─────────────────────────────────────────────────────────────────────
 
 
@@ -17,10 +17,10 @@ import uuid
 from datetime import date
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from voter_api.api.response_cache import results_cache, serve_cached_results
 from voter_api.core.dependencies import get_async_session, require_role
 from voter_api.lib.election_tracker import FetchError
 from voter_api.models.user import User
@@ -51,6 +51,8 @@ from voter_api.services.election_service import (
 
 elections_router = APIRouter(prefix="/elections", tags=["elections"])
 
+GEOJSON_MEDIA_TYPE = "application/geo+json"
+
 
 # --- US5: List elections ---
 
@@ -256,6 +258,7 @@ async def update_election(
     election = await election_service.update_election(session, election_id, request)
     if election is None:
         raise HTTPException(status_code=404, detail="Election not found.")
+    results_cache.invalidate(election_id)
     return election_service.build_detail_response(election)
 
 
@@ -334,6 +337,7 @@ async def submit_election_results(
         raise HTTPException(status_code=404, detail=str(e)) from e
     except ManualResultConflictError as e:
         raise HTTPException(status_code=409, detail=str(e)) from e
+    results_cache.invalidate(election_id)
     response.status_code = 200 if is_update else 201
     return result
 
@@ -344,19 +348,21 @@ async def submit_election_results(
 @elections_router.get("/{election_id}/results", response_model=ElectionResultsResponse)
 async def get_election_results(
     election_id: uuid.UUID,
-    response: Response,
+    request: Request,
     session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> ElectionResultsResponse:
-    """Get statewide + county election results as JSON. Public endpoint."""
-    result = await election_service.get_election_results(session, election_id)
-    if result is None:
-        raise HTTPException(status_code=404, detail="Election not found.")
-
-    # Status-dependent Cache-Control header
-    cache_ttl = 60 if result.status == "active" else 86400
-    response.headers["Cache-Control"] = f"public, max-age={cache_ttl}"
-
-    return result
+) -> Response:
+    """Get statewide + county election results as JSON. Public endpoint.
+
+    Served from the results response cache; ``Cache-Control`` is
+    status-dependent and ``ETag``/``If-None-Match`` are honored.
+    """
+    return await serve_cached_results(
+        request,
+        session,
+        election_id,
+        "results",
+        lambda: election_service.get_election_results(session, election_id),
+    )
 
 
 # --- FR-006: Raw SOS results ---
@@ -365,18 +371,17 @@ async def get_election_results(
 @elections_router.get("/{election_id}/results/raw", response_model=RawElectionResultsResponse)
 async def get_raw_election_results(
     election_id: uuid.UUID,
-    response: Response,
+    request: Request,
     session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> RawElectionResultsResponse:
+) -> Response:
     """Get raw SOS election results preserving original field names. Public endpoint."""
-    result = await election_service.get_raw_election_results(session, election_id)
-    if result is None:
-        raise HTTPException(status_code=404, detail="Election not found.")
-
-    cache_ttl = 60 if result.status == "active" else 86400
-    response.headers["Cache-Control"] = f"public, max-age={cache_ttl}"
-
-    return result
+    return await serve_cached_results(
+        request,
+        session,
+        election_id,
+        "raw",
+        lambda: election_service.get_raw_election_results(session, election_id),
+    )
 
 
 # --- US2: GeoJSON results ---
@@ -385,22 +390,17 @@ async def get_raw_election_results(
 @elections_router.get("/{election_id}/results/geojson")
 async def get_election_results_geojson(
     election_id: uuid.UUID,
-    response: Response,
+    request: Request,
     session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> JSONResponse:
+) -> Response:
     """Get county-level election results as GeoJSON. Public endpoint."""
-    result = await election_service.get_election_results_geojson(session, election_id)
-    if result is None:
-        raise HTTPException(status_code=404, detail="Election not found.")
-
-    # Status-dependent Cache-Control header
-    election = await election_service.get_election_by_id(session, election_id)
-    cache_ttl = 60 if election and election.status == "active" else 86400
-
-    return JSONResponse(
-        content=result.model_dump(mode="json"),
-        media_type="application/geo+json",
-        headers={"Cache-Control": f"public, max-age={cache_ttl}"},
+    return await serve_cached_results(
+        request,
+        session,
+        election_id,
+        "geojson",
+        lambda: election_service.get_election_results_geojson(session, election_id),
+        media_type=GEOJSON_MEDIA_TYPE,
     )
 
 
@@ -410,21 +410,19 @@ async def get_election_results_geojson(
 @elections_router.get("/{election_id}/results/geojson/precincts")
 async def get_election_results_geojson_precincts(
     election_id: uuid.UUID,
-    response: Response,
+    request: Request,
     session: Annotated[AsyncSession, Depends(get_async_session)],
     county: str | None = Query(default=None, description="Filter by county name"),
-) -> JSONResponse:
+) -> Response:
     """Get precinct-level election results as GeoJSON. Public endpoint."""
-    result = await election_service.get_election_precinct_results_geojson(session, election_id, county=county)
-    if result is None:
-        raise HTTPException(status_code=404, detail="Election not found.")
-
-    cache_ttl = 60 if result.status == "active" else 86400
-
-    return JSONResponse(
-        content=result.model_dump(mode="json"),
-        media_type="application/geo+json",
-        headers={"Cache-Control": f"public, max-age={cache_ttl}"},
+    view = f"geojson-precincts:{county.upper()}" if county else "geojson-precincts"
+    return await serve_cached_results(
+        request,
+        session,
+        election_id,
+        view,
+        lambda: election_service.get_election_precinct_results_geojson(session, election_id, county=county),
+        media_type=GEOJSON_MEDIA_TYPE,
     )
 
 
@@ -439,7 +437,7 @@ async def refresh_election(
 ) -> RefreshResponse:
     """Trigger manual election results refresh. Admin-only."""
     try:
-        return await election_service.refresh_single_election(session, election_id)
+        refreshed = await election_service.refresh_single_election(session, election_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
     except FetchError as e:
@@ -447,3 +445,5 @@ async def refresh_election(
             status_code=502,
             detail="Failed to retrieve results from data source. Please retry later.",
         ) from e
+    results_cache.invalidate(election_id)
+    return refreshed
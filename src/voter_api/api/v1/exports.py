@@ -7,9 +7,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from voter_api.core.background import task_runner
+from voter_api.core.background import get_task_runner
 from voter_api.core.config import Settings, get_settings
-from voter_api.core.database import get_session_factory
 from voter_api.core.dependencies import get_async_session, get_current_user, require_role
 from voter_api.models.user import User
 from voter_api.schemas.common import PaginationMeta
@@ -22,7 +21,6 @@ from voter_api.services.export_service import (
     create_export_job,
     get_export_job,
     list_export_jobs,
-    process_export,
 )
 
 exports_router = APIRouter(prefix="/exports", tags=["exports"])
@@ -61,16 +59,7 @@ async def request_export(
     )
 
     # Submit background processing
-    export_dir = Path(settings.export_dir)
-
-    async def _run_export() -> None:
-        factory = get_session_factory()
-        async with factory() as bg_session:
-            bg_job = await get_export_job(bg_session, job.id)
-            if bg_job:
-                await process_export(bg_session, bg_job, export_dir)
-
-    task_runner.submit_task(_run_export())
+    await get_task_runner().submit_job("export", {"job_id": str(job.id), "export_dir": settings.export_dir})
 
     return _job_to_response(job, settings)
 
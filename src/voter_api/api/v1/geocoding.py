@@ -6,10 +6,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from voter_api.core.background import task_runner
+from voter_api.core.background import get_task_runner
 from voter_api.core.config import get_settings
 from voter_api.core.dependencies import get_async_session, get_current_user, require_role
-from voter_api.lib.geocoder import get_all_provider_metadata, get_configured_providers
+from voter_api.lib.geocoder import get_all_provider_metadata
 from voter_api.lib.geocoder.base import GeocodingProviderError
 from voter_api.lib.geocoder.point_lookup import validate_georgia_coordinates
 from voter_api.models.user import User
@@ -43,7 +43,6 @@ from voter_api.services.geocoding_service import (
     get_geocoding_job,
     list_geocoding_jobs,
     mark_geocoding_job_failed,
-    process_geocoding_job,
     verify_address,
 )
 
@@ -274,31 +273,8 @@ async def trigger_batch_geocoding(
         triggered_by=current_user.id,
     )
 
-    # Resolve fallback providers if requested
-    use_fallback = request.fallback
-    fallback_providers = None
-    if use_fallback:
-        settings = get_settings()
-        fallback_providers = get_configured_providers(settings)
-
-    # Run geocoding in background
-    async def _run_geocoding() -> None:
-        from voter_api.core.database import get_session_factory
-
-        factory = get_session_factory()
-        async with factory() as bg_session:
-            bg_job = await get_geocoding_job(bg_session, job.id)
-            if bg_job:
-                await process_geocoding_job(
-                    bg_session,
-                    bg_job,
-                    fallback=use_fallback,
-                    fallback_providers=fallback_providers,
-                )
-            else:
-                logger.error(f"Background geocoding job {job.id} not found")
-
-    task_runner.submit_task(_run_geocoding())
+    # Run geocoding in background (fallback providers are resolved when it runs)
+    await get_task_runner().submit_job("geocoding", {"job_id": str(job.id), "fallback": request.fallback})
 
     return GeocodingJobResponse.model_validate(job)
 
@@ -17,7 +17,7 @@ from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from voter_api.core.background import task_runner
+from voter_api.core.background import get_task_runner
 from voter_api.core.config import Settings, get_settings
 from voter_api.core.dependencies import get_async_session, require_role
 from voter_api.models.user import User
@@ -94,21 +94,11 @@ async def import_voters(
         triggered_by=current_user.id,
     )
 
-    # Submit background task
-    async def _run_import() -> None:
-        from voter_api.core.database import get_session_factory
-
-        try:
-            factory = get_session_factory()
-            async with factory() as bg_session:
-                bg_job = await import_service.get_import_job(bg_session, job.id)
-                if bg_job:
-                    await import_service.process_voter_import(bg_session, bg_job, tmp_path, settings.import_batch_size)
-        finally:
-            tmp_path.unlink(missing_ok=True)
-
     try:
-        task_runner.submit_task(_run_import())
+        await get_task_runner().submit_job(
+            "voter_import",
+            {"job_id": str(job.id), "file_path": str(tmp_path), "batch_size": settings.import_batch_size},
+        )
     except Exception:
         logger.exception("Failed to submit voter import task for job {}", job.id)
         tmp_path.unlink(missing_ok=True)
@@ -151,21 +141,8 @@ async def import_voter_history(
         triggered_by=current_user.id,
     )
 
-    async def _run_import() -> None:
-        from voter_api.core.database import get_session_factory
-        from voter_api.services.voter_history_service import process_voter_history_import
-
-        try:
-            factory = get_session_factory()
-            async with factory() as bg_session:
-                bg_job = await import_service.get_import_job(bg_session, job.id)
-                if bg_job:
-                    await process_voter_history_import(bg_session, bg_job, tmp_path)
-        finally:
-            tmp_path.unlink(missing_ok=True)
-
     try:
-        task_runner.submit_task(_run_import())
+        await get_task_runner().submit_job("voter_history_import", {"job_id": str(job.id), "file_path": str(tmp_path)})
     except Exception:
         logger.exception("Failed to submit voter-history import task for job {}", job.id)
         tmp_path.unlink(missing_ok=True)
@@ -221,21 +198,8 @@ async def import_candidates(
         tmp_path.unlink(missing_ok=True)
         raise
 
-    async def _run_import() -> None:
-        from voter_api.core.database import get_session_factory
-        from voter_api.services.candidate_import_service import process_candidate_import
-
-        try:
-            factory = get_session_factory()
-            async with factory() as bg_session:
-                bg_job = await import_service.get_import_job(bg_session, job.id)
-                if bg_job:
-                    await process_candidate_import(bg_session, bg_job, tmp_path)
-        finally:
-            tmp_path.unlink(missing_ok=True)
-
     try:
-        task_runner.submit_task(_run_import())
+        await get_task_runner().submit_job("candidate_import", {"job_id": str(job.id), "file_path": str(tmp_path)})
     except Exception:
         logger.exception("Failed to submit candidate import task for job {}", job.id)
         tmp_path.unlink(missing_ok=True)
@@ -290,21 +254,10 @@ async def import_election_results(
         tmp_path.unlink(missing_ok=True)
         raise
 
-    async def _run_import() -> None:
-        from voter_api.core.database import get_session_factory
-        from voter_api.services.results_import_service import process_results_import
-
-        try:
-            factory = get_session_factory()
-            async with factory() as bg_session:
-                bg_job = await import_service.get_import_job(bg_session, job.id)
-                if bg_job:
-                    await process_results_import(bg_session, bg_job, tmp_path)
-        finally:
-            tmp_path.unlink(missing_ok=True)
-
     try:
-        task_runner.submit_task(_run_import())
+        await get_task_runner().submit_job(
+            "election_results_import", {"job_id": str(job.id), "file_path": str(tmp_path)}
+        )
     except Exception:
         logger.exception("Failed to submit election results import task for job {}", job.id)
         tmp_path.unlink(missing_ok=True)
@@ -351,21 +304,8 @@ async def import_absentee(
         triggered_by=current_user.id,
     )
 
-    async def _run_import() -> None:
-        from voter_api.core.database import get_session_factory
-        from voter_api.services.absentee_service import process_absentee_import
-
-        try:
-            factory = get_session_factory()
-            async with factory() as bg_session:
-                bg_job = await import_service.get_import_job(bg_session, job.id)
-                if bg_job:
-                    await process_absentee_import(bg_session, bg_job, tmp_path)
-        finally:
-            tmp_path.unlink(missing_ok=True)
-
     try:
-        task_runner.submit_task(_run_import())
+        await get_task_runner().submit_job("absentee_import", {"job_id": str(job.id), "file_path": str(tmp_path)})
     except Exception:
         logger.exception("Failed to submit absentee import task for job {}", job.id)
         tmp_path.unlink(missing_ok=True)
@@ -408,7 +348,7 @@ async def import_boundary_file(
         tmp_path = Path(tmp.name)
 
     try:
-        boundaries = await import_boundaries(
+        imported = await import_boundaries(
             session,
             file_path=tmp_path,
             boundary_type=boundary_type,
@@ -418,7 +358,7 @@ async def import_boundary_file(
     finally:
         tmp_path.unlink(missing_ok=True)
 
-    return {"imported": len(boundaries), "boundary_type": boundary_type}
+    return {"imported": imported, "boundary_type": boundary_type}
 
 
 @router.get("", response_model=PaginatedImportJobResponse)
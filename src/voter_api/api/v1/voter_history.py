@@ -197,10 +197,19 @@ async def get_election_participation_stats(
     election_id: uuid.UUID,
     current_user: Annotated[User, Depends(require_role("analyst", "admin"))],
     session: Annotated[AsyncSession, Depends(get_async_session)],
+    refresh: bool = Query(
+        default=False,
+        description="Recompute statistics instead of serving the stored rollup.",
+    ),
 ) -> ParticipationStatsResponse:
-    """Get aggregate participation statistics for an election."""
+    """Get aggregate participation statistics for an election.
+
+    Served from the precomputed participation rollup, which is recomputed
+    when stale (after voter history import or election resolution) or
+    when ``refresh=true``.
+    """
     try:
-        return await voter_history_service.get_participation_stats(session, election_id)
+        return await voter_history_service.get_participation_stats(session, election_id, force_refresh=refresh)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,11 +1,13 @@
 """Voter API endpoints for search, detail, and geocoded location management."""
 
 import uuid
-from typing import Annotated
+from dataclasses import asdict
+from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from voter_api.core.config import Settings, get_settings
 from voter_api.core.dependencies import get_async_session, get_current_user, require_role
 from voter_api.lib.geocoder.point_lookup import OutOfBoundsError
 from voter_api.lib.normalize import normalize_registration_number
@@ -20,6 +22,8 @@ from voter_api.schemas.voter import (
     SetOfficialLocationRequest,
     VoterDetailResponse,
     VoterFilterOptions,
+    VoterNameLookupResponse,
+    VoterNameMatch,
     VoterSummaryResponse,
 )
 from voter_api.services.geocoding_service import (
@@ -31,12 +35,16 @@ from voter_api.services.geocoding_service import (
 )
 from voter_api.services.voter_history_service import get_participation_summary
 from voter_api.services.voter_service import (
+    VoterSearchFilters,
     build_voter_detail_dict,
     check_batch_boundaries_for_voter,
     check_voter_districts,
+    encode_voter_cursor,
     get_voter_detail,
     get_voter_filter_options,
+    lookup_voters_by_name,
     search_voters,
+    search_voters_keyset,
 )
 
 voters_router = APIRouter(prefix="/voters", tags=["voters"])
@@ -69,12 +77,29 @@ async def search_voters_endpoint(
     has_district_mismatch: bool | None = Query(None, description="Filter by district mismatch status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None,
+        description="Opaque next_cursor from a previous response; pages by keyset and ignores page",
+        max_length=1000,
+    ),
+    count: Literal["exact", "estimate", "capped"] = Query(
+        "exact",
+        description=(
+            "How to compute pagination.total: exact COUNT(*), planner estimate, "
+            "or a count capped at 10,000 (see total_is_exact)"
+        ),
+    ),
 ) -> PaginatedVoterResponse:
-    """Search and list voters with multiple filter parameters."""
+    """Search and list voters with multiple filter parameters.
+
+    Every response carries ``next_cursor``; following it instead of
+    incrementing ``page`` keeps deep pages as cheap as the first. Broad
+    filters can pass ``count=estimate`` or ``count=capped`` to skip the
+    exact count over the whole filtered set.
+    """
     if voter_registration_number:
         voter_registration_number = normalize_registration_number(voter_registration_number)
-    voters, total = await search_voters(
-        session,
+    filters = VoterSearchFilters(
         q=q,
         voter_registration_number=voter_registration_number,
         first_name=first_name,
@@ -91,9 +116,26 @@ async def search_voters_endpoint(
         school_board_district=school_board_district,
         present_in_latest_import=present_in_latest_import,
         has_district_mismatch=has_district_mismatch,
-        page=page,
-        page_size=page_size,
     )
+
+    if cursor is None and count == "exact":
+        voters, total = await search_voters(session, **asdict(filters), page=page, page_size=page_size)
+        total_is_exact = True
+        next_cursor = encode_voter_cursor(voters[-1]) if voters and page * page_size < total else None
+    else:
+        try:
+            result = await search_voters_keyset(
+                session, filters, cursor=cursor, page=page, page_size=page_size, count_mode=count
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        voters, total, total_is_exact, next_cursor = (
+            result.voters,
+            result.total,
+            result.total_is_exact,
+            result.next_cursor,
+        )
+
     return PaginatedVoterResponse(
         items=[VoterSummaryResponse.model_validate(v) for v in voters],
         pagination=PaginationMeta(
@@ -102,6 +144,8 @@ async def search_voters_endpoint(
             total=total,
             total_pages=(total + page_size - 1) // page_size,
         ),
+        next_cursor=next_cursor,
+        total_is_exact=total_is_exact,
     )
 
 
@@ -121,12 +165,13 @@ async def get_filter_options(
     school_board_district: str | None = Query(
         None, description="School board district to narrow other county-scoped options"
     ),
+    include_counts: bool = Query(False, description="Include the voter count for every option"),
 ) -> VoterFilterOptions:
     """Return distinct values for voter search filter dropdowns.
 
-    Queries the database for all non-null distinct values currently present in
-    the voters table.  Use this endpoint to populate dropdown/select components
-    in search UIs.
+    Serves the non-null distinct values present in the voters table from a
+    facet rollup refreshed after each voter import.  Use this endpoint to
+    populate dropdown/select components in search UIs.
 
     Cascading filters: when county-scoped params are provided alongside
     ``county``, each narrows the *other* county-scoped lists but not its own,
@@ -139,6 +184,7 @@ async def get_filter_options(
             county-scoped lists.
         school_board_district: School board district that narrows other
             county-scoped lists.
+        include_counts: Whether to include per-option voter counts.
         session: Async database session.
         _current_user: Authenticated user dependency.
 
@@ -152,10 +198,51 @@ async def get_filter_options(
         county_precinct=county_precinct,
         county_commission_district=county_commission_district,
         school_board_district=school_board_district,
+        with_counts=include_counts,
     )
     return VoterFilterOptions(**options)
 
 
+@voters_router.get(
+    "/lookup",
+    response_model=VoterNameLookupResponse,
+)
+async def lookup_voters_endpoint(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    _current_user: Annotated[User, Depends(get_current_user)],
+    settings: Annotated[Settings, Depends(get_settings)],
+    q: str = Query(
+        ...,
+        description="Name text; each word matches the start of a first, middle, or last name",
+        min_length=1,
+        max_length=200,
+    ),
+    county: str | None = Query(None, description="Restrict matches to one county"),
+    limit: int = Query(10, ge=1, le=50),
+) -> VoterNameLookupResponse:
+    """Relevance-ranked voter name lookup for type-ahead search.
+
+    Unlike ``q`` on the list endpoint (substring match, alphabetical order),
+    each word here is a prefix match and results come back closest first.
+    """
+    try:
+        matches = await lookup_voters_by_name(
+            session,
+            q,
+            county=county,
+            limit=limit,
+            min_token_length=settings.name_search_min_token_length,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+    return VoterNameLookupResponse(
+        items=[
+            VoterNameMatch(**VoterSummaryResponse.model_validate(voter).model_dump(), score=round(score, 4))
+            for voter, score in matches
+        ]
+    )
+
+
 @voters_router.get(
     "/{voter_id}",
     response_model=VoterDetailResponse,
@@ -55,6 +55,7 @@ def _register_subcommands() -> None:
     from voter_api.cli.publish_cmd import publish_app
     from voter_api.cli.seed_cmd import seed
     from voter_api.cli.user_cmd import user_app
+    from voter_api.cli.worker_cmd import worker
 
     app.add_typer(convert_app, name="convert", help="Markdown to JSONL conversion")
     app.add_typer(normalize_app, name="normalize", help="Normalize markdown files")
@@ -70,6 +71,7 @@ def _register_subcommands() -> None:
     app.add_typer(officials_app, name="officials", help="Elected officials data commands")
     app.command("deploy-check")(deploy_check)
     app.command("seed")(seed)
+    app.command("worker")(worker)
 
 
 _register_subcommands()
@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Any
 
 import typer
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from voter_api.cli.voter_history_cmd import import_voter_history
 
@@ -45,6 +44,39 @@ async def _cleanup_jobs() -> None:
         await dispose_engine()
 
 
+@import_app.command("voter-facets")
+def refresh_voter_facets_cmd(
+    county: list[str] | None = typer.Option(  # noqa: B008
+        None, "--county", help="Rebuild only this county's facets (repeatable); default rebuilds all"
+    ),
+) -> None:
+    """Rebuild the voter search filter facets from the voters table.
+
+    Imports keep the facets current; run this after loading voters any
+    other way (SQL, restores) or if the filter dropdowns look stale.
+    """
+    asyncio.run(_refresh_voter_facets(county or None))
+
+
+async def _refresh_voter_facets(counties: list[str] | None) -> None:
+    """Async implementation of voter-facets command."""
+    from voter_api.core.config import get_settings
+    from voter_api.core.database import dispose_engine, get_session_factory, init_engine
+    from voter_api.services.voter_service import refresh_voter_filter_facets
+
+    settings = get_settings()
+    init_engine(settings.database_url, schema=settings.database_schema)
+
+    try:
+        factory = get_session_factory()
+        async with factory() as session:
+            written = await refresh_voter_filter_facets(session, counties=counties)
+            scope = "all counties" if counties is None else ", ".join(counties)
+            typer.echo(f"Rebuilt {written} voter filter facet(s) for {scope}.")
+    finally:
+        await dispose_engine()
+
+
 @import_app.command("voters")
 def import_voters(
     file: Path = typer.Argument(..., help="Path to voter CSV file", exists=True),  # noqa: B008
@@ -86,21 +118,32 @@ async def _import_voters(file_path: Path, batch_size: int) -> None:
 @import_app.command("absentee")
 def import_absentee(
     file: Path = typer.Argument(..., help="Path to absentee ballot application CSV", exists=True),  # noqa: B008
-    batch_size: int = typer.Option(400, "--batch-size", help=_BATCH_SIZE_HELP),  # noqa: B008
+    batch_size: int | None = typer.Option(  # noqa: B008
+        None, "--batch-size", help="Records per batch (default: 50000 with --copy, 400 without)"
+    ),
+    use_copy: bool = typer.Option(  # noqa: B008
+        True,
+        "--copy/--no-copy",
+        help="Load via COPY + staging-table merge, skipping unchanged rows, instead of multi-row upserts",
+    ),
 ) -> None:
     """Import absentee ballot applications from a GA SoS CSV file."""
-    asyncio.run(_import_absentee(file, batch_size))
+    asyncio.run(_import_absentee(file, batch_size, use_copy=use_copy))
 
 
-async def _import_absentee(file_path: Path, batch_size: int) -> None:
+async def _import_absentee(file_path: Path, batch_size: int | None, *, use_copy: bool = True) -> None:
     """Async implementation of absentee ballot application import."""
     from voter_api.core.config import get_settings
     from voter_api.core.database import dispose_engine, get_session_factory, init_engine
     from voter_api.services.absentee_service import (
+        DEFAULT_COPY_BATCH_SIZE,
         create_absentee_import_job,
         process_absentee_import,
     )
 
+    if batch_size is None:
+        batch_size = DEFAULT_COPY_BATCH_SIZE if use_copy else 400
+
     settings = get_settings()
     init_engine(settings.database_url, schema=settings.database_schema)
 
@@ -111,7 +154,7 @@ async def _import_absentee(file_path: Path, batch_size: int) -> None:
             typer.echo(f"Import job created: {job.id}")
             typer.echo(f"Importing absentee ballot applications from {file_path.name}...")
 
-            job = await process_absentee_import(session, job, file_path, batch_size)
+            job = await process_absentee_import(session, job, file_path, batch_size, use_copy=use_copy)
 
             typer.echo(f"\nImport {'completed' if job.status == 'completed' else 'failed'}:")
             typer.echo(f"  Total records:  {job.total_records or 0}")
@@ -119,6 +162,8 @@ async def _import_absentee(file_path: Path, batch_size: int) -> None:
             typer.echo(f"  Failed:         {job.records_failed or 0}")
             typer.echo(f"  Inserted:       {job.records_inserted or 0}")
             typer.echo(f"  Updated:        {job.records_updated or 0}")
+            typer.echo(f"  Unchanged:      {job.records_skipped or 0}")
+            typer.echo(f"  Duplicates:     {job.records_deduplicated or 0}")
     finally:
         await dispose_engine()
 
@@ -146,14 +191,14 @@ async def _import_boundaries(file_path: Path, boundary_type: str, source: str, c
     try:
         factory = get_session_factory()
         async with factory() as session:
-            boundaries = await import_boundaries(
+            imported = await import_boundaries(
                 session,
                 file_path=file_path,
                 boundary_type=boundary_type,
                 source=source,
                 county=county,
             )
-            typer.echo(f"Imported {len(boundaries)} boundaries")
+            typer.echo(f"Imported {imported} boundaries")
             typer.echo(f"  Type:   {boundary_type}")
             typer.echo(f"  Source: {source}")
             typer.echo(f"  County: {county or 'all'}")
@@ -337,16 +382,17 @@ async def _import_one_boundary(
     Returns:
         Tuple of (success, count, error_message_or_None).
     """
-    from voter_api.services.boundary_service import import_boundaries
+    from voter_api.services.boundary_service import import_boundaries, upsert_boundaries
 
     async with factory() as session:
         if boundary_data is not None:
-            imported = await _import_filtered_boundaries(
+            imported = await upsert_boundaries(
                 session,
                 boundary_data,
                 entry.boundary_type,
                 entry.source,
                 entry.county,
+                county_from_properties=False,
             )
             meta_count = 0
             if metadata_records:
@@ -355,8 +401,8 @@ async def _import_one_boundary(
                 meta_count = await import_county_metadata(session, metadata_records)
 
             suffix = f", {meta_count} county metadata records" if metadata_records else ""
-            typer.echo(f"  OK: {len(imported)} boundaries imported{suffix}")
-            return True, len(imported), None
+            typer.echo(f"  OK: {imported} boundaries imported{suffix}")
+            return True, imported, None
 
         imported = await import_boundaries(
             session,
@@ -365,8 +411,8 @@ async def _import_one_boundary(
             source=entry.source,
             county=entry.county,
         )
-        typer.echo(f"  OK: {len(imported)} boundaries imported")
-        return True, len(imported), None
+        typer.echo(f"  OK: {imported} boundaries imported")
+        return True, imported, None
 
 
 async def _import_all_boundaries(
@@ -526,71 +572,6 @@ def _filter_by_state_fips(shp_path: Path, state_fips: str) -> tuple[list, list[d
     return boundaries, metadata_records
 
 
-async def _import_filtered_boundaries(
-    session: AsyncSession,
-    boundary_data: list,
-    boundary_type: str,
-    source: str,
-    county: str | None,
-) -> list:
-    """Import pre-filtered boundary data directly into the database.
-
-    Args:
-        session: Async database session.
-        boundary_data: List of BoundaryData objects.
-        boundary_type: Boundary type string.
-        source: Data source string.
-        county: County name or None.
-
-    Returns:
-        List of imported Boundary records.
-    """
-    from geoalchemy2.shape import from_shape
-    from loguru import logger
-    from sqlalchemy import select
-
-    from voter_api.models.boundary import Boundary
-
-    logger.info(f"Importing {len(boundary_data)} filtered boundaries (type={boundary_type})")
-
-    imported: list[Boundary] = []
-
-    for bd in boundary_data:
-        geom_wkb = from_shape(bd.geometry, srid=4326)
-
-        result = await session.execute(
-            select(Boundary).where(
-                Boundary.boundary_type == boundary_type,
-                Boundary.boundary_identifier == bd.boundary_identifier,
-                Boundary.county == county if county else Boundary.county.is_(None),
-            )
-        )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            existing.name = bd.name
-            existing.geometry = geom_wkb
-            existing.properties = bd.properties
-            existing.source = source
-            imported.append(existing)
-        else:
-            boundary = Boundary(
-                name=bd.name,
-                boundary_type=boundary_type,
-                boundary_identifier=bd.boundary_identifier,
-                source=source,
-                county=county,
-                geometry=geom_wkb,
-                properties=bd.properties,
-            )
-            session.add(boundary)
-            imported.append(boundary)
-
-    await session.commit()
-    logger.info(f"Imported {len(imported)} filtered boundaries")
-    return imported
-
-
 def _print_summary(results: list) -> None:
     """Print a summary table of import results."""
     typer.echo("\n" + "=" * 70)
@@ -645,6 +626,7 @@ async def _resolve_elections(election_date: date | None, force: bool, dry_run: b
     from voter_api.core.config import get_settings
     from voter_api.core.database import dispose_engine, get_session_factory, init_engine
     from voter_api.services.election_resolution_service import resolve_voter_history_elections
+    from voter_api.services.voter_history_service import refresh_stale_participation_stats
 
     settings = get_settings()
     init_engine(settings.database_url, schema=settings.database_schema)
@@ -664,6 +646,10 @@ async def _resolve_elections(election_date: date | None, force: bool, dry_run: b
             typer.echo(f"  Tier 2 (district match): {result.tier2_updated}")
             typer.echo(f"  Total VH updated:       {result.total_updated}")
             typer.echo(f"  Unresolvable elections: {result.unresolvable}")
+
+            if not dry_run:
+                refreshed = await refresh_stale_participation_stats(session)
+                typer.echo(f"  Participation rollups refreshed: {refreshed}")
     finally:
         await dispose_engine()
 
@@ -900,14 +886,25 @@ async def _import_candidates(file_path: Path, batch_size: int) -> None:
 def import_election_results_cmd(
     path: Path = typer.Argument(..., help="Path to JSON file or directory of JSON files", exists=True),  # noqa: B008
     dry_run: bool = typer.Option(False, "--dry-run", help="Parse and validate without importing"),  # noqa: B008
+    stream: bool | None = typer.Option(  # noqa: B008
+        None,
+        "--stream/--no-stream",
+        help="Parse files one county at a time (default: files of at least RESULTS_STREAM_THRESHOLD_MB)",
+    ),
 ) -> None:
     """Import election results from SoS JSON export file(s)."""
-    asyncio.run(_import_election_results(path, dry_run))
+    asyncio.run(_import_election_results(path, dry_run, stream))
 
 
-async def _import_election_results(path: Path, dry_run: bool) -> None:
+async def _import_election_results(path: Path, dry_run: bool, stream: bool | None = None) -> None:
     """Async implementation of election-results import."""
-    from voter_api.lib.results_importer import iter_ballot_items, load_results_file, validate_results_file
+    from voter_api.lib.results_importer import (
+        iter_ballot_items,
+        iter_local_results,
+        load_results_file,
+        load_results_header,
+        validate_results_file,
+    )
 
     # Collect files
     if path.is_file():
@@ -923,7 +920,7 @@ async def _import_election_results(path: Path, dry_run: bool) -> None:
         all_valid = True
         for json_path in json_files:
             try:
-                feed = load_results_file(json_path)
+                feed = load_results_header(json_path) if stream else load_results_file(json_path)
                 errors = validate_results_file(feed)
                 if errors:
                     typer.echo(f"  INVALID  {json_path.name}")
@@ -933,9 +930,10 @@ async def _import_election_results(path: Path, dry_run: bool) -> None:
                 else:
                     contexts = iter_ballot_items(feed)
                     candidates_count = sum(len(c.candidates) for c in contexts)
+                    counties = sum(1 for _ in iter_local_results(json_path)) if stream else len(feed.localResults)
                     typer.echo(
                         f"  VALID    {json_path.name} "
-                        f"({len(contexts)} races, {candidates_count} candidates, "
+                        f"({len(contexts)} races, {candidates_count} candidates, {counties} counties, "
                         f"date={feed.electionDate})"
                     )
             except Exception as e:
@@ -969,7 +967,7 @@ async def _import_election_results(path: Path, dry_run: bool) -> None:
                     job = await create_results_import_job(session, file_name=json_path.name)
                     typer.echo(f"  Import job created: {job.id}")
 
-                    job = await process_results_import(session, job, json_path)
+                    job = await process_results_import(session, job, json_path, stream=stream)
 
                     status = "completed" if job.status == "completed" else "failed"
                     typer.echo(f"  Import {status}:")
@@ -1009,6 +1007,106 @@ async def _import_election_results(path: Path, dry_run: bool) -> None:
         raise typer.Exit(code=1)
 
 
+@import_app.command("results-archive")
+def import_results_archive_cmd(
+    path: Path = typer.Argument(..., help="Directory of SoS results JSON files (searched recursively)", exists=True),  # noqa: B008
+    workers: int = typer.Option(  # noqa: B008
+        4,
+        "--workers",
+        min=1,
+        help="Election dates imported concurrently, and processes parsing their files",
+    ),
+    batch_size: int = typer.Option(1000, "--batch-size", min=1, help="Ballot items written per batch"),  # noqa: B008
+    optimize: bool = typer.Option(  # noqa: B008
+        True,
+        "--optimize/--no-optimize",
+        help="Drop election_county_results indexes and pause autovacuum for the run",
+    ),
+) -> None:
+    """Bulk import a historical archive of election results files.
+
+    Files are grouped by election date; each date is imported as one job
+    with a shared election cache. Dates are imported concurrently on one
+    event loop, which overlaps their database writes, while their files
+    are parsed in parallel in a pool of worker processes.
+    """
+    asyncio.run(_import_results_archive(path, workers, batch_size, optimize))
+
+
+async def _import_results_archive(path: Path, workers: int, batch_size: int, optimize: bool) -> None:
+    """Async implementation of results-archive import."""
+    import contextlib
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    from voter_api.core.config import get_settings
+    from voter_api.core.database import dispose_engine, get_session_factory, init_engine
+    from voter_api.services.results_import_service import (
+        bulk_results_import_context,
+        group_results_archive,
+        import_results_archive,
+    )
+
+    json_files = sorted(path.rglob("*.json")) if path.is_dir() else [path]
+    if not json_files:
+        typer.echo(f"No *.json files found in {path}")
+        raise typer.Exit(code=1)
+
+    groups, unreadable = group_results_archive(json_files)
+    typer.echo(f"Found {len(json_files)} file(s) across {len(groups)} election date(s)")
+    for file_path, error in unreadable:
+        typer.echo(f"  SKIPPED  {file_path.name}: {error}", err=True)
+
+    settings = get_settings()
+    init_engine(settings.database_url, schema=settings.database_schema)
+
+    # spawn: workers must not inherit the parent's event loop or DB connections.
+    pool = ProcessPoolExecutor(
+        max_workers=min(workers, max(1, len(groups))), mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        factory = get_session_factory()
+        async with contextlib.AsyncExitStack() as stack:
+            if optimize:
+                lifecycle_session = await stack.enter_async_context(factory())
+                await stack.enter_async_context(bulk_results_import_context(lifecycle_session))
+            await import_results_archive(groups, workers=workers, batch_size=batch_size, executor=pool)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        await dispose_engine()
+
+    typer.echo("\n" + "=" * 100)
+    typer.echo(_IMPORT_SUMMARY_HEADER)
+    typer.echo("=" * 100)
+    typer.echo(
+        f"  {'Election date':<20s} {'Files':>6s} {'Status':<10s} "
+        f"{'Items':>6s} {'OK':>6s} {'Fail':>6s} {'New':>6s} {'Upd':>6s}"
+    )
+    typer.echo("-" * 100)
+    for group in groups:
+        job = group.job
+        status = "error" if group.error or job is None else job.status
+        total, ok, fail, ins, upd = (
+            (
+                job.total_records or 0,
+                job.records_succeeded or 0,
+                job.records_failed or 0,
+                job.records_inserted or 0,
+                job.records_updated or 0,
+            )
+            if job is not None
+            else (0, 0, 0, 0, 0)
+        )
+        typer.echo(
+            f"  {group.election_date:<20s} {len(group.files):>6d} {status:<10s} "
+            f"{total:>6d} {ok:>6d} {fail:>6d} {ins:>6d} {upd:>6d}"
+        )
+    typer.echo("=" * 100)
+
+    if unreadable or any(group.error or group.job is None or group.job.status != "completed" for group in groups):
+        raise typer.Exit(code=1)
+
+
 @import_app.command("build-crosswalk")
 def build_crosswalk_cmd() -> None:
     """Build or display the precinct crosswalk table.
@@ -3,23 +3,36 @@
 The ``voter-api seed`` command fetches a remote manifest, downloads data
 files with checksum verification, and imports them using the existing
 import pipelines in dependency order: county-districts → boundaries → voters → voter-history.
+
+Downloads run in parallel over one shared connection pool, scheduled in
+import order, and each category's import starts as soon as its own files
+are on disk — so county-districts and boundaries are usually imported
+while the large voter files are still downloading.
 """
 
 from __future__ import annotations
 
 import asyncio
+from collections import Counter, defaultdict
 from pathlib import Path  # noqa: TC003 - Typer needs Path at runtime
+from typing import TYPE_CHECKING
 
 import typer
 
-from voter_api.lib.data_loader.downloader import download_file, resolve_download_path
+from voter_api.lib.data_loader.downloader import create_download_client, download_files, resolve_download_path
 from voter_api.lib.data_loader.manifest import fetch_manifest
 from voter_api.lib.data_loader.types import (
+    DataFileEntry,
     DownloadResult,
     FileCategory,
     SeedResult,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Mapping
+
+    import httpx
+
 # Map user-facing CLI category names to manifest FileCategory values.
 _CATEGORY_MAP: dict[str, FileCategory] = {
     "boundaries": FileCategory.BOUNDARY,
@@ -35,6 +48,18 @@ _VALID_CATEGORIES = ", ".join(sorted([*_CATEGORY_MAP.keys(), _ELECTION_CATEGORY]
 
 _DEFAULT_ELECTION_SOURCE = "https://voteapi.civpulse.org"
 
+_DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
+# Downloads are scheduled in import order so the first import phases can
+# start while later (larger) files are still downloading.
+_DOWNLOAD_ORDER: tuple[FileCategory, ...] = (
+    FileCategory.COUNTY_DISTRICT,
+    FileCategory.BOUNDARY,
+    FileCategory.VOTER,
+    FileCategory.VOTER_HISTORY,
+    FileCategory.REFERENCE,
+)
+
 
 def _validate_data_root(value: str | None) -> str | None:
     """Validate and normalize the --data-root CLI override.
@@ -101,6 +126,12 @@ def seed(
         "--skip-elections",
         help="Skip the election seeding step",
     ),
+    download_concurrency: int = typer.Option(
+        _DEFAULT_DOWNLOAD_CONCURRENCY,
+        "--download-concurrency",
+        min=1,
+        help="Maximum parallel downloads (--fail-fast always downloads one file at a time)",
+    ),
 ) -> None:
     """Download seed data and import into the database.
 
@@ -139,6 +170,7 @@ def seed(
             election_source=election_source,
             skip_elections=skip_elections,
             seed_elections_explicitly=seed_elections_explicitly,
+            download_concurrency=download_concurrency,
         )
     )
 
@@ -155,6 +187,7 @@ async def _run_seed(
     election_source: str | None = _DEFAULT_ELECTION_SOURCE,
     skip_elections: bool = False,
     seed_elections_explicitly: bool = False,
+    download_concurrency: int = _DEFAULT_DOWNLOAD_CONCURRENCY,
 ) -> None:
     """Async implementation of the seed workflow.
 
@@ -163,123 +196,201 @@ async def _run_seed(
         data_dir: Local directory for downloaded files.
         category_filters: If set, only process these categories.
         download_only: If True, skip database imports.
-        fail_fast: If True, stop on first error.
+        fail_fast: If True, stop on first error. Downloads then run one at
+            a time and all of them finish before any import starts.
         skip_checksum: If True, skip SHA512 verification.
         max_voters: If set, limit total voter records imported.
         election_source: Base URL of the source API for election seeding.
         skip_elections: If True, skip the election seeding step.
         seed_elections_explicitly: If True, seed elections even when no file
             categories match (e.g. ``--category elections``).
+        download_concurrency: Maximum number of parallel downloads.
     """
     from voter_api.core.config import get_settings
 
     settings = get_settings()
     root_url = data_root or settings.data_root_url
 
-    # --- Phase 1: Fetch manifest ---
-    typer.echo(f"Fetching manifest from {root_url}")
-    try:
-        manifest = await fetch_manifest(root_url)
-    except Exception as exc:
-        typer.echo(f"Error fetching manifest: {exc}", err=True)
-        raise typer.Exit(code=1) from exc
-
-    typer.echo(f"Manifest loaded: {len(manifest.files)} files")
-
-    # Filter by category
-    entries = list(manifest.files)
-    if category_filters is not None:
-        entries = [e for e in entries if e.category in category_filters]
-        if category_filters:
-            cats = ", ".join(c.value for c in category_filters)
-            typer.echo(f"Filtered to {len(entries)} files matching categories: {cats}")
-
-    if not entries and not seed_elections_explicitly:
-        typer.echo("No files to process.")
-        raise typer.Exit(code=0)
-
-    seed_result = SeedResult()
-
-    # --- Phase 2: Download files (skipped when only "elections" was requested) ---
-    if entries:
-        typer.echo(f"\nDownloading {len(entries)} file(s) to {data_dir.resolve()}")
-
-        for i, entry in enumerate(entries, 1):
-            dest = resolve_download_path(entry, data_dir)
-            url = f"{root_url.rstrip('/')}/{entry.filename}"
-
-            typer.echo(f"\n[{i}/{len(entries)}] {entry.filename} ({entry.size_bytes:,} bytes)")
-
-            result = await download_file(
-                url=url,
-                dest=dest,
-                expected_sha512=entry.sha512,
-                size_bytes=entry.size_bytes,
+    async with create_download_client(download_concurrency) as client:
+        # --- Phase 1: Fetch manifest ---
+        typer.echo(f"Fetching manifest from {root_url}")
+        try:
+            manifest = await fetch_manifest(root_url, client=client)
+        except Exception as exc:
+            typer.echo(f"Error fetching manifest: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+
+        typer.echo(f"Manifest loaded: {len(manifest.files)} files")
+
+        # Filter by category
+        entries = list(manifest.files)
+        if category_filters is not None:
+            entries = [e for e in entries if e.category in category_filters]
+            if category_filters:
+                cats = ", ".join(c.value for c in category_filters)
+                typer.echo(f"Filtered to {len(entries)} files matching categories: {cats}")
+
+        if not entries and not seed_elections_explicitly:
+            typer.echo("No files to process.")
+            raise typer.Exit(code=0)
+
+        seed_result = SeedResult()
+        loop = asyncio.get_running_loop()
+        ready: dict[FileCategory, asyncio.Future[list[DownloadResult]]] = {
+            category: loop.create_future() for category in FileCategory
+        }
+
+        # --- Phase 2: Download files (skipped when only "elections" was requested) ---
+        download_task: asyncio.Task[None] | None = None
+        if entries:
+            download_task = asyncio.create_task(
+                _download_entries(
+                    entries,
+                    root_url=root_url,
+                    data_dir=data_dir,
+                    client=client,
+                    max_concurrency=1 if fail_fast else download_concurrency,
+                    skip_checksum=skip_checksum,
+                    fail_fast=fail_fast,
+                    seed_result=seed_result,
+                    ready=ready,
+                )
+            )
+            if fail_fast or download_only:
+                await download_task
+                if fail_fast and not seed_result.success:
+                    typer.echo("Stopping (--fail-fast).", err=True)
+                    raise typer.Exit(code=1)
+        else:
+            typer.echo("\nNo manifest files to download (seeding elections from API only).")
+            for future in ready.values():
+                future.set_result([])
+
+        # --- Phase 3: Import (unless --download-only) ---
+        if download_only:
+            typer.echo("\n--download-only specified, skipping imports.")
+            if not seed_result.success:
+                raise typer.Exit(code=1)
+            raise typer.Exit(code=0)
+
+        try:
+            await _run_imports(
+                downloads=ready,
+                data_dir=data_dir,
+                category_filters=category_filters,
+                fail_fast=fail_fast,
                 skip_checksum=skip_checksum,
-                entry=entry,
+                seed_result=seed_result,
+                max_voters=max_voters,
+                election_source=election_source,
+                skip_elections=skip_elections,
+                seed_elections_explicitly=seed_elections_explicitly,
             )
+            if download_task is not None:
+                # Reference files may still be downloading.
+                await download_task
+        finally:
+            if download_task is not None and not download_task.done():
+                download_task.cancel()
+                await asyncio.gather(download_task, return_exceptions=True)
+
+    if not seed_result.success:
+        typer.echo("\nSeed completed with errors.", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo("\nSeed completed successfully.")
+
+
+async def _download_entries(
+    entries: list[DataFileEntry],
+    *,
+    root_url: str,
+    data_dir: Path,
+    client: httpx.AsyncClient,
+    max_concurrency: int,
+    skip_checksum: bool,
+    fail_fast: bool,
+    seed_result: SeedResult,
+    ready: Mapping[FileCategory, asyncio.Future[list[DownloadResult]]],
+) -> None:
+    """Download manifest entries in parallel and signal per-category readiness.
+
+    Each future in ``ready`` is resolved with the category's successful
+    downloads as soon as the last file of that category finishes (or
+    immediately for categories with no files), letting imports begin
+    while other categories are still downloading.
+
+    Args:
+        entries: Manifest entries to download.
+        root_url: Data Root URL the filenames are relative to.
+        data_dir: Local directory for downloaded files.
+        client: Shared ``httpx.AsyncClient``.
+        max_concurrency: Maximum number of downloads in flight.
+        skip_checksum: If True, skip SHA512 verification.
+        fail_fast: If True, stop after the first failed download.
+        seed_result: Mutable result to record downloads in.
+        ready: Per-category futures to resolve.
+    """
+    ordered = sorted(entries, key=lambda e: _DOWNLOAD_ORDER.index(e.category))
+    jobs = [(e, f"{root_url.rstrip('/')}/{e.filename}", resolve_download_path(e, data_dir)) for e in ordered]
+    pending = Counter(e.category for e in ordered)
+    collected: defaultdict[FileCategory, list[DownloadResult]] = defaultdict(list)
+
+    def _release(category: FileCategory) -> None:
+        future = ready[category]
+        if not future.done():
+            future.set_result([r for r in collected[category] if r.success and r.local_path])
+
+    for category in ready:
+        if pending[category] == 0:
+            _release(category)
+
+    typer.echo(f"\nDownloading {len(jobs)} file(s) to {data_dir.resolve()} (up to {max_concurrency} at a time)")
+    try:
+        done = 0
+        async for result in download_files(
+            jobs,
+            max_concurrency=max_concurrency,
+            skip_checksum=skip_checksum,
+            stop_on_error=fail_fast,
+            client=client,
+        ):
+            done += 1
+            entry = result.entry
             seed_result.downloads.append(result)
+            typer.echo(f"\n[{done}/{len(jobs)}] {entry.filename} ({entry.size_bytes:,} bytes)")
 
             if result.success:
                 if result.downloaded:
                     seed_result.total_downloaded_bytes += entry.size_bytes
-                    typer.echo(f"  Downloaded: {dest}")
+                    typer.echo(f"  Downloaded: {result.local_path}")
                 else:
                     seed_result.total_skipped += 1
-                    typer.echo(f"  Cached: {dest}")
+                    typer.echo(f"  Cached: {result.local_path}")
             else:
                 typer.echo(f"  FAILED: {result.error}", err=True)
                 seed_result.success = False
-                if fail_fast:
-                    typer.echo("Stopping (--fail-fast).", err=True)
-                    raise typer.Exit(code=1)
 
-        # --- Download summary ---
-        downloaded_count = sum(1 for r in seed_result.downloads if r.downloaded)
-        failed_count = sum(1 for r in seed_result.downloads if not r.success)
-        typer.echo(
-            f"\nDownload complete: {downloaded_count} downloaded, "
-            f"{seed_result.total_skipped} cached, {failed_count} failed"
-        )
-
-        if failed_count > 0 and fail_fast:
-            raise typer.Exit(code=1)
-    else:
-        typer.echo("\nNo manifest files to download (seeding elections from API only).")
-
-    # --- Phase 3: Import (unless --download-only) ---
-    if download_only:
-        typer.echo("\n--download-only specified, skipping imports.")
-        if not seed_result.success:
-            raise typer.Exit(code=1)
-        raise typer.Exit(code=0)
-
-    # Only import files that downloaded/cached successfully
-    successful = [r for r in seed_result.downloads if r.success and r.local_path]
-
-    await _run_imports(
-        successful_downloads=successful,
-        data_dir=data_dir,
-        category_filters=category_filters,
-        fail_fast=fail_fast,
-        skip_checksum=skip_checksum,
-        seed_result=seed_result,
-        max_voters=max_voters,
-        election_source=election_source,
-        skip_elections=skip_elections,
-        seed_elections_explicitly=seed_elections_explicitly,
+            collected[entry.category].append(result)
+            pending[entry.category] -= 1
+            if pending[entry.category] == 0:
+                _release(entry.category)
+    finally:
+        # Unblock any waiting import phase even if downloads stopped early.
+        for category in ready:
+            _release(category)
+
+    # --- Download summary ---
+    downloaded_count = sum(1 for r in seed_result.downloads if r.downloaded)
+    failed_count = sum(1 for r in seed_result.downloads if not r.success)
+    typer.echo(
+        f"\nDownload complete: {downloaded_count} downloaded, {seed_result.total_skipped} cached, {failed_count} failed"
     )
 
-    if not seed_result.success:
-        typer.echo("\nSeed completed with errors.", err=True)
-        raise typer.Exit(code=1)
-
-    typer.echo("\nSeed completed successfully.")
-
 
 async def _run_imports(
     *,
-    successful_downloads: list[DownloadResult],
+    downloads: Mapping[FileCategory, Awaitable[list[DownloadResult]]],
     data_dir: Path,
     category_filters: set[FileCategory] | None,
     fail_fast: bool,
@@ -293,10 +404,13 @@ async def _run_imports(
     """Run database imports in dependency order.
 
     Import order: county-districts → boundaries → elections (from API) → voters → voter-history.
-    Reference-category files are never imported.
+    Reference-category files are never imported. Each phase waits only for
+    its own category's downloads, so it can start while later categories
+    are still downloading.
 
     Args:
-        successful_downloads: Download results with local_path set.
+        downloads: Per-category awaitables resolving to the successful
+            download results (with local_path set) for that category.
         data_dir: Local data directory.
         category_filters: Active category filters, or None for all.
         fail_fast: Stop on first error.
@@ -316,7 +430,7 @@ async def _run_imports(
 
     try:
         # County-districts first
-        county_files = [r for r in successful_downloads if r.entry.category == FileCategory.COUNTY_DISTRICT]
+        county_files = await downloads[FileCategory.COUNTY_DISTRICT]
         if county_files and (category_filters is None or FileCategory.COUNTY_DISTRICT in category_filters):
             typer.echo("\n--- Importing county-district mappings ---")
             for r in county_files:
@@ -332,7 +446,7 @@ async def _run_imports(
                         return
 
         # Boundaries second
-        boundary_files = [r for r in successful_downloads if r.entry.category == FileCategory.BOUNDARY]
+        boundary_files = await downloads[FileCategory.BOUNDARY]
         if boundary_files and (category_filters is None or FileCategory.BOUNDARY in category_filters):
             typer.echo("\n--- Importing boundaries ---")
             try:
@@ -372,7 +486,7 @@ async def _run_imports(
             typer.echo("\n--- Skipping election seeding (--skip-elections) ---")
 
         # Voters — parallel processing with single index lifecycle
-        voter_files = [r for r in successful_downloads if r.entry.category == FileCategory.VOTER]
+        voter_files = await downloads[FileCategory.VOTER]
         if voter_files and (category_filters is None or FileCategory.VOTER in category_filters):
             typer.echo("\n--- Importing voter files ---")
             voter_paths = [r.local_path for r in voter_files if r.local_path is not None]
@@ -385,7 +499,7 @@ async def _run_imports(
             )
 
         # Voter history last — depends on voters being imported first
-        vh_files = [r for r in successful_downloads if r.entry.category == FileCategory.VOTER_HISTORY]
+        vh_files = await downloads[FileCategory.VOTER_HISTORY]
         if vh_files and (category_filters is None or FileCategory.VOTER_HISTORY in category_filters):
             typer.echo("\n--- Importing voter history files ---")
             await _import_voter_history_batch(
@@ -529,6 +643,11 @@ async def _import_voters_batch(
     sequentially so a running budget can be tracked across files;
     processing stops once the budget is exhausted.
 
+    CSV chunks from every file are validated and type-coerced in one shared
+    process pool (``IMPORT_WORKERS`` processes) while each file's session
+    writes already-prepared chunks, so parsing is no longer serialized on
+    the event loop. Per-stage timings are reported per file and in total.
+
     Args:
         file_paths: Voter CSV file paths.
         batch_size: Records per batch per file.
@@ -537,10 +656,16 @@ async def _import_voters_batch(
         max_voters: If set, limit total voter records imported across
             all files. Files are processed sequentially when set.
     """
+    import multiprocessing
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
     from sqlalchemy import text
 
+    from voter_api.core.config import get_settings
     from voter_api.core.database import get_session_factory
     from voter_api.services.import_service import (
+        ImportStageTimings,
         bulk_import_context,
         create_import_job,
         process_voter_import,
@@ -552,6 +677,12 @@ async def _import_voters_batch(
     if max_voters is not None:
         typer.echo(f"  Voter import limited to {max_voters:,} records total")
 
+    settings = get_settings()
+    workers = settings.import_workers or os.cpu_count() or 1
+    typer.echo(f"  Preparing chunks in {workers} worker process(es)")
+    # spawn: workers must not inherit the parent's event loop or DB connections.
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    total_timings = ImportStageTimings()
     factory = get_session_factory()
 
     async def _process_one(file_path: Path, max_records: int | None = None) -> int:
@@ -569,6 +700,7 @@ async def _import_voters_batch(
             await session.execute(text("SET synchronous_commit = 'off'"))
             job = await create_import_job(session, file_name=file_path.name)
             typer.echo(f"  Import job: {job.id} for {file_path.name}")
+            timings = ImportStageTimings()
             job = await process_voter_import(
                 session,
                 job,
@@ -576,45 +708,55 @@ async def _import_voters_batch(
                 batch_size,
                 skip_optimizations=True,
                 max_records=max_records,
+                executor=pool,
+                queue_depth=settings.import_queue_depth,
+                stage_timings=timings,
             )
+            total_timings.merge(timings)
             typer.echo(
                 f"  Result ({file_path.name}): {job.records_succeeded or 0} succeeded, {job.records_failed or 0} failed"
             )
+            typer.echo(f"  Stages ({file_path.name}): {timings.summary()}")
             return job.records_succeeded or 0
 
-    # Use a dedicated session for the optimization lifecycle (drop/rebuild indexes)
-    async with factory() as lifecycle_session, bulk_import_context(lifecycle_session):
-        if max_voters is not None:
-            # Sequential processing with a running budget
-            remaining = max_voters
-            for fp in file_paths:
-                if remaining <= 0:
-                    typer.echo(f"  Skipping {fp.name} (voter limit reached)")
-                    break
-                try:
-                    imported = await _process_one(fp, max_records=remaining)
-                    remaining -= imported
-                    seed_result.import_results[f"voter:{fp.name}"] = "success"
-                except Exception as exc:
-                    typer.echo(f"  IMPORT FAILED: {fp.name}: {exc}", err=True)
-                    seed_result.success = False
-                    seed_result.import_results[f"voter:{fp.name}"] = str(exc)
-                    if fail_fast:
-                        return
-        else:
-            # Concurrent processing (no limit)
-            tasks = [_process_one(fp) for fp in file_paths]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for fp, result in zip(file_paths, results, strict=True):
-                if isinstance(result, Exception):
-                    typer.echo(f"  IMPORT FAILED: {fp.name}: {result}", err=True)
-                    seed_result.success = False
-                    seed_result.import_results[f"voter:{fp.name}"] = str(result)
-                    if fail_fast:
-                        return
-                else:
-                    seed_result.import_results[f"voter:{fp.name}"] = "success"
+    try:
+        # Use a dedicated session for the optimization lifecycle (drop/rebuild indexes)
+        async with factory() as lifecycle_session, bulk_import_context(lifecycle_session):
+            if max_voters is not None:
+                # Sequential processing with a running budget
+                remaining = max_voters
+                for fp in file_paths:
+                    if remaining <= 0:
+                        typer.echo(f"  Skipping {fp.name} (voter limit reached)")
+                        break
+                    try:
+                        imported = await _process_one(fp, max_records=remaining)
+                        remaining -= imported
+                        seed_result.import_results[f"voter:{fp.name}"] = "success"
+                    except Exception as exc:
+                        typer.echo(f"  IMPORT FAILED: {fp.name}: {exc}", err=True)
+                        seed_result.success = False
+                        seed_result.import_results[f"voter:{fp.name}"] = str(exc)
+                        if fail_fast:
+                            return
+            else:
+                # Concurrent processing (no limit)
+                tasks = [_process_one(fp) for fp in file_paths]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+
+                for fp, result in zip(file_paths, results, strict=True):
+                    if isinstance(result, Exception):
+                        typer.echo(f"  IMPORT FAILED: {fp.name}: {result}", err=True)
+                        seed_result.success = False
+                        seed_result.import_results[f"voter:{fp.name}"] = str(result)
+                        if fail_fast:
+                            return
+                    else:
+                        seed_result.import_results[f"voter:{fp.name}"] = "success"
+    finally:
+        await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+        if total_timings.chunks:
+            typer.echo(f"  Voter import stages (all files): {total_timings.summary()}")
 
 
 async def _import_voter_history(file_path: Path, batch_size: int, *, skip_optimizations: bool = False) -> None:
@@ -656,7 +798,7 @@ async def _import_voter_history(file_path: Path, batch_size: int, *, skip_optimi
         job = await create_import_job(session, file_name=csv_path.name, file_type="voter_history")
         typer.echo(f"  Import job: {job.id} for {csv_path.name}")
         job = await process_voter_history_import(
-            session, job, csv_path, batch_size, skip_optimizations=skip_optimizations
+            session, job, csv_path, batch_size, skip_optimizations=skip_optimizations, use_copy=True
         )
         typer.echo(
             f"  Result ({csv_path.name}): {job.records_succeeded or 0} succeeded, {job.records_failed or 0} failed"
@@ -27,6 +27,7 @@ from voter_api.models.import_job import ImportJob
 from voter_api.models.user import User
 from voter_api.models.voter import Voter
 from voter_api.models.voter_history import VoterHistory
+from voter_api.services.voter_service import refresh_voter_filter_facets
 
 # ---------------------------------------------------------------------------
 # Deterministic UUIDs in the 11111111-xxxx range (avoids E2E's 00000000-xxxx)
@@ -71,7 +72,7 @@ async def _seed() -> None:
 
     try:
         async with factory() as session:
-            hashed = hash_password(DEV_PASSWORD)
+            hashed = hash_password(DEV_PASSWORD, rounds=settings.password_bcrypt_rounds)
 
             # --- Users --------------------------------------------------------
             users = [
@@ -486,6 +487,10 @@ async def _seed() -> None:
             logger.info("Seeded 2 candidates")
 
             await session.commit()
+
+            # The voters above bypass the import pipeline, which is what
+            # normally keeps the search filter facets current.
+            await refresh_voter_filter_facets(session)
             logger.success("Dev seed data complete")
     finally:
         await dispose_engine()
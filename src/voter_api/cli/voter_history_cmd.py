@@ -9,19 +9,31 @@ import typer
 
 def import_voter_history(
     file: Path = typer.Argument(..., help="Path to voter history CSV file", exists=True),  # noqa: B008
-    batch_size: int = typer.Option(1000, "--batch-size", help="Records per batch"),  # noqa: B008
+    batch_size: int | None = typer.Option(  # noqa: B008
+        None, "--batch-size", help="Records per batch (default: 50000 with --copy, 1000 without)"
+    ),
+    use_copy: bool = typer.Option(  # noqa: B008
+        True, "--copy/--no-copy", help="Load via COPY + staging-table merge instead of multi-row upserts"
+    ),
 ) -> None:
     """Import voter participation history from a GA SoS CSV file."""
-    asyncio.run(_import_voter_history(file, batch_size))
+    asyncio.run(_import_voter_history(file, batch_size, use_copy=use_copy))
 
 
-async def _import_voter_history(file_path: Path, batch_size: int) -> None:
+async def _import_voter_history(file_path: Path, batch_size: int | None, *, use_copy: bool = True) -> None:
     """Async implementation of voter history import."""
     from voter_api.core.config import get_settings
     from voter_api.core.database import dispose_engine, get_session_factory, init_engine
     from voter_api.services.election_resolution_service import resolve_voter_history_elections
     from voter_api.services.import_service import create_import_job
-    from voter_api.services.voter_history_service import process_voter_history_import
+    from voter_api.services.voter_history_service import (
+        DEFAULT_COPY_BATCH_SIZE,
+        process_voter_history_import,
+        refresh_stale_participation_stats,
+    )
+
+    if batch_size is None:
+        batch_size = DEFAULT_COPY_BATCH_SIZE if use_copy else 1000
 
     settings = get_settings()
     init_engine(settings.database_url)
@@ -34,8 +46,9 @@ async def _import_voter_history(file_path: Path, batch_size: int) -> None:
             typer.echo(f"Importing voter history from {file_path.name}...")
 
             start = time.monotonic()
-            job = await process_voter_history_import(session, job, file_path, batch_size)
+            job = await process_voter_history_import(session, job, file_path, batch_size, use_copy=use_copy)
             elapsed = time.monotonic() - start
+            throughput = (job.total_records or 0) / elapsed if elapsed > 0 else 0.0
 
             status_label = "completed" if job.status == "completed" else "failed"
             typer.echo(f"\nImport {status_label} in {elapsed:.1f}s:")
@@ -44,6 +57,7 @@ async def _import_voter_history(file_path: Path, batch_size: int) -> None:
             typer.echo(f"  Failed:            {job.records_failed or 0}")
             typer.echo(f"  Skipped (dupes):   {job.records_skipped or 0}")
             typer.echo(f"  Unmatched voters:  {job.records_unmatched or 0}")
+            typer.echo(f"  Throughput:        {throughput:,.0f} rows/s")
 
             if job.status == "completed":
                 typer.echo("\nResolving voter history to elections...")
@@ -58,5 +72,9 @@ async def _import_voter_history(file_path: Path, batch_size: int) -> None:
                 typer.echo(f"  Unresolvable:      {resolution.unresolvable}")
                 if resolution.elections_backfilled:
                     typer.echo(f"  Elections parsed:  {resolution.elections_backfilled}")
+
+                typer.echo("\nRefreshing participation stats...")
+                refreshed = await refresh_stale_participation_stats(session)
+                typer.echo(f"  Rollups refreshed: {refreshed}")
     finally:
         await dispose_engine()
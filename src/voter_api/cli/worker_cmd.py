@@ -0,0 +1,61 @@
+"""CLI command running the background job worker.
+
+``voter-api worker`` serves the Postgres job queue that the API fills when
+``TASK_BACKEND=queue``: imports, batch geocoding, analysis runs and
+exports. Run as many worker processes as needed; they coordinate through
+row locks. SIGINT/SIGTERM release running jobs back to the queue so the
+next worker resumes them from their checkpoints.
+"""
+
+import asyncio
+import signal
+
+import typer
+
+from voter_api.core.config import Settings, get_settings
+from voter_api.services.job_tasks import JOB_TASKS
+
+
+def worker(
+    queues: str | None = typer.Option(
+        None,
+        "--queues",
+        help="Queue concurrency as queue:count pairs, e.g. 'imports:1,geocoding:2' (default: WORKER_CONCURRENCY)",
+    ),
+) -> None:
+    """Run queued background jobs until interrupted."""
+    settings = get_settings()
+    if queues is not None:
+        settings = settings.model_copy(update={"worker_concurrency": queues})
+    try:
+        concurrency = settings.worker_concurrency_map
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--queues") from e
+    if not concurrency:
+        raise typer.BadParameter("No queues to serve", param_hint="--queues")
+    unknown = sorted(set(concurrency) - {task.queue for task in JOB_TASKS.values()})
+    if unknown:
+        raise typer.BadParameter(f"Unknown queue(s): {', '.join(unknown)}", param_hint="--queues")
+
+    asyncio.run(_run_worker(settings, concurrency))
+
+
+async def _run_worker(settings: Settings, concurrency: dict[str, int]) -> None:
+    """Async implementation of worker."""
+    from voter_api.core.database import dispose_engine, init_engine
+    from voter_api.services.job_queue_service import Worker
+
+    init_engine(settings.database_url, schema=settings.database_schema)
+    runner = Worker(
+        concurrency,
+        poll_interval=settings.worker_poll_interval,
+        heartbeat_interval=settings.worker_heartbeat_interval,
+        stale_after=settings.worker_stale_after,
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, runner.stop)
+    try:
+        await runner.run()
+    finally:
+        await dispose_engine()
@@ -1,8 +1,10 @@
 """Background task runner abstraction.
 
-Provides a protocol for submitting and tracking background tasks,
-with an in-process FastAPI BackgroundTasks implementation for MVP.
-Enables future swap to Celery/ARQ without service layer changes.
+API endpoints submit work as a registered task name plus a JSON payload
+(see ``services.job_tasks``). ``QueuedTaskRunner`` persists it to the
+Postgres job queue run by ``voter-api worker``; ``InProcessTaskRunner``
+runs it with ``asyncio`` inside the API process. ``TASK_BACKEND`` selects
+the implementation returned by :func:`get_task_runner`.
 """
 
 import asyncio
@@ -10,10 +12,13 @@ import enum
 import uuid
 import weakref
 from collections.abc import Coroutine
+from functools import lru_cache
 from typing import Any, Protocol
 
 from loguru import logger
 
+from voter_api.core.config import get_settings
+
 
 class JobStatus(enum.StrEnum):
     """Status of a background job."""
@@ -27,28 +32,18 @@ class JobStatus(enum.StrEnum):
 class BackgroundTaskRunner(Protocol):
     """Protocol for background task execution."""
 
-    def submit_task(self, coro: Coroutine[Any, Any, Any]) -> str:
-        """Submit an async task for background execution.
+    async def submit_job(self, task: str, payload: dict[str, Any]) -> str:
+        """Submit a registered task for background execution.
 
         Args:
-            coro: The coroutine to execute.
+            task: Task name registered in ``services.job_tasks``.
+            payload: JSON-serializable task arguments.
 
         Returns:
             A job ID string for tracking.
         """
         ...
 
-    def get_status(self, job_id: str) -> JobStatus:
-        """Get the current status of a background job.
-
-        Args:
-            job_id: The job ID returned by submit_task.
-
-        Returns:
-            The current job status.
-        """
-        ...
-
 
 class InProcessTaskRunner:
     """In-process background task runner using asyncio.
@@ -106,6 +101,23 @@ class InProcessTaskRunner:
         self._tasks[job_id] = task
         return job_id
 
+    async def submit_job(self, task: str, payload: dict[str, Any]) -> str:
+        """Run a registered task in this process.
+
+        Args:
+            task: Task name registered in ``services.job_tasks``.
+            payload: Task arguments.
+
+        Returns:
+            A job ID string for tracking.
+
+        Raises:
+            ValueError: If the task name is not registered.
+        """
+        from voter_api.services.job_tasks import get_job_task
+
+        return self.submit_task(get_job_task(task).run(payload))
+
     def get_status(self, job_id: str) -> JobStatus:
         """Get the current status of a background job.
 
@@ -121,5 +133,42 @@ class InProcessTaskRunner:
         return self._jobs[job_id]
 
 
-# Singleton instance for the application
+class QueuedTaskRunner:
+    """Persists tasks to the Postgres job queue for ``voter-api worker``.
+
+    Jobs survive API restarts and run outside the API's event loop; the
+    worker resumes interrupted jobs from their checkpoints.
+    """
+
+    async def submit_job(self, task: str, payload: dict[str, Any]) -> str:
+        """Enqueue a registered task.
+
+        Args:
+            task: Task name registered in ``services.job_tasks``.
+            payload: JSON-serializable task arguments.
+
+        Returns:
+            The queued ``background_jobs`` row ID.
+
+        Raises:
+            ValueError: If the task name is not registered.
+        """
+        from voter_api.core.database import get_session_factory
+        from voter_api.services.job_queue_service import enqueue_job
+
+        factory = get_session_factory()
+        async with factory() as session:
+            job = await enqueue_job(session, task, payload, max_attempts=get_settings().job_max_attempts)
+        return str(job.id)
+
+
+# Singleton instance for the in-process backend
 task_runner = InProcessTaskRunner()
+
+
+@lru_cache(maxsize=1)
+def get_task_runner() -> BackgroundTaskRunner:
+    """Return the task runner selected by ``TASK_BACKEND``."""
+    if get_settings().task_backend == "inprocess":
+        return task_runner
+    return QueuedTaskRunner()
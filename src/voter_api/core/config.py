@@ -4,7 +4,7 @@ All configuration is loaded from environment variables following 12-factor princ
 """
 
 import re
-from typing import Self
+from typing import Literal, Self
 
 from pydantic import Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -55,6 +55,30 @@ class Settings(BaseSettings):
         description="Refresh token expiration in days",
         gt=0,
     )
+    password_bcrypt_rounds: int = Field(
+        default=12,
+        description="bcrypt work factor for new password hashes; older hashes are upgraded at login",
+        ge=4,
+        le=31,
+    )
+    password_hash_workers: int = Field(
+        default=2,
+        description="Threads per process hashing passwords off the event loop",
+        gt=0,
+    )
+    password_hash_max_queue: int = Field(
+        default=32,
+        description="Password hashes allowed to wait for a thread before requests are rejected with 503",
+        ge=0,
+    )
+    auth_principal_cache_ttl_seconds: float = Field(
+        default=30.0,
+        description=(
+            "Seconds an authenticated user is cached per access token, skipping the per-request user "
+            "lookup (0 disables). Bounds how long other workers see a changed role or deactivation."
+        ),
+        ge=0,
+    )
 
     # Geocoding — general
     geocoder_batch_size: int = Field(
@@ -176,6 +200,86 @@ class Settings(BaseSettings):
         description="Records per import batch",
         gt=0,
     )
+    import_workers: int = Field(
+        default=0,
+        description="Worker processes preparing voter CSV chunks during seeding (0 = one per CPU)",
+        ge=0,
+    )
+    import_queue_depth: int = Field(
+        default=4,
+        description="Prepared voter chunks allowed in flight per file before the reader pauses",
+        gt=0,
+    )
+    results_stream_threshold_mb: int = Field(
+        default=64,
+        description="Election results files at least this large (MB) are parsed one county at a time (0 = always)",
+        ge=0,
+    )
+
+    # Background jobs
+    task_backend: Literal["queue", "inprocess"] = Field(
+        default="queue",
+        description=(
+            "Where imports, geocoding, analysis and exports run: 'queue' persists them for "
+            "`voter-api worker`, 'inprocess' runs them inside the API process"
+        ),
+    )
+    worker_concurrency: str = Field(
+        default="imports:1,geocoding:1,analysis:1,exports:2",
+        description="Comma-separated queue:concurrency pairs a worker serves",
+    )
+    worker_poll_interval: float = Field(
+        default=2.0,
+        description="Seconds an idle worker slot waits before polling its queue again",
+        gt=0,
+    )
+    worker_heartbeat_interval: float = Field(
+        default=15.0,
+        description="Seconds between heartbeats for a running job",
+        gt=0,
+    )
+    worker_stale_after: float = Field(
+        default=120.0,
+        description="Seconds without a heartbeat after which a running job is reclaimed and resumed",
+        gt=0,
+    )
+    job_max_attempts: int = Field(
+        default=3,
+        description="Times a job is started (including resumes after a worker dies) before it is failed",
+        ge=1,
+    )
+
+    @property
+    def worker_concurrency_map(self) -> dict[str, int]:
+        """Parse worker concurrency into a mapping of queue name to slot count.
+
+        Returns:
+            Queue names mapped to concurrency; queues with 0 slots are omitted.
+
+        Raises:
+            ValueError: If an entry is not ``queue:count`` with a non-negative count.
+        """
+        result: dict[str, int] = {}
+        for entry in self.worker_concurrency.split(","):
+            if not entry.strip():
+                continue
+            name, sep, count = entry.partition(":")
+            if not sep or not name.strip() or not count.strip().isdigit():
+                msg = f"Invalid worker concurrency entry: {entry.strip()!r} (expected queue:count)"
+                raise ValueError(msg)
+            if int(count) > 0:
+                result[name.strip()] = int(count)
+        return result
+
+    # Voter name lookup
+    name_search_min_token_length: int = Field(
+        default=2,
+        description=(
+            "Shortest name token that can drive a voter name lookup; shorter tokens (initials) "
+            "only narrow results alongside a longer one"
+        ),
+        ge=1,
+    )
 
     # Export
     export_dir: str = Field(
@@ -284,11 +388,60 @@ class Settings(BaseSettings):
         description="Maximum API requests per minute per IP address (0 to disable)",
         ge=0,
     )
+    rate_limit_backend: Literal["memory", "postgres"] = Field(
+        default="memory",
+        description=(
+            "Where rate limit buckets live: 'memory' limits each worker process on its own, "
+            "'postgres' shares the limit across workers and pods (one extra query per request, on its own small pool)"
+        ),
+    )
+    rate_limit_max_clients: int = Field(
+        default=100_000,
+        description="Client buckets kept in memory per worker; the least recently seen are evicted first",
+        gt=0,
+    )
+    rate_limit_pool_size: int = Field(
+        default=2,
+        description="Connections per worker in the postgres rate limit backend's own pool",
+        gt=0,
+    )
+    rate_limit_db_timeout_ms: int = Field(
+        default=250,
+        description=(
+            "Connect, pool wait and statement timeout for postgres rate limit hits; "
+            "slower hits fall back to per-worker limiting"
+        ),
+        gt=0,
+    )
     trusted_proxy_headers: str = Field(
         default="CF-Connecting-IP,X-Forwarded-For,X-Real-IP",
         description="Comma-separated list of HTTP headers to check for real client IP, in priority order",
     )
 
+    # Instrumentation
+    instrumentation_enabled: bool = Field(
+        default=True,
+        description="Collect per-request SQL timings (slow-query log, N+1 warnings, route histograms)",
+    )
+    server_timing_enabled: bool = Field(
+        default=False,
+        description="Add a Server-Timing header with per-request SQL counts and timings (needs instrumentation)",
+    )
+    slow_query_ms: int = Field(
+        default=500,
+        description="Log SQL statements slower than this many milliseconds (0 to disable)",
+        ge=0,
+    )
+    n_plus_one_threshold: int = Field(
+        default=25,
+        description="Warn when one normalized SQL statement runs this many times in a request (0 to disable)",
+        ge=0,
+    )
+    metrics_enabled: bool = Field(
+        default=False,
+        description="Expose Prometheus-format request metrics at GET {api_v1_prefix}/metrics",
+    )
+
     @property
     def trusted_proxy_header_list(self) -> list[str]:
         """Parse trusted proxy headers string into a list."""
@@ -35,12 +35,21 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
-def init_engine(database_url: str, *, schema: str | None = None, **kwargs: object) -> AsyncEngine:
+def init_engine(
+    database_url: str,
+    *,
+    schema: str | None = None,
+    slow_query_ms: int | None = None,
+    **kwargs: object,
+) -> AsyncEngine:
     """Create and store the async engine and session factory.
 
     Args:
         database_url: PostgreSQL async connection string.
         schema: Optional PostgreSQL schema for isolated environments.
+        slow_query_ms: When set, attach the per-request SQL instrumentation
+            hooks (see ``core.instrumentation``) and log statements slower
+            than this many milliseconds (0 disables only the slow-query log).
         **kwargs: Additional arguments passed to create_async_engine.
 
     Returns:
@@ -60,6 +69,10 @@ def init_engine(database_url: str, *, schema: str | None = None, **kwargs: objec
         kwargs.setdefault("pool_size", 20)
         kwargs.setdefault("max_overflow", 10)
     _engine = create_async_engine(database_url, **kwargs)
+    if slow_query_ms is not None:
+        from voter_api.core.instrumentation import instrument_engine
+
+        instrument_engine(_engine, slow_query_ms=slow_query_ms)
     _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
     return _engine
 
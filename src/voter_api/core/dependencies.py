@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from voter_api.core.config import Settings, get_settings
 from voter_api.core.database import get_session_factory
+from voter_api.core.principal_cache import principal_cache, token_issued_at
 from voter_api.core.security import decode_token
 from voter_api.core.sensitivity import SensitivityTier
 from voter_api.models.user import User
@@ -36,6 +37,10 @@ async def get_current_user(
 ) -> User:
     """Decode JWT and return the authenticated user.
 
+    The user is served from ``principal_cache`` when this token was seen
+    within ``AUTH_PRINCIPAL_CACHE_TTL_SECONDS``; the session is only used
+    (and a connection only checked out) on a miss.
+
     Args:
         token: The JWT bearer token.
         session: The database session.
@@ -60,10 +65,19 @@ async def get_current_user(
     except Exception as exc:
         raise credentials_exception from exc
 
+    ttl = settings.auth_principal_cache_ttl_seconds
+    issued_at = token_issued_at(payload)
+    if ttl > 0:
+        cached = principal_cache.get(username, issued_at)
+        if cached is not None:
+            return cached
+
     result = await session.execute(select(User).where(User.username == username))
     user = result.scalar_one_or_none()
     if user is None or not user.is_active:
         raise credentials_exception
+    if ttl > 0:
+        principal_cache.put(username, issued_at, user, ttl_seconds=ttl)
     return user
 
 
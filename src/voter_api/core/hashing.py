@@ -0,0 +1,133 @@
+"""Password hashing off the event loop.
+
+bcrypt takes 100-300 ms of CPU per hash or check; calling it directly in
+a request handler blocks every other request on the worker for that long.
+:class:`PasswordHasher` runs it on a small dedicated thread pool instead
+(bcrypt releases the GIL while hashing) and bounds the backlog: once
+``PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE`` hashes are in flight,
+further requests fail fast with :class:`PasswordHashingBusyError` (served
+as 503) rather than queueing for seconds behind a login burst.
+
+Queue wait and hashing time are recorded as histograms, rendered with the
+request metrics at ``GET /metrics``.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
+
+from voter_api.core.config import get_settings
+from voter_api.core.instrumentation import DURATION_BUCKETS, Histogram
+from voter_api.core.security import bcrypt_rounds, hash_password, verify_password
+
+
+class PasswordHashingBusyError(RuntimeError):
+    """Raised when the hashing pool's backlog is full."""
+
+
+class PasswordHasher:
+    """Bounded thread pool for bcrypt hashing and verification.
+
+    Args:
+        max_workers: Threads hashing concurrently.
+        max_queue: Hashes allowed to wait for a free thread.
+        rounds: bcrypt work factor for new hashes.
+    """
+
+    def __init__(self, *, max_workers: int, max_queue: int, rounds: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._rejected = 0
+        self._wait = Histogram(DURATION_BUCKETS)
+        self._duration = Histogram(DURATION_BUCKETS)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the configured work factor."""
+        return await self._run(hash_password, password, self.rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Check a password against a bcrypt hash."""
+        return await self._run(verify_password, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Return True if a hash uses a lower work factor than configured."""
+        return bcrypt_rounds(hashed_password) < self.rounds
+
+    async def _run[T](self, fn: Callable[..., T], *args: object) -> T:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                msg = "Too many password hashing requests in progress; retry shortly"
+                raise PasswordHashingBusyError(msg)
+            self._in_flight += 1
+        submitted = time.perf_counter()
+
+        def timed() -> T:
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self._wait.observe(started - submitted)
+                    self._duration.observe(finished - started)
+
+        future = self._executor.submit(timed)
+        # Release the slot when the thread finishes, not when the caller stops
+        # waiting: a cancelled request's hash still occupies a thread.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future: Future[Any]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def stats(self) -> dict[str, int]:
+        """Return in-flight, completed and rejected counts."""
+        with self._lock:
+            return {"in_flight": self._in_flight, "completed": self._duration.count, "rejected": self._rejected}
+
+    def render(self) -> str:
+        """Return the hashing metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for name, help_text, histogram in (
+                ("voter_api_password_hash_wait_seconds", "Time password hashes waited for a thread.", self._wait),
+                ("voter_api_password_hash_seconds", "Time spent in bcrypt per hash or check.", self._duration),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+                lines.append(f"{name}_sum {histogram.sum:.6f}")
+                lines.append(f"{name}_count {histogram.count}")
+            lines.append("# HELP voter_api_password_hash_in_flight Password hashes running or queued.")
+            lines.append("# TYPE voter_api_password_hash_in_flight gauge")
+            lines.append(f"voter_api_password_hash_in_flight {self._in_flight}")
+            lines.append("# HELP voter_api_password_hash_rejected_total Password hashes rejected by the backlog limit.")
+            lines.append("# TYPE voter_api_password_hash_rejected_total counter")
+            lines.append(f"voter_api_password_hash_rejected_total {self._rejected}")
+        return "\n".join(lines) + "\n"
+
+    def shutdown(self) -> None:
+        """Stop the pool after running hashes finish."""
+        self._executor.shutdown(wait=True)
+
+
+@lru_cache(maxsize=1)
+def get_password_hasher() -> PasswordHasher:
+    """Return the process-wide hasher configured from settings."""
+    settings = get_settings()
+    return PasswordHasher(
+        max_workers=settings.password_hash_workers,
+        max_queue=settings.password_hash_max_queue,
+        rounds=settings.password_bcrypt_rounds,
+    )
@@ -0,0 +1,265 @@
+"""Per-request SQL instrumentation and Prometheus-style request metrics.
+
+SQLAlchemy cursor events on the application engine time every statement
+and attribute it to the request being served through a context variable
+(set by ``QueryInstrumentationMiddleware``). The middleware records
+per-route histograms exposed in the Prometheus text format, warns when a
+single normalized statement repeats often enough to look like an N+1
+pattern, and can report the per-request totals in a ``Server-Timing``
+header.
+
+Statements slower than the configured threshold are logged with their
+literals and bind lists collapsed, so repeated slow queries group
+together in log search. Everything is process-local.
+"""
+
+import re
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Histogram upper bounds in seconds (request duration, per-request DB time).
+DURATION_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Histogram upper bounds for statements executed per request.
+QUERY_COUNT_BUCKETS: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 250, 500)
+
+_MAX_NORMALIZED_LENGTH = 2000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_BIND_RE = re.compile(r"\$\d+|%\(\w+\)s|(?<![:\w]):[A-Za-z_]\w*|\?")
+# A parenthesised list of placeholders, e.g. "(?, ?, ?)" from IN-lists and VALUES rows.
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_ROWS_RE = re.compile(r"(\(\?\.\.\.\))(?:\s*,\s*\(\?\.\.\.\))+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse a SQL statement to a shape shared by all its executions.
+
+    Literals and bind parameters become ``?``, placeholder lists become
+    ``(?...)``, repeated VALUES rows collapse to one, and whitespace is
+    squeezed, so ``WHERE id IN ($1, $2, $3)`` and ``WHERE id IN ($1)``
+    normalize to the same text.
+
+    Args:
+        statement: SQL text as sent to the driver.
+
+    Returns:
+        The normalized statement, truncated to a bounded length.
+    """
+    text = _STRING_LITERAL_RE.sub("?", statement)
+    text = _BIND_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _PLACEHOLDER_LIST_RE.sub("(?...)", text)
+    text = text.replace("(?)", "(?...)")
+    text = _VALUES_ROWS_RE.sub(r"\1", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    return text[:_MAX_NORMALIZED_LENGTH]
+
+
+@dataclass
+class RequestQueryStats:
+    """SQL activity attributed to one request (or any instrumented scope).
+
+    Attributes:
+        count: Statements executed.
+        total_seconds: Wall-clock time spent in the driver.
+        statements: Executions per normalized statement.
+    """
+
+    count: int = 0
+    total_seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        """Account one executed statement."""
+        self.count += 1
+        self.total_seconds += elapsed
+        self.statements[normalize_statement(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Return normalized statements executed at least ``threshold`` times."""
+        return [(stmt, n) for stmt, n in self.statements.most_common() if n >= threshold]
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar("voter_api_query_stats", default=None)
+
+
+def start_request_stats() -> tuple[RequestQueryStats, Any]:
+    """Begin collecting statements for the current context.
+
+    Returns:
+        The stats object and a token for :func:`stop_request_stats`.
+    """
+    stats = RequestQueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def stop_request_stats(token: Any) -> None:
+    """Stop collecting statements (restores the previous context value)."""
+    _current_stats.reset(token)
+
+
+def current_request_stats() -> RequestQueryStats | None:
+    """Return the stats object collecting for the current context, if any."""
+    return _current_stats.get()
+
+
+# Start time is kept on the per-statement execution context, so a statement
+# that fails before ``after_cursor_execute`` leaves nothing behind.
+_QUERY_START_ATTR = "_voter_api_query_start"
+
+_instrumented_engines: weakref.WeakSet[Engine] = weakref.WeakSet()
+
+
+def instrument_engine(engine: AsyncEngine, *, slow_query_ms: float) -> None:
+    """Attach timing hooks to an engine (idempotent).
+
+    Args:
+        engine: The async engine to instrument.
+        slow_query_ms: Statements slower than this are logged as warnings
+            (0 disables the slow-query log).
+    """
+    sync_engine = engine.sync_engine
+    if sync_engine in _instrumented_engines:
+        return
+    slow_seconds = slow_query_ms / 1000 if slow_query_ms > 0 else None
+
+    def after_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        start = getattr(context, _QUERY_START_ATTR, None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+
+        if slow_seconds is not None and elapsed >= slow_seconds:
+            logger.bind(slow_query=True).warning(
+                "Slow query ({:.1f} ms): {}",
+                elapsed * 1000,
+                normalize_statement(statement),
+            )
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+    _instrumented_engines.add(sync_engine)
+
+
+def _before_cursor_execute(
+    conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    setattr(context, _QUERY_START_ATTR, time.perf_counter())
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus exposition model.
+
+    Args:
+        buckets: Sorted finite upper bounds; ``+Inf`` is implicit.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return (``le`` label, cumulative count) pairs including ``+Inf``."""
+        total = 0
+        result = []
+        for bound, n in zip((*(_format_bound(b) for b in self.buckets), "+Inf"), self.counts, strict=True):
+            total += n
+            result.append((bound, total))
+        return result
+
+
+def _format_bound(value: float) -> str:
+    return f"{value:g}"
+
+
+_HISTOGRAMS: dict[str, tuple[str, tuple[float, ...]]] = {
+    "voter_api_request_duration_seconds": ("HTTP request duration by route.", DURATION_BUCKETS),
+    "voter_api_request_db_seconds": ("Time spent executing SQL per request, by route.", DURATION_BUCKETS),
+    "voter_api_request_db_queries": ("SQL statements executed per request, by route.", QUERY_COUNT_BUCKETS),
+}
+
+
+class RequestMetrics:
+    """Per-route request histograms, rendered in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._series: dict[str, dict[tuple[str, str, str], Histogram]] = {name: {} for name in _HISTOGRAMS}
+
+    def observe_request(
+        self,
+        *,
+        method: str,
+        route: str,
+        status: int,
+        duration_seconds: float,
+        stats: RequestQueryStats,
+    ) -> None:
+        """Record one finished request."""
+        labels = (method, route, str(status))
+        values = {
+            "voter_api_request_duration_seconds": duration_seconds,
+            "voter_api_request_db_seconds": stats.total_seconds,
+            "voter_api_request_db_queries": float(stats.count),
+        }
+        with self._lock:
+            for name, value in values.items():
+                series = self._series[name]
+                histogram = series.get(labels)
+                if histogram is None:
+                    histogram = series[labels] = Histogram(_HISTOGRAMS[name][1])
+                histogram.observe(value)
+
+    def render(self) -> str:
+        """Return all series in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for name, (help_text, _) in _HISTOGRAMS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (method, route, status), histogram in sorted(self._series[name].items()):
+                    base = f'method="{method}",route="{_escape_label(route)}",status="{status}"'
+                    for bound, count in histogram.cumulative():
+                        lines.append(f'{name}_bucket{{{base},le="{bound}"}} {count}')
+                    lines.append(f"{name}_sum{{{base}}} {histogram.sum:.6f}")
+                    lines.append(f"{name}_count{{{base}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop every recorded series."""
+        with self._lock:
+            for series in self._series.values():
+                series.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+request_metrics = RequestMetrics()
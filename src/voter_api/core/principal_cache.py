@@ -0,0 +1,77 @@
+"""Short-lived cache of authenticated principals.
+
+``get_current_user`` used to load the user row on every authenticated
+request. This cache keeps a snapshot of the user's columns keyed by the
+token's ``(sub, iat)``, so repeat requests with the same access token skip
+the query. Entries live for ``AUTH_PRINCIPAL_CACHE_TTL_SECONDS`` at most;
+``auth_service`` invalidates a user's entries when their role, active flag
+or password changes, or when the account is deleted. The cache is
+process-local, so in a multi-worker deployment the TTL bounds how long
+another worker may keep serving a changed account.
+
+Each hit builds a fresh detached ``User`` from the snapshot: no ORM
+instance is shared between requests or sessions, and a request can still
+attach its user to its own session as before.
+"""
+
+from typing import Any
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from voter_api.core.cache import LRUCache
+from voter_api.models.user import User
+
+_MAX_ENTRIES = 4096
+
+type _PrincipalKey = tuple[str, int | None]
+
+
+class PrincipalCache:
+    """LRU cache of user column snapshots keyed by (username, token issued-at).
+
+    Args:
+        max_entries: Maximum number of cached principals.
+    """
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES) -> None:
+        self._cache: LRUCache[_PrincipalKey, dict[str, Any]] = LRUCache(max_entries=max_entries)
+
+    def get(self, username: str, issued_at: int | None) -> User | None:
+        """Return a detached copy of the cached user, or None on a miss."""
+        snapshot = self._cache.get((username, issued_at))
+        if snapshot is None:
+            return None
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return user
+
+    def put(self, username: str, issued_at: int | None, user: User, *, ttl_seconds: float) -> None:
+        """Cache a snapshot of ``user``'s column values for ``ttl_seconds``."""
+        snapshot = {attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs}
+        self._cache.set((username, issued_at), snapshot, ttl_seconds=ttl_seconds)
+
+    def invalidate(self, username: str) -> int:
+        """Drop every cached token of a user.
+
+        Returns:
+            Number of entries removed.
+        """
+        return self._cache.invalidate_where(lambda k: k[0] == username)
+
+    def clear(self) -> None:
+        """Drop all cached principals."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count and hit/miss counters."""
+        return self._cache.stats()
+
+
+def token_issued_at(payload: dict[str, Any]) -> int | None:
+    """Return a decoded token's ``iat`` as epoch seconds (None if absent)."""
+    issued_at = payload.get("iat")
+    return int(issued_at) if isinstance(issued_at, int | float) else None
+
+
+# Singleton instance for the application
+principal_cache = PrincipalCache()
@@ -0,0 +1,227 @@
+"""Token-bucket rate limiting backends for ``RateLimitMiddleware``.
+
+Each client gets a bucket of ``limit`` tokens that refills at ``limit``
+tokens per minute; a request spends one token and is rejected when less
+than one is left. A bucket stores only its level and when it was last
+updated (the refill since then is computed on the next hit), so a hit
+costs O(1) whatever the limit.
+
+``RATE_LIMIT_BACKEND`` selects where buckets live:
+
+* ``memory`` (:class:`MemoryRateLimitBackend`): a bounded LRU in the
+  worker process. A bucket idle for a minute is full again, so entries
+  expire after a minute and the least recently seen clients are evicted
+  when ``RATE_LIMIT_MAX_CLIENTS`` is reached, without changing any limit.
+  Limits are per worker process.
+* ``postgres`` (:class:`PostgresRateLimitBackend`): the ``UNLOGGED``
+  ``rate_limit_buckets`` table, updated by one atomic UPSERT per request,
+  so limits hold across uvicorn workers and pods. Hits use a small
+  dedicated engine (:func:`init_rate_limit_engine`) with a short statement
+  and pool timeout, so they never wait on the application pool and are
+  not counted in the per-request SQL instrumentation. While the database
+  is slow or unreachable it falls back to a per-process memory backend
+  rather than failing or waving through requests.
+"""
+
+from typing import Protocol
+
+from loguru import logger
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.sql.dml import ReturningInsert
+
+from voter_api.core.cache import LRUCache
+from voter_api.core.config import Settings
+from voter_api.models.rate_limit_bucket import RateLimitBucket
+
+# Refill period: a bucket of ``limit`` tokens refills completely in this time.
+_WINDOW_SECONDS = 60.0
+
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def init_rate_limit_engine(
+    database_url: str,
+    *,
+    schema: str | None = None,
+    pool_size: int = 2,
+    timeout_ms: int = 250,
+) -> AsyncEngine:
+    """Create and store the engine used by :class:`PostgresRateLimitBackend`.
+
+    The engine is separate from the application engine: a hit never waits
+    behind request queries for a pooled connection, and the engine carries
+    no instrumentation hooks. ``timeout_ms`` bounds connecting, waiting for
+    a pooled connection and each statement, after which the hit falls back
+    to the memory backend.
+
+    Args:
+        database_url: PostgreSQL async connection string.
+        schema: Optional PostgreSQL schema for isolated environments.
+        pool_size: Connections kept for rate limiting (no overflow).
+        timeout_ms: Connect, pool acquire and statement timeout.
+
+    Returns:
+        The created async engine.
+    """
+    global _engine, _session_factory  # noqa: PLW0603
+    server_settings = {"statement_timeout": str(timeout_ms)}
+    if schema is not None:
+        server_settings["search_path"] = f"{schema},public"
+    _engine = create_async_engine(
+        database_url,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=timeout_ms / 1000,
+        connect_args={"timeout": timeout_ms / 1000, "server_settings": server_settings},
+    )
+    _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
+    return _engine
+
+
+def get_rate_limit_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the rate limiter's session factory.
+
+    Raises:
+        RuntimeError: If the rate limit engine has not been initialized.
+    """
+    if _session_factory is None:
+        msg = "Rate limit engine not initialized. Call init_rate_limit_engine() first."
+        raise RuntimeError(msg)
+    return _session_factory
+
+
+async def dispose_rate_limit_engine() -> None:
+    """Dispose of the rate limit engine and release its connections."""
+    global _engine, _session_factory  # noqa: PLW0603
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+        _session_factory = None
+
+
+class RateLimitBackend(Protocol):
+    """Protocol for rate limit bucket storage."""
+
+    async def hit(self, key: str, limit: int, now: float) -> bool:
+        """Spend one token from ``key``'s bucket.
+
+        Args:
+            key: Client identifier (e.g. IP address).
+            limit: Bucket capacity, refilled in full every minute.
+            now: Current wall-clock time in epoch seconds.
+
+        Returns:
+            True if the request is allowed, False if the bucket is empty.
+        """
+        ...
+
+
+class MemoryRateLimitBackend:
+    """Process-local token buckets in a bounded LRU.
+
+    Hits run on the event loop thread, so the read-modify-write of a
+    bucket is never interleaved with another hit.
+
+    Args:
+        max_clients: Maximum number of buckets kept; the least recently
+            seen client is evicted first.
+    """
+
+    def __init__(self, max_clients: int = 100_000) -> None:
+        self._buckets: LRUCache[str, tuple[float, float]] = LRUCache(
+            max_entries=max_clients, ttl_seconds=_WINDOW_SECONDS
+        )
+
+    async def hit(self, key: str, limit: int, now: float) -> bool:
+        """Spend one token from ``key``'s bucket (see :class:`RateLimitBackend`)."""
+        return self.take(key, limit, now)
+
+    def take(self, key: str, limit: int, now: float) -> bool:
+        """Synchronous :meth:`hit`."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = float(limit)
+        else:
+            level, updated_at = bucket
+            tokens = min(float(limit), level + max(0.0, now - updated_at) * limit / _WINDOW_SECONDS)
+        if tokens < 1:
+            return False
+        self._buckets.set(key, (tokens - 1, now))
+        return True
+
+    def stats(self) -> dict[str, int]:
+        """Return bucket count and LRU counters."""
+        return self._buckets.stats()
+
+
+def _take_token_statement(key: str, limit: int, now: float) -> ReturningInsert[tuple[float]]:
+    """Build the UPSERT that spends one token from a shared bucket.
+
+    A new client's bucket is inserted with one token spent. An existing
+    bucket is refilled for the time since its last update and spent only
+    if at least one token is available; otherwise the conflict update is
+    skipped and the statement returns no row.
+    """
+    capacity = float(limit)
+    refilled = func.least(
+        capacity,
+        RateLimitBucket.tokens + func.greatest(0.0, now - RateLimitBucket.updated_at) * (capacity / _WINDOW_SECONDS),
+    )
+    stmt = pg_insert(RateLimitBucket).values(key=key, tokens=capacity - 1, updated_at=now)
+    return stmt.on_conflict_do_update(
+        index_elements=[RateLimitBucket.key],
+        # Never move updated_at backwards when pods' clocks disagree slightly.
+        set_={"tokens": refilled - 1.0, "updated_at": func.greatest(RateLimitBucket.updated_at, now)},
+        where=refilled >= 1.0,
+    ).returning(RateLimitBucket.tokens)
+
+
+class PostgresRateLimitBackend:
+    """Token buckets shared through the ``rate_limit_buckets`` table.
+
+    Buckets idle for a minute are full and are deleted at most once a
+    minute per process. Hits run on the engine from
+    :func:`init_rate_limit_engine`; until it is initialized they use the
+    fallback.
+
+    Args:
+        fallback: Backend used while the database is unreachable.
+    """
+
+    def __init__(self, fallback: MemoryRateLimitBackend | None = None) -> None:
+        self.fallback = fallback if fallback is not None else MemoryRateLimitBackend()
+        self._last_purge = 0.0
+        self._degraded = False
+
+    async def hit(self, key: str, limit: int, now: float) -> bool:
+        """Spend one token from ``key``'s shared bucket (see :class:`RateLimitBackend`)."""
+        try:
+            async with get_rate_limit_session_factory()() as session:
+                allowed = (await session.execute(_take_token_statement(key, limit, now))).first() is not None
+                if now - self._last_purge >= _WINDOW_SECONDS:
+                    self._last_purge = now
+                    await session.execute(
+                        delete(RateLimitBucket).where(RateLimitBucket.updated_at < now - _WINDOW_SECONDS)
+                    )
+                await session.commit()
+        except (SQLAlchemyError, OSError, RuntimeError) as exc:
+            if not self._degraded:
+                self._degraded = True
+                logger.warning("Shared rate limiting unavailable, limiting per process: {}", exc)
+            return self.fallback.take(key, limit, now)
+        if self._degraded:
+            self._degraded = False
+            logger.info("Shared rate limiting restored")
+        return allowed
+
+
+def create_rate_limit_backend(settings: Settings) -> RateLimitBackend:
+    """Return the rate limit backend selected by ``RATE_LIMIT_BACKEND``."""
+    memory = MemoryRateLimitBackend(max_clients=settings.rate_limit_max_clients)
+    if settings.rate_limit_backend == "postgres":
+        return PostgresRateLimitBackend(fallback=memory)
+    return memory
@@ -10,16 +10,21 @@ import bcrypt
 import jwt
 
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, rounds: int = 12) -> str:
     """Hash a plaintext password using bcrypt.
 
+    Blocks for the duration of the hash; async code should use
+    ``core.hashing.get_password_hasher()`` instead.
+
     Args:
         password: The plaintext password to hash.
+        rounds: bcrypt work factor (log2 of the iteration count); callers
+            with settings pass ``settings.password_bcrypt_rounds``.
 
     Returns:
         The bcrypt-hashed password string.
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds)
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
@@ -36,6 +41,21 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
 
 
+def bcrypt_rounds(hashed_password: str) -> int:
+    """Return the work factor of a bcrypt hash (``$2b$<rounds>$...``).
+
+    Args:
+        hashed_password: A bcrypt hash.
+
+    Returns:
+        The hash's rounds, or 0 if the string is not a bcrypt hash.
+    """
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return 0
+    return int(parts[2])
+
+
 def create_access_token(
     subject: str,
     role: str,
@@ -55,11 +75,12 @@ def create_access_token(
     Returns:
         The encoded JWT string.
     """
-    expire = datetime.now(UTC) + timedelta(minutes=expires_minutes)
+    now = datetime.now(UTC)
     payload = {
         "sub": subject,
         "role": role,
-        "exp": expire,
+        "iat": now,
+        "exp": now + timedelta(minutes=expires_minutes),
         "type": "access",
     }
     return jwt.encode(payload, secret_key, algorithm=algorithm)
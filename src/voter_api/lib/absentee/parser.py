@@ -162,19 +162,16 @@ def _process_chunk(chunk: pd.DataFrame) -> list[dict]:
         List of parsed record dicts with ``_parse_error`` key.
     """
     records: list[dict] = []
-
-    for _, row in chunk.iterrows():
-        record: dict = {}
+    # Reindexing once supplies missing columns as None, so rows can be read
+    # as plain tuples instead of building a Series per row.
+    fields = sorted(_MAPPED_FIELDS)
+    values = chunk.reindex(columns=fields).astype(object)
+    values = values.where(values.notna(), None)
+
+    for row in values.itertuples(index=False, name=None):
+        record: dict = dict(zip(fields, row, strict=True))
         parse_error: str | None = None
 
-        # Copy all mapped fields, converting NaN to None
-        for field in _MAPPED_FIELDS:
-            if field in row.index:
-                val = row[field]
-                record[field] = None if pd.isna(val) else val
-            else:
-                record[field] = None
-
         # Required field validation
         for field in _REQUIRED_FIELDS:
             if record.get(field) is None:
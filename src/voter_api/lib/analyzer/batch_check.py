@@ -16,6 +16,7 @@ from voter_api.lib.analyzer.comparator import (
     extract_registered_boundaries,
 )
 from voter_api.lib.analyzer.spatial import find_boundaries_for_point
+from voter_api.lib.normalize import normalize_district_identifier
 from voter_api.models.boundary import Boundary
 from voter_api.models.geocoded_location import GeocodedLocation
 from voter_api.models.voter import Voter
@@ -204,28 +205,25 @@ async def check_batch_boundaries(
         )
 
     # Normalize voter identifiers to match boundary DB storage format:
-    #   Numeric types: voter stores '8', DB stores '008' → zero-pad to 3 digits
+    #   Numeric types: voter stores '8', DB stores '008' → compare canonical keys ('8')
     #   Precinct types: voter stores 'HO7', DB stores '021HO7' → suffix-match
-    numeric_pairs: list[tuple[str, str]] = []
+    numeric_pairs: list[tuple[str, str | None]] = []
+    exact_pairs: list[tuple[str, str]] = []
     precinct_pairs: list[tuple[str, str]] = []
 
     for btype, bident in registered.items():
         if btype in NUMERIC_DISTRICT_TYPES:
-            try:
-                n = int(bident)
-                # Try all common storage widths so we match regardless of zero-padding in DB
-                for candidate in {str(n), str(n).zfill(2), str(n).zfill(3)}:
-                    numeric_pairs.append((btype, candidate))
-            except ValueError:
-                numeric_pairs.append((btype, bident))
+            numeric_pairs.append((btype, normalize_district_identifier(bident)))
         elif btype in PRECINCT_TYPES:
             precinct_pairs.append((btype, bident))
         else:
-            numeric_pairs.append((btype, bident))
+            exact_pairs.append((btype, bident))
 
     conditions: list[ColumnElement[bool]] = []
     if numeric_pairs:
-        conditions.append(tuple_(Boundary.boundary_type, Boundary.boundary_identifier).in_(numeric_pairs))
+        conditions.append(tuple_(Boundary.boundary_type, Boundary.boundary_identifier_key).in_(numeric_pairs))
+    if exact_pairs:
+        conditions.append(tuple_(Boundary.boundary_type, Boundary.boundary_identifier).in_(exact_pairs))
     for btype, bident in precinct_pairs:
         precinct_cond: ColumnElement[bool] = and_(
             Boundary.boundary_type == btype,
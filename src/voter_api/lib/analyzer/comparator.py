@@ -5,9 +5,9 @@ spatially-determined values per boundary type, and classifies
 the overall match status.
 """
 
-import contextlib
 from dataclasses import dataclass, field
 
+from voter_api.lib.normalize import normalize_district_identifier
 from voter_api.models.voter import Voter
 
 # Mapping from boundary_type values in boundaries table to voter model fields
@@ -89,13 +89,9 @@ def normalize_for_comparison(boundary_type: str, determined: str, registered: st
     det = determined.strip()
     reg = registered.strip()
 
-    # For numeric district types, normalize by stripping leading zeros
+    # For numeric district types, compare canonical keys (leading zeros stripped)
     if boundary_type in NUMERIC_DISTRICT_TYPES:
-        with contextlib.suppress(ValueError):
-            det = str(int(det))
-        with contextlib.suppress(ValueError):
-            reg = str(int(reg))
-        return det, reg
+        return normalize_district_identifier(det) or det, normalize_district_identifier(reg) or reg
 
     # For precinct types, strip 3-digit county FIPS prefix from determined value
     # if the suffix matches the registered value
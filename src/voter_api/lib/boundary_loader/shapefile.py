@@ -58,26 +58,29 @@ def read_shapefile(file_path: Path) -> list[BoundaryData]:
         logger.debug(f"Transforming CRS from {gdf.crs} to EPSG:4326")
         gdf = gdf.to_crs(epsg=4326)
 
-    boundaries: list[BoundaryData] = []
-
-    for _, row in gdf.iterrows():
-        geom = row.geometry
-        if geom is None or not hasattr(geom, "geom_type"):
-            continue
+    # Geometry filtering and Polygon -> MultiPolygon promotion operate on the
+    # whole GeoSeries; attribute rows come from a single to_dict() instead of
+    # building a pandas Series per row with iterrows().
+    gdf = gdf[gdf.geometry.notna()]
+    geom_types = gdf.geom_type
+    unsupported = ~geom_types.isin(["Polygon", "MultiPolygon"])
+    for geom_type in geom_types[unsupported]:
+        logger.warning(f"Skipping unsupported geometry type: {geom_type}")
+    gdf = gdf[~unsupported]
+    geometries = [MultiPolygon([geom]) if isinstance(geom, Polygon) else geom for geom in gdf.geometry]
+
+    attribute_columns = [col for col in gdf.columns if col != gdf.geometry.name]
+    records = gdf[attribute_columns].to_dict(orient="records")
 
-        # Convert to MultiPolygon if needed
-        if isinstance(geom, Polygon):
-            geom = MultiPolygon([geom])
-        elif not isinstance(geom, MultiPolygon):
-            logger.warning(f"Skipping unsupported geometry type: {geom.geom_type}")
-            continue
+    boundaries: list[BoundaryData] = []
 
+    for geom, record in zip(geometries, records, strict=True):
         # Extract properties (all non-geometry columns)
-        props = {col: _serialize_value(row[col]) for col in gdf.columns if col != "geometry" and row[col] is not None}
+        props = {col: _serialize_value(val) for col, val in record.items() if val is not None}
 
         # Try to find name and identifier from common column patterns
-        name = _extract_field(row, ["NAME", "Name", "name", "NAMELSAD", "DISTRICT"])
-        identifier = _extract_field(row, ["GEOID", "DISTRICT", "DISTRICTID", "ID", "PREC_ID", "PRECINCT"])
+        name = _extract_field(record, ["NAME", "Name", "name", "NAMELSAD", "DISTRICT"])
+        identifier = _extract_field(record, ["GEOID", "DISTRICT", "DISTRICTID", "ID", "PREC_ID", "PRECINCT"])
 
         # Skip rows with no usable identifier (e.g., statewide remainder polygons)
         if identifier is None:
@@ -87,14 +90,14 @@ def read_shapefile(file_path: Path) -> list[BoundaryData]:
         # Skip remainder polygons: if a district-type column exists but is
         # NaN/empty for this row, the row is a remainder polygon even if a
         # generic fallback like "ID" produced an identifier.
-        if _is_remainder_polygon(row, gdf.columns):
+        if _is_remainder_polygon(record, attribute_columns):
             logger.warning(f"Skipping remainder polygon (district column is NaN, fallback ID={identifier})")
             continue
 
         boundaries.append(
             BoundaryData(
                 name=name or f"Boundary {len(boundaries) + 1}",
-                boundary_identifier=identifier or str(len(boundaries) + 1),
+                boundary_identifier=identifier,
                 geometry=geom,
                 properties=props,
             )
@@ -113,8 +116,8 @@ def _is_remainder_polygon(row: object, columns: Any) -> bool:
     pass the null-identifier check.
 
     Args:
-        row: A GeoDataFrame row.
-        columns: The column index of the GeoDataFrame.
+        row: A GeoDataFrame row or attribute record dict.
+        columns: The attribute column names of the GeoDataFrame.
 
     Returns:
         True if the row appears to be a remainder polygon.
@@ -4,7 +4,12 @@ Public API for fetching the remote seed manifest and downloading
 data files with checksum verification and skip-if-cached support.
 """
 
-from voter_api.lib.data_loader.downloader import download_file, resolve_download_path
+from voter_api.lib.data_loader.downloader import (
+    create_download_client,
+    download_file,
+    download_files,
+    resolve_download_path,
+)
 from voter_api.lib.data_loader.election_seeder import fetch_elections_from_api
 from voter_api.lib.data_loader.manifest import fetch_manifest
 from voter_api.lib.data_loader.types import (
@@ -21,7 +26,9 @@ __all__ = [
     "FileCategory",
     "SeedManifest",
     "SeedResult",
+    "create_download_client",
     "download_file",
+    "download_files",
     "fetch_elections_from_api",
     "fetch_manifest",
     "resolve_download_path",
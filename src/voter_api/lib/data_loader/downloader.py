@@ -2,16 +2,26 @@
 
 Downloads data files from the Data Root URL with streaming, SHA512
 checksum verification, atomic writes, and tqdm progress bars.
+
+Verified digests are recorded in a ``<file>.sha512`` sidecar keyed by the
+file's size and mtime, so re-runs trust unchanged cached files without
+re-hashing them. Hashing of cached files runs in worker threads, and
+:func:`download_files` fetches many files concurrently over one shared
+connection pool.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import hashlib
+import json
 from typing import TYPE_CHECKING
 
 import httpx
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
     from pathlib import Path
 from loguru import logger
 from tqdm import tqdm
@@ -38,6 +48,13 @@ def resolve_download_path(entry: DataFileEntry, data_dir: Path) -> Path:
     return data_dir / entry.filename
 
 
+# Read/stream in large blocks: hashlib releases the GIL for buffers this size,
+# so several files can be hashed in parallel threads.
+_CHUNK_SIZE = 1024 * 1024
+
+_DEFAULT_TIMEOUT = 300.0
+
+
 def _compute_sha512(path: Path) -> str:
     """Compute SHA512 hex digest of a local file using streaming reads.
 
@@ -49,14 +66,52 @@ def _compute_sha512(path: Path) -> str:
     """
     h = hashlib.sha512()
     with path.open("rb") as f:
-        while chunk := f.read(8192):
+        while chunk := f.read(_CHUNK_SIZE):
             h.update(chunk)
     return h.hexdigest()
 
 
+def _sidecar_path(path: Path) -> Path:
+    """Return the path of the digest sidecar for ``path``."""
+    return path.with_name(path.name + ".sha512")
+
+
+def _read_sidecar(path: Path) -> str | None:
+    """Return the recorded digest for ``path`` if the sidecar is still valid.
+
+    The sidecar is only trusted when the file's current size and
+    nanosecond mtime match the values recorded alongside the digest.
+    """
+    try:
+        record = json.loads(_sidecar_path(path).read_text())
+        stat = path.stat()
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    if record.get("size") != stat.st_size or record.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+    digest = record.get("sha512")
+    return digest if isinstance(digest, str) else None
+
+
+def _write_sidecar(path: Path, digest: str) -> None:
+    """Record ``digest`` for the current size/mtime of ``path`` (best effort)."""
+    try:
+        stat = path.stat()
+        _sidecar_path(path).write_text(
+            json.dumps({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha512": digest})
+        )
+    except OSError as exc:
+        logger.warning("Could not write checksum sidecar for {}: {}", path.name, exc)
+
+
 def _is_cached(dest: Path, expected_sha512: str) -> bool:
     """Check if a local file exists and matches the expected checksum.
 
+    Uses the digest sidecar when it is still valid for the file; otherwise
+    hashes the file and refreshes the sidecar.
+
     Args:
         dest: Local file path.
         expected_sha512: Expected SHA512 hex digest.
@@ -66,7 +121,10 @@ def _is_cached(dest: Path, expected_sha512: str) -> bool:
     """
     if not dest.exists():
         return False
-    actual = _compute_sha512(dest)
+    actual = _read_sidecar(dest)
+    if actual is None:
+        actual = _compute_sha512(dest)
+        _write_sidecar(dest, actual)
     return actual == expected_sha512
 
 
@@ -78,6 +136,7 @@ async def download_file(
     *,
     skip_checksum: bool = False,
     entry: DataFileEntry | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> DownloadResult:
     """Download a single file with checksum verification and atomic writes.
 
@@ -93,6 +152,8 @@ async def download_file(
         skip_checksum: If True, skip checksum verification.
         entry: Optional manifest entry to attach to the result. If not
             provided, a synthetic entry with ``category=REFERENCE`` is created.
+        client: Optional shared HTTP client. When omitted a client is
+            created for this download only.
 
     Returns:
         A DownloadResult indicating success or failure.
@@ -106,8 +167,8 @@ async def download_file(
         )
     result = DownloadResult(entry=entry)
 
-    # Skip if cached
-    if not skip_checksum and _is_cached(dest, expected_sha512):
+    # Skip if cached (hashing runs off the event loop)
+    if not skip_checksum and dest.exists() and await asyncio.to_thread(_is_cached, dest, expected_sha512):
         logger.info("Cached (checksum match): {}", dest.name)
         result.downloaded = False
         result.verified = True
@@ -128,24 +189,23 @@ async def download_file(
 
     try:
         h = hashlib.sha512()
-        async with httpx.AsyncClient(timeout=300.0, follow_redirects=True) as client:  # noqa: SIM117
-            async with client.stream("GET", url) as response:
-                response.raise_for_status()
-
-                with (
-                    part_path.open("wb") as f,
-                    tqdm(
-                        total=size_bytes,
-                        unit="B",
-                        unit_scale=True,
-                        desc=dest.name,
-                        leave=True,
-                    ) as pbar,
-                ):
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                        h.update(chunk)
-                        pbar.update(len(chunk))
+        async with _client_scope(client) as http, http.stream("GET", url) as response:
+            response.raise_for_status()
+
+            with (
+                part_path.open("wb") as f,
+                tqdm(
+                    total=size_bytes,
+                    unit="B",
+                    unit_scale=True,
+                    desc=dest.name,
+                    leave=True,
+                ) as pbar,
+            ):
+                async for chunk in response.aiter_bytes(chunk_size=_CHUNK_SIZE):
+                    f.write(chunk)
+                    h.update(chunk)
+                    pbar.update(len(chunk))
 
         # Verify checksum
         if not skip_checksum:
@@ -160,6 +220,7 @@ async def download_file(
 
         # Atomic rename
         part_path.rename(dest)
+        _write_sidecar(dest, h.hexdigest())
         result.downloaded = True
         result.verified = True
         result.local_path = dest
@@ -176,3 +237,96 @@ async def download_file(
         logger.error(result.error)
 
     return result
+
+
+def _client_scope(client: httpx.AsyncClient | None) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
+    """Use ``client`` as-is, or open (and later close) a one-off client."""
+    if client is not None:
+        return contextlib.nullcontext(client)
+    return httpx.AsyncClient(timeout=_DEFAULT_TIMEOUT, follow_redirects=True)
+
+
+def create_download_client(max_connections: int = 4) -> httpx.AsyncClient:
+    """Create an HTTP client whose connection pool is sized for parallel downloads.
+
+    Args:
+        max_connections: Maximum simultaneous connections to the data host.
+
+    Returns:
+        An unopened ``httpx.AsyncClient``; use it as an async context manager.
+    """
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    return httpx.AsyncClient(timeout=_DEFAULT_TIMEOUT, follow_redirects=True, limits=limits)
+
+
+async def download_files(
+    jobs: Sequence[tuple[DataFileEntry, str, Path]],
+    *,
+    max_concurrency: int = 4,
+    skip_checksum: bool = False,
+    stop_on_error: bool = False,
+    client: httpx.AsyncClient | None = None,
+) -> AsyncIterator[DownloadResult]:
+    """Download many files concurrently, yielding results as they finish.
+
+    Downloads start in ``jobs`` order, at most ``max_concurrency`` at a time,
+    over one shared connection pool (``client`` or a pool created here).
+
+    Args:
+        jobs: ``(entry, url, dest)`` tuples to download.
+        max_concurrency: Maximum number of downloads in flight.
+        skip_checksum: If True, skip checksum verification.
+        stop_on_error: If True, stop after the first failed download;
+            downloads that have not started yet are cancelled.
+        client: Optional shared HTTP client.
+
+    Yields:
+        One DownloadResult per job in completion order (fewer when
+        ``stop_on_error`` stops early).
+    """
+    if max_concurrency < 1:
+        msg = "max_concurrency must be at least 1"
+        raise ValueError(msg)
+    if not jobs:
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    stopped = False
+
+    async def _one(http: httpx.AsyncClient, entry: DataFileEntry, url: str, dest: Path) -> DownloadResult | None:
+        nonlocal stopped
+        async with semaphore:
+            # Checked under the semaphore so nothing new starts once a
+            # failure has been seen in stop_on_error mode.
+            if stopped:
+                return None
+            result = await download_file(
+                url=url,
+                dest=dest,
+                expected_sha512=entry.sha512,
+                size_bytes=entry.size_bytes,
+                skip_checksum=skip_checksum,
+                entry=entry,
+                client=http,
+            )
+            if stop_on_error and not result.success:
+                stopped = True
+            return result
+
+    owned = client is None
+    http = client if client is not None else create_download_client(max_concurrency)
+    tasks = [asyncio.create_task(_one(http, entry, url, dest)) for entry, url, dest in jobs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result is None:
+                continue
+            yield result
+            if stop_on_error and not result.success:
+                return
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if owned:
+            await http.aclose()
@@ -14,11 +14,13 @@ from loguru import logger
 from voter_api.lib.data_loader.types import DataFileEntry, FileCategory, SeedManifest
 
 
-async def fetch_manifest(data_root_url: str) -> SeedManifest:
+async def fetch_manifest(data_root_url: str, *, client: httpx.AsyncClient | None = None) -> SeedManifest:
     """Fetch and parse the remote manifest.json.
 
     Args:
         data_root_url: Base URL ending with ``/`` (e.g. ``https://data.hatchtech.dev/``).
+        client: Optional shared HTTP client (e.g. the seed download pool).
+            When omitted a short-lived client is created.
 
     Returns:
         A validated SeedManifest with all file entries.
@@ -31,9 +33,12 @@ async def fetch_manifest(data_root_url: str) -> SeedManifest:
     url = f"{data_root_url.rstrip('/')}/manifest.json"
     logger.info("Fetching manifest from {}", url)
 
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        response = await client.get(url)
-        response.raise_for_status()
+    if client is not None:
+        response = await client.get(url, timeout=30.0)
+    else:
+        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as own_client:
+            response = await own_client.get(url)
+    response.raise_for_status()
 
     data = response.json()
 
@@ -4,6 +4,8 @@ Public API:
     - parse_sos_feed: Parse raw JSON into validated SoSFeed model
     - fetch_election_results: Async HTTP fetch + parse from SoS feed URL
     - ingest_election_results: Extract statewide + county results from a parsed SoS feed
+    - ingest_all_election_results: Extract results for every contest in one pass
+    - ingest_local_result: Extract one county's results for every contest it carries
     - SoSFeed: Top-level feed model
     - FetchError: HTTP/parse error type
 """
@@ -15,7 +17,9 @@ from voter_api.lib.election_tracker.ingester import (
     IngestionResult,
     StatewideResultData,
     detect_election_type,
+    ingest_all_election_results,
     ingest_election_results,
+    ingest_local_result,
 )
 from voter_api.lib.election_tracker.parser import SoSFeed, parse_sos_feed
 
@@ -28,7 +32,9 @@ __all__ = [
     "StatewideResultData",
     "detect_election_type",
     "fetch_election_results",
+    "ingest_all_election_results",
     "ingest_election_results",
+    "ingest_local_result",
     "parse_sos_feed",
     "validate_url_domain",
 ]
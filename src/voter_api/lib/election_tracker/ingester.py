@@ -10,7 +10,7 @@ from typing import Literal
 
 from loguru import logger
 
-from voter_api.lib.election_tracker.parser import BallotItem, SoSFeed
+from voter_api.lib.election_tracker.parser import BallotItem, LocalResult, SoSFeed
 
 ElectionType = Literal[
     # Legacy SoS feed types
@@ -146,12 +146,46 @@ def _find_ballot_item(
     return None
 
 
+def _source_created_at(feed: SoSFeed) -> datetime | None:
+    """Parse the feed's ``createdAt``, or None (with a warning) if it is malformed."""
+    try:
+        return feed.created_at_dt
+    except (ValueError, TypeError):
+        logger.warning("Could not parse createdAt from SoS feed: {}", feed.createdAt)
+        return None
+
+
+def _statewide_result(ballot: BallotItem | None, source_created_at: datetime | None) -> StatewideResultData:
+    """Build statewide result data from a statewide ballot item."""
+    return StatewideResultData(
+        precincts_participating=ballot.precinctsParticipating if ballot else None,
+        precincts_reporting=ballot.precinctsReporting if ballot else None,
+        results_data=[opt.model_dump() for opt in ballot.ballotOptions] if ballot else [],
+        source_created_at=source_created_at,
+    )
+
+
+def _county_result(county_name: str, county_name_normalized: str, ballot: BallotItem) -> CountyResultData:
+    """Build county result data from a county's ballot item."""
+    return CountyResultData(
+        county_name=county_name,
+        county_name_normalized=county_name_normalized,
+        precincts_participating=ballot.precinctsParticipating,
+        precincts_reporting=ballot.precinctsReporting,
+        results_data=[opt.model_dump() for opt in ballot.ballotOptions],
+    )
+
+
 def ingest_election_results(
     feed: SoSFeed,
     ballot_item_id: str | None = None,
 ) -> IngestionResult:
     """Extract statewide and county-level results from a parsed SoS feed.
 
+    Scans the whole feed for one ballot item; use
+    :func:`ingest_all_election_results` to extract every contest of a
+    multi-contest feed.
+
     Args:
         feed: Parsed SoS feed data.
         ballot_item_id: SoS ballot item ID to extract. When None, defaults
@@ -163,34 +197,15 @@ def ingest_election_results(
     Raises:
         ValueError: If ballot_item_id is specified but not found in statewide results.
     """
-    # --- Statewide result extraction ---
     statewide_ballot = _find_ballot_item(
         feed.results.ballotItems,
         ballot_item_id,
         "statewide results",
         raise_on_missing=True,
     )
+    statewide = _statewide_result(statewide_ballot, _source_created_at(feed))
 
-    precincts_participating = statewide_ballot.precinctsParticipating if statewide_ballot else None
-    precincts_reporting = statewide_ballot.precinctsReporting if statewide_ballot else None
-    results_data = [opt.model_dump() for opt in statewide_ballot.ballotOptions] if statewide_ballot else []
-
-    source_created_at = None
-    try:
-        source_created_at = feed.created_at_dt
-    except (ValueError, TypeError):
-        logger.warning("Could not parse createdAt from SoS feed: {}", feed.createdAt)
-
-    statewide = StatewideResultData(
-        precincts_participating=precincts_participating,
-        precincts_reporting=precincts_reporting,
-        results_data=results_data,
-        source_created_at=source_created_at,
-    )
-
-    # --- County results extraction ---
     counties: list[CountyResultData] = []
-
     for local_result in feed.localResults:
         county_name = local_result.name
         county_name_normalized = _normalize_county_name(county_name)
@@ -208,20 +223,74 @@ def ingest_election_results(
         if county_ballot is None:
             continue
 
-        county_precincts_participating = county_ballot.precinctsParticipating
-        county_precincts_reporting = county_ballot.precinctsReporting
-        county_results_data = [opt.model_dump() for opt in county_ballot.ballotOptions]
-
-        counties.append(
-            CountyResultData(
-                county_name=county_name,
-                county_name_normalized=county_name_normalized,
-                precincts_participating=county_precincts_participating,
-                precincts_reporting=county_precincts_reporting,
-                results_data=county_results_data,
-            )
-        )
+        counties.append(_county_result(county_name, county_name_normalized, county_ballot))
 
     logger.info("Extracted results from SoS feed: {} counties", len(counties))
 
     return IngestionResult(statewide=statewide, counties=counties)
+
+
+def ingest_all_election_results(feed: SoSFeed) -> dict[str, IngestionResult]:
+    """Extract statewide and county-level results for every contest in one pass.
+
+    Equivalent to calling :func:`ingest_election_results` for each
+    statewide ballot item, but each county's ballot items are visited once
+    and matched to their contest by ID, so a statewide general-election
+    feed (hundreds of contests x 159 counties) is linear rather than
+    quadratic in its size. Contests are keyed in statewide order; when an
+    ID repeats, the first occurrence wins, as with the per-item lookup.
+    County ballot items without a statewide counterpart are ignored.
+
+    Args:
+        feed: Parsed SoS feed data.
+
+    Returns:
+        Mapping of ballot item ID to its IngestionResult.
+    """
+    source_created_at = _source_created_at(feed)
+    results: dict[str, IngestionResult] = {}
+    for ballot in feed.results.ballotItems:
+        if ballot.id not in results:
+            results[ballot.id] = IngestionResult(statewide=_statewide_result(ballot, source_created_at))
+
+    county_count = 0
+    for local_result in feed.localResults:
+        county_results = ingest_local_result(local_result)
+        if county_results is None:
+            continue
+        county_count += 1
+        for ballot_item_id, county in county_results:
+            result = results.get(ballot_item_id)
+            if result is not None:
+                result.counties.append(county)
+
+    logger.info("Extracted results from SoS feed: {} contests across {} counties", len(results), county_count)
+
+    return results
+
+
+def ingest_local_result(local_result: LocalResult) -> list[tuple[str, CountyResultData]] | None:
+    """Extract one county's results for every contest it carries.
+
+    Args:
+        local_result: One entry of the feed's ``localResults``.
+
+    Returns:
+        ``(ballot_item_id, county data)`` pairs in the county's ballot
+        order (first occurrence of a repeated ID only), or None when the
+        county name normalizes to nothing and the county is skipped.
+    """
+    county_name = local_result.name
+    county_name_normalized = _normalize_county_name(county_name)
+    if not county_name_normalized:
+        logger.warning("Skipping county with empty normalized name: {}", county_name)
+        return None
+
+    seen: set[str] = set()
+    county_results: list[tuple[str, CountyResultData]] = []
+    for county_ballot in local_result.ballotItems:
+        if county_ballot.id in seen:
+            continue
+        seen.add(county_ballot.id)
+        county_results.append((county_ballot.id, _county_result(county_name, county_name_normalized, county_ballot)))
+    return county_results
@@ -1,5 +1,7 @@
 """Shared normalization utilities for voter data fields."""
 
+import re
+
 
 def normalize_registration_number(value: str) -> str:
     """Strip leading zeros from a voter registration number.
@@ -22,3 +24,86 @@ def normalize_registration_number(value: str) -> str:
         all-zeros input to avoid an empty string.
     """
     return value.lstrip("0") or "0"
+
+
+def normalize_district_identifier(value: str | None) -> str | None:
+    """Return the canonical key for a district identifier.
+
+    Boundary shapefiles, the GA SoS voter CSV, and election district text
+    disagree on zero-padding ("5", "05", "005"). The canonical key strips
+    surrounding whitespace and, for purely numeric identifiers, leading
+    zeros. Non-numeric identifiers (e.g. "HO7", "2A") keep their case and
+    padding.
+
+    Must stay in sync with :func:`district_key_sql`, which computes the same
+    key in PostgreSQL for the ``*_key`` generated columns.
+
+    Args:
+        value: Raw district identifier, or None.
+
+    Returns:
+        The canonical key, or None for None/blank input.
+    """
+    if value is None:
+        return None
+    stripped = value.strip()
+    if not stripped:
+        return None
+    if stripped.isascii() and stripped.isdigit():
+        return stripped.lstrip("0") or "0"
+    return stripped
+
+
+def district_key_sql(column: str) -> str:
+    """Return the PostgreSQL expression computing a column's canonical district key.
+
+    Used as the ``GENERATED ALWAYS AS`` expression of the ``*_key`` columns
+    on ``voters`` and ``boundaries``; mirrors
+    :func:`normalize_district_identifier`.
+
+    Args:
+        column: Name of the source column (trusted, never user input).
+
+    Returns:
+        SQL expression string.
+    """
+    return (
+        f"CASE WHEN btrim({column}) ~ '^[0-9]+$' "
+        f"THEN COALESCE(NULLIF(ltrim(btrim({column}), '0'), ''), '0') "
+        f"ELSE NULLIF(btrim({column}), '') END"
+    )
+
+
+def normalize_search_name(value: str) -> str:
+    """Normalize free-form name text for the ``voters.search_name`` column.
+
+    Lowercases and replaces every run of characters other than ASCII
+    letters and digits with a single space, so "O'Neil-Smith, Jane" becomes
+    "o neil smith jane". Applied to query text, it yields the tokens that
+    :func:`search_name_sql` stores.
+
+    Must stay in sync with :func:`search_name_sql`.
+
+    Args:
+        value: Raw name text.
+
+    Returns:
+        Space-separated lowercase tokens (possibly empty).
+    """
+    return re.sub(r"[^a-z0-9]+", " ", value.lower()).strip()
+
+
+def search_name_sql() -> str:
+    """Return the PostgreSQL expression computing ``voters.search_name``.
+
+    First, middle, and last name normalized as in
+    :func:`normalize_search_name`, with a leading space so a word-prefix
+    match is a plain ``LIKE '% tok%'`` that the trigram index can serve.
+
+    Returns:
+        SQL expression string.
+    """
+    return (
+        "' ' || btrim(regexp_replace(lower(coalesce(first_name, '') || ' ' || coalesce(middle_name, '') "
+        "|| ' ' || coalesce(last_name, '')), '[^a-z0-9]+', ' ', 'g'))"
+    )
@@ -0,0 +1,113 @@
+"""Shared helpers for keyset-paginated list queries.
+
+Keyset cursors are opaque URL-safe tokens wrapping a JSON array of the
+last row's sort key; each service decodes and type-checks its own key.
+Totals are computed per :data:`CountMode` by :func:`count_total`.
+"""
+
+import base64
+import json
+from typing import Any, Literal
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+# Upper bound for ``count_mode="capped"`` totals.
+SEARCH_COUNT_CAP = 10_000
+
+CountMode = Literal["exact", "estimate", "capped"]
+
+
+def encode_cursor(key: list[Any]) -> str:
+    """Encode a row's sort key as an opaque cursor token.
+
+    Args:
+        key: JSON-serializable sort key values of the last row on a page.
+
+    Returns:
+        URL-safe token without padding.
+    """
+    payload = json.dumps(key, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a token produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: The opaque cursor token.
+
+    Returns:
+        The sort key values.
+
+    Raises:
+        ValueError: If the token is not a base64-encoded JSON array.
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(key, list):
+        raise ValueError("Invalid cursor")
+    return key
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` wrapper that keeps the statement's bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + str(compiler.process(element.statement, **kw))
+
+
+async def estimate_row_count(session: AsyncSession, query: Select[Any]) -> int:
+    """Return the planner's row estimate for a query without executing it."""
+    plan = (await session.execute(_Explain(query))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_total(
+    session: AsyncSession,
+    ids: Select[Any],
+    *,
+    count_mode: CountMode,
+    seen: int,
+    has_more: bool,
+) -> tuple[int, bool]:
+    """Count the rows matched by a list query.
+
+    ``exact`` runs ``COUNT(*)``, ``capped`` counts at most
+    :data:`SEARCH_COUNT_CAP` rows, and ``estimate`` reads the planner's row
+    estimate from ``EXPLAIN``.
+
+    Args:
+        session: Database session.
+        ids: Unordered query selecting the primary key of every match.
+        count_mode: How to compute the total.
+        seen: Rows up to and including the current page.
+        has_more: Whether another page follows the current one.
+
+    Returns:
+        Tuple of (total, total_is_exact).
+    """
+    if count_mode == "exact":
+        count_query = ids.with_only_columns(func.count(ids.selected_columns[0]))
+        return (await session.execute(count_query)).scalar_one(), True
+    if count_mode == "capped":
+        capped = ids.limit(SEARCH_COUNT_CAP + 1).subquery()
+        total = (await session.execute(select(func.count()).select_from(capped))).scalar_one()
+        if total > SEARCH_COUNT_CAP:
+            return SEARCH_COUNT_CAP, False
+        return total, True
+    # Never report fewer matches than this request has already proven exist.
+    return max(await estimate_row_count(session, ids), seen + int(has_more)), False
@@ -2,6 +2,8 @@
 
 Public API:
     - load_results_file: Load JSON file into SoSFeed
+    - load_results_header: Stream a file's metadata + statewide results (no counties)
+    - iter_local_results: Stream a file's county results one at a time
     - iter_ballot_items: Extract per-contest contexts with candidates
     - validate_results_file: Pre-import validation
     - BallotItemContext: Per-contest data container
@@ -20,13 +22,16 @@ from voter_api.lib.results_importer.parser import (
     iter_ballot_items,
     load_results_file,
 )
+from voter_api.lib.results_importer.stream import iter_local_results, load_results_header
 from voter_api.lib.results_importer.validator import validate_results_file
 
 __all__ = [
     "BallotItemContext",
     "ParsedCandidate",
     "iter_ballot_items",
+    "iter_local_results",
     "load_results_file",
+    "load_results_header",
     "normalize_party",
     "parse_candidate_name",
     "validate_results_file",
@@ -13,7 +13,7 @@ from pathlib import Path
 from voter_api.lib.election_tracker.ingester import (
     IngestionResult,
     detect_election_type,
-    ingest_election_results,
+    ingest_all_election_results,
 )
 from voter_api.lib.election_tracker.parser import SoSFeed, parse_sos_feed
 from voter_api.lib.results_importer.candidate_parser import (
@@ -75,7 +75,8 @@ def iter_ballot_items(feed: SoSFeed) -> list[BallotItemContext]:
 
     For each ballot item in the feed, produces a BallotItemContext with:
     - Parsed candidate information from ballot options
-    - Ingestion result (statewide + county data) via the existing ingester
+    - Ingestion result (statewide + county data), extracted for all
+      contests in a single pass over the feed
 
     Args:
         feed: Parsed SoS feed.
@@ -85,6 +86,7 @@ def iter_ballot_items(feed: SoSFeed) -> list[BallotItemContext]:
     """
     election_date = date.fromisoformat(feed.electionDate)
     election_type = detect_election_type(feed.electionName)
+    ingestions = ingest_all_election_results(feed)
     contexts: list[BallotItemContext] = []
 
     for ballot_item in feed.results.ballotItems:
@@ -110,9 +112,6 @@ def iter_ballot_items(feed: SoSFeed) -> list[BallotItemContext]:
                 )
             )
 
-        # Extract ingestion result for this specific ballot item
-        ingestion = ingest_election_results(feed, ballot_item_id=ballot_item.id)
-
         contexts.append(
             BallotItemContext(
                 ballot_item_id=ballot_item.id,
@@ -120,7 +119,7 @@ def iter_ballot_items(feed: SoSFeed) -> list[BallotItemContext]:
                 election_event_name=feed.electionName,
                 election_date=election_date,
                 election_type=election_type,
-                ingestion=ingestion,
+                ingestion=ingestions[ballot_item.id],
                 candidates=candidates,
             )
         )
@@ -0,0 +1,200 @@
+"""Incremental loading of large SoS results files.
+
+:func:`~voter_api.lib.results_importer.parser.load_results_file` decodes
+and validates the whole feed at once, so a statewide file with precinct
+detail needs several times its size in memory. Streaming splits the feed
+instead: :func:`load_results_header` reads the election metadata and the
+statewide ``results`` (small: no precinct detail) and skips
+``localResults``, then :func:`iter_local_results` yields ``localResults``
+one validated county at a time. Peak memory is bounded by the largest
+county rather than the file.
+
+Only the standard library is used: values are decoded with
+``json.JSONDecoder.raw_decode`` over a sliding read buffer, and the
+reader steps through the enclosing object and array punctuation itself.
+"""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from voter_api.lib.election_tracker.parser import LocalResult, SoSFeed, parse_sos_feed
+
+_HEADER_KEYS = frozenset({"electionDate", "electionName", "createdAt", "results"})
+_LOCAL_RESULTS_KEY = "localResults"
+_READ_SIZE = 1 << 20
+_WHITESPACE = " \t\n\r"
+# Characters that may continue a JSON number (``12`` -> ``12.5e-3``).
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class _JsonReader:
+    """Pull-style JSON reader over a text stream.
+
+    ``members`` and ``items`` step into an object or array; each key or
+    element position must be consumed with ``value`` (or a nested
+    ``members``/``items``) before the iterator is advanced.
+    """
+
+    def __init__(self, fh: TextIO, read_size: int = _READ_SIZE) -> None:
+        self._fh = fh
+        self._read_size = read_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int) -> bool:
+        """Append up to ``size`` characters, discarding consumed input first."""
+        if self._eof:
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        chunk = self._fh.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def _error(self, expected: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(f"Expecting {expected}", self._buf, self._pos)
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at end of input)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(self._read_size):
+                return ""
+
+    def _consume(self, char: str, expected: str) -> None:
+        if self.peek() != char:
+            raise self._error(expected)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        size = self._read_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete value: read more (growing the read so a large
+                # value costs a logarithmic number of retries).
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number cut at the end of the buffer decodes as a shorter one
+            # ("12" of "12.5"), possibly followed by the start of its fraction
+            # or exponent ("12." / "2.5e"); read on while that could be so.
+            rest = self._buf[end:]
+            is_number = isinstance(value, int | float) and not isinstance(value, bool)
+            if (not rest or (is_number and not rest.strip(_NUMBER_CHARS))) and self._fill(size):
+                continue
+            self._pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Iterate the keys of the object at the cursor."""
+        self._consume("{", "'{'")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise self._error("property name")
+            self._consume(":", "':' delimiter")
+            yield key
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                self._pos -= 1
+                raise self._error("',' delimiter")
+
+    def items(self) -> Iterator[Any]:
+        """Iterate the elements of the array at the cursor (``null`` is empty)."""
+        if self.peek() == "n":
+            if self.value() is not None:
+                raise self._error("array")
+            return
+        self._consume("[", "'['")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                self._pos -= 1
+                raise self._error("',' delimiter")
+
+
+def load_results_header(path: Path) -> SoSFeed:
+    """Load a results file's metadata and statewide results, without counties.
+
+    ``localResults`` is skipped one county at a time and never held in
+    memory; the returned feed's ``localResults`` is empty.
+
+    Args:
+        path: Path to the JSON file.
+
+    Returns:
+        Validated SoSFeed with empty ``localResults``.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is not valid JSON.
+        pydantic.ValidationError: If the header doesn't match the SoSFeed schema.
+    """
+    raw: dict[str, Any] = {}
+    with path.open() as f:
+        reader = _JsonReader(f)
+        for key in reader.members():
+            if key == _LOCAL_RESULTS_KEY:
+                for _ in reader.items():
+                    pass
+            else:
+                value = reader.value()
+                if key in _HEADER_KEYS:
+                    raw[key] = value
+                    if raw.keys() >= _HEADER_KEYS:
+                        break
+    return parse_sos_feed(raw)
+
+
+def iter_local_results(path: Path) -> Iterator[LocalResult]:
+    """Yield a results file's county results one at a time.
+
+    Args:
+        path: Path to the JSON file.
+
+    Yields:
+        Each validated LocalResult, in file order.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+        pydantic.ValidationError: If a county doesn't match the LocalResult
+            schema (counties before it have already been yielded).
+    """
+    with path.open() as f:
+        reader = _JsonReader(f)
+        for key in reader.members():
+            if key != _LOCAL_RESULTS_KEY:
+                reader.value()
+                continue
+            for raw in reader.items():
+                yield LocalResult.model_validate(raw)
+            return
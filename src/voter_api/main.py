@@ -16,7 +16,9 @@ from loguru import logger
 from voter_api import __version__
 from voter_api.core.config import get_settings
 from voter_api.core.database import dispose_engine, get_session_factory, init_engine
+from voter_api.core.hashing import PasswordHashingBusyError, get_password_hasher
 from voter_api.core.logging import setup_logging
+from voter_api.core.rate_limit import dispose_rate_limit_engine, init_rate_limit_engine
 
 _STALE_TASK_NOTE = "Server restarted while task was in progress"
 
@@ -89,34 +91,17 @@ async def _recover_stale_geocoding_jobs() -> None:
 async def _verify_import_db_state() -> None:
     """Check and repair database state that may be inconsistent after a bulk import crash.
 
-    Specifically checks for:
-    1. Autovacuum disabled on the voters table (left disabled if import crashed mid-way)
+    Specifically checks, for the voters and election_county_results tables, for:
+    1. Autovacuum left disabled (if an import crashed mid-way)
     2. Missing indexes that were dropped for bulk import but never rebuilt
     """
-    from sqlalchemy import text as sa_text
-
-    from voter_api.services.import_service import _DROPPABLE_INDEXES
+    from voter_api.services.import_service import repair_bulk_import_state
+    from voter_api.services.results_import_service import repair_results_import_state
 
     factory = get_session_factory()
     async with factory() as session:
-        # Check if autovacuum is disabled on voters table
-        result = await session.execute(sa_text("SELECT reloptions FROM pg_class WHERE relname = 'voters'"))
-        row = result.first()
-        if row and row[0] and "autovacuum_enabled=false" in str(row[0]):
-            logger.warning("Autovacuum is disabled on voters table — re-enabling after crash recovery")
-            await session.execute(sa_text("ALTER TABLE voters SET (autovacuum_enabled = true)"))
-            await session.commit()
-
-        # Check for missing indexes and rebuild them
-        for idx in _DROPPABLE_INDEXES:
-            result = await session.execute(
-                sa_text("SELECT 1 FROM pg_indexes WHERE indexname = :name"),
-                {"name": idx["name"]},
-            )
-            if result.first() is None:
-                logger.warning("Missing index {} — rebuilding after crash recovery", idx["name"])
-                await session.execute(sa_text(idx["create"]))
-                await session.commit()
+        await repair_bulk_import_state(session)
+        await repair_results_import_state(session)
 
 
 async def _recover_stale_import_jobs() -> None:
@@ -156,31 +141,48 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """Manage application lifecycle: init engine on startup, dispose on shutdown."""
     settings = get_settings()
     setup_logging(settings.log_level, log_dir=settings.log_dir)
-    init_engine(settings.database_url, echo=False, schema=settings.database_schema)
-
-    # Recover analysis runs orphaned by a previous server restart
-    try:
-        await _recover_stale_analysis_runs()
-    except Exception:
-        logger.warning("Could not recover stale analysis runs on startup (table may not exist yet)")
-
-    # Recover geocoding jobs orphaned by a previous server restart
-    try:
-        await _recover_stale_geocoding_jobs()
-    except Exception:
-        logger.warning("Could not recover stale geocoding jobs on startup (table may not exist yet)")
-
-    # Verify DB state consistency after potential bulk import crash
-    try:
-        await _verify_import_db_state()
-    except Exception:
-        logger.warning("Could not verify import DB state on startup (table may not exist yet)")
-
-    # Recover import jobs orphaned by a previous server restart
-    try:
-        await _recover_stale_import_jobs()
-    except Exception:
-        logger.warning("Could not recover stale import jobs on startup (table may not exist yet)")
+    init_engine(
+        settings.database_url,
+        echo=False,
+        schema=settings.database_schema,
+        slow_query_ms=settings.slow_query_ms if settings.instrumentation_enabled else None,
+    )
+    if settings.rate_limit_backend == "postgres":
+        init_rate_limit_engine(
+            settings.database_url,
+            schema=settings.database_schema,
+            pool_size=settings.rate_limit_pool_size,
+            timeout_ms=settings.rate_limit_db_timeout_ms,
+        )
+
+    # With the in-process runner, jobs still pending/running at boot died with
+    # the previous process. Queued jobs belong to `voter-api worker`, which
+    # resumes them from their checkpoints, so leave them (and the indexes an
+    # import in progress may have dropped) alone.
+    if settings.task_backend == "inprocess":
+        # Recover analysis runs orphaned by a previous server restart
+        try:
+            await _recover_stale_analysis_runs()
+        except Exception:
+            logger.warning("Could not recover stale analysis runs on startup (table may not exist yet)")
+
+        # Recover geocoding jobs orphaned by a previous server restart
+        try:
+            await _recover_stale_geocoding_jobs()
+        except Exception:
+            logger.warning("Could not recover stale geocoding jobs on startup (table may not exist yet)")
+
+        # Verify DB state consistency after potential bulk import crash
+        try:
+            await _verify_import_db_state()
+        except Exception:
+            logger.warning("Could not verify import DB state on startup (table may not exist yet)")
+
+        # Recover import jobs orphaned by a previous server restart
+        try:
+            await _recover_stale_import_jobs()
+        except Exception:
+            logger.warning("Could not recover stale import jobs on startup (table may not exist yet)")
 
     # Start election auto-refresh background task
     refresh_task = None
@@ -197,6 +199,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         with contextlib.suppress(asyncio.CancelledError):
             await refresh_task
 
+    # Let in-flight password hashes finish; a later app start gets a new pool.
+    if get_password_hasher.cache_info().currsize:
+        get_password_hasher().shutdown()
+        get_password_hasher.cache_clear()
+    await dispose_rate_limit_engine()
     await dispose_engine()
 
 
@@ -223,6 +230,14 @@ def create_app() -> FastAPI:
             content={"detail": str(exc)},
         )
 
+    @app.exception_handler(PasswordHashingBusyError)
+    async def hashing_busy_handler(request: Request, exc: PasswordHashingBusyError) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc)},
+            headers={"Retry-After": "1"},
+        )
+
     # Register middleware and routers
     from voter_api.api.router import create_router, setup_middleware
 
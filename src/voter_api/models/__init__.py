@@ -1,12 +1,14 @@
 """ORM model registry — import all models so Alembic autogenerate discovers them."""
 
 from voter_api.models.absentee_ballot import AbsenteeBallotApplication
+from voter_api.models.absentee_ballot_stat import AbsenteeBallotStat
 from voter_api.models.address import Address
 from voter_api.models.agenda_item import AgendaItem
 from voter_api.models.analysis_result import AnalysisResult
 from voter_api.models.analysis_run import AnalysisRun
 from voter_api.models.audit_log import AuditLog
 from voter_api.models.auth_tokens import PasswordResetToken, UserInvite
+from voter_api.models.background_job import BackgroundJob
 from voter_api.models.boundary import Boundary
 from voter_api.models.candidacy import Candidacy
 from voter_api.models.candidate import Candidate, CandidateLink
@@ -14,6 +16,7 @@ from voter_api.models.county_district import CountyDistrict
 from voter_api.models.county_metadata import CountyMetadata
 from voter_api.models.election import Election, ElectionCountyResult, ElectionResult
 from voter_api.models.election_event import ElectionEvent
+from voter_api.models.election_participation_stats import ElectionParticipationStats
 from voter_api.models.export_job import ExportJob
 from voter_api.models.geocoded_location import GeocodedLocation
 from voter_api.models.geocoder_cache import GeocoderCache
@@ -27,13 +30,16 @@ from voter_api.models.meeting_video_embed import MeetingVideoEmbed
 from voter_api.models.passkey import Passkey
 from voter_api.models.precinct_crosswalk import PrecinctCrosswalk
 from voter_api.models.precinct_metadata import PrecinctMetadata
+from voter_api.models.rate_limit_bucket import RateLimitBucket
 from voter_api.models.totp import TOTPCredential, TOTPRecoveryCode
 from voter_api.models.user import User
 from voter_api.models.voter import Voter
+from voter_api.models.voter_filter_facet import VoterFilterFacet
 from voter_api.models.voter_history import VoterHistory
 
 __all__ = [
     "AbsenteeBallotApplication",
+    "AbsenteeBallotStat",
     "Address",
     "AgendaItem",
     "Passkey",
@@ -44,6 +50,7 @@ __all__ = [
     "AnalysisResult",
     "AnalysisRun",
     "AuditLog",
+    "BackgroundJob",
     "Boundary",
     "Candidacy",
     "Candidate",
@@ -53,6 +60,7 @@ __all__ = [
     "Election",
     "ElectionCountyResult",
     "ElectionEvent",
+    "ElectionParticipationStats",
     "ElectionResult",
     "ExportJob",
     "GeocodedLocation",
@@ -66,7 +74,9 @@ __all__ = [
     "MeetingVideoEmbed",
     "PrecinctCrosswalk",
     "PrecinctMetadata",
+    "RateLimitBucket",
     "User",
     "Voter",
+    "VoterFilterFacet",
     "VoterHistory",
 ]
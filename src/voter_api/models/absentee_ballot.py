@@ -85,6 +85,10 @@ class AbsenteeBallotApplication(Base, UUIDMixin):
         nullable=True,
     )
 
+    # md5 of the imported columns, set by the COPY loader so re-imports of
+    # the daily full file skip unchanged rows (NULL: not loaded by COPY yet)
+    row_hash: Mapped[str | None] = mapped_column(String(32), nullable=True)
+
     # Timestamps (created_at only — no updated_at for append-only import data)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -104,8 +108,15 @@ class AbsenteeBallotApplication(Base, UUIDMixin):
             unique=True,
         ),
         Index("ix_aba_voter_reg_num", "voter_registration_number"),
-        Index("ix_aba_county", "county"),
-        Index("ix_aba_application_status", "application_status"),
+        # Listing indexes: each filter combination the list endpoint serves,
+        # followed by its (created_at, id) sort key, so a page (by offset or
+        # keyset cursor) is read in order from the index and filtered counts
+        # can be answered by index-only scans.
+        Index("ix_aba_created", "created_at", "id"),
+        Index("ix_aba_county_created", "county", "created_at", "id"),
+        Index("ix_aba_county_status_created", "county", "application_status", "created_at", "id"),
+        Index("ix_aba_county_party_created", "county", "party", "created_at", "id"),
+        Index("ix_aba_status_created", "application_status", "created_at", "id"),
         Index("ix_aba_ballot_status", "ballot_status"),
         Index("ix_aba_import_job_id", "import_job_id"),
     )
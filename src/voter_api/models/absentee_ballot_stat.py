@@ -0,0 +1,32 @@
+"""AbsenteeBallotStat model — precomputed absentee application counts behind the stats endpoint."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from voter_api.models.base import Base, UUIDMixin
+
+
+class AbsenteeBallotStat(Base, UUIDMixin):
+    """Application count for one (county, application status, party).
+
+    Rows are the ``GROUP BY`` of ``absentee_ballot_applications`` over the
+    columns the stats endpoint breaks down by, at most a few thousand rows
+    however many applications arrive. A county's rows are replaced when an
+    absentee import touching that county completes.
+    """
+
+    __tablename__ = "absentee_ballot_stats"
+
+    county: Mapped[str] = mapped_column(String(100), nullable=False)
+    application_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    party: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    application_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (Index("ix_absentee_ballot_stats_county", "county"),)
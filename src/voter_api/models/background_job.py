@@ -0,0 +1,50 @@
+"""BackgroundJob model — durable queue entry for work run by ``voter-api worker``."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from voter_api.models.base import Base, UUIDMixin
+
+
+class BackgroundJob(Base, UUIDMixin):
+    """One unit of queued background work (an import, geocoding batch, analysis run or export).
+
+    The row names a registered task and its JSON arguments; the domain job
+    it drives (``ImportJob``, ``GeocodingJob``, ...) keeps its own status and
+    checkpoint. Workers claim pending rows with ``FOR UPDATE SKIP LOCKED``
+    and refresh ``heartbeat_at`` while running, so a row whose worker died
+    is reclaimed once its heartbeat goes stale and the task resumes from the
+    domain job's checkpoint.
+    """
+
+    __tablename__ = "background_jobs"
+
+    queue: Mapped[str] = mapped_column(String(50), nullable=False)
+    task: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending", server_default="pending")
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default=text("0"))
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3, server_default=text("3"))
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Claim / liveness
+    locked_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Metadata
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_background_jobs_claim",
+            "queue",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
@@ -4,10 +4,11 @@ from datetime import date, datetime
 from typing import Any
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Date, DateTime, Index, String, UniqueConstraint, func
+from sqlalchemy import Computed, Date, DateTime, Index, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
+from voter_api.lib.normalize import district_key_sql
 from voter_api.models.base import Base, UUIDMixin
 
 # Valid boundary types matching GA SoS district types
@@ -41,6 +42,10 @@ class Boundary(Base, UUIDMixin):
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     boundary_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     boundary_identifier: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Canonical identifier (leading zeros stripped from numeric values), maintained by PostgreSQL
+    boundary_identifier_key: Mapped[str | None] = mapped_column(
+        String(50), Computed(district_key_sql("boundary_identifier"), persisted=True), nullable=True
+    )
     source: Mapped[str] = mapped_column(String(20), nullable=False)
     county: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True)
     geometry: Mapped[Any] = mapped_column(
@@ -57,4 +62,5 @@ class Boundary(Base, UUIDMixin):
     __table_args__ = (
         UniqueConstraint("boundary_type", "boundary_identifier", "county", name="uq_boundary_type_id_county"),
         Index("idx_boundaries_geometry", "geometry", postgresql_using="gist"),
+        Index("ix_boundaries_type_identifier_key", "boundary_type", "boundary_identifier_key"),
     )
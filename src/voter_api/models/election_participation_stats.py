@@ -0,0 +1,36 @@
+"""ElectionParticipationStats model — precomputed participation rollup per election."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from voter_api.models.base import Base
+
+
+class ElectionParticipationStats(Base):
+    """Materialized participation statistics for one election.
+
+    ``payload`` holds a serialized ``ParticipationStatsResponse``. Rows are
+    marked stale (rather than recomputed inline) when voter history is
+    imported or resolved for the election's date, and are recomputed on the
+    next read or by ``refresh_stale_participation_stats``.
+    """
+
+    __tablename__ = "election_participation_stats"
+
+    election_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    is_stale: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    stale_since: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
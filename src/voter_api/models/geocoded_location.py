@@ -30,7 +30,7 @@ class GeocodedLocation(Base, UUIDMixin):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationship back to voter
-    voter = relationship("Voter", back_populates="geocoded_locations", lazy="selectin")
+    voter = relationship("Voter", back_populates="geocoded_locations", lazy="raise")
 
     __table_args__ = (
         UniqueConstraint("voter_id", "source_type", name="uq_voter_source"),
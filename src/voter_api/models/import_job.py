@@ -29,6 +29,7 @@ class ImportJob(Base, UUIDMixin):
     records_updated: Mapped[int | None] = mapped_column(Integer, nullable=True)
     records_soft_deleted: Mapped[int | None] = mapped_column(Integer, nullable=True)
     records_skipped: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    records_deduplicated: Mapped[int | None] = mapped_column(Integer, nullable=True)
     records_unmatched: Mapped[int | None] = mapped_column(Integer, nullable=True)
     records_needs_review: Mapped[int | None] = mapped_column(Integer, nullable=True, server_default=text("0"))
 
@@ -0,0 +1,29 @@
+"""RateLimitBucket model — shared token buckets for the API rate limiter."""
+
+from sqlalchemy import Double, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from voter_api.models.base import Base
+
+
+class RateLimitBucket(Base):
+    """Token bucket of one client, shared by every API worker.
+
+    ``tokens`` is the bucket level as of ``updated_at`` (epoch seconds); the
+    refill since then is computed on each hit, so idle buckets are never
+    written. A bucket idle for a full minute is full again and can be
+    deleted without changing any limit. The table is ``UNLOGGED``: counters
+    are not worth WAL traffic and an empty table after a crash only resets
+    the limits.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    tokens: Mapped[float] = mapped_column(Double, nullable=False)
+    updated_at: Mapped[float] = mapped_column(Double, nullable=False)
+
+    __table_args__ = (
+        Index("ix_rate_limit_buckets_updated_at", "updated_at"),
+        {"prefixes": ["UNLOGGED"]},
+    )
@@ -4,10 +4,11 @@ import uuid
 from datetime import date, datetime
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Boolean, Date, DateTime, Double, ForeignKey, Index, Integer, String
+from sqlalchemy import Boolean, Computed, Date, DateTime, Double, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from voter_api.lib.normalize import district_key_sql, search_name_sql
 from voter_api.models.base import Base, TimestampMixin, UUIDMixin
 
 
@@ -27,6 +28,10 @@ class Voter(Base, UUIDMixin, TimestampMixin):
     first_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     middle_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     suffix: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    # Normalized "first middle last" maintained by PostgreSQL on every insert/update
+    search_name: Mapped[str | None] = mapped_column(
+        Text, Computed(search_name_sql(), persisted=True), nullable=True, deferred=True
+    )
 
     # Demographics
     birth_year: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -70,6 +75,48 @@ class Voter(Base, UUIDMixin, TimestampMixin):
     super_commissioner_district: Mapped[str | None] = mapped_column(String(10), nullable=True)
     super_school_board_district: Mapped[str | None] = mapped_column(String(10), nullable=True)
     fire_district: Mapped[str | None] = mapped_column(String(10), nullable=True)
+
+    # Canonical district keys (whitespace and leading zeros stripped from numeric
+    # identifiers) maintained by PostgreSQL; see lib.normalize.normalize_district_identifier.
+    congressional_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("congressional_district"), persisted=True), nullable=True
+    )
+    state_senate_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("state_senate_district"), persisted=True), nullable=True
+    )
+    state_house_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("state_house_district"), persisted=True), nullable=True
+    )
+    judicial_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("judicial_district"), persisted=True), nullable=True
+    )
+    county_commission_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("county_commission_district"), persisted=True), nullable=True
+    )
+    school_board_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("school_board_district"), persisted=True), nullable=True
+    )
+    city_council_district_key: Mapped[str | None] = mapped_column(
+        String(50), Computed(district_key_sql("city_council_district"), persisted=True), nullable=True
+    )
+    municipal_school_board_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("municipal_school_board_district"), persisted=True), nullable=True
+    )
+    water_board_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("water_board_district"), persisted=True), nullable=True
+    )
+    super_council_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("super_council_district"), persisted=True), nullable=True
+    )
+    super_commissioner_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("super_commissioner_district"), persisted=True), nullable=True
+    )
+    super_school_board_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("super_school_board_district"), persisted=True), nullable=True
+    )
+    fire_district_key: Mapped[str | None] = mapped_column(
+        String(10), Computed(district_key_sql("fire_district"), persisted=True), nullable=True
+    )
     municipality: Mapped[str | None] = mapped_column(String(100), nullable=True)
     combo: Mapped[str | None] = mapped_column(String(20), nullable=True)
     land_lot: Mapped[str | None] = mapped_column(String(20), nullable=True)
@@ -110,10 +157,19 @@ class Voter(Base, UUIDMixin, TimestampMixin):
     )
 
     # Relationships
-    geocoded_locations = relationship("GeocodedLocation", back_populates="voter", lazy="selectin")
+    # Not eager-loaded: bulk keyset loops select thousands of voters per batch and
+    # never read locations. Callers that need them opt in with selectinload().
+    geocoded_locations = relationship("GeocodedLocation", back_populates="voter", lazy="raise")
     residence_address = relationship("Address", back_populates="voters")
 
     __table_args__ = (
-        Index("ix_voters_name_search", "last_name", "first_name"),
+        Index("ix_voters_name_search", "last_name", "first_name", "id"),
         Index("ix_voters_official_point", "official_point", postgresql_using="gist"),
+        Index("ix_voters_congressional_district_key", "congressional_district_key"),
+        Index("ix_voters_state_senate_district_key", "state_senate_district_key"),
+        Index("ix_voters_state_house_district_key", "state_house_district_key"),
+        Index("ix_voters_judicial_district_key", "judicial_district_key"),
+        Index("ix_voters_county_commission_district_key", "county", "county_commission_district_key"),
+        Index("ix_voters_school_board_district_key", "county", "school_board_district_key"),
+        Index("ix_voters_city_council_district_key", "city_council_district_key"),
     )
@@ -0,0 +1,39 @@
+"""VoterFilterFacet model — precomputed voter counts behind the search filter dropdowns."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from voter_api.models.base import Base, UUIDMixin
+
+
+class VoterFilterFacet(Base, UUIDMixin):
+    """Voter count for one combination of filterable field values.
+
+    Rows are the ``GROUP BY`` of ``voters`` over the filter dropdown
+    columns, a few rows per precinct instead of one per voter. Keeping all
+    the columns in one grouping (rather than one row per field and value)
+    lets the county-scoped dropdowns cascade: each list is narrowed by the
+    other selections with a sum over this table. A county's rows are
+    replaced when a voter import touching that county completes.
+    """
+
+    __tablename__ = "voter_filter_facets"
+
+    county: Mapped[str] = mapped_column(String(100), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    congressional_district: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    state_senate_district: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    state_house_district: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    county_precinct: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    county_commission_district: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    school_board_district: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    voter_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (Index("ix_voter_filter_facets_county", "county"),)
@@ -16,13 +16,18 @@ class VoterHistory(Base, UUIDMixin):
     Records are imported from GA SoS voter history CSV files. The voter
     association is lazy — records join to voters by registration number
     at query time rather than via a foreign key.
+
+    The table is RANGE-partitioned by ``election_date`` into one partition
+    per calendar year (``voter_history_y2024`` …) plus a DEFAULT partition;
+    see migration ``b4d8e1f2a3c5``. Because PostgreSQL requires the partition
+    key in every unique constraint, the primary key is (id, election_date).
     """
 
     __tablename__ = "voter_history"
 
     voter_registration_number: Mapped[str] = mapped_column(String(20), nullable=False)
     county: Mapped[str] = mapped_column(String(100), nullable=False)
-    election_date: Mapped[date] = mapped_column(Date, nullable=False)
+    election_date: Mapped[date] = mapped_column(Date, primary_key=True, nullable=False)
     election_type: Mapped[str] = mapped_column(String(50), nullable=False)
     normalized_election_type: Mapped[str] = mapped_column(String(20), nullable=False)
     party: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -66,4 +71,5 @@ class VoterHistory(Base, UUIDMixin):
         Index("idx_voter_history_date_type", "election_date", "normalized_election_type"),
         Index("idx_voter_history_election_id", "election_id"),
         Index("idx_voter_history_election_event_id", "election_event_id"),
+        {"postgresql_partition_by": "RANGE (election_date)"},
     )
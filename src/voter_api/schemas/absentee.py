@@ -66,6 +66,10 @@ class PaginatedAbsenteeResponse(BaseModel):
 
     items: list[AbsenteeBallotSummaryResponse]
     pagination: PaginationMeta
+    next_cursor: str | None = Field(default=None, description="Opaque cursor for the next page; null on the last page")
+    total_is_exact: bool = Field(
+        default=True, description="False when pagination.total is a planner estimate or capped count"
+    )
 
 
 class AbsenteeStatsResponse(BaseModel):
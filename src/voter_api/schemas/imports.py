@@ -22,6 +22,7 @@ class ImportJobResponse(BaseModel):
     records_updated: int | None = None
     records_soft_deleted: int | None = None
     records_skipped: int | None = None
+    records_deduplicated: int | None = None
     records_unmatched: int | None = None
     records_needs_review: int | None = None
     error_log: list[dict] | None = None
@@ -95,6 +95,18 @@ class VoterSummaryResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class VoterNameMatch(VoterSummaryResponse):
+    """Voter summary ranked by name-lookup relevance."""
+
+    score: float = Field(description="Trigram word similarity to the query, 0-1 (higher is closer)")
+
+
+class VoterNameLookupResponse(BaseModel):
+    """Best-first voter name lookup results."""
+
+    items: list[VoterNameMatch]
+
+
 class OfficialLocationResponse(BaseModel):
     """The voter's authoritative location used for analysis and exports."""
 
@@ -157,6 +169,10 @@ class PaginatedVoterResponse(BaseModel):
 
     items: list[VoterSummaryResponse]
     pagination: PaginationMeta
+    next_cursor: str | None = Field(default=None, description="Opaque cursor for the next page; null on the last page")
+    total_is_exact: bool = Field(
+        default=True, description="False when pagination.total is a planner estimate or capped count"
+    )
 
 
 class MatchStatus(StrEnum):
@@ -221,6 +237,9 @@ class VoterFilterOptions(BaseModel):
     county_precincts: list[str] | None = None
     county_commission_districts: list[str] | None = None
     school_board_districts: list[str] | None = None
+    counts: dict[str, dict[str, int]] | None = Field(
+        default=None, description="Voter count per option, keyed by field then value (include_counts=true)"
+    )
 
 
 class ProviderResult(BaseModel):
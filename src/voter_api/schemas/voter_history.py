@@ -129,6 +129,10 @@ class ParticipationStatsResponse(BaseModel):
     by_county: list[CountyBreakdown] = Field(default_factory=list)
     by_ballot_style: list[BallotStyleBreakdown] = Field(default_factory=list)
     by_precinct: list[PrecinctBreakdown] = Field(default_factory=list)
+    computed_at: datetime | None = Field(
+        default=None,
+        description="When these statistics were computed (served from the participation rollup).",
+    )
 
     model_config = {"from_attributes": True}
 
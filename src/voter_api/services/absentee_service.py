@@ -1,17 +1,22 @@
 """Absentee ballot application service — import, query, and stats."""
 
+import time
 import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
 from loguru import logger
-from sqlalchemy import func, literal_column, select, text
+from sqlalchemy import ColumnElement, delete, func, insert, literal_column, select, text, tuple_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from voter_api.core.utils import _mask_vrn
 from voter_api.lib.absentee import parse_absentee_csv_chunks
+from voter_api.lib.pagination import CountMode, count_total, decode_cursor, encode_cursor
 from voter_api.models.absentee_ballot import AbsenteeBallotApplication
+from voter_api.models.absentee_ballot_stat import AbsenteeBallotStat
 from voter_api.models.import_job import ImportJob
 
 # Sub-batch size: 38 columns * 400 rows = 15,200 params (under 32,767 asyncpg limit)
@@ -57,6 +62,52 @@ _UPDATE_COLUMNS = [
     "import_job_id",
 ]
 
+# Default chunk size for the COPY loader. COPY has no bind-parameter ceiling,
+# so chunks are sized for memory and merge-statement cost instead.
+DEFAULT_COPY_BATCH_SIZE = 50_000
+
+# Columns loaded by the COPY loader (and hashed into row_hash), in COPY order
+_COPY_COLUMNS: tuple[str, ...] = (
+    "voter_registration_number",
+    "application_date",
+    "ballot_style",
+    *(col for col in _UPDATE_COLUMNS if col != "import_job_id"),
+)
+
+# Staging table with the applications table's column types and no
+# constraints; ``seq`` preserves file order so the merge keeps the last
+# occurrence of a duplicate key.
+_CREATE_ABSENTEE_STAGING = f"""
+    CREATE TEMP TABLE absentee_staging ON COMMIT DROP AS
+    SELECT 0::bigint AS seq, {", ".join(_COPY_COLUMNS)}
+    FROM absentee_ballot_applications WITH NO DATA
+"""  # noqa: S608 — column names are module constants
+
+# Set-based merge of one staged chunk: dedup in SQL (last occurrence wins),
+# then a single ON CONFLICT against the application key that only rewrites
+# rows whose hash changed. RETURNING lists inserted and updated rows only.
+_MERGE_ABSENTEE_STAGING = f"""
+    INSERT INTO absentee_ballot_applications (id, {", ".join(_COPY_COLUMNS)}, import_job_id, row_hash)
+    SELECT DISTINCT ON (voter_registration_number, application_date, COALESCE(ballot_style, ''))
+        gen_random_uuid(), {", ".join(_COPY_COLUMNS)}, :import_job_id,
+        md5(ROW({", ".join(_COPY_COLUMNS)})::text)
+    FROM absentee_staging
+    ORDER BY voter_registration_number, application_date, COALESCE(ballot_style, ''), seq DESC
+    ON CONFLICT (voter_registration_number, application_date, (COALESCE(ballot_style, ''))) DO UPDATE SET
+        {", ".join(f"{col} = EXCLUDED.{col}" for col in (*_UPDATE_COLUMNS, "row_hash"))}
+    WHERE absentee_ballot_applications.row_hash IS DISTINCT FROM EXCLUDED.row_hash
+    RETURNING (xmax = 0)::int AS is_insert
+"""  # noqa: S608 — column names are module constants
+
+# Columns absentee_ballot_stats groups applications by
+_STAT_COLUMNS = ("county", "application_status", "party")
+
+# GROUPING(county, application_status, party) of each stats grouping set
+_GROUPED_BY_COUNTY = 0b011
+_GROUPED_BY_STATUS = 0b101
+_GROUPED_BY_PARTY = 0b110
+_GROUPED_TOTAL = 0b111
+
 
 async def create_absentee_import_job(
     session: AsyncSession,
@@ -117,7 +168,8 @@ async def _upsert_absentee_batch(
                 AbsenteeBallotApplication.__table__.c.application_date,
                 text("COALESCE(ballot_style, '')"),
             ],
-            set_={col: stmt.excluded[col] for col in _UPDATE_COLUMNS},
+            # Clear row_hash so the COPY loader never skips a row this path changed
+            set_={**{col: stmt.excluded[col] for col in _UPDATE_COLUMNS}, "row_hash": None},
         )
         # xmax = 0 identifies genuinely new rows (not updated via ON CONFLICT)
         stmt = stmt.returning(  # type: ignore[assignment]
@@ -135,22 +187,87 @@ async def _upsert_absentee_batch(
     return total_inserted, total_updated
 
 
+async def _copy_merge_absentee_batch(
+    session: AsyncSession,
+    records: list[dict],
+    import_job_id: uuid.UUID,
+) -> tuple[int, int, int]:
+    """Load a chunk of absentee records via COPY and a set-based merge.
+
+    Streams the records into an ``ON COMMIT DROP`` temporary staging table
+    using the asyncpg binary COPY protocol, then merges them into
+    absentee_ballot_applications in one statement. Duplicate keys within
+    the chunk are resolved by ``DISTINCT ON`` with the last occurrence
+    winning, and existing rows whose ``row_hash`` matches are left
+    untouched. The caller must commit after each chunk so the staging
+    table is dropped.
+
+    Args:
+        session: Database session.
+        records: Prepared absentee ballot record dicts.
+        import_job_id: The current import job ID.
+
+    Returns:
+        Tuple of (inserted_count, updated_count, duplicate_count), where
+        duplicates are the earlier occurrences of a key repeated in the
+        chunk; unchanged rows count as none of these.
+    """
+    if not records:
+        return 0, 0, 0
+
+    # Same key as the merge's DISTINCT ON: every occurrence but one is dropped.
+    keys = {
+        (r.get("voter_registration_number"), r.get("application_date"), r.get("ballot_style") or "") for r in records
+    }
+    duplicates = len(records) - len(keys)
+
+    await session.execute(text(_CREATE_ABSENTEE_STAGING))
+
+    rows = [(seq, *(r.get(col) for col in _COPY_COLUMNS)) for seq, r in enumerate(records)]
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    asyncpg_connection = raw_connection.driver_connection
+    if asyncpg_connection is None:
+        msg = "COPY loader requires an open asyncpg connection"
+        raise RuntimeError(msg)
+    await asyncpg_connection.copy_records_to_table(
+        "absentee_staging",
+        records=rows,
+        columns=["seq", *_COPY_COLUMNS],
+    )
+
+    result = await session.execute(text(_MERGE_ABSENTEE_STAGING), {"import_job_id": import_job_id})
+    merged = result.all()
+    inserted = sum(row.is_insert for row in merged)
+    return inserted, len(merged) - inserted, duplicates
+
+
 async def process_absentee_import(
     session: AsyncSession,
     job: ImportJob,
     file_path: Path,
     batch_size: int = 400,
+    *,
+    use_copy: bool = False,
 ) -> ImportJob:
     """Process an absentee ballot application CSV file import with bulk upsert.
 
     Reads the CSV file in batches using the absentee parser, validates records,
     and upserts them into the database.
 
+    With ``use_copy=True`` each chunk is streamed into a temporary staging
+    table with ``COPY`` and merged with a single set-based statement that
+    skips rows whose ``row_hash`` is unchanged, so re-importing the daily
+    full file only writes the applications that changed. Unchanged rows
+    are counted in ``records_skipped``; rows superseded by a later row with
+    the same key in the same chunk are counted in ``records_deduplicated``.
+
     Args:
         session: Database session.
         job: The ImportJob to track progress.
         file_path: Path to the absentee ballot CSV file.
         batch_size: Records per processing batch.
+        use_copy: If True, load through COPY + staging-table merge.
 
     Returns:
         The updated ImportJob with final counts.
@@ -162,7 +279,10 @@ async def process_absentee_import(
     total = 0
     inserted = 0
     updated_count = 0
+    skipped = 0
+    deduplicated = 0
     errors: list[dict] = []
+    imported_counties: set[str] = set()
 
     try:
         chunk_offset = job.last_processed_offset or 0
@@ -198,9 +318,18 @@ async def process_absentee_import(
                         db_record[key] = value
 
                 valid_records.append(db_record)
+                if record.get("county"):
+                    imported_counties.add(record["county"])
 
             # Upsert batch
-            chunk_inserted, chunk_updated = await _upsert_absentee_batch(session, valid_records)
+            if use_copy:
+                chunk_inserted, chunk_updated, chunk_duplicates = await _copy_merge_absentee_batch(
+                    session, valid_records, job.id
+                )
+                deduplicated += chunk_duplicates
+                skipped += len(valid_records) - chunk_inserted - chunk_updated - chunk_duplicates
+            else:
+                chunk_inserted, chunk_updated = await _upsert_absentee_batch(session, valid_records)
             inserted += chunk_inserted
             updated_count += chunk_updated
 
@@ -216,7 +345,7 @@ async def process_absentee_import(
 
         # Finalize job
         failed = len(errors)
-        succeeded = inserted + updated_count
+        succeeded = inserted + updated_count + skipped + deduplicated
 
         job.status = "completed"
         job.total_records = total
@@ -224,13 +353,19 @@ async def process_absentee_import(
         job.records_failed = failed
         job.records_inserted = inserted
         job.records_updated = updated_count
+        job.records_skipped = skipped
+        job.records_deduplicated = deduplicated
         job.error_log = errors if errors else None
         job.completed_at = datetime.now(UTC)
         await session.commit()
 
+        # A resumed import skipped chunks whose counties are unknown here
+        await _refresh_stats_after_import(session, imported_counties if chunk_offset == 0 else None)
+
         logger.info(
             f"Absentee import completed: {total} total, {succeeded} succeeded, "
-            f"{failed} failed, {inserted} inserted, {updated_count} updated"
+            f"{failed} failed, {inserted} inserted, {updated_count} updated, {skipped} unchanged, "
+            f"{deduplicated} duplicates"
         )
 
     except Exception:
@@ -243,6 +378,82 @@ async def process_absentee_import(
     return job
 
 
+async def refresh_absentee_stats(session: AsyncSession, *, counties: Iterable[str] | None = None) -> int:
+    """Recompute the ``absentee_ballot_stats`` rollup and commit.
+
+    Args:
+        session: Database session.
+        counties: Replace only these counties' rows (the counties an
+            absentee import touched); None rebuilds the whole table.
+
+    Returns:
+        Number of stat rows written.
+    """
+    start = time.monotonic()
+    application_columns = [getattr(AbsenteeBallotApplication, column) for column in _STAT_COLUMNS]
+    source = select(*application_columns, func.count()).group_by(*application_columns)
+    clear = delete(AbsenteeBallotStat)
+    if counties is not None:
+        county_list = sorted(set(counties))
+        if not county_list:
+            return 0
+        source = source.where(AbsenteeBallotApplication.county.in_(county_list))
+        clear = clear.where(AbsenteeBallotStat.county.in_(county_list))
+
+    await session.execute(clear)
+    result = await session.execute(
+        insert(AbsenteeBallotStat).from_select([*_STAT_COLUMNS, "application_count"], source, include_defaults=False)
+    )
+    await session.commit()
+    written: int = result.rowcount  # type: ignore[attr-defined]
+    scope = "all counties" if counties is None else f"{len(county_list)} counties"
+    logger.info(f"Refreshed {written} absentee stat rows for {scope} in {time.monotonic() - start:.2f}s")
+    return written
+
+
+async def _refresh_stats_after_import(session: AsyncSession, counties: set[str] | None) -> None:
+    """Refresh the stats rollup after an import without ever failing it.
+
+    A failure leaves the previous counts in place (stats go stale until
+    the next import).
+    """
+    try:
+        await refresh_absentee_stats(session, counties=counties)
+    except Exception:
+        await session.rollback()
+        logger.exception("Failed to refresh absentee stats after import")
+
+
+def _absentee_conditions(
+    *,
+    county: str | None = None,
+    voter_registration_number: str | None = None,
+    application_status: str | None = None,
+    ballot_status: str | None = None,
+    party: str | None = None,
+) -> list[ColumnElement[bool]]:
+    """Build the WHERE conditions for the given absentee filters (AND logic)."""
+    conditions: list[ColumnElement[bool]] = []
+    if county:
+        conditions.append(AbsenteeBallotApplication.county == county)
+    if voter_registration_number:
+        conditions.append(AbsenteeBallotApplication.voter_registration_number == voter_registration_number)
+    if application_status:
+        conditions.append(AbsenteeBallotApplication.application_status == application_status)
+    if ballot_status:
+        conditions.append(AbsenteeBallotApplication.ballot_status == ballot_status)
+    if party:
+        conditions.append(AbsenteeBallotApplication.party == party)
+    return conditions
+
+
+# Newest first, with the primary key as a tie-breaker: every row of an import
+# shares its transaction's created_at, so the id gives each row a unique
+# position and keyset cursors never skip or repeat applications.
+_LIST_ORDER = (AbsenteeBallotApplication.created_at.desc(), AbsenteeBallotApplication.id.desc())
+_LIST_KEY = (AbsenteeBallotApplication.created_at, AbsenteeBallotApplication.id)
+
+
 async def query_absentee_ballots(
     session: AsyncSession,
     county: str | None = None,
@@ -255,6 +466,10 @@ async def query_absentee_ballots(
 ) -> tuple[list[AbsenteeBallotApplication], int]:
     """Query absentee ballot applications with optional filters and pagination.
 
+    Runs an exact ``COUNT(*)`` and an ``OFFSET`` page;
+    :func:`query_absentee_ballots_keyset` avoids both for deep pages and
+    broad filters.
+
     Args:
         session: Database session.
         county: Filter by county name.
@@ -268,34 +483,21 @@ async def query_absentee_ballots(
     Returns:
         Tuple of (list of AbsenteeBallotApplication records, total count).
     """
-    query = select(AbsenteeBallotApplication)
-    count_query = select(func.count(AbsenteeBallotApplication.id))
-
-    if county:
-        query = query.where(AbsenteeBallotApplication.county == county)
-        count_query = count_query.where(AbsenteeBallotApplication.county == county)
-    if voter_registration_number:
-        query = query.where(AbsenteeBallotApplication.voter_registration_number == voter_registration_number)
-        count_query = count_query.where(
-            AbsenteeBallotApplication.voter_registration_number == voter_registration_number
-        )
-    if application_status:
-        query = query.where(AbsenteeBallotApplication.application_status == application_status)
-        count_query = count_query.where(AbsenteeBallotApplication.application_status == application_status)
-    if ballot_status:
-        query = query.where(AbsenteeBallotApplication.ballot_status == ballot_status)
-        count_query = count_query.where(AbsenteeBallotApplication.ballot_status == ballot_status)
-    if party:
-        query = query.where(AbsenteeBallotApplication.party == party)
-        count_query = count_query.where(AbsenteeBallotApplication.party == party)
+    conditions = _absentee_conditions(
+        county=county,
+        voter_registration_number=voter_registration_number,
+        application_status=application_status,
+        ballot_status=ballot_status,
+        party=party,
+    )
 
     # Get total count
-    total_result = await session.execute(count_query)
-    total = total_result.scalar_one()
+    count_query = select(func.count(AbsenteeBallotApplication.id)).where(*conditions)
+    total = (await session.execute(count_query)).scalar_one()
 
     # Apply pagination and ordering
     offset = (page - 1) * page_size
-    query = query.order_by(AbsenteeBallotApplication.created_at.desc()).offset(offset).limit(page_size)
+    query = select(AbsenteeBallotApplication).where(*conditions).order_by(*_LIST_ORDER).offset(offset).limit(page_size)
 
     result = await session.execute(query)
     records = list(result.scalars().all())
@@ -303,6 +505,130 @@ async def query_absentee_ballots(
     return records, total
 
 
+@dataclass
+class AbsenteePage:
+    """One page of keyset-paginated absentee ballot applications.
+
+    Attributes:
+        records: Applications on this page, newest first.
+        total: Matching applications, exact or approximate per ``total_is_exact``.
+        total_is_exact: False when ``total`` is a planner estimate or a cap.
+        next_cursor: Token for the following page, or None on the last page.
+    """
+
+    records: list[AbsenteeBallotApplication]
+    total: int
+    total_is_exact: bool
+    next_cursor: str | None
+
+
+def encode_absentee_cursor(record: AbsenteeBallotApplication) -> str:
+    """Encode an application's list position as an opaque cursor token.
+
+    Args:
+        record: The last application on the current page.
+
+    Returns:
+        URL-safe token to pass back as ``cursor`` for the next page.
+    """
+    return encode_cursor([record.created_at.isoformat(), str(record.id)])
+
+
+def decode_absentee_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a token produced by :func:`encode_absentee_cursor`.
+
+    Args:
+        cursor: The opaque cursor token.
+
+    Returns:
+        Tuple of (created_at, application id).
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        created_at, record_id = decode_cursor(cursor)
+        return datetime.fromisoformat(created_at), uuid.UUID(record_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+async def query_absentee_ballots_keyset(
+    session: AsyncSession,
+    *,
+    county: str | None = None,
+    voter_registration_number: str | None = None,
+    application_status: str | None = None,
+    ballot_status: str | None = None,
+    party: str | None = None,
+    cursor: str | None = None,
+    page: int = 1,
+    page_size: int = 25,
+    count_mode: CountMode = "estimate",
+) -> AbsenteePage:
+    """Query absentee ballot applications, paging by keyset cursor instead of ``OFFSET``.
+
+    With a ``cursor`` the page starts strictly after the encoded
+    ``(created_at, id)`` position, which the ``ix_aba_*_created`` indexes
+    serve without scanning skipped rows. Without one, ``page`` is applied as
+    an offset so the first page (or a legacy page link) can be fetched
+    before a cursor exists. ``count_mode`` works as in
+    :func:`~voter_api.services.voter_service.search_voters_keyset`.
+
+    Args:
+        session: Database session.
+        county: Filter by county name.
+        voter_registration_number: Filter by voter registration number.
+        application_status: Filter by application status.
+        ballot_status: Filter by ballot status.
+        party: Filter by party.
+        cursor: ``next_cursor`` from a previous page.
+        page: Page number, used only when no cursor is given.
+        page_size: Items per page.
+        count_mode: How to compute the total.
+
+    Returns:
+        The page of applications with its total and next cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    conditions = _absentee_conditions(
+        county=county,
+        voter_registration_number=voter_registration_number,
+        application_status=application_status,
+        ballot_status=ballot_status,
+        party=party,
+    )
+    query = select(AbsenteeBallotApplication).where(*conditions).order_by(*_LIST_ORDER)
+    offset = 0
+    if cursor is not None:
+        position = decode_absentee_cursor(cursor)
+        query = query.where(tuple_(*_LIST_KEY) < tuple_(*position, types=[column.type for column in _LIST_KEY]))
+    else:
+        offset = (page - 1) * page_size
+        query = query.offset(offset)
+
+    # Fetch one extra row to learn whether another page follows.
+    rows = list((await session.execute(query.limit(page_size + 1))).scalars().all())
+    has_more = len(rows) > page_size
+    records = rows[:page_size]
+    next_cursor = encode_absentee_cursor(records[-1]) if has_more else None
+    seen = offset + len(records)
+
+    if cursor is None and not has_more and (records or offset == 0):
+        return AbsenteePage(records=records, total=seen, total_is_exact=True, next_cursor=None)
+
+    total, total_is_exact = await count_total(
+        session,
+        select(AbsenteeBallotApplication.id).where(*conditions),
+        count_mode=count_mode,
+        seen=seen,
+        has_more=has_more,
+    )
+    return AbsenteePage(records=records, total=total, total_is_exact=total_is_exact, next_cursor=next_cursor)
+
+
 async def get_absentee_ballot(
     session: AsyncSession,
     ballot_id: uuid.UUID,
@@ -326,6 +652,10 @@ async def get_absentee_stats(
 ) -> dict:
     """Get aggregate statistics for absentee ballot applications.
 
+    Reads the ``absentee_ballot_stats`` rollup (refreshed by absentee
+    imports through :func:`refresh_absentee_stats`) with one ``GROUPING
+    SETS`` query, so latency does not grow with the applications table.
+
     Args:
         session: Database session.
         county: Optional county filter.
@@ -333,46 +663,36 @@ async def get_absentee_stats(
     Returns:
         Dict with total_applications, by_county, by_status, by_party.
     """
-    base_filter = []
+    county_col = AbsenteeBallotStat.county
+    status_col = AbsenteeBallotStat.application_status
+    party_col = AbsenteeBallotStat.party
+    # GROUPING() sets a bit for each column rolled up in a row's grouping
+    # set, which tells the sets apart even where status or party is NULL.
+    stmt = select(
+        func.grouping(county_col, status_col, party_col),
+        county_col,
+        status_col,
+        party_col,
+        # The grand-total set yields a row even when no stats match, with a NULL sum.
+        func.coalesce(func.sum(AbsenteeBallotStat.application_count), 0),
+    ).group_by(func.grouping_sets(county_col, status_col, party_col, text("()")))
     if county:
-        base_filter.append(AbsenteeBallotApplication.county == county)
-
-    # Total count
-    total_query = select(func.count(AbsenteeBallotApplication.id))
-    if base_filter:
-        total_query = total_query.where(*base_filter)
-    total_result = await session.execute(total_query)
-    total = total_result.scalar_one()
-
-    # By county
-    county_query = select(
-        AbsenteeBallotApplication.county,
-        func.count(AbsenteeBallotApplication.id),
-    ).group_by(AbsenteeBallotApplication.county)
-    if base_filter:
-        county_query = county_query.where(*base_filter)
-    county_result = await session.execute(county_query)
-    by_county = {row[0]: row[1] for row in county_result.all() if row[0] is not None}
-
-    # By application status
-    status_query = select(
-        AbsenteeBallotApplication.application_status,
-        func.count(AbsenteeBallotApplication.id),
-    ).group_by(AbsenteeBallotApplication.application_status)
-    if base_filter:
-        status_query = status_query.where(*base_filter)
-    status_result = await session.execute(status_query)
-    by_status = {row[0]: row[1] for row in status_result.all() if row[0] is not None}
-
-    # By party
-    party_query = select(
-        AbsenteeBallotApplication.party,
-        func.count(AbsenteeBallotApplication.id),
-    ).group_by(AbsenteeBallotApplication.party)
-    if base_filter:
-        party_query = party_query.where(*base_filter)
-    party_result = await session.execute(party_query)
-    by_party = {row[0]: row[1] for row in party_result.all() if row[0] is not None}
+        stmt = stmt.where(county_col == county)
+
+    total = 0
+    by_county: dict[str, int] = {}
+    by_status: dict[str, int] = {}
+    by_party: dict[str, int] = {}
+    for grouping, county_value, status_value, party_value, count in (await session.execute(stmt)).all():
+        count = int(count)
+        if grouping == _GROUPED_TOTAL:
+            total = count
+        elif grouping == _GROUPED_BY_COUNTY and county_value is not None:
+            by_county[county_value] = count
+        elif grouping == _GROUPED_BY_STATUS and status_value is not None:
+            by_status[status_value] = count
+        elif grouping == _GROUPED_BY_PARTY and party_value is not None:
+            by_party[party_value] = count
 
     return {
         "total_applications": total,
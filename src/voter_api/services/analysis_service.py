@@ -7,13 +7,26 @@ from loguru import logger
 from sqlalchemy import func, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
-from voter_api.lib.analyzer.comparator import compare_boundaries, extract_registered_boundaries
+from voter_api.lib.analyzer.comparator import (
+    BOUNDARY_TYPE_TO_VOTER_FIELD,
+    compare_boundaries,
+    extract_registered_boundaries,
+)
 from voter_api.lib.analyzer.spatial import find_boundaries_for_point
 from voter_api.models.analysis_result import AnalysisResult
 from voter_api.models.analysis_run import AnalysisRun
 from voter_api.models.voter import Voter
 
+# Lean loading profile for the analysis batch loop: only the columns
+# _analyze_voter reads (id, official point, registered district fields).
+_ANALYSIS_VOTER_COLUMNS = (
+    Voter.id,
+    Voter.official_point,
+    *(getattr(Voter, field) for field in BOUNDARY_TYPE_TO_VOTER_FIELD.values()),
+)
+
 ANALYSIS_BATCH_SIZE = 100
 
 
@@ -107,9 +120,13 @@ async def process_analysis_run(
 
         while True:
             # Find eligible voters: those with an official location
-            voter_query = select(Voter).where(
-                Voter.present_in_latest_import.is_(True),
-                Voter.official_point.isnot(None),
+            voter_query = (
+                select(Voter)
+                .options(load_only(*_ANALYSIS_VOTER_COLUMNS))
+                .where(
+                    Voter.present_in_latest_import.is_(True),
+                    Voter.official_point.isnot(None),
+                )
             )
 
             if county:
@@ -179,6 +196,10 @@ async def process_analysis_run(
             {"run_id": run.id},
         )
 
+        from voter_api.services.voter_history_service import mark_participation_stats_stale
+
+        # Participation rollups count mismatches from the latest analysis results
+        await mark_participation_stats_stale(session)
         await session.commit()
         await session.refresh(run)
 
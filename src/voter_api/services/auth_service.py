@@ -3,6 +3,7 @@
 Handles user authentication, creation, token generation, and refresh.
 """
 
+import contextlib
 import hashlib
 import secrets
 import uuid
@@ -14,14 +15,14 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from voter_api.core.config import Settings
+from voter_api.core.hashing import PasswordHashingBusyError, get_password_hasher
+from voter_api.core.principal_cache import principal_cache
 from voter_api.core.security import (
     create_access_token,
     create_passkey_challenge_token,
     create_refresh_token,
     decode_passkey_challenge_token,
     decode_token,
-    hash_password,
-    verify_password,
 )
 from voter_api.lib.mailer import MailDeliveryError, MailgunMailer
 from voter_api.lib.passkey import PasskeyManager
@@ -81,7 +82,8 @@ async def authenticate_user(
     """
     result = await session.execute(select(User).where(User.username == username))
     user = result.scalar_one_or_none()
-    if user is None or not verify_password(password, user.hashed_password):
+    hasher = get_password_hasher()
+    if user is None or not await hasher.verify(password, user.hashed_password):
         return None
     if not user.is_active:
         return None
@@ -200,6 +202,12 @@ async def authenticate_user(
                 username=username,
             )
 
+    if hasher.needs_rehash(user.hashed_password):
+        # Upgrade hashes made with a lower work factor while the plaintext is
+        # at hand; best effort, so a busy hashing pool does not fail the login.
+        with contextlib.suppress(PasswordHashingBusyError):
+            user.hashed_password = await hasher.hash(password)
+
     user.last_login_at = datetime.now(UTC)
     await session.commit()
     return user
@@ -228,7 +236,7 @@ async def create_user(session: AsyncSession, request: UserCreateRequest) -> User
     user = User(
         username=request.username,
         email=request.email,
-        hashed_password=hash_password(request.password),
+        hashed_password=await get_password_hasher().hash(request.password),
         role=request.role,
     )
     session.add(user)
@@ -451,9 +459,10 @@ async def confirm_password_reset(
         msg = "User not found"
         raise ValueError(msg)
 
-    user.hashed_password = hash_password(new_password)
+    user.hashed_password = await get_password_hasher().hash(new_password)
     row.used_at = now
     await session.commit()
+    principal_cache.invalidate(user.username)
 
     logger.info(
         "security.password_reset.completed user_id={user_id}",
@@ -678,7 +687,7 @@ async def accept_invite(
     user = User(
         username=username,
         email=row.email,
-        hashed_password=hash_password(password),
+        hashed_password=await get_password_hasher().hash(password),
         role=row.role,
     )
     session.add(user)
@@ -733,6 +742,8 @@ async def update_user(session: AsyncSession, user: User, updates: dict) -> User:
         msg = "Email already in use"
         raise ValueError(msg) from e
     await session.refresh(user)
+    # Role or is_active may have changed; stop serving the cached principal.
+    principal_cache.invalidate(user.username)
     return user
 
 
@@ -743,8 +754,10 @@ async def delete_user(session: AsyncSession, user: User) -> None:
         session: The database session.
         user: The User to delete.
     """
+    username = user.username
     await session.delete(user)
     await session.commit()
+    principal_cache.invalidate(username)
 
 
 # ── TOTP (US3) ──────────────────────────────────────────────────────────────
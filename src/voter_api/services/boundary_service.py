@@ -1,15 +1,17 @@
 """Boundary service — orchestrates boundary import, queries, and spatial operations."""
 
+import json
 import uuid
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
-from geoalchemy2.shape import from_shape
+import shapely
 from loguru import logger
-from sqlalchemy import and_, exists, func, or_, select
+from sqlalchemy import and_, exists, func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from voter_api.lib.boundary_loader import load_boundaries
+from voter_api.lib.boundary_loader import BoundaryData, load_boundaries
 from voter_api.models.boundary import Boundary
 from voter_api.models.county_district import CountyDistrict
 
@@ -85,98 +87,188 @@ def _build_county_filter(county_name: str) -> Any:
     return or_(relation_match, column_match, county_self_match, spatial_fallback)
 
 
-async def import_boundaries(
+_CREATE_BOUNDARY_STAGING = """
+    CREATE TEMP TABLE boundary_staging (
+        name text NOT NULL,
+        boundary_identifier text NOT NULL,
+        county text,
+        geometry_wkb bytea NOT NULL,
+        properties text
+    ) ON COMMIT DROP
+"""
+
+_BOUNDARY_STAGING_COLUMNS = ("name", "boundary_identifier", "county", "geometry_wkb", "properties")
+
+# Legacy rows imported before boundaries carried a county have county IS NULL.
+# Adopt them for the staged county instead of inserting a duplicate, unless a
+# row for that county already exists.
+_ADOPT_LEGACY_BOUNDARIES = """
+    UPDATE boundaries b SET county = s.county
+    FROM (
+        SELECT DISTINCT ON (boundary_identifier) boundary_identifier, county
+        FROM boundary_staging
+        WHERE county IS NOT NULL
+        ORDER BY boundary_identifier, county
+    ) s
+    WHERE b.boundary_type = :boundary_type
+      AND b.boundary_identifier = s.boundary_identifier
+      AND b.county IS NULL
+      AND NOT EXISTS (
+          SELECT 1 FROM boundaries e
+          WHERE e.boundary_type = :boundary_type
+            AND e.boundary_identifier = s.boundary_identifier
+            AND e.county = s.county
+      )
+"""
+
+# NULL counties never conflict under uq_boundary_type_id_county, so the merge
+# is an UPDATE of matched rows plus an INSERT of the rest (IS NOT DISTINCT FROM
+# treats NULL counties as equal) rather than ON CONFLICT.
+_UPDATE_BOUNDARIES_FROM_STAGING = """
+    UPDATE boundaries b SET
+        name = s.name,
+        geometry = ST_GeomFromWKB(s.geometry_wkb, 4326),
+        properties = s.properties::jsonb,
+        source = :source,
+        updated_at = now()
+    FROM boundary_staging s
+    WHERE b.boundary_type = :boundary_type
+      AND b.boundary_identifier = s.boundary_identifier
+      AND b.county IS NOT DISTINCT FROM s.county
+"""
+
+_INSERT_BOUNDARIES_FROM_STAGING = """
+    INSERT INTO boundaries (name, boundary_type, boundary_identifier, source, county, geometry, properties)
+    SELECT s.name, :boundary_type, s.boundary_identifier, :source, s.county,
+           ST_GeomFromWKB(s.geometry_wkb, 4326), s.properties::jsonb
+    FROM boundary_staging s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM boundaries b
+        WHERE b.boundary_type = :boundary_type
+          AND b.boundary_identifier = s.boundary_identifier
+          AND b.county IS NOT DISTINCT FROM s.county
+    )
+"""
+
+_SELECT_STAGED_BOUNDARY_IDS = """
+    SELECT b.id, s.boundary_identifier, s.county
+    FROM boundary_staging s
+    JOIN boundaries b
+      ON b.boundary_type = :boundary_type
+     AND b.boundary_identifier = s.boundary_identifier
+     AND b.county IS NOT DISTINCT FROM s.county
+"""
+
+
+async def upsert_boundaries(
     session: AsyncSession,
-    file_path: Path,
+    boundary_data: Sequence[BoundaryData],
     boundary_type: str,
     source: str,
     county: str | None = None,
-) -> list[Boundary]:
-    """Import boundaries from a file, upserting by type+identifier+county.
+    *,
+    county_from_properties: bool = True,
+) -> int:
+    """Upsert a layer of parsed boundaries with set-based statements.
+
+    The layer is streamed into an ``ON COMMIT DROP`` staging table with the
+    asyncpg binary COPY protocol (geometries as WKB) and merged into
+    ``boundaries`` with a fixed number of statements, independent of the
+    number of features. Features sharing (identifier, county) collapse to
+    the last occurrence. For ``county_precinct`` layers the precinct
+    metadata is upserted in the same transaction. Commits on success.
 
     Args:
         session: Database session.
-        file_path: Path to shapefile or GeoJSON file.
+        boundary_data: Parsed boundaries (see ``load_boundaries``).
         boundary_type: Type of boundary (e.g., congressional, county_precinct).
         source: Data source ("state" or "county").
-        county: County name for county-level boundaries.
+        county: County name applied to every feature.
+        county_from_properties: When ``county`` is None, take each feature's
+            county from its ``CTYNAME``/``COUNTY`` property.
 
     Returns:
-        List of imported/updated Boundary records.
+        Number of distinct boundaries written.
     """
-    boundary_data = load_boundaries(file_path)
-
-    logger.info(f"Importing {len(boundary_data)} boundaries (type={boundary_type}, source={source})")
-
-    imported: list[Boundary] = []
-
+    staged: dict[tuple[str, str | None], BoundaryData] = {}
     for bd in boundary_data:
-        geom_wkb = from_shape(bd.geometry, srid=4326)
-
-        # Extract county from properties when caller doesn't supply one
         effective_county = county
-        if effective_county is None and bd.properties:
+        if effective_county is None and county_from_properties and bd.properties:
             effective_county = bd.properties.get("CTYNAME") or bd.properties.get("COUNTY")
-
-        # Check for existing boundary (upsert)
-        result = await session.execute(
-            select(Boundary).where(
-                Boundary.boundary_type == boundary_type,
-                Boundary.boundary_identifier == bd.boundary_identifier,
-                Boundary.county == effective_county if effective_county else Boundary.county.is_(None),
-            )
+        staged[(bd.boundary_identifier, effective_county)] = bd
+
+    logger.info(f"Importing {len(staged)} boundaries (type={boundary_type}, source={source})")
+    if not staged:
+        return 0
+
+    rows = [
+        (
+            bd.name,
+            identifier,
+            effective_county,
+            shapely.to_wkb(bd.geometry),
+            json.dumps(bd.properties, default=str) if bd.properties else None,
         )
-        existing = result.scalar_one_or_none()
-
-        # Fallback: check for legacy record with NULL county (pre-migration)
-        if existing is None and effective_county is not None:
-            fallback_result = await session.execute(
-                select(Boundary).where(
-                    Boundary.boundary_type == boundary_type,
-                    Boundary.boundary_identifier == bd.boundary_identifier,
-                    Boundary.county.is_(None),
-                )
-            )
-            existing = fallback_result.scalar_one_or_none()
-
-        if existing:
-            existing.name = bd.name
-            existing.geometry = geom_wkb
-            existing.properties = bd.properties
-            existing.source = source
-            if effective_county:
-                existing.county = effective_county
-            imported.append(existing)
-        else:
-            boundary = Boundary(
-                name=bd.name,
-                boundary_type=boundary_type,
-                boundary_identifier=bd.boundary_identifier,
-                source=source,
-                county=effective_county,
-                geometry=geom_wkb,
-                properties=bd.properties,
-            )
-            session.add(boundary)
-            imported.append(boundary)
+        for (identifier, effective_county), bd in staged.items()
+    ]
+
+    await session.execute(text(_CREATE_BOUNDARY_STAGING))
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    asyncpg_connection = raw_connection.driver_connection
+    if asyncpg_connection is None:
+        msg = "Bulk boundary import requires an open asyncpg connection"
+        raise RuntimeError(msg)
+    await asyncpg_connection.copy_records_to_table(
+        "boundary_staging",
+        records=rows,
+        columns=list(_BOUNDARY_STAGING_COLUMNS),
+    )
 
-    await session.commit()
+    params = {"boundary_type": boundary_type, "source": source}
+    await session.execute(text(_ADOPT_LEGACY_BOUNDARIES), {"boundary_type": boundary_type})
+    await session.execute(text(_UPDATE_BOUNDARIES_FROM_STAGING), params)
+    await session.execute(text(_INSERT_BOUNDARIES_FROM_STAGING), params)
 
-    # Import precinct metadata for county_precinct boundaries
     if boundary_type == "county_precinct":
-        from voter_api.services.precinct_metadata_service import upsert_precinct_metadata
-
-        meta_count = 0
-        for b in imported:
-            if b.properties:
-                meta = await upsert_precinct_metadata(session, b.id, b.properties)
-                if meta:
-                    meta_count += 1
-        await session.commit()
+        from voter_api.services.precinct_metadata_service import upsert_precinct_metadata_batch
+
+        id_rows = await session.execute(text(_SELECT_STAGED_BOUNDARY_IDS), {"boundary_type": boundary_type})
+        items = [
+            (boundary_id, staged[(identifier, row_county)].properties)
+            for boundary_id, identifier, row_county in id_rows.all()
+            if staged[(identifier, row_county)].properties
+        ]
+        meta_count = await upsert_precinct_metadata_batch(session, items)
         logger.info(f"Upserted {meta_count} precinct metadata records")
 
-    logger.info(f"Imported {len(imported)} boundaries")
-    return imported
+    await session.commit()
+
+    logger.info(f"Imported {len(staged)} boundaries")
+    return len(staged)
+
+
+async def import_boundaries(
+    session: AsyncSession,
+    file_path: Path,
+    boundary_type: str,
+    source: str,
+    county: str | None = None,
+) -> int:
+    """Import boundaries from a file, upserting by type+identifier+county.
+
+    Args:
+        session: Database session.
+        file_path: Path to shapefile or GeoJSON file.
+        boundary_type: Type of boundary (e.g., congressional, county_precinct).
+        source: Data source ("state" or "county").
+        county: County name for county-level boundaries.
+
+    Returns:
+        Number of imported/updated boundaries.
+    """
+    boundary_data = load_boundaries(file_path)
+    return await upsert_boundaries(session, boundary_data, boundary_type, source, county)
 
 
 async def list_boundaries(
@@ -129,10 +129,18 @@ async def _resolve_election(
     existing = result.scalar_one_or_none()
     if existing is not None:
         # Backfill eligible_county/eligible_municipality if not yet set
+        backfilled = False
         if county and not existing.eligible_county:
             existing.eligible_county = county.upper()
+            backfilled = True
         if municipality and not existing.eligible_municipality:
             existing.eligible_municipality = municipality
+            backfilled = True
+        if backfilled:
+            from voter_api.services.voter_history_service import mark_participation_stats_stale
+
+            # Participation rollups are scoped by the election's county
+            await mark_participation_stats_stale(session, election_ids=[existing.id])
         cache[cache_key] = existing.id
         return existing.id
 
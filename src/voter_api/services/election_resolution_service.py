@@ -24,9 +24,9 @@ from voter_api.lib.district_parser import (
     DISTRICT_TYPE_TO_BOUNDARY_TYPE,
     DISTRICT_TYPE_TO_VOTER_COLUMN,
     PSC_DISTRICT_COUNTIES,
-    pad_district_identifier,
     parse_election_district,
 )
+from voter_api.lib.normalize import normalize_district_identifier
 from voter_api.models.boundary import Boundary
 from voter_api.models.election import Election
 from voter_api.models.election_event import ElectionEvent
@@ -153,14 +153,13 @@ async def link_election_to_boundary(session: AsyncSession, election: Election) -
     if parsed.county and not election.eligible_county:
         election.eligible_county = parsed.county.upper()
 
-    # Look up boundary by (type, zero-padded identifier), scoped by county when known
+    # Look up boundary by (type, canonical identifier key), scoped by county when known
     if parsed.district_identifier is not None:
         boundary_type = DISTRICT_TYPE_TO_BOUNDARY_TYPE.get(parsed.district_type)
         if boundary_type:
-            padded = pad_district_identifier(parsed.district_identifier)
             stmt = select(Boundary.id).where(
                 Boundary.boundary_type == boundary_type,
-                Boundary.boundary_identifier == padded,
+                Boundary.boundary_identifier_key == normalize_district_identifier(parsed.district_identifier),
             )
             if parsed.county:
                 county = parsed.county.strip()
@@ -227,6 +226,13 @@ async def resolve_voter_history_elections(
     if dry_run:
         await session.rollback()
     else:
+        from voter_api.services.voter_history_service import mark_participation_stats_stale
+
+        # Newly linked rows change per-election participation counts
+        if election_date:
+            await mark_participation_stats_stale(session, election_dates=[election_date])
+        else:
+            await mark_participation_stats_stale(session)
         await session.commit()
     logger.info(
         "Election resolution complete: tier0={}, tier1={}, tier2={}, unresolvable={}",
@@ -808,9 +814,8 @@ async def _update_vh_by_municipality(
         if voter_column not in _ALLOWED_VOTER_COLUMNS:
             msg = f"Invalid voter column: {voter_column}"
             raise ValueError(msg)
-        district_ids = _build_district_id_variants(district_identifier)
-        conditions.append(f"v.{voter_column} = ANY(:district_ids)")  # noqa: S608
-        params["district_ids"] = district_ids
+        conditions.append(f"v.{voter_column}_key = :district_key")  # noqa: S608
+        params["district_key"] = normalize_district_identifier(district_identifier)
 
     where_clause = " AND ".join(conditions)
     sql = f"UPDATE voter_history vh SET election_id = :election_id {join_clause} AND {where_clause}"  # noqa: S608
@@ -819,32 +824,6 @@ async def _update_vh_by_municipality(
     return cursor.rowcount  # type: ignore[attr-defined, no-any-return]
 
 
-def _build_district_id_variants(district_identifier: str) -> list[str]:
-    """Generate padded variants of a district identifier.
-
-    Handles zero-padding mismatches between election district text
-    and voter CSV fields.
-
-    Args:
-        district_identifier: Unpadded district identifier (e.g. "5").
-
-    Returns:
-        List of padded/unpadded variants for matching.
-    """
-    if district_identifier.isdigit():
-        num_val = int(district_identifier)
-        return [
-            *{
-                district_identifier,
-                str(num_val),
-                str(num_val).zfill(2),
-                str(num_val).zfill(3),
-                str(num_val).zfill(4),
-            }
-        ]
-    return [district_identifier]
-
-
 async def _update_vh_by_district(
     session: AsyncSession,
     *,
@@ -865,7 +844,7 @@ async def _update_vh_by_district(
         election_id: Election UUID to assign.
         election_date: Election date filter.
         voter_column: Voter table column name for district matching.
-        district_identifier: Unpadded district identifier value.
+        district_identifier: District identifier (compared by canonical key).
         county: Optional county name for sub-county scoping.
         force: If True, overwrite existing election_id values.
 
@@ -876,14 +855,12 @@ async def _update_vh_by_district(
         msg = f"Invalid voter column: {voter_column}"
         raise ValueError(msg)
 
-    district_ids = _build_district_id_variants(district_identifier)
-
     null_filter = "" if force else "AND vh.election_id IS NULL "
     county_filter = ""
     params: dict[str, object] = {
         "election_id": election_id,
         "election_date": election_date,
-        "district_ids": district_ids,
+        "district_key": normalize_district_identifier(district_identifier),
     }
 
     if county:
@@ -898,7 +875,7 @@ async def _update_vh_by_district(
         f"AND vh.election_date = :election_date "
         f"{null_filter}"
         f"{county_filter}"
-        f"AND v.{voter_column} = ANY(:district_ids)"
+        f"AND v.{voter_column}_key = :district_key"
     )
     cursor = await session.execute(text(sql), params)
     return cursor.rowcount  # type: ignore[attr-defined, no-any-return]
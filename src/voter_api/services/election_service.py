@@ -20,12 +20,14 @@ if TYPE_CHECKING:
 
 from voter_api.core.config import get_settings
 from voter_api.lib.election_tracker import (
+    CountyResultData,
     ElectionType,
     FetchError,
     IngestionResult,
     SoSFeed,
     detect_election_type,
     fetch_election_results,
+    ingest_all_election_results,
     ingest_election_results,
 )
 from voter_api.models.election import Election, ElectionCountyResult, ElectionResult
@@ -274,6 +276,53 @@ async def get_election_by_id(
     return result.scalar_one_or_none()
 
 
+async def get_results_version(
+    session: AsyncSession,
+    election_id: uuid.UUID,
+) -> str | None:
+    """Return the cache version token of an election's results without loading them.
+
+    The token changes whenever the election row is touched (``updated_at``)
+    or its results are re-ingested (``last_refreshed_at``), so cached
+    results payloads keyed by it are invalidated by ``refresh_single_election``,
+    results file imports, manual result submission, and metadata edits alike.
+
+    Args:
+        session: Async database session.
+        election_id: The election UUID.
+
+    Returns:
+        Opaque version token, or None if the election does not exist or is deleted.
+    """
+    result = await session.execute(
+        select(Election.updated_at, Election.last_refreshed_at, Election.status).where(
+            Election.id == election_id, Election.deleted_at.is_(None)
+        )
+    )
+    row = result.first()
+    if row is None:
+        return None
+    updated_at, last_refreshed_at, status = row
+    refreshed = last_refreshed_at.isoformat() if last_refreshed_at else "never"
+    updated = updated_at.isoformat() if updated_at else "never"
+    return f"{refreshed}|{updated}|{status}"
+
+
+# Election fields the participation stats rollup depends on (history
+# matching, county scoping and the eligible-voter boundary).
+_PARTICIPATION_FIELDS = frozenset(
+    {
+        "election_date",
+        "election_type",
+        "district_type",
+        "district_identifier",
+        "boundary_id",
+        "eligible_county",
+        "eligible_municipality",
+    }
+)
+
+
 async def update_election(
     session: AsyncSession,
     election_id: uuid.UUID,
@@ -294,11 +343,18 @@ async def update_election(
         return None
 
     update_data = request.model_dump(exclude_unset=True)
+    participation_changed = False
     for field, value in update_data.items():
         if field == "data_source_url" and value is not None:
             value = str(value)
+        if field in _PARTICIPATION_FIELDS and getattr(election, field) != value:
+            participation_changed = True
         setattr(election, field, value)
 
+    if participation_changed:
+        from voter_api.services.voter_history_service import mark_participation_stats_stale
+
+        await mark_participation_stats_stale(session, election_ids=[election.id])
     await session.commit()
     await session.refresh(election)
     return election
@@ -672,35 +728,55 @@ async def persist_ingestion_result(
     # --- County results upsert ---
     counties_updated = 0
     for county in ingestion.counties:
-        existing_county = await session.execute(
-            select(ElectionCountyResult).where(
-                ElectionCountyResult.election_id == election_id,
-                ElectionCountyResult.county_name == county.county_name,
-            )
-        )
-        county_row = existing_county.scalar_one_or_none()
-
-        if county_row is None:
-            county_row = ElectionCountyResult(
-                election_id=election_id,
-                county_name=county.county_name,
-                county_name_normalized=county.county_name_normalized,
-                precincts_participating=county.precincts_participating,
-                precincts_reporting=county.precincts_reporting,
-                results_data=county.results_data,
-            )
-            session.add(county_row)
-        else:
-            county_row.precincts_participating = county.precincts_participating
-            county_row.precincts_reporting = county.precincts_reporting
-            county_row.results_data = county.results_data
-
+        await persist_county_result(session, election_id, county, flush=False)
         counties_updated += 1
 
     await session.flush()
     return counties_updated
 
 
+async def persist_county_result(
+    session: AsyncSession,
+    election_id: uuid.UUID,
+    county: CountyResultData,
+    *,
+    flush: bool = True,
+) -> None:
+    """Upsert one county's result for an election.
+
+    Args:
+        session: Async database session.
+        election_id: The UUID of the election to update.
+        county: Extracted county result data.
+        flush: Flush the session afterwards.
+    """
+    existing_county = await session.execute(
+        select(ElectionCountyResult).where(
+            ElectionCountyResult.election_id == election_id,
+            ElectionCountyResult.county_name == county.county_name,
+        )
+    )
+    county_row = existing_county.scalar_one_or_none()
+
+    if county_row is None:
+        county_row = ElectionCountyResult(
+            election_id=election_id,
+            county_name=county.county_name,
+            county_name_normalized=county.county_name_normalized,
+            precincts_participating=county.precincts_participating,
+            precincts_reporting=county.precincts_reporting,
+            results_data=county.results_data,
+        )
+        session.add(county_row)
+    else:
+        county_row.precincts_participating = county.precincts_participating
+        county_row.precincts_reporting = county.precincts_reporting
+        county_row.results_data = county.results_data
+
+    if flush:
+        await session.flush()
+
+
 async def refresh_single_election(
     session: AsyncSession,
     election_id: uuid.UUID,
@@ -1327,6 +1403,7 @@ async def import_feed(
     election_date, election_type, status = _resolve_feed_metadata(feed, request.election_type)
     created_elections: list[FeedImportedElection] = []
     skipped = 0
+    ingestions: dict[str, IngestionResult] | None = None
 
     for ballot_item in feed.results.ballotItems:
         election_name = f"{feed.electionName} - {ballot_item.name}"
@@ -1376,7 +1453,9 @@ async def import_feed(
                 )
         elif request.auto_refresh and status == "finalized":
             try:
-                ingestion = ingest_election_results(feed, ballot_item_id=ballot_item.id)
+                if ingestions is None:
+                    ingestions = ingest_all_election_results(feed)
+                ingestion = ingestions[ballot_item.id]
                 await persist_ingestion_result(session, election.id, ingestion)
                 election.last_refreshed_at = datetime.now(UTC)
                 await session.commit()
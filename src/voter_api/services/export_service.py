@@ -8,12 +8,34 @@ from typing import Any
 from loguru import logger
 from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from voter_api.lib.exporter import export_voters
 from voter_api.models.analysis_result import AnalysisResult
 from voter_api.models.export_job import ExportJob
 from voter_api.models.voter import Voter
 
+# Lean loading profile for exports: exactly the columns _voter_to_dict reads.
+_EXPORT_VOTER_COLUMNS = (
+    Voter.voter_registration_number,
+    Voter.county,
+    Voter.status,
+    Voter.last_name,
+    Voter.first_name,
+    Voter.middle_name,
+    Voter.residence_street_number,
+    Voter.residence_street_name,
+    Voter.residence_street_type,
+    Voter.residence_city,
+    Voter.residence_zipcode,
+    Voter.congressional_district,
+    Voter.state_senate_district,
+    Voter.state_house_district,
+    Voter.county_precinct,
+    Voter.official_latitude,
+    Voter.official_longitude,
+)
+
 
 async def create_export_job(
     session: AsyncSession,
@@ -113,7 +135,7 @@ def _build_export_query(filters: dict) -> Select[Any]:
     Returns:
         Configured select query.
     """
-    query = select(Voter)
+    query = select(Voter).options(load_only(*_EXPORT_VOTER_COLUMNS))
 
     # Apply standard voter filters
     if filters.get("county"):
@@ -10,6 +10,7 @@ from shapely.geometry import Point
 from sqlalchemy import func, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from voter_api.core.config import get_settings
 from voter_api.lib.geocoder import (
@@ -50,6 +51,21 @@ RETRY_BASE_DELAY = 60.0  # seconds
 # Terminal job statuses — no further transitions allowed
 TERMINAL_STATUSES: frozenset[str] = frozenset({"completed", "failed", "cancelled"})
 
+# Lean loading profile for the batch geocoding loop: the residence address
+# parts fed to reconstruct_address plus what sync_official_location reads.
+_GEOCODING_VOTER_COLUMNS = (
+    Voter.id,
+    Voter.residence_street_number,
+    Voter.residence_pre_direction,
+    Voter.residence_street_name,
+    Voter.residence_street_type,
+    Voter.residence_post_direction,
+    Voter.residence_apt_unit_number,
+    Voter.residence_city,
+    Voter.residence_zipcode,
+    Voter.official_is_override,
+)
+
 
 class GeocodingJobNotFoundError(Exception):
     """Raised when a geocoding job cannot be found by the given ID."""
@@ -488,7 +504,9 @@ async def process_geocoding_job(
         semaphore = asyncio.Semaphore(rate_limit)
 
         # Build voter query
-        query = select(Voter).where(Voter.present_in_latest_import.is_(True))
+        query = (
+            select(Voter).options(load_only(*_GEOCODING_VOTER_COLUMNS)).where(Voter.present_in_latest_import.is_(True))
+        )
 
         if job.county:
             query = query.where(Voter.county == job.county)
@@ -514,6 +532,24 @@ async def process_geocoding_job(
         # Process in batches with keyset pagination
         offset = job.last_processed_voter_offset or 0
         last_voter_id: uuid.UUID | None = None
+        if offset and job.force_regeocode:
+            # Resume: the eligible set is unchanged, so the checkpoint offset
+            # locates the keyset cursor of the last committed batch.
+            cursor_result = await session.execute(query.with_only_columns(Voter.id).offset(offset - 1).limit(1))
+            last_voter_id = cursor_result.scalar_one_or_none()
+            processed = job.processed or 0
+            succeeded = job.succeeded or 0
+            failed_count = job.failed or 0
+            cache_hits = job.cache_hits or 0
+            logger.info("Geocoding job {} resuming after {} of {} voters", job.id, offset, total)
+        elif offset:
+            # Resume: voters geocoded before the interruption have left the
+            # eligible set, so start over on what remains (retrying failures).
+            succeeded = job.succeeded or 0
+            cache_hits = job.cache_hits or 0
+            processed = succeeded
+            logger.info("Geocoding job {} resuming: {} already geocoded, {} remaining", job.id, succeeded, total)
+            offset = 0
         next_log_pct = 10  # Log progress every 10%
 
         while offset < total:
@@ -1,11 +1,24 @@
-"""Import service — orchestrates voter file import with upsert, soft-delete, and diff tracking."""
-
+"""Import service — orchestrates voter file import with upsert, soft-delete, and diff tracking.
+
+Voter files are imported as a producer/consumer pipeline: a reader thread
+parses CSV chunks, an executor (a process pool for bulk seeding, the
+default thread pool otherwise) validates and type-coerces them into
+compact picklable :class:`PreparedVoterChunk` batches, and the async
+consumer upserts them in order. A bounded queue of in-flight chunks
+provides back-pressure so a slow database never lets prepared batches
+pile up in memory.
+"""
+
+import asyncio
 import time
 import uuid
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, AsyncIterator
+from concurrent.futures import Executor
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 from dateutil.parser import parse as parse_date
@@ -27,6 +40,9 @@ _IN_CLAUSE_BATCH = 5000
 # Sub-batch size for bulk upsert: ~50 columns * 500 rows = 25,000 params (under 32,767 limit)
 _UPSERT_SUB_BATCH = 500
 
+# Default number of prepared chunks allowed in flight per file.
+_DEFAULT_QUEUE_DEPTH = 4
+
 _DATE_FIELDS = (
     "registration_date",
     "last_modified_date",
@@ -68,9 +84,13 @@ _DROPPABLE_INDEXES: list[dict[str, str]] = [
         "name": "ix_voters_middle_name_trgm",
         "create": "CREATE INDEX ix_voters_middle_name_trgm ON voters USING GIN (middle_name gin_trgm_ops)",
     },
+    {
+        "name": "ix_voters_search_name_trgm",
+        "create": "CREATE INDEX ix_voters_search_name_trgm ON voters USING GIST (search_name gist_trgm_ops)",
+    },
     {
         "name": "ix_voters_name_search",
-        "create": "CREATE INDEX ix_voters_name_search ON voters (last_name, first_name)",
+        "create": "CREATE INDEX ix_voters_name_search ON voters (last_name, first_name, id)",
     },
     {
         "name": "ix_voters_county_status",
@@ -88,6 +108,36 @@ _DROPPABLE_INDEXES: list[dict[str, str]] = [
         "name": "ix_voters_city_zip",
         "create": "CREATE INDEX ix_voters_city_zip ON voters (residence_city, residence_zipcode)",
     },
+    {
+        "name": "ix_voters_congressional_district_key",
+        "create": "CREATE INDEX ix_voters_congressional_district_key ON voters (congressional_district_key)",
+    },
+    {
+        "name": "ix_voters_state_senate_district_key",
+        "create": "CREATE INDEX ix_voters_state_senate_district_key ON voters (state_senate_district_key)",
+    },
+    {
+        "name": "ix_voters_state_house_district_key",
+        "create": "CREATE INDEX ix_voters_state_house_district_key ON voters (state_house_district_key)",
+    },
+    {
+        "name": "ix_voters_judicial_district_key",
+        "create": "CREATE INDEX ix_voters_judicial_district_key ON voters (judicial_district_key)",
+    },
+    {
+        "name": "ix_voters_county_commission_district_key",
+        "create": (
+            "CREATE INDEX ix_voters_county_commission_district_key ON voters (county, county_commission_district_key)"
+        ),
+    },
+    {
+        "name": "ix_voters_school_board_district_key",
+        "create": "CREATE INDEX ix_voters_school_board_district_key ON voters (county, school_board_district_key)",
+    },
+    {
+        "name": "ix_voters_city_council_district_key",
+        "create": "CREATE INDEX ix_voters_city_council_district_key ON voters (city_council_district_key)",
+    },
 ]
 
 
@@ -130,7 +180,7 @@ async def _soft_delete_absent_voters(
     return len(absent_list)
 
 
-async def _drop_import_indexes(session: AsyncSession) -> None:
+async def _drop_import_indexes(session: AsyncSession, indexes: list[dict[str, str]] = _DROPPABLE_INDEXES) -> None:
     """Drop non-essential indexes before bulk import.
 
     Drops GIN trigram and composite B-tree indexes that are expensive
@@ -138,15 +188,16 @@ async def _drop_import_indexes(session: AsyncSession) -> None:
 
     Args:
         session: Database session.
+        indexes: Indexes to drop (default: the voters table's).
     """
-    for idx in _DROPPABLE_INDEXES:
+    for idx in indexes:
         await session.execute(text(f"DROP INDEX IF EXISTS {idx['name']}"))
         logger.debug(f"Dropped index: {idx['name']}")
     await session.commit()
-    logger.info(f"Dropped {len(_DROPPABLE_INDEXES)} indexes for bulk import")
+    logger.info(f"Dropped {len(indexes)} indexes for bulk import")
 
 
-async def _rebuild_import_indexes(session: AsyncSession) -> None:
+async def _rebuild_import_indexes(session: AsyncSession, indexes: list[dict[str, str]] = _DROPPABLE_INDEXES) -> None:
     """Rebuild indexes after bulk import.
 
     Uses elevated maintenance_work_mem for faster index creation.
@@ -154,11 +205,12 @@ async def _rebuild_import_indexes(session: AsyncSession) -> None:
 
     Args:
         session: Database session.
+        indexes: Indexes to rebuild (default: the voters table's).
     """
     await session.execute(text("SET maintenance_work_mem = '512MB'"))
     await session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
 
-    for idx in _DROPPABLE_INDEXES:
+    for idx in indexes:
         create_sql = idx["create"].replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS", 1)
         logger.info(f"Rebuilding index: {idx['name']}")
         start = time.monotonic()
@@ -168,39 +220,71 @@ async def _rebuild_import_indexes(session: AsyncSession) -> None:
 
     await session.execute(text("RESET maintenance_work_mem"))
     await session.commit()
-    logger.info(f"Rebuilt all {len(_DROPPABLE_INDEXES)} indexes")
+    logger.info(f"Rebuilt all {len(indexes)} indexes")
+
 
+async def repair_bulk_import_state(
+    session: AsyncSession,
+    table: str = "voters",
+    indexes: list[dict[str, str]] = _DROPPABLE_INDEXES,
+) -> None:
+    """Undo bulk import optimizations left behind by a crashed import.
 
-async def _disable_autovacuum(session: AsyncSession) -> None:
-    """Disable autovacuum on the voters table for bulk import.
+    Re-enables autovacuum on ``table`` if it is disabled and rebuilds any of
+    ``indexes`` that are missing. Does nothing when the table is in order.
 
     Args:
         session: Database session.
+        table: Table the import was loading (default: voters).
+        indexes: Its droppable indexes (default: the voters table's).
     """
-    await session.execute(text("ALTER TABLE voters SET (autovacuum_enabled = false)"))
+    result = await session.execute(text("SELECT reloptions FROM pg_class WHERE relname = :table"), {"table": table})
+    row = result.first()
+    if row and row[0] and "autovacuum_enabled=false" in str(row[0]):
+        logger.warning("Autovacuum is disabled on {} table — re-enabling after crash recovery", table)
+        await session.execute(text(f"ALTER TABLE {table} SET (autovacuum_enabled = true)"))
+        await session.commit()
+
+    for idx in indexes:
+        result = await session.execute(text("SELECT 1 FROM pg_indexes WHERE indexname = :name"), {"name": idx["name"]})
+        if result.first() is None:
+            logger.warning("Missing index {} — rebuilding after crash recovery", idx["name"])
+            await session.execute(text(idx["create"]))
+            await session.commit()
+
+
+async def _disable_autovacuum(session: AsyncSession, table: str = "voters") -> None:
+    """Disable autovacuum on a table (default: voters) for bulk import.
+
+    Args:
+        session: Database session.
+        table: Table being bulk loaded.
+    """
+    await session.execute(text(f"ALTER TABLE {table} SET (autovacuum_enabled = false)"))
     await session.commit()
-    logger.info("Disabled autovacuum on voters table")
+    logger.info(f"Disabled autovacuum on {table} table")
 
 
-async def _enable_autovacuum_and_vacuum(session: AsyncSession) -> None:
-    """Re-enable autovacuum and run VACUUM ANALYZE on the voters table.
+async def _enable_autovacuum_and_vacuum(session: AsyncSession, table: str = "voters") -> None:
+    """Re-enable autovacuum and run VACUUM ANALYZE on a table (default: voters).
 
     VACUUM cannot run inside a transaction block, so we use the raw
     asyncpg driver connection.
 
     Args:
         session: Database session.
+        table: Table that was bulk loaded.
     """
-    await session.execute(text("ALTER TABLE voters SET (autovacuum_enabled = true)"))
+    await session.execute(text(f"ALTER TABLE {table} SET (autovacuum_enabled = true)"))
     await session.commit()
-    logger.info("Re-enabled autovacuum on voters table")
+    logger.info(f"Re-enabled autovacuum on {table} table")
 
-    logger.info("Running VACUUM ANALYZE on voters table...")
+    logger.info(f"Running VACUUM ANALYZE on {table} table...")
     start = time.monotonic()
     engine = get_engine()
     async with engine.connect() as vacuum_conn:
         autocommit_conn = await vacuum_conn.execution_options(isolation_level="AUTOCOMMIT")
-        await autocommit_conn.execute(text("VACUUM ANALYZE voters"))
+        await autocommit_conn.execute(text(f"VACUUM ANALYZE {table}"))
     elapsed = time.monotonic() - start
     logger.info(f"VACUUM ANALYZE completed in {elapsed:.1f}s")
 
@@ -308,6 +392,7 @@ def _prepare_records_for_db(
 async def _upsert_voter_batch(
     session: AsyncSession,
     records: list[dict],
+    previous_counties: set[str] | None = None,
 ) -> tuple[int, int]:
     """Bulk upsert voter records using PostgreSQL INSERT ... ON CONFLICT.
 
@@ -321,6 +406,9 @@ async def _upsert_voter_batch(
     Args:
         session: Database session.
         records: Prepared record dicts (from ``_prepare_records_for_db``).
+        previous_counties: Optional mutable set to collect the counties
+            voters are moving out of (their stored county before the
+            upsert, where it differs from every county in the batch).
 
     Returns:
         Tuple of (inserted_count, updated_count).
@@ -338,6 +426,18 @@ async def _upsert_voter_batch(
     for i in range(0, len(records), _UPSERT_SUB_BATCH):
         batch = records[i : i + _UPSERT_SUB_BATCH]
 
+        if previous_counties is not None:
+            batch_counties = {record.get("county") for record in batch} - {None}
+            moved_from = await session.execute(
+                select(Voter.county)
+                .where(
+                    Voter.voter_registration_number.in_([record["voter_registration_number"] for record in batch]),
+                    Voter.county.not_in(batch_counties),
+                )
+                .distinct()
+            )
+            previous_counties.update(county for county in moved_from.scalars() if county)
+
         stmt = pg_insert(Voter).values(batch)
         stmt = stmt.on_conflict_do_update(
             index_elements=["voter_registration_number"],
@@ -359,6 +459,21 @@ async def _upsert_voter_batch(
     return total_inserted, total_updated
 
 
+async def _refresh_filter_facets(session: AsyncSession, counties: set[str]) -> None:
+    """Rebuild the search filter facets of the imported counties.
+
+    A failure here leaves the previous facets in place (the dropdowns go
+    stale until the next import) but never fails the completed import.
+    """
+    from voter_api.services.voter_service import refresh_voter_filter_facets
+
+    try:
+        await refresh_voter_filter_facets(session, counties=counties)
+    except Exception:
+        await session.rollback()
+        logger.exception(f"Failed to refresh voter filter facets for {len(counties)} counties")
+
+
 async def create_import_job(
     session: AsyncSession,
     *,
@@ -389,53 +504,216 @@ async def create_import_job(
     return job
 
 
-async def _process_chunk(
-    session: AsyncSession,
-    job: ImportJob,
-    chunk: pd.DataFrame,
-    chunk_idx: int,
-    errors: list[dict],
-    imported_reg_numbers: set[str],
-) -> tuple[int, int, int, str | None]:
-    """Validate and upsert a single CSV chunk.
+@dataclass(frozen=True, slots=True)
+class PreparedVoterChunk:
+    """Import-ready form of one CSV chunk.
+
+    Built by :func:`prepare_voter_chunk`, possibly in a worker process, so it
+    only holds picklable data: the column names once plus one value tuple
+    per valid record.
+
+    Attributes:
+        chunk_idx: Zero-based chunk index within the file.
+        total: Number of rows in the chunk (valid and failed).
+        county: County of the first row, used to scope soft-deletes.
+        columns: Column names shared by every row tuple.
+        rows: Value tuples for the records to upsert.
+        errors: Validation errors for rejected rows.
+        prepare_seconds: Time spent preparing the chunk.
+    """
+
+    chunk_idx: int
+    total: int
+    county: str | None
+    columns: tuple[str, ...]
+    rows: list[tuple[Any, ...]]
+    errors: list[dict]
+    prepare_seconds: float
+
+    def records(self) -> list[dict]:
+        """Return the rows as column-keyed dicts for the upsert statement."""
+        return [dict(zip(self.columns, row, strict=True)) for row in self.rows]
+
+    def registration_numbers(self) -> set[str]:
+        """Return the registration numbers of the rows in this chunk."""
+        if not self.rows:
+            return set()
+        idx = self.columns.index("voter_registration_number")
+        return {row[idx] for row in self.rows}
+
+    def counties(self) -> set[str]:
+        """Return the counties of the rows in this chunk."""
+        if not self.rows:
+            return set()
+        idx = self.columns.index("county")
+        return {row[idx] for row in self.rows if row[idx]}
+
+
+@dataclass(slots=True)
+class ImportStageTimings:
+    """Seconds spent in each stage of a pipelined voter import.
+
+    ``prepare_seconds`` is summed across chunks, so it exceeds wall-clock
+    time when chunks are prepared in parallel. ``wait_seconds`` is time
+    the writer sat idle waiting for the next prepared chunk; a large value
+    means the import is CPU-bound rather than database-bound.
+    """
+
+    chunks: int = 0
+    read_seconds: float = 0.0
+    prepare_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    def merge(self, other: "ImportStageTimings") -> None:
+        """Add another import's timings to this one."""
+        self.chunks += other.chunks
+        self.read_seconds += other.read_seconds
+        self.prepare_seconds += other.prepare_seconds
+        self.wait_seconds += other.wait_seconds
+        self.write_seconds += other.write_seconds
+
+    def summary(self) -> str:
+        """Return a one-line human-readable summary."""
+        return (
+            f"{self.chunks} chunks: read {self.read_seconds:.1f}s, prepare {self.prepare_seconds:.1f}s, "
+            f"write {self.write_seconds:.1f}s, writer idle {self.wait_seconds:.1f}s"
+        )
+
+
+def prepare_voter_chunk(chunk: pd.DataFrame, chunk_idx: int, job_id: uuid.UUID) -> PreparedVoterChunk:
+    """Validate and type-coerce one CSV chunk into an import-ready batch.
+
+    Pure CPU work with picklable arguments and result, so it can run in a
+    worker process.
 
     Args:
-        session: Database session.
-        job: The ImportJob to track progress.
         chunk: DataFrame chunk from the CSV parser.
-        chunk_idx: Zero-based chunk index (for logging).
-        errors: Mutable list to append validation errors to.
-        imported_reg_numbers: Mutable set to accumulate registration numbers.
+        chunk_idx: Zero-based chunk index.
+        job_id: Current import job ID.
 
     Returns:
-        Tuple of (total_in_chunk, chunk_inserted, chunk_updated, detected_county).
+        The prepared chunk.
     """
+    start = time.perf_counter()
     records = [{k: (None if pd.isna(v) else v) for k, v in row.items()} for row in chunk.to_dict("records")]
 
     # Detect county for scoped soft-delete
     detected_county = records[0].get("county") if records else None
 
     valid_records, failed_records = validate_batch(records)
-
-    logger.info(
-        f"Chunk {chunk_idx + 1}: {len(records)} records ({len(valid_records)} valid, {len(failed_records)} failed)"
-    )
-
-    errors.extend(
+    errors = [
         {
             "voter_registration_number": fr.get("voter_registration_number", "unknown"),
             "errors": fr.get("_validation_errors", []),
         }
         for fr in failed_records
+    ]
+
+    db_records, _ = _prepare_records_for_db(valid_records, job_id)
+    columns = tuple(db_records[0]) if db_records else ()
+    rows = [tuple(record.get(col) for col in columns) for record in db_records]
+
+    return PreparedVoterChunk(
+        chunk_idx=chunk_idx,
+        total=len(records),
+        county=detected_county,
+        columns=columns,
+        rows=rows,
+        errors=errors,
+        prepare_seconds=time.perf_counter() - start,
     )
 
-    # Prepare and bulk-upsert valid records
-    db_records, chunk_reg_numbers = _prepare_records_for_db(valid_records, job.id)
-    imported_reg_numbers.update(chunk_reg_numbers)
 
-    chunk_inserted, chunk_updated = await _upsert_voter_batch(session, db_records)
+async def _iter_prepared_chunks(
+    file_path: Path,
+    batch_size: int,
+    job_id: uuid.UUID,
+    *,
+    start_chunk: int,
+    executor: Executor | None,
+    queue_depth: int,
+    timings: ImportStageTimings,
+) -> AsyncGenerator[PreparedVoterChunk]:
+    """Yield prepared chunks in file order while later chunks are being prepared.
+
+    A producer task reads CSV chunks in a thread and submits each to
+    ``executor``; at most ``queue_depth`` submitted chunks are held at once.
+    Chunks before ``start_chunk`` (already checkpointed) are read but not
+    prepared.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[asyncio.Future[PreparedVoterChunk] | None] = asyncio.Queue(maxsize=queue_depth)
+
+    async def _produce() -> None:
+        chunks = parse_csv_chunks(file_path, batch_size)
+        chunk_idx = 0
+        try:
+            while True:
+                read_start = time.monotonic()
+                chunk = await asyncio.to_thread(next, chunks, None)
+                timings.read_seconds += time.monotonic() - read_start
+                if chunk is None:
+                    break
+                if chunk_idx >= start_chunk:
+                    await queue.put(loop.run_in_executor(executor, prepare_voter_chunk, chunk, chunk_idx, job_id))
+                chunk_idx += 1
+        except Exception as exc:
+            # Surface reader errors (e.g. unknown columns) to the consumer in order.
+            failure: asyncio.Future[PreparedVoterChunk] = loop.create_future()
+            failure.set_exception(exc)
+            await queue.put(failure)
+        await queue.put(None)
+
+    producer = asyncio.create_task(_produce())
+    try:
+        while True:
+            wait_start = time.monotonic()
+            pending = await queue.get()
+            if pending is None:
+                timings.wait_seconds += time.monotonic() - wait_start
+                break
+            prepared = await pending
+            timings.wait_seconds += time.monotonic() - wait_start
+            timings.prepare_seconds += prepared.prepare_seconds
+            timings.chunks += 1
+            yield prepared
+    finally:
+        producer.cancel()
+        while not queue.empty():
+            leftover = queue.get_nowait()
+            if leftover is not None:
+                leftover.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def _write_prepared_chunk(
+    session: AsyncSession,
+    prepared: PreparedVoterChunk,
+    errors: list[dict],
+    imported_reg_numbers: set[str],
+    previous_counties: set[str] | None = None,
+) -> tuple[int, int]:
+    """Upsert a prepared chunk and record its errors and registration numbers.
+
+    Args:
+        session: Database session.
+        prepared: Chunk built by :func:`prepare_voter_chunk`.
+        errors: Mutable list to append validation errors to.
+        imported_reg_numbers: Mutable set to accumulate registration numbers.
+        previous_counties: Optional mutable set to accumulate the counties
+            updated voters moved out of.
 
-    return len(records), chunk_inserted, chunk_updated, detected_county
+    Returns:
+        Tuple of (chunk_inserted, chunk_updated).
+    """
+    logger.info(
+        f"Chunk {prepared.chunk_idx + 1}: {prepared.total} records "
+        f"({len(prepared.rows)} valid, {len(prepared.errors)} failed)"
+    )
+    errors.extend(prepared.errors)
+    imported_reg_numbers.update(prepared.registration_numbers())
+    return await _upsert_voter_batch(session, prepared.records(), previous_counties)
 
 
 async def process_voter_import(
@@ -446,11 +724,16 @@ async def process_voter_import(
     *,
     skip_optimizations: bool = False,
     max_records: int | None = None,
+    executor: Executor | None = None,
+    queue_depth: int = _DEFAULT_QUEUE_DEPTH,
+    stage_timings: ImportStageTimings | None = None,
 ) -> ImportJob:
     """Process a voter CSV file import with bulk optimizations.
 
     Reads the file in chunks, validates records, upserts voters,
-    soft-deletes absent voters, and generates a diff report.
+    soft-deletes absent voters, and generates a diff report. Chunk
+    preparation runs on ``executor`` and overlaps with the database writes
+    of earlier chunks (see the module docstring).
 
     Performance optimizations applied during import (unless skipped):
     - Drops non-essential indexes, rebuilds after
@@ -470,10 +753,16 @@ async def process_voter_import(
             ``bulk_import_context``.
         max_records: If set, stop importing after this many records.
             Soft-delete is skipped for partial imports.
+        executor: Executor for chunk preparation. Pass a process pool to
+            prepare chunks in parallel; None uses the default thread pool.
+        queue_depth: Maximum number of chunks being prepared or waiting
+            to be written at once.
+        stage_timings: Optional accumulator for per-stage timings.
 
     Returns:
         The updated ImportJob with final counts.
     """
+    timings = stage_timings if stage_timings is not None else ImportStageTimings()
     job.status = "running"
     job.started_at = datetime.now(UTC)
     await session.commit()
@@ -483,6 +772,7 @@ async def process_voter_import(
     updated_count = 0
     errors: list[dict] = []
     imported_reg_numbers: set[str] = set()
+    imported_counties: set[str] = set()
     import_county: str | None = None
 
     try:
@@ -496,42 +786,67 @@ async def process_voter_import(
             logger.info("Bulk import optimizations applied")
 
         chunk_offset = job.last_processed_offset or 0
-        for chunk_idx, chunk in enumerate(parse_csv_chunks(file_path, batch_size)):
-            if chunk_idx < chunk_offset:
-                continue
-
-            chunk_start = time.monotonic()
-
-            chunk_total, chunk_inserted, chunk_updated, detected_county = await _process_chunk(
-                session,
-                job,
-                chunk,
-                chunk_idx,
-                errors,
-                imported_reg_numbers,
-            )
-            total += chunk_total
-            inserted += chunk_inserted
-            updated_count += chunk_updated
-
-            if import_county is None and detected_county:
-                import_county = detected_county
-                logger.info(f"Detected county: {import_county}")
-
-            # Update checkpoint and commit batch atomically
-            job.last_processed_offset = chunk_idx + 1
-            await session.commit()
-
-            chunk_elapsed = time.monotonic() - chunk_start
-            logger.info(
-                f"Chunk {chunk_idx + 1} committed: "
-                f"{chunk_inserted} inserted, {chunk_updated} updated "
-                f"({chunk_elapsed:.1f}s) | running total: {total} records"
+        resumed_records = 0
+        if chunk_offset:
+            # Resuming: voters from the committed chunks already carry this
+            # job's id, so seed the seen set and the soft-delete scope from them.
+            resumed = await session.execute(
+                select(Voter.voter_registration_number, Voter.county).where(Voter.last_seen_in_import_id == job.id)
             )
-
-            if max_records is not None and total >= max_records:
-                logger.info(f"Reached max_records limit ({max_records}), stopping import")
-                break
+            for reg_number, county in resumed.all():
+                imported_reg_numbers.add(reg_number)
+                if county:
+                    imported_counties.add(county)
+                    import_county = import_county or county
+            resumed_records = len(imported_reg_numbers)
+            total = resumed_records
+            logger.info(f"Resuming import after chunk {chunk_offset}: {resumed_records} records already imported")
+
+        prepared_chunks = _iter_prepared_chunks(
+            file_path,
+            batch_size,
+            job.id,
+            start_chunk=chunk_offset,
+            executor=executor,
+            queue_depth=queue_depth,
+            timings=timings,
+        )
+        # aclosing: stop the reader and cancel queued chunks promptly on
+        # break (max_records) or error.
+        async with aclosing(prepared_chunks):
+            async for prepared in prepared_chunks:
+                chunk_idx = prepared.chunk_idx
+                chunk_start = time.monotonic()
+
+                # Counties voters moved out of lose them, so their facets
+                # are refreshed along with the imported counties.
+                chunk_inserted, chunk_updated = await _write_prepared_chunk(
+                    session, prepared, errors, imported_reg_numbers, imported_counties
+                )
+                total += prepared.total
+                inserted += chunk_inserted
+                updated_count += chunk_updated
+                imported_counties |= prepared.counties()
+
+                if import_county is None and prepared.county:
+                    import_county = prepared.county
+                    logger.info(f"Detected county: {import_county}")
+
+                # Update checkpoint and commit batch atomically
+                job.last_processed_offset = chunk_idx + 1
+                await session.commit()
+
+                chunk_elapsed = time.monotonic() - chunk_start
+                timings.write_seconds += chunk_elapsed
+                logger.info(
+                    f"Chunk {chunk_idx + 1} committed: "
+                    f"{chunk_inserted} inserted, {chunk_updated} updated "
+                    f"({chunk_elapsed:.1f}s) | running total: {total} records"
+                )
+
+                if max_records is not None and total >= max_records:
+                    logger.info(f"Reached max_records limit ({max_records}), stopping import")
+                    break
 
         # Soft-delete absent voters scoped to the imported county
         # Skip when max_records is set — partial imports should not mark
@@ -544,7 +859,7 @@ async def process_voter_import(
             logger.info("Skipping soft-delete (partial import with max_records limit)")
 
         failed = len(errors)
-        succeeded = inserted + updated_count
+        succeeded = inserted + updated_count + resumed_records
 
         # Update job status and commit everything atomically
         job.status = "completed"
@@ -556,14 +871,24 @@ async def process_voter_import(
         job.records_soft_deleted = soft_deleted
         job.error_log = errors if errors else None
         job.completed_at = datetime.now(UTC)
+
+        from voter_api.services.voter_history_service import mark_participation_stats_stale
+
+        # Participation rollups join voters for precincts and eligible-voter totals
+        await mark_participation_stats_stale(session)
         await session.commit()
 
+        if import_county:
+            imported_counties.add(import_county)
+        await _refresh_filter_facets(session, imported_counties)
+
         import_elapsed = time.monotonic() - import_start
         logger.info(
             f"Import data phase completed in {import_elapsed:.1f}s: "
             f"{total} total, {succeeded} succeeded, {failed} failed, "
             f"{inserted} inserted, {updated_count} updated, {soft_deleted} soft-deleted"
         )
+        logger.info(f"Import stages ({file_path.name}): {timings.summary()}")
 
     except Exception:
         await session.rollback()
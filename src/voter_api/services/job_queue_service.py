@@ -0,0 +1,325 @@
+"""Postgres-backed background job queue and the ``voter-api worker`` loop.
+
+Jobs are rows in ``background_jobs``. A worker runs a fixed number of
+slots per queue; each idle slot claims the oldest claimable row of its
+queue with ``UPDATE ... WHERE id = (SELECT ... FOR UPDATE SKIP LOCKED)``,
+so any number of worker processes can poll the same queue without
+handing a job out twice or blocking on each other's locks.
+
+While a job runs, its slot refreshes ``heartbeat_at``. A ``running`` row
+whose heartbeat is older than ``WORKER_STALE_AFTER`` belonged to a worker
+that died; it is claimable again and its task resumes from the domain
+job's checkpoint (``last_processed_offset`` / ``last_processed_voter_offset``).
+Each claim counts as an attempt; once ``max_attempts`` is exceeded the
+job and its domain job are failed instead. On a graceful shutdown running
+jobs are cancelled and released back to ``pending`` without using up an
+attempt.
+"""
+
+import asyncio
+import contextlib
+import os
+import socket
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from voter_api.core.database import get_session_factory
+from voter_api.models.background_job import BackgroundJob
+from voter_api.services.job_tasks import get_job_task
+
+_ABANDONED_REASON = "Gave up after {attempts} attempt(s); the worker running it stopped responding"
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimedJob:
+    """A job claimed by a worker slot."""
+
+    id: uuid.UUID
+    task: str
+    payload: dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+async def enqueue_job(
+    session: AsyncSession,
+    task: str,
+    payload: dict[str, Any],
+    *,
+    max_attempts: int = 3,
+) -> BackgroundJob:
+    """Persist a job for a worker to pick up.
+
+    Args:
+        session: Database session (committed here).
+        task: Registered task name (see ``services.job_tasks``).
+        payload: JSON-serializable task arguments.
+        max_attempts: Claims allowed before the job is failed.
+
+    Returns:
+        The queued BackgroundJob.
+
+    Raises:
+        ValueError: If the task name is not registered.
+    """
+    spec = get_job_task(task)
+    job = BackgroundJob(queue=spec.queue, task=task, payload=payload, max_attempts=max_attempts)
+    session.add(job)
+    await session.commit()
+    logger.info("Queued {} job {} on '{}'", task, job.id, spec.queue)
+    return job
+
+
+async def claim_job(
+    session: AsyncSession,
+    queue: str,
+    worker_id: str,
+    *,
+    stale_after: float,
+) -> ClaimedJob | None:
+    """Claim the oldest pending (or stale running) job on a queue.
+
+    Args:
+        session: Database session (committed here).
+        queue: Queue to claim from.
+        worker_id: Identifier recorded in ``locked_by``.
+        stale_after: Seconds without a heartbeat after which a running
+            job is considered orphaned and may be reclaimed.
+
+    Returns:
+        The claimed job, or None if the queue has nothing claimable.
+    """
+    candidate = (
+        select(BackgroundJob.id)
+        .where(
+            BackgroundJob.queue == queue,
+            or_(
+                BackgroundJob.status == "pending",
+                and_(
+                    BackgroundJob.status == "running",
+                    BackgroundJob.heartbeat_at < func.now() - timedelta(seconds=stale_after),
+                ),
+            ),
+        )
+        .order_by(BackgroundJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.id == candidate)
+        .values(
+            status="running",
+            locked_by=worker_id,
+            heartbeat_at=func.now(),
+            started_at=func.coalesce(BackgroundJob.started_at, func.now()),
+            attempts=BackgroundJob.attempts + 1,
+        )
+        .returning(
+            BackgroundJob.id,
+            BackgroundJob.task,
+            BackgroundJob.payload,
+            BackgroundJob.attempts,
+            BackgroundJob.max_attempts,
+        )
+    )
+    row = result.first()
+    await session.commit()
+    if row is None:
+        return None
+    return ClaimedJob(
+        id=row.id, task=row.task, payload=row.payload, attempts=row.attempts, max_attempts=row.max_attempts
+    )
+
+
+async def heartbeat_job(session: AsyncSession, job_id: uuid.UUID, worker_id: str) -> bool:
+    """Refresh a running job's heartbeat.
+
+    Returns:
+        False if the worker no longer holds the job (it was reclaimed).
+    """
+    result = await session.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.id == job_id, BackgroundJob.locked_by == worker_id, BackgroundJob.status == "running")
+        .values(heartbeat_at=func.now())
+    )
+    await session.commit()
+    return bool(result.rowcount)  # type: ignore[attr-defined]
+
+
+async def finish_job(
+    session: AsyncSession,
+    job_id: uuid.UUID,
+    worker_id: str,
+    *,
+    error: str | None = None,
+) -> None:
+    """Mark a claimed job completed, or failed with ``error``."""
+    await session.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.id == job_id, BackgroundJob.locked_by == worker_id)
+        .values(
+            status="failed" if error is not None else "completed",
+            last_error=error,
+            locked_by=None,
+            completed_at=func.now(),
+        )
+    )
+    await session.commit()
+
+
+async def release_job(session: AsyncSession, job_id: uuid.UUID, worker_id: str) -> None:
+    """Return an interrupted job to the queue without counting the attempt."""
+    await session.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.id == job_id, BackgroundJob.locked_by == worker_id, BackgroundJob.status == "running")
+        .values(status="pending", locked_by=None, heartbeat_at=None, attempts=BackgroundJob.attempts - 1)
+    )
+    await session.commit()
+
+
+def default_worker_id() -> str:
+    """Return ``host:pid``, identifying this worker process in ``locked_by``."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Worker:
+    """Runs queued jobs with a fixed number of slots per queue.
+
+    Args:
+        concurrency: Queue names mapped to the number of jobs run at once.
+        poll_interval: Seconds an idle slot waits before polling again.
+        heartbeat_interval: Seconds between heartbeats of a running job.
+        stale_after: Seconds without a heartbeat before a running job is reclaimed.
+        worker_id: Identifier recorded on claimed jobs (default ``host:pid``).
+    """
+
+    def __init__(
+        self,
+        concurrency: dict[str, int],
+        *,
+        poll_interval: float,
+        heartbeat_interval: float,
+        stale_after: float,
+        worker_id: str | None = None,
+    ) -> None:
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.worker_id = worker_id or default_worker_id()
+        self._stop = asyncio.Event()
+
+    def stop(self) -> None:
+        """Ask every slot to finish: idle slots exit, running jobs are released."""
+        self._stop.set()
+
+    async def run(self) -> None:
+        """Run all slots until :meth:`stop` is called."""
+        logger.info(
+            "Worker {} serving {}",
+            self.worker_id,
+            ", ".join(f"{queue}={slots}" for queue, slots in self.concurrency.items()),
+        )
+        async with asyncio.TaskGroup() as group:
+            for queue, slots in self.concurrency.items():
+                for _ in range(slots):
+                    group.create_task(self._run_slot(queue))
+        logger.info("Worker {} stopped", self.worker_id)
+
+    async def _run_slot(self, queue: str) -> None:
+        factory = get_session_factory()
+        while not self._stop.is_set():
+            try:
+                async with factory() as session:
+                    claimed = await claim_job(session, queue, self.worker_id, stale_after=self.stale_after)
+            except Exception:
+                logger.exception("Could not poll queue '{}'", queue)
+                claimed = None
+            if claimed is None:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+                continue
+            try:
+                await self.execute(claimed)
+            except Exception:
+                # Bookkeeping failed; the job's heartbeat lapses and it is reclaimed.
+                logger.exception("Worker slot lost track of job {}", claimed.id)
+
+    async def execute(self, claimed: ClaimedJob) -> None:
+        """Run one claimed job to completion, failure, or release on shutdown."""
+        factory = get_session_factory()
+        try:
+            spec = get_job_task(claimed.task)
+        except ValueError as e:
+            logger.error("Job {}: {}", claimed.id, e)
+            async with factory() as session:
+                await finish_job(session, claimed.id, self.worker_id, error=str(e))
+            return
+
+        if claimed.attempts > claimed.max_attempts:
+            reason = _ABANDONED_REASON.format(attempts=claimed.max_attempts)
+            logger.error("Job {} ({}): {}", claimed.id, claimed.task, reason)
+            try:
+                await spec.abandon(claimed.payload, reason)
+            finally:
+                async with factory() as session:
+                    await finish_job(session, claimed.id, self.worker_id, error=reason)
+            return
+
+        if claimed.attempts > 1:
+            logger.warning("Resuming {} job {} (attempt {})", claimed.task, claimed.id, claimed.attempts)
+        else:
+            logger.info("Running {} job {}", claimed.task, claimed.id)
+
+        runner = asyncio.create_task(spec.run(claimed.payload))
+        heartbeat = asyncio.create_task(self._heartbeat(claimed.id, runner))
+        stopping = asyncio.create_task(self._stop.wait())
+        try:
+            await asyncio.wait({runner, stopping}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stopping.cancel()
+
+        if not runner.done():
+            # Shutting down: interrupt the task and hand the job back; its
+            # checkpoint lets the next claim resume where this one stopped.
+            runner.cancel()
+            with contextlib.suppress(BaseException):
+                await runner
+            heartbeat.cancel()
+            async with factory() as session:
+                await release_job(session, claimed.id, self.worker_id)
+            logger.info("Released {} job {} for resume", claimed.task, claimed.id)
+            return
+
+        heartbeat.cancel()
+        if runner.cancelled():
+            # The heartbeat lost the claim; whoever reclaimed the job owns it now.
+            return
+        error = runner.exception()
+        if error is not None:
+            logger.opt(exception=error).error("{} job {} failed", claimed.task, claimed.id)
+        async with factory() as session:
+            await finish_job(session, claimed.id, self.worker_id, error=repr(error) if error else None)
+
+    async def _heartbeat(self, job_id: uuid.UUID, runner: asyncio.Task[None]) -> None:
+        factory = get_session_factory()
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with factory() as session:
+                    held = await heartbeat_job(session, job_id, self.worker_id)
+            except Exception:
+                logger.exception("Heartbeat for job {} failed", job_id)
+                continue
+            if not held:
+                logger.warning("Job {} was reclaimed by another worker; cancelling it here", job_id)
+                runner.cancel()
+                return
@@ -0,0 +1,257 @@
+"""Background job task registry.
+
+Each queued job names one of these tasks and carries its arguments as a
+JSON payload, so a job enqueued by the API can run in a separate
+``voter-api worker`` process (or, with ``TASK_BACKEND=inprocess``, inside
+the API). Tasks load the domain job they drive (``ImportJob``,
+``GeocodingJob``, ``AnalysisRun``, ``ExportJob``) in a fresh session and
+hand it to the existing service; running a task again for a job that was
+interrupted resumes from the job's checkpoint.
+
+Every task also has an ``abandon`` hook, called when the queue gives up
+on a job (too many attempts) to mark its domain job failed. Voter and
+results import hooks also repair the indexes and autovacuum setting a
+crashed bulk import leaves behind, which in queue mode nothing else does.
+"""
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import func, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from voter_api.core.database import get_session_factory
+from voter_api.models.analysis_run import AnalysisRun
+from voter_api.models.export_job import ExportJob
+from voter_api.models.geocoding_job import GeocodingJob
+from voter_api.models.import_job import ImportJob
+
+# Domain job statuses a task may (re)start from.
+_LIVE_STATUSES = frozenset({"pending", "running"})
+
+_ImportProcessor = Callable[[AsyncSession, ImportJob, Path], Awaitable[Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class JobTask:
+    """A task the queue knows how to run.
+
+    Attributes:
+        queue: Queue the task is enqueued on (workers size concurrency per queue).
+        run: Runs the task for a payload; safe to call again after an interruption.
+        abandon: Marks the payload's domain job failed with a reason.
+    """
+
+    queue: str
+    run: Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
+    abandon: Callable[[dict[str, Any], str], Awaitable[None]]
+
+
+async def _run_file_import(payload: dict[str, Any], process: _ImportProcessor) -> None:
+    """Run an upload-backed import task, discarding the upload once it finishes.
+
+    The upload is kept when the task is cancelled (worker shutdown or a
+    lost claim) so the job can resume from its checkpoint.
+    """
+    from voter_api.services.import_service import get_import_job
+
+    file_path = Path(payload["file_path"])
+    try:
+        factory = get_session_factory()
+        async with factory() as session:
+            job = await get_import_job(session, uuid.UUID(payload["job_id"]))
+            if job is None:
+                logger.error("Background import job {} not found", payload["job_id"])
+            elif job.status not in _LIVE_STATUSES:
+                logger.warning("Import job {} is already {}; skipping", job.id, job.status)
+            else:
+                await process(session, job, file_path)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        file_path.unlink(missing_ok=True)
+        raise
+    file_path.unlink(missing_ok=True)
+
+
+async def _run_voter_import(payload: dict[str, Any]) -> None:
+    from voter_api.services.import_service import process_voter_import
+
+    async def process(session: AsyncSession, job: ImportJob, file_path: Path) -> None:
+        await process_voter_import(session, job, file_path, payload["batch_size"])
+
+    await _run_file_import(payload, process)
+
+
+async def _run_voter_history_import(payload: dict[str, Any]) -> None:
+    from voter_api.services.voter_history_service import process_voter_history_import
+
+    await _run_file_import(payload, process_voter_history_import)
+
+
+async def _run_candidate_import(payload: dict[str, Any]) -> None:
+    from voter_api.services.candidate_import_service import process_candidate_import
+
+    await _run_file_import(payload, process_candidate_import)
+
+
+async def _run_results_import(payload: dict[str, Any]) -> None:
+    from voter_api.services.results_import_service import process_results_import
+
+    await _run_file_import(payload, process_results_import)
+
+
+async def _run_absentee_import(payload: dict[str, Any]) -> None:
+    from voter_api.services.absentee_service import process_absentee_import
+
+    await _run_file_import(payload, process_absentee_import)
+
+
+async def _run_geocoding(payload: dict[str, Any]) -> None:
+    from voter_api.core.config import get_settings
+    from voter_api.lib.geocoder import get_configured_providers
+    from voter_api.services.geocoding_service import get_geocoding_job, process_geocoding_job
+
+    fallback = bool(payload.get("fallback"))
+    fallback_providers = get_configured_providers(get_settings()) if fallback else None
+
+    factory = get_session_factory()
+    async with factory() as session:
+        job = await get_geocoding_job(session, uuid.UUID(payload["job_id"]))
+        if job is None:
+            logger.error("Background geocoding job {} not found", payload["job_id"])
+        elif job.status not in _LIVE_STATUSES:
+            logger.warning("Geocoding job {} is already {}; skipping", job.id, job.status)
+        else:
+            await process_geocoding_job(session, job, fallback=fallback, fallback_providers=fallback_providers)
+
+
+async def _run_analysis(payload: dict[str, Any]) -> None:
+    from voter_api.services.analysis_service import get_analysis_run, process_analysis_run
+
+    factory = get_session_factory()
+    async with factory() as session:
+        run = await get_analysis_run(session, uuid.UUID(payload["run_id"]))
+        if run is None:
+            logger.error("Background analysis run {} not found", payload["run_id"])
+        elif run.status not in _LIVE_STATUSES:
+            logger.warning("Analysis run {} is already {}; skipping", run.id, run.status)
+        else:
+            await process_analysis_run(session, run, county=payload.get("county"))
+
+
+async def _run_export(payload: dict[str, Any]) -> None:
+    from voter_api.services.export_service import get_export_job, process_export
+
+    factory = get_session_factory()
+    async with factory() as session:
+        job = await get_export_job(session, uuid.UUID(payload["job_id"]))
+        if job is None:
+            logger.error("Background export job {} not found", payload["job_id"])
+        elif job.status not in _LIVE_STATUSES:
+            logger.warning("Export job {} is already {}; skipping", job.id, job.status)
+        else:
+            await process_export(session, job, Path(payload["export_dir"]))
+
+
+async def _abandon_logged_job(model: type[ImportJob] | type[GeocodingJob], job_id: uuid.UUID, reason: str) -> None:
+    """Fail a live job whose model keeps a JSONB ``error_log``, appending the reason."""
+    factory = get_session_factory()
+    async with factory() as session:
+        await session.execute(
+            update(model)
+            .where(model.id == job_id, model.status.in_(_LIVE_STATUSES))
+            .values(
+                status="failed",
+                error_log=func.coalesce(model.error_log, type_coerce([], JSONB))
+                + type_coerce([{"error": reason}], JSONB),
+                completed_at=func.now(),
+            )
+        )
+        await session.commit()
+
+
+async def _abandon_import(payload: dict[str, Any], reason: str) -> None:
+    await _abandon_logged_job(ImportJob, uuid.UUID(payload["job_id"]), reason)
+    Path(payload["file_path"]).unlink(missing_ok=True)
+
+
+async def _abandon_voter_import(payload: dict[str, Any], reason: str) -> None:
+    """Abandon a voter import and undo the index drops and autovacuum change it may have left."""
+    from voter_api.services.import_service import repair_bulk_import_state
+
+    await _abandon_import(payload, reason)
+    factory = get_session_factory()
+    async with factory() as session:
+        await repair_bulk_import_state(session)
+
+
+async def _abandon_results_import(payload: dict[str, Any], reason: str) -> None:
+    """Abandon a results import and repair ``election_county_results`` the same way."""
+    from voter_api.services.results_import_service import repair_results_import_state
+
+    await _abandon_import(payload, reason)
+    factory = get_session_factory()
+    async with factory() as session:
+        await repair_results_import_state(session)
+
+
+async def _abandon_geocoding(payload: dict[str, Any], reason: str) -> None:
+    await _abandon_logged_job(GeocodingJob, uuid.UUID(payload["job_id"]), reason)
+
+
+async def _abandon_analysis(payload: dict[str, Any], reason: str) -> None:
+    factory = get_session_factory()
+    async with factory() as session:
+        await session.execute(
+            update(AnalysisRun)
+            .where(AnalysisRun.id == uuid.UUID(payload["run_id"]), AnalysisRun.status.in_(_LIVE_STATUSES))
+            .values(
+                status="failed",
+                notes=func.concat_ws("; ", AnalysisRun.notes, reason),
+                completed_at=func.now(),
+            )
+        )
+        await session.commit()
+
+
+async def _abandon_export(payload: dict[str, Any], reason: str) -> None:
+    factory = get_session_factory()
+    async with factory() as session:
+        await session.execute(
+            update(ExportJob)
+            .where(ExportJob.id == uuid.UUID(payload["job_id"]), ExportJob.status.in_(_LIVE_STATUSES))
+            .values(status="failed", completed_at=func.now())
+        )
+        await session.commit()
+
+
+JOB_TASKS: dict[str, JobTask] = {
+    "voter_import": JobTask("imports", _run_voter_import, _abandon_voter_import),
+    "voter_history_import": JobTask("imports", _run_voter_history_import, _abandon_import),
+    "candidate_import": JobTask("imports", _run_candidate_import, _abandon_import),
+    "election_results_import": JobTask("imports", _run_results_import, _abandon_results_import),
+    "absentee_import": JobTask("imports", _run_absentee_import, _abandon_import),
+    "geocoding": JobTask("geocoding", _run_geocoding, _abandon_geocoding),
+    "analysis": JobTask("analysis", _run_analysis, _abandon_analysis),
+    "export": JobTask("exports", _run_export, _abandon_export),
+}
+
+
+def get_job_task(name: str) -> JobTask:
+    """Look up a registered task by name.
+
+    Raises:
+        ValueError: If no task is registered under ``name``.
+    """
+    task = JOB_TASKS.get(name)
+    if task is None:
+        msg = f"Unknown background task: {name}"
+        raise ValueError(msg)
+    return task
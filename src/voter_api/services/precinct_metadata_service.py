@@ -7,6 +7,7 @@ from decimal import Decimal, InvalidOperation
 
 from loguru import logger
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from voter_api.models.precinct_metadata import PrecinctMetadata
@@ -24,6 +25,17 @@ _PRECINCT_FIELD_MAP: dict[str, str] = {
     "AREA": "area",
 }
 
+# NOT NULL PrecinctMetadata fields that must be present in the properties.
+_REQUIRED_PRECINCT_FIELDS = ("sos_district_id", "fips", "fips_county", "county_name", "precinct_id", "precinct_name")
+
+# asyncpg has a hard limit of 32767 query parameters
+_MAX_BIND_PARAMS = 32767
+
+# Rows per multi-row upsert: each row binds the mapped fields plus
+# boundary_id and the client-generated id (11 parameters), so this is
+# 2,978 rows, about a full statewide precinct file per statement.
+_PRECINCT_UPSERT_BATCH = _MAX_BIND_PARAMS // (len(_PRECINCT_FIELD_MAP) + 2)
+
 
 def _extract_precinct_fields(properties: dict) -> dict:
     """Extract and map precinct metadata fields from a shapefile properties dict.
@@ -68,8 +80,7 @@ async def upsert_precinct_metadata(
     fields = _extract_precinct_fields(properties)
 
     # Require the NOT NULL fields
-    required = ("sos_district_id", "fips", "fips_county", "county_name", "precinct_id", "precinct_name")
-    if not all(fields.get(f) for f in required):
+    if not all(fields.get(f) for f in _REQUIRED_PRECINCT_FIELDS):
         logger.debug(f"Skipping precinct metadata for boundary {boundary_id}: missing required fields")
         return None
 
@@ -86,6 +97,53 @@ async def upsert_precinct_metadata(
     return record
 
 
+async def upsert_precinct_metadata_batch(
+    session: AsyncSession,
+    items: Sequence[tuple[uuid.UUID, dict]],
+) -> int:
+    """Upsert precinct metadata for many boundaries with set-based statements.
+
+    Bulk counterpart of :func:`upsert_precinct_metadata`: one
+    ``INSERT ... ON CONFLICT (boundary_id) DO UPDATE`` per
+    ``_PRECINCT_UPSERT_BATCH`` rows. As in the single-row path, optional
+    fields missing from the properties keep their stored values.
+
+    Args:
+        session: Database session (caller commits).
+        items: (boundary_id, raw shapefile properties) pairs.
+
+    Returns:
+        Number of metadata rows upserted (items missing required fields are skipped).
+    """
+    rows: dict[uuid.UUID, dict] = {}
+    for boundary_id, properties in items:
+        fields = _extract_precinct_fields(properties)
+        if not all(fields.get(f) for f in _REQUIRED_PRECINCT_FIELDS):
+            continue
+        rows[boundary_id] = {
+            "boundary_id": boundary_id,
+            **{meta_field: fields.get(meta_field) for meta_field in _PRECINCT_FIELD_MAP.values()},
+        }
+
+    if not rows:
+        return 0
+
+    values = list(rows.values())
+    for i in range(0, len(values), _PRECINCT_UPSERT_BATCH):
+        stmt = pg_insert(PrecinctMetadata).values(values[i : i + _PRECINCT_UPSERT_BATCH])
+        set_ = {
+            meta_field: (
+                getattr(stmt.excluded, meta_field)
+                if meta_field in _REQUIRED_PRECINCT_FIELDS
+                else func.coalesce(getattr(stmt.excluded, meta_field), getattr(PrecinctMetadata, meta_field))
+            )
+            for meta_field in _PRECINCT_FIELD_MAP.values()
+        }
+        await session.execute(stmt.on_conflict_do_update(constraint="uq_precinct_metadata_boundary", set_=set_))
+
+    return len(values)
+
+
 async def get_precinct_metadata_batch(
     session: AsyncSession,
     boundary_ids: list[uuid.UUID],
@@ -1,30 +1,51 @@
-"""Election results import service — orchestrates JSON file import."""
+"""Election results import service — orchestrates JSON file import.
 
+:func:`process_results_import` imports one file as one job. Historical
+archives go through :func:`import_results_archive` instead, which groups
+files by election date and imports the groups with concurrent workers.
+The workers are asyncio tasks, so only their database I/O overlaps; file
+parsing is CPU-bound and runs in an optional process pool
+(:func:`prepare_results_file`).
+"""
+
+import asyncio
 import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from pathlib import Path
 
 from loguru import logger
-from sqlalchemy import literal_column, select
+from sqlalchemy import Boolean, String, Update, column, func, literal_column, select, text, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from voter_api.lib.district_parser.parser import parse_election_district
+from voter_api.core.config import get_settings
+from voter_api.core.database import get_session_factory
+from voter_api.lib.district_parser.parser import ParsedDistrict, parse_election_district
 from voter_api.lib.election_name_normalizer import normalize_election_name
+from voter_api.lib.election_tracker import CountyResultData, ingest_local_result
 from voter_api.lib.results_importer import (
     BallotItemContext,
     iter_ballot_items,
+    iter_local_results,
     load_results_file,
+    load_results_header,
     validate_results_file,
 )
 from voter_api.models.candidacy import Candidacy
 from voter_api.models.candidate import Candidate
-from voter_api.models.election import Election
+from voter_api.models.election import Election, ElectionCountyResult, ElectionResult
 from voter_api.models.import_job import ImportJob
 from voter_api.services.election_resolution_service import find_or_create_election_event
-from voter_api.services.election_service import persist_ingestion_result
 
 _CANDIDATE_UPSERT_BATCH = 500
+_RESULT_UPSERT_BATCH = 500
 
 
 async def create_results_import_job(
@@ -45,10 +66,124 @@ async def create_results_import_job(
     return job
 
 
+@dataclass(slots=True)
+class _KnownElection:
+    """The columns of an election that ballot-item matching looks at."""
+
+    id: uuid.UUID
+    name: str | None
+    ballot_item_id: str | None
+    district_type: str | None
+    district_identifier: str | None
+    district_party: str | None
+    eligible_county: str | None
+
+
+class _ElectionMatcher:
+    """In-memory election matching for one results file.
+
+    Every election on the file's date is fetched in a single query and
+    indexed by ballot item ID and by district, so tier-1 and tier-2
+    matches cost no round trip. Tier-2 ``ballot_item_id`` backfills are
+    collected in :attr:`backfills` and written in bulk with the rest of
+    the import.
+    """
+
+    def __init__(self, elections: list[_KnownElection]) -> None:
+        self._by_ballot_item: dict[str, list[_KnownElection]] = defaultdict(list)
+        self._by_district: dict[tuple[str, str], list[_KnownElection]] = defaultdict(list)
+        self._resolved: dict[tuple[str, str], uuid.UUID] = {}
+        self.backfills: dict[uuid.UUID, str] = {}
+        for election in elections:
+            self.add(election)
+
+    @classmethod
+    async def prefetch(cls, session: AsyncSession, election_date: date) -> "_ElectionMatcher":
+        """Load every live election on ``election_date``."""
+        result = await session.execute(
+            select(
+                Election.id,
+                Election.name,
+                Election.ballot_item_id,
+                Election.district_type,
+                Election.district_identifier,
+                Election.district_party,
+                Election.eligible_county,
+            ).where(Election.election_date == election_date, Election.deleted_at.is_(None))
+        )
+        return cls([_KnownElection(*row) for row in result.all()])
+
+    def add(self, election: _KnownElection) -> None:
+        """Index an election (prefetched or just created)."""
+        if election.ballot_item_id:
+            self._by_ballot_item[election.ballot_item_id].append(election)
+        if election.district_type and election.district_identifier:
+            self._by_district[(election.district_type, election.district_identifier)].append(election)
+
+    def resolved(self, ctx: BallotItemContext) -> uuid.UUID | None:
+        """Return the election already resolved for this ballot item, if any."""
+        return self._resolved.get((ctx.ballot_item_id, ctx.election_event_name))
+
+    def remember(self, ctx: BallotItemContext, election_id: uuid.UUID) -> uuid.UUID:
+        """Record the election a ballot item resolved to."""
+        self._resolved[(ctx.ballot_item_id, ctx.election_event_name)] = election_id
+        return election_id
+
+    def match(self, ctx: BallotItemContext, parsed: ParsedDistrict) -> uuid.UUID | None:
+        """Apply tiers 1 and 2 of :func:`_match_election` in memory.
+
+        Raises:
+            MultipleResultsFound: If tier 2 matches more than one election.
+        """
+        # --- Tier 1: ballot_item_id + election_date ---
+        matches = self._by_ballot_item.get(ctx.ballot_item_id)
+        if matches:
+            if len(matches) > 1 and "recount" in ctx.election_event_name.lower():
+                # Multiple matches — for recounts, prefer the recount election
+                for election in matches:
+                    if "recount" in (election.name or "").lower():
+                        return self.remember(ctx, election.id)
+            return self.remember(ctx, matches[0].id)
+
+        # --- Tier 2: district matching ---
+        if not (parsed.district_type and parsed.district_identifier):
+            return None
+        county = parsed.county.upper() if parsed.county else None
+        candidates = [
+            e
+            for e in self._by_district.get((parsed.district_type, parsed.district_identifier), [])
+            if (not parsed.party or e.district_party == parsed.party)
+            # Narrow by geography when available to prevent county/municipality-scoped
+            # contests that share the same district_type+identifier on the same date
+            # from colliding (e.g. two different county commission district 5s).
+            and (county is None or e.eligible_county == county)
+        ]
+        if not candidates:
+            return None
+        if len(candidates) > 1:
+            msg = f"Multiple elections match district of '{ctx.ballot_item_name}' on {ctx.election_date}"
+            raise MultipleResultsFound(msg)
+
+        election = candidates[0]
+        # Backfill ballot_item_id for future lookups
+        if election.ballot_item_id and election in self._by_ballot_item.get(election.ballot_item_id, []):
+            self._by_ballot_item[election.ballot_item_id].remove(election)
+        election.ballot_item_id = ctx.ballot_item_id
+        self._by_ballot_item[ctx.ballot_item_id].append(election)
+        self.backfills[election.id] = ctx.ballot_item_id
+        logger.info(
+            "Tier 2 match for '{}' -> election {} (backfilled ballot_item_id={})",
+            ctx.ballot_item_name,
+            election.id,
+            ctx.ballot_item_id,
+        )
+        return self.remember(ctx, election.id)
+
+
 async def _match_election(
     session: AsyncSession,
     ctx: BallotItemContext,
-    election_cache: dict[tuple[str, date], uuid.UUID],
+    matcher: _ElectionMatcher,
 ) -> uuid.UUID:
     """Match a ballot item to an existing election or auto-create one.
 
@@ -63,67 +198,18 @@ async def _match_election(
 
     Special: For recount files (electionName contains "Recount"), if Tier 1
     returns multiple rows, prefer the one whose name also contains "Recount".
-    """
-    cache_key = (ctx.ballot_item_id, ctx.election_date)
-    if cache_key in election_cache:
-        return election_cache[cache_key]
 
-    is_recount = "recount" in ctx.election_event_name.lower()
+    Tiers 1 and 2 are resolved in memory against the matcher's prefetch;
+    only Tier 3 touches the database.
+    """
+    election_id = matcher.resolved(ctx)
+    if election_id is not None:
+        return election_id
 
-    # --- Tier 1: ballot_item_id + election_date ---
-    stmt = select(Election).where(
-        Election.ballot_item_id == ctx.ballot_item_id,
-        Election.election_date == ctx.election_date,
-        Election.deleted_at.is_(None),
-    )
-    result = await session.execute(stmt)
-    matches = list(result.scalars().all())
-
-    if matches:
-        if len(matches) == 1:
-            election_cache[cache_key] = matches[0].id
-            return matches[0].id
-        # Multiple matches — for recounts, prefer recount election
-        if is_recount:
-            recount_matches = [e for e in matches if "recount" in (e.name or "").lower()]
-            if recount_matches:
-                election_cache[cache_key] = recount_matches[0].id
-                return recount_matches[0].id
-        # Fall through to first match
-        election_cache[cache_key] = matches[0].id
-        return matches[0].id
-
-    # --- Tier 2: district matching ---
     parsed = parse_election_district(ctx.ballot_item_name)
-    if parsed.district_type and parsed.district_identifier:
-        tier2_stmt = select(Election).where(
-            Election.district_type == parsed.district_type,
-            Election.district_identifier == parsed.district_identifier,
-            Election.election_date == ctx.election_date,
-            Election.deleted_at.is_(None),
-        )
-        if parsed.party:
-            tier2_stmt = tier2_stmt.where(Election.district_party == parsed.party)
-        # Narrow by geography when available to prevent county/municipality-scoped
-        # contests that share the same district_type+identifier on the same date
-        # from colliding (e.g. two different county commission district 5s).
-        if parsed.county:
-            tier2_stmt = tier2_stmt.where(Election.eligible_county == parsed.county.upper())
-
-        result = await session.execute(tier2_stmt)
-        tier2_match = result.scalar_one_or_none()
-        if tier2_match:
-            # Backfill ballot_item_id for future lookups
-            tier2_match.ballot_item_id = ctx.ballot_item_id
-            await session.flush()
-            election_cache[cache_key] = tier2_match.id
-            logger.info(
-                "Tier 2 match for '{}' -> election {} (backfilled ballot_item_id={})",
-                ctx.ballot_item_name,
-                tier2_match.id,
-                ctx.ballot_item_id,
-            )
-            return tier2_match.id
+    election_id = matcher.match(ctx, parsed)
+    if election_id is not None:
+        return election_id
 
     # --- Tier 3: auto-create ---
     election_name = f"{ctx.election_event_name} - {ctx.ballot_item_name}"
@@ -180,8 +266,7 @@ async def _match_election(
         )
         existing_id = existing.scalar_one_or_none()
         if existing_id:
-            election_cache[cache_key] = existing_id
-            return existing_id
+            return matcher.remember(ctx, existing_id)
         msg = (
             f"Election insert conflicted but no existing election could be resolved "
             f"for '{normalized_name}' on {ctx.election_date}"
@@ -189,18 +274,55 @@ async def _match_election(
         raise RuntimeError(msg)
 
     await session.flush()
-    election_cache[cache_key] = new_id
+    matcher.add(
+        _KnownElection(
+            id=new_id,
+            name=normalized_name,
+            ballot_item_id=ctx.ballot_item_id,
+            district_type=parsed.district_type or None,
+            district_identifier=parsed.district_identifier or None,
+            district_party=parsed.party or None,
+            eligible_county=None,
+        )
+    )
     logger.info("Tier 3: created election '{}' -> {}", normalized_name, new_id)
-    return new_id
+    return matcher.remember(ctx, new_id)
+
+
+def _candidate_flags_update(rows: list[dict]) -> Update:
+    """Build the post-upsert party/incumbent update for candidate rows.
+
+    Party is only set where currently NULL and is_incumbent only ever
+    flips to True, for candidates linked to the election by a candidacy.
+    """
+    flags = values(
+        column("election_id", PG_UUID(as_uuid=True)),
+        column("full_name", String),
+        column("party", String),
+        column("is_incumbent", Boolean),
+        name="flags",
+    ).data([(r["election_id"], r["full_name"], r["party"], r["is_incumbent"]) for r in rows])
+    return (
+        update(Candidate)
+        .where(
+            Candidacy.candidate_id == Candidate.id,
+            Candidacy.election_id == flags.c.election_id,
+            Candidate.full_name == flags.c.full_name,
+        )
+        .values(
+            party=func.coalesce(Candidate.party, flags.c.party),
+            is_incumbent=Candidate.is_incumbent | flags.c.is_incumbent,
+        )
+        .execution_options(synchronize_session=False)
+    )
 
 
 async def _upsert_candidates(
     session: AsyncSession,
-    election_id: uuid.UUID,
-    ctx: BallotItemContext,
+    plan: list[tuple[BallotItemContext, uuid.UUID]],
     job_id: uuid.UUID,
 ) -> tuple[int, int]:
-    """Upsert candidates from ballot options for a single election.
+    """Upsert candidates from ballot options for matched ballot items.
 
     Uses INSERT ... ON CONFLICT (election_id, full_name) DO UPDATE with
     conservative update rules:
@@ -208,16 +330,17 @@ async def _upsert_candidates(
     - Set if True: is_incumbent (never flip to False)
     - Never overwrite: bio, photo_url, filing_status, contest_name, etc.
 
+    Candidates of every ballot item are written together in batches of
+    ``_CANDIDATE_UPSERT_BATCH``; a repeated (election, name) keeps its
+    last occurrence.
+
     Returns:
         Tuple of (inserted_count, updated_count).
     """
-    if not ctx.candidates:
-        return 0, 0
-
-    records = []
-    for c in ctx.candidates:
-        records.append(
-            {
+    by_key: dict[tuple[uuid.UUID, str], dict] = {}
+    for ctx, election_id in plan:
+        for c in ctx.candidates:
+            by_key[(election_id, c.full_name)] = {
                 "id": uuid.uuid4(),
                 "election_id": election_id,
                 "full_name": c.full_name,
@@ -227,7 +350,7 @@ async def _upsert_candidates(
                 "sos_ballot_option_id": c.sos_ballot_option_id,
                 "import_job_id": job_id,
             }
-        )
+    records = list(by_key.values())
 
     total_inserted = 0
     total_updated = 0
@@ -259,42 +382,284 @@ async def _upsert_candidates(
         total_updated += len(rows) - batch_inserted
 
     # Post-upsert: conditionally update party and is_incumbent
-    # Party: only set if currently NULL
-    # is_incumbent: only set to True, never flip to False
-    for c in ctx.candidates:
-        if c.party or c.is_incumbent:
-            existing = await session.execute(
-                select(Candidate)
-                .join(Candidacy, Candidacy.candidate_id == Candidate.id)
-                .where(
-                    Candidacy.election_id == election_id,
-                    Candidate.full_name == c.full_name,
-                )
-            )
-            candidate = existing.scalar_one_or_none()
-            if candidate:
-                if c.party and not candidate.party:
-                    candidate.party = c.party
-                if c.is_incumbent and not candidate.is_incumbent:
-                    candidate.is_incumbent = True
+    flagged = [r for r in records if r["party"] or r["is_incumbent"]]
+    for i in range(0, len(flagged), _CANDIDATE_UPSERT_BATCH):
+        await session.execute(_candidate_flags_update(flagged[i : i + _CANDIDATE_UPSERT_BATCH]))
 
     return total_inserted, total_updated
 
 
+async def _upsert_county_results(session: AsyncSession, rows: list[tuple[uuid.UUID, CountyResultData]]) -> int:
+    """Upsert county results in batches; a repeated (election, county) keeps its last occurrence.
+
+    Returns:
+        Number of county results written.
+    """
+    by_key = {
+        (election_id, county.county_name): {
+            "id": uuid.uuid4(),
+            "election_id": election_id,
+            "county_name": county.county_name,
+            "county_name_normalized": county.county_name_normalized,
+            "precincts_participating": county.precincts_participating,
+            "precincts_reporting": county.precincts_reporting,
+            "results_data": county.results_data,
+        }
+        for election_id, county in rows
+    }
+    records = list(by_key.values())
+    for i in range(0, len(records), _RESULT_UPSERT_BATCH):
+        stmt = pg_insert(ElectionCountyResult).values(records[i : i + _RESULT_UPSERT_BATCH])
+        await session.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_election_county_results",
+                set_={
+                    "precincts_participating": stmt.excluded.precincts_participating,
+                    "precincts_reporting": stmt.excluded.precincts_reporting,
+                    "results_data": stmt.excluded.results_data,
+                },
+            )
+        )
+    return len(records)
+
+
+async def _mark_results_refreshed(session: AsyncSession, election_ids: set[uuid.UUID]) -> None:
+    """Stamp ``last_refreshed_at`` on elections whose results were just written.
+
+    The stamp feeds ``election_service.get_results_version``, so cached
+    results payloads and their ETags change in the same transaction as the
+    results themselves.
+    """
+    if election_ids:
+        await session.execute(
+            update(Election).where(Election.id.in_(election_ids)).values(last_refreshed_at=datetime.now(UTC))
+        )
+
+
+async def _upsert_results(session: AsyncSession, plan: list[tuple[BallotItemContext, uuid.UUID]]) -> int:
+    """Upsert statewide and county results for matched ballot items.
+
+    Returns:
+        Number of result rows written (statewide + county).
+    """
+    now = datetime.now(UTC)
+    statewide = {
+        election_id: {
+            "id": uuid.uuid4(),
+            "election_id": election_id,
+            "precincts_participating": ctx.ingestion.statewide.precincts_participating,
+            "precincts_reporting": ctx.ingestion.statewide.precincts_reporting,
+            "results_data": ctx.ingestion.statewide.results_data,
+            "source_created_at": ctx.ingestion.statewide.source_created_at,
+            "fetched_at": now,
+        }
+        for ctx, election_id in plan
+    }
+    records = list(statewide.values())
+    for i in range(0, len(records), _RESULT_UPSERT_BATCH):
+        stmt = pg_insert(ElectionResult).values(records[i : i + _RESULT_UPSERT_BATCH])
+        await session.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_election_results_election_id",
+                set_={
+                    "precincts_participating": stmt.excluded.precincts_participating,
+                    "precincts_reporting": stmt.excluded.precincts_reporting,
+                    "results_data": stmt.excluded.results_data,
+                    "source_created_at": stmt.excluded.source_created_at,
+                    "fetched_at": stmt.excluded.fetched_at,
+                },
+            )
+        )
+
+    counties = [(election_id, county) for ctx, election_id in plan for county in ctx.ingestion.counties]
+    written = len(records) + await _upsert_county_results(session, counties)
+    await _mark_results_refreshed(session, set(statewide))
+    return written
+
+
+async def _write_items(
+    session: AsyncSession,
+    plan: list[tuple[BallotItemContext, uuid.UUID]],
+    backfills: dict[uuid.UUID, str],
+    job_id: uuid.UUID,
+) -> tuple[int, int, int]:
+    """Write matched ballot items: ballot_item_id backfills, candidates, and results.
+
+    Returns:
+        Tuple of (candidates inserted, candidates updated, result rows).
+    """
+    election_ids = {election_id for _, election_id in plan}
+    backfill_rows = [
+        {"id": election_id, "ballot_item_id": ballot_item_id}
+        for election_id, ballot_item_id in backfills.items()
+        if election_id in election_ids
+    ]
+    if backfill_rows:
+        await session.execute(update(Election), backfill_rows)
+    inserted, updated = await _upsert_candidates(session, plan, job_id)
+    return inserted, updated, await _upsert_results(session, plan)
+
+
+def _item_error(ctx: BallotItemContext, error: Exception, **extra: str) -> dict:
+    """Log and describe a ballot item that failed to import."""
+    logger.warning("Error processing ballot item '{}': {}", ctx.ballot_item_name, error)
+    return {"ballot_item": ctx.ballot_item_name, "ballot_item_id": ctx.ballot_item_id, **extra, "error": str(error)}
+
+
+async def _write_plan(
+    session: AsyncSession,
+    plan: list[tuple[BallotItemContext, uuid.UUID]],
+    backfills: dict[uuid.UUID, str],
+    job_id: uuid.UUID,
+    errors: list[dict],
+) -> tuple[int, int, int, int]:
+    """Write all matched ballot items in bulk, isolating failures per item.
+
+    The bulk write runs in one savepoint. If it fails, it is rolled back
+    and each ballot item is written in its own savepoint instead, so one
+    bad item is reported without losing the rest.
+
+    Returns:
+        Tuple of (ballot items written, candidates inserted, candidates
+        updated, result rows).
+    """
+    if not plan:
+        return 0, 0, 0, 0
+    try:
+        async with session.begin_nested():
+            inserted, updated, results = await _write_items(session, plan, backfills, job_id)
+    except Exception as e:
+        logger.warning("Bulk results write failed ({}); retrying {} ballot items one at a time", e, len(plan))
+    else:
+        return len(plan), inserted, updated, results
+
+    written = inserted = updated = results = 0
+    for ctx, election_id in plan:
+        try:
+            async with session.begin_nested():
+                item_inserted, item_updated, item_results = await _write_items(
+                    session, [(ctx, election_id)], backfills, job_id
+                )
+        except Exception as e:
+            errors.append(_item_error(ctx, e))
+            continue
+        written += 1
+        inserted += item_inserted
+        updated += item_updated
+        results += item_results
+    return written, inserted, updated, results
+
+
+def _should_stream(file_path: Path) -> bool:
+    """Whether a results file is large enough to parse one county at a time."""
+    threshold_mb = get_settings().results_stream_threshold_mb
+    return file_path.stat().st_size >= threshold_mb * 1024 * 1024
+
+
+async def _persist_streamed_counties(
+    session: AsyncSession,
+    file_path: Path,
+    contexts: list[BallotItemContext],
+    election_ids: dict[str, uuid.UUID],
+    errors: list[dict],
+) -> int:
+    """Stream a results file's counties and persist each for its matched elections.
+
+    Each county's results are upserted together and committed before the
+    next county is read, so memory stays bounded by one county. If a
+    county's write fails, its contests are retried one at a time and
+    failures are reported against their ballot item.
+
+    Returns:
+        Number of county results persisted.
+    """
+    by_id = {ctx.ballot_item_id: ctx for ctx in contexts}
+    persisted = 0
+    for local_result in iter_local_results(file_path):
+        rows = [
+            (ballot_item_id, election_ids[ballot_item_id], county)
+            for ballot_item_id, county in ingest_local_result(local_result) or []
+            if ballot_item_id in election_ids
+        ]
+        try:
+            async with session.begin_nested():
+                persisted += await _upsert_county_results(session, [(eid, county) for _, eid, county in rows])
+                await _mark_results_refreshed(session, {eid for _, eid, _ in rows})
+        except Exception:
+            for ballot_item_id, election_id, county in rows:
+                try:
+                    async with session.begin_nested():
+                        persisted += await _upsert_county_results(session, [(election_id, county)])
+                        await _mark_results_refreshed(session, {election_id})
+                except Exception as e:
+                    errors.append(_item_error(by_id[ballot_item_id], e, county=county.county_name))
+        await session.commit()
+    return persisted
+
+
+async def _plan_ballot_items(
+    session: AsyncSession,
+    contexts: list[BallotItemContext],
+    matcher: _ElectionMatcher,
+    errors: list[dict],
+) -> list[tuple[BallotItemContext, uuid.UUID]]:
+    """Match ballot items to elections, collecting failures in ``errors``.
+
+    Returns:
+        The (ballot item, election ID) pairs to write.
+    """
+    plan: list[tuple[BallotItemContext, uuid.UUID]] = []
+    for ctx in contexts:
+        try:
+            # Use a savepoint so that a single ballot-item failure can be
+            # rolled back without poisoning the session for subsequent items.
+            async with session.begin_nested():
+                plan.append((ctx, await _match_election(session, ctx, matcher)))
+        except Exception as e:
+            errors.append(_item_error(ctx, e))
+    return plan
+
+
+def _written_election_ids(
+    plan: list[tuple[BallotItemContext, uuid.UUID]],
+    errors: list[dict],
+) -> dict[str, uuid.UUID]:
+    """Map ballot item IDs to their elections, leaving out items that failed."""
+    failed_ids = {e["ballot_item_id"] for e in errors if "ballot_item_id" in e}
+    election_ids: dict[str, uuid.UUID] = {}
+    for ctx, election_id in plan:
+        if ctx.ballot_item_id not in failed_ids:
+            election_ids.setdefault(ctx.ballot_item_id, election_id)
+    return election_ids
+
+
 async def process_results_import(
     session: AsyncSession,
     job: ImportJob,
     file_path: Path,
+    *,
+    stream: bool | None = None,
 ) -> ImportJob:
     """Process a single election results JSON file.
 
     Loads the file, validates it, matches/creates elections, upserts
-    candidates, and persists results.
+    candidates, and persists results. Elections on the file's date are
+    prefetched once and matched in memory; candidates and results of all
+    matched ballot items are then written in bulk statements, falling
+    back to one savepoint per ballot item if the bulk write fails.
+
+    In streaming mode only the file's metadata and statewide results are
+    loaded up front; elections, candidates and statewide results are
+    written first, then county results are read and committed one county
+    at a time. A malformed county fails the import at that county (those
+    before it stay persisted; re-importing the file is idempotent).
 
     Args:
         session: Database session.
         job: The ImportJob tracking this import.
         file_path: Path to the JSON file.
+        stream: Parse the file incrementally. None (the default) streams
+            files of at least ``RESULTS_STREAM_THRESHOLD_MB``.
 
     Returns:
         Updated ImportJob with final counts.
@@ -304,15 +669,13 @@ async def process_results_import(
     await session.commit()
 
     errors: list[dict] = []
-    elections_processed = 0
-    candidates_inserted = 0
-    candidates_updated = 0
-    results_persisted = 0
-    election_cache: dict[tuple[str, date], uuid.UUID] = {}
 
     try:
-        # Load and validate
-        feed = load_results_file(file_path)
+        if stream is None:
+            stream = _should_stream(file_path)
+
+        # Load and validate (without county results when streaming)
+        feed = load_results_header(file_path) if stream else load_results_file(file_path)
         validation_errors = validate_results_file(feed)
         if validation_errors:
             job.status = "failed"
@@ -326,37 +689,21 @@ async def process_results_import(
         job.total_records = len(contexts)
         await session.commit()
 
-        for ctx in contexts:
-            try:
-                # Use a savepoint so that a single ballot-item failure can be
-                # rolled back without poisoning the session for subsequent items.
-                async with session.begin_nested():
-                    # Match or create election
-                    election_id = await _match_election(session, ctx, election_cache)
-                    elections_processed += 1
-
-                    # Upsert candidates
-                    c_ins, c_upd = await _upsert_candidates(session, election_id, ctx, job.id)
-                    candidates_inserted += c_ins
-                    candidates_updated += c_upd
-
-                    # Persist results (statewide + county)
-                    counties_updated = await persist_ingestion_result(session, election_id, ctx.ingestion)
-                    results_persisted += 1 + counties_updated  # 1 for statewide + counties
-
-            except Exception as e:
-                logger.warning(
-                    "Error processing ballot item '{}': {}",
-                    ctx.ballot_item_name,
-                    e,
-                )
-                errors.append(
-                    {
-                        "ballot_item": ctx.ballot_item_name,
-                        "ballot_item_id": ctx.ballot_item_id,
-                        "error": str(e),
-                    }
-                )
+        # Plan: match every ballot item to an election against a single
+        # prefetch of the election date (only auto-creates write here).
+        matcher = await _ElectionMatcher.prefetch(session, date.fromisoformat(feed.electionDate))
+        plan = await _plan_ballot_items(session, contexts, matcher, errors)
+
+        # Write candidates and results for every matched item in bulk
+        elections_processed, candidates_inserted, candidates_updated, results_persisted = await _write_plan(
+            session, plan, matcher.backfills, job.id, errors
+        )
+
+        if stream:
+            await session.commit()
+            results_persisted += await _persist_streamed_counties(
+                session, file_path, contexts, _written_election_ids(plan, errors), errors
+            )
 
         # Finalize
         job.status = "completed"
@@ -386,3 +733,315 @@ async def process_results_import(
         raise
 
     return job
+
+
+# --- Bulk archive import ---
+
+# Secondary indexes on election_county_results that are dropped for an
+# archive import and rebuilt once afterwards. uq_election_county_results
+# stays: the county upsert's ON CONFLICT needs it.
+_DROPPABLE_RESULTS_INDEXES: list[dict[str, str]] = [
+    {
+        "name": "idx_election_county_results_election_id",
+        "create": "CREATE INDEX idx_election_county_results_election_id ON election_county_results (election_id)",
+    },
+    {
+        "name": "idx_election_county_results_county_normalized",
+        "create": (
+            "CREATE INDEX idx_election_county_results_county_normalized "
+            "ON election_county_results (county_name_normalized)"
+        ),
+    },
+    {
+        "name": "idx_election_county_results_jsonb",
+        "create": "CREATE INDEX idx_election_county_results_jsonb ON election_county_results USING GIN (results_data)",
+    },
+]
+
+
+async def repair_results_import_state(session: AsyncSession) -> None:
+    """Re-enable autovacuum and rebuild dropped indexes on ``election_county_results`` after a crash."""
+    from voter_api.services.import_service import repair_bulk_import_state
+
+    await repair_bulk_import_state(session, ElectionCountyResult.__tablename__, _DROPPABLE_RESULTS_INDEXES)
+
+
+@asynccontextmanager
+async def bulk_results_import_context(session: AsyncSession) -> AsyncIterator[None]:
+    """Context manager for bulk election results imports.
+
+    The ``election_county_results`` counterpart of
+    :func:`~voter_api.services.import_service.bulk_import_context`: drops
+    its secondary indexes and disables autovacuum on entry, then rebuilds
+    the indexes and runs VACUUM ANALYZE once on exit (including on error).
+
+    Args:
+        session: Database session for lifecycle DDL operations.
+
+    Yields:
+        None — caller imports files inside the context.
+    """
+    from voter_api.services.import_service import (
+        _disable_autovacuum,
+        _drop_import_indexes,
+        _enable_autovacuum_and_vacuum,
+        _rebuild_import_indexes,
+    )
+
+    table = ElectionCountyResult.__tablename__
+    try:
+        await session.execute(text("SET synchronous_commit = 'off'"))
+        await _disable_autovacuum(session, table)
+        await _drop_import_indexes(session, _DROPPABLE_RESULTS_INDEXES)
+        logger.info("Bulk results import context entered: optimizations applied")
+        yield
+    finally:
+        logger.info("Bulk results import context exiting: restoring database settings...")
+        try:
+            await session.rollback()
+            await session.execute(text("SET synchronous_commit = 'on'"))
+            await _rebuild_import_indexes(session, _DROPPABLE_RESULTS_INDEXES)
+            await _enable_autovacuum_and_vacuum(session, table)
+            logger.info("Bulk results import context: database settings restored")
+        except Exception:
+            logger.exception("Error during bulk results import teardown — indexes may need manual rebuild")
+            raise
+
+
+@dataclass(slots=True)
+class ResultsArchiveGroup:
+    """The results files of one election date, imported as one job.
+
+    Attributes:
+        election_date: ISO election date shared by the files.
+        files: The files, in import order.
+        job: The group's ImportJob once the import has started.
+        error: Why the group failed outright, if it did.
+    """
+
+    election_date: str
+    files: list[Path]
+    job: ImportJob | None = None
+    error: str | None = None
+
+
+def group_results_archive(files: list[Path]) -> tuple[list[ResultsArchiveGroup], list[tuple[Path, str]]]:
+    """Group results files by election date, reading only each file's header.
+
+    Args:
+        files: Results JSON files, in import order.
+
+    Returns:
+        Tuple of (groups ordered by election date, unreadable files with
+        the reason).
+    """
+    by_date: dict[str, list[Path]] = defaultdict(list)
+    unreadable: list[tuple[Path, str]] = []
+    for path in files:
+        try:
+            by_date[load_results_header(path).electionDate].append(path)
+        except Exception as e:
+            unreadable.append((path, str(e)))
+    groups = [ResultsArchiveGroup(election_date=d, files=paths) for d, paths in sorted(by_date.items())]
+    return groups, unreadable
+
+
+@dataclass(slots=True)
+class PreparedResultsFile:
+    """A results file parsed into ballot item contexts, ready for matching.
+
+    Attributes:
+        contexts: One context per ballot item (empty if the file is unusable).
+        load_error: Why the file could not be read, if it could not.
+        validation_errors: Why the parsed file cannot be imported.
+    """
+
+    contexts: list[BallotItemContext]
+    load_error: str | None = None
+    validation_errors: list[str] = field(default_factory=list)
+
+
+def prepare_results_file(file_path: Path, stream: bool) -> PreparedResultsFile:
+    """Parse and validate one results file.
+
+    Module-level and returning only picklable contexts, so it can run in
+    a process pool worker. With ``stream`` only the header and statewide
+    results are parsed here; the counties are streamed later by
+    :func:`_persist_streamed_counties`.
+
+    Args:
+        file_path: Path to the results JSON file.
+        stream: Parse only the header and statewide results.
+
+    Returns:
+        The file's contexts, or why it cannot be imported.
+    """
+    try:
+        feed = load_results_header(file_path) if stream else load_results_file(file_path)
+    except Exception as e:
+        return PreparedResultsFile(contexts=[], load_error=str(e))
+    validation_errors = validate_results_file(feed)
+    if validation_errors:
+        return PreparedResultsFile(contexts=[], validation_errors=validation_errors)
+    return PreparedResultsFile(contexts=iter_ballot_items(feed))
+
+
+async def import_results_group(
+    session: AsyncSession,
+    job: ImportJob,
+    group: ResultsArchiveGroup,
+    *,
+    batch_size: int,
+    executor: Executor | None = None,
+) -> ImportJob:
+    """Import every results file of one election date as a single job.
+
+    Unlike :func:`process_results_import`, elections are prefetched once
+    for the whole group and the matcher's cache is shared by its files,
+    and writes are deferred until ``batch_size`` ballot items (from any
+    number of files) are pending, then written and committed together.
+    Later files win where files overlap, as they would importing one at
+    a time. Files over ``RESULTS_STREAM_THRESHOLD_MB`` still have their
+    counties streamed, on the event loop.
+
+    With an ``executor`` (a process pool), files are parsed by
+    :func:`prepare_results_file` in a worker process, so parsing one
+    group's files does not stall the other groups' database writes.
+
+    Args:
+        session: Database session.
+        job: The ImportJob tracking this group.
+        group: The files to import.
+        batch_size: Ballot items written per batch.
+
+    Returns:
+        Updated ImportJob with counts summed over the group's files.
+    """
+    job.status = "running"
+    job.started_at = datetime.now(UTC)
+    await session.commit()
+
+    errors: list[dict] = []
+    totals = [0, 0, 0, 0]  # ballot items written, candidates inserted/updated, result rows
+    total_records = 0
+    matcher = await _ElectionMatcher.prefetch(session, date.fromisoformat(group.election_date))
+    pending: list[tuple[BallotItemContext, uuid.UUID]] = []
+
+    async def flush() -> None:
+        written = await _write_plan(session, pending, matcher.backfills, job.id, errors)
+        totals[:] = [total + n for total, n in zip(totals, written, strict=True)]
+        pending.clear()
+        matcher.backfills.clear()
+        await session.commit()
+
+    loop = asyncio.get_running_loop()
+    try:
+        for file_path in group.files:
+            stream = _should_stream(file_path)
+            if executor is None:
+                prepared = prepare_results_file(file_path, stream)
+            else:
+                prepared = await loop.run_in_executor(executor, prepare_results_file, file_path, stream)
+            if prepared.load_error is not None:
+                logger.warning("Skipping unreadable results file {}: {}", file_path.name, prepared.load_error)
+                errors.append({"file": file_path.name, "error": prepared.load_error})
+                continue
+            if prepared.validation_errors:
+                errors.extend({"file": file_path.name, "error": e} for e in prepared.validation_errors)
+                continue
+
+            contexts = prepared.contexts
+            total_records += len(contexts)
+            plan = await _plan_ballot_items(session, contexts, matcher, errors)
+            pending.extend(plan)
+            if stream:
+                await flush()
+                totals[3] += await _persist_streamed_counties(
+                    session, file_path, contexts, _written_election_ids(plan, errors), errors
+                )
+            elif len(pending) >= batch_size:
+                await flush()
+        await flush()
+
+        job.status = "completed"
+        job.total_records = total_records
+        job.records_succeeded, job.records_inserted, job.records_updated = totals[0], totals[1], totals[2]
+        job.records_failed = len(errors)
+        job.error_log = errors if errors else None
+        job.completed_at = datetime.now(UTC)
+        await session.commit()
+
+        logger.info(
+            "Results archive group {} completed: {} files, {} ballot items, {} result rows",
+            group.election_date,
+            len(group.files),
+            totals[0],
+            totals[3],
+        )
+    except Exception:
+        await session.rollback()
+        job.status = "failed"
+        job.error_log = errors if errors else None
+        await session.commit()
+        raise
+
+    return job
+
+
+async def import_results_archive(
+    groups: list[ResultsArchiveGroup],
+    *,
+    workers: int,
+    batch_size: int,
+    executor: Executor | None = None,
+) -> list[ResultsArchiveGroup]:
+    """Import grouped results files with concurrent workers.
+
+    Each worker is an asyncio task holding one session (with
+    ``synchronous_commit`` off). It takes whole date groups from a shared
+    queue, so a date's election cache is only ever used by one worker and
+    groups never contend for the same elections. A group that fails is
+    recorded on it and the worker moves on.
+
+    The workers share one event loop, so on their own they only overlap
+    database round trips. Pass a process pool as ``executor`` to parse
+    files in parallel as well (see :func:`import_results_group`).
+
+    Wrap the call in :func:`bulk_results_import_context` to defer index
+    maintenance on ``election_county_results`` to the end of the run.
+
+    Args:
+        groups: Date groups from :func:`group_results_archive`.
+        workers: Number of groups imported concurrently.
+        batch_size: Ballot items written per batch.
+        executor: Executor that parses the files; None parses them on
+            the event loop.
+
+    Returns:
+        The groups, with ``job`` and ``error`` filled in.
+    """
+    factory = get_session_factory()
+    queue: asyncio.Queue[ResultsArchiveGroup] = asyncio.Queue()
+    for group in groups:
+        queue.put_nowait(group)
+
+    async def work() -> None:
+        async with factory() as session:
+            # synchronous_commit is per connection; each worker has its own.
+            await session.execute(text("SET synchronous_commit = 'off'"))
+            while not queue.empty():
+                group = queue.get_nowait()
+                try:
+                    group.job = await create_results_import_job(
+                        session, file_name=f"{group.election_date} archive ({len(group.files)} files)"
+                    )
+                    await import_results_group(session, group.job, group, batch_size=batch_size, executor=executor)
+                except Exception as e:
+                    logger.exception("Results archive group {} failed", group.election_date)
+                    group.error = str(e)
+                    await session.rollback()
+
+    async with asyncio.TaskGroup() as task_group:
+        for _ in range(max(1, min(workers, len(groups)))):
+            task_group.create_task(work())
+    return groups
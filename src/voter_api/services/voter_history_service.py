@@ -3,14 +3,27 @@
 import re
 import time
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any, NamedTuple
 
 from loguru import logger
-from sqlalchemy import ColumnElement, Row, Subquery, and_, delete, exists, func, or_, select, text, type_coerce
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Subquery,
+    and_,
+    delete,
+    exists,
+    func,
+    or_,
+    select,
+    text,
+    type_coerce,
+    update,
+)
 from sqlalchemy.dialects.postgresql import JSONB as JSONB_TYPE
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,6 +37,7 @@ from voter_api.lib.voter_history import (
 )
 from voter_api.models.analysis_result import AnalysisResult
 from voter_api.models.election import Election
+from voter_api.models.election_participation_stats import ElectionParticipationStats
 from voter_api.models.import_job import ImportJob
 from voter_api.models.voter import Voter
 from voter_api.models.voter_history import VoterHistory
@@ -52,6 +66,67 @@ _UPSERT_SUB_BATCH = 2000
 # E.g. with batch_size=2000, this commits every 100K records.
 _COMMIT_INTERVAL_CHUNKS = 50
 
+# Default chunk size for the COPY loader. COPY has no bind-parameter ceiling,
+# so chunks are sized for memory and merge-statement cost instead.
+DEFAULT_COPY_BATCH_SIZE = 50_000
+
+# Columns staged by the COPY loader, in COPY order. ``seq`` preserves file
+# order so the merge keeps the last occurrence of a duplicate key.
+_VH_STAGING_COLUMNS: tuple[str, ...] = (
+    "seq",
+    "voter_registration_number",
+    "county",
+    "election_date",
+    "election_type",
+    "normalized_election_type",
+    "party",
+    "ballot_style",
+    "absentee",
+    "provisional",
+    "supplemental",
+)
+
+_CREATE_VH_STAGING = """
+    CREATE TEMP TABLE voter_history_staging (
+        seq bigint NOT NULL,
+        voter_registration_number text NOT NULL,
+        county text NOT NULL,
+        election_date date NOT NULL,
+        election_type text NOT NULL,
+        normalized_election_type text NOT NULL,
+        party text,
+        ballot_style text,
+        absentee boolean NOT NULL,
+        provisional boolean NOT NULL,
+        supplemental boolean NOT NULL
+    ) ON COMMIT DROP
+"""
+
+# Set-based merge of one staged chunk: dedup in SQL (last occurrence wins),
+# then a single ON CONFLICT against the participation key.
+_MERGE_VH_STAGING = """
+    INSERT INTO voter_history (
+        voter_registration_number, county, election_date, election_type,
+        normalized_election_type, party, ballot_style,
+        absentee, provisional, supplemental, import_job_id
+    )
+    SELECT DISTINCT ON (voter_registration_number, election_date, election_type)
+        voter_registration_number, county, election_date, election_type,
+        normalized_election_type, party, ballot_style,
+        absentee, provisional, supplemental, :import_job_id
+    FROM voter_history_staging
+    ORDER BY voter_registration_number, election_date, election_type, seq DESC
+    ON CONFLICT ON CONSTRAINT uq_voter_history_participation DO UPDATE SET
+        county = EXCLUDED.county,
+        normalized_election_type = EXCLUDED.normalized_election_type,
+        party = EXCLUDED.party,
+        ballot_style = EXCLUDED.ballot_style,
+        absentee = EXCLUDED.absentee,
+        provisional = EXCLUDED.provisional,
+        supplemental = EXCLUDED.supplemental,
+        import_job_id = EXCLUDED.import_job_id
+"""
+
 # Non-unique indexes to drop before bulk import and rebuild afterward.
 # The unique constraint uq_voter_history_participation is kept for ON CONFLICT.
 _DROPPABLE_VH_INDEXES: list[dict[str, str]] = [
@@ -122,15 +197,55 @@ async def _rebuild_vh_indexes(session: AsyncSession) -> None:
     logger.info(f"Rebuilt all {len(_DROPPABLE_VH_INDEXES)} voter_history indexes")
 
 
+async def _list_vh_partitions(session: AsyncSession) -> list[str]:
+    """Return the names of all voter_history partitions.
+
+    Storage parameters such as ``autovacuum_enabled`` cannot be set on a
+    partitioned parent, so lifecycle DDL is applied to each partition.
+
+    Args:
+        session: Database session.
+
+    Returns:
+        Partition table names, ordered by name.
+    """
+    result = await session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'voter_history'::regclass "
+            "ORDER BY c.relname"
+        )
+    )
+    return list(result.scalars().all())
+
+
+async def _ensure_vh_partition(session: AsyncSession, year: int) -> None:
+    """Create the yearly voter_history partition for ``year`` if missing.
+
+    Delegates to the ``voter_history_ensure_partition`` SQL function, which
+    also moves any rows for that year out of the DEFAULT partition.
+
+    Args:
+        session: Database session.
+        year: Calendar year of the election dates about to be loaded.
+    """
+    await session.execute(text("SELECT voter_history_ensure_partition(:year)"), {"year": year})
+    await session.commit()
+    logger.debug(f"Ensured voter_history partition for {year}")
+
+
 async def _disable_vh_autovacuum(session: AsyncSession) -> None:
-    """Disable autovacuum on the voter_history table for bulk import.
+    """Disable autovacuum on every voter_history partition for bulk import.
 
     Args:
         session: Database session.
     """
-    await session.execute(text("ALTER TABLE voter_history SET (autovacuum_enabled = false)"))
+    partitions = await _list_vh_partitions(session)
+    for partition in partitions:
+        await session.execute(text(f"ALTER TABLE {partition} SET (autovacuum_enabled = false)"))
     await session.commit()
-    logger.info("Disabled autovacuum on voter_history table")
+    logger.info(f"Disabled autovacuum on {len(partitions)} voter_history partitions")
 
 
 async def _enable_vh_autovacuum_and_vacuum(session: AsyncSession) -> None:
@@ -142,9 +257,11 @@ async def _enable_vh_autovacuum_and_vacuum(session: AsyncSession) -> None:
     Args:
         session: Database session.
     """
-    await session.execute(text("ALTER TABLE voter_history SET (autovacuum_enabled = true)"))
+    partitions = await _list_vh_partitions(session)
+    for partition in partitions:
+        await session.execute(text(f"ALTER TABLE {partition} SET (autovacuum_enabled = true)"))
     await session.commit()
-    logger.info("Re-enabled autovacuum on voter_history table")
+    logger.info(f"Re-enabled autovacuum on {len(partitions)} voter_history partitions")
 
     # VACUUM is best-effort — autovacuum will handle it if this fails
     try:
@@ -205,12 +322,19 @@ async def process_voter_history_import(
     batch_size: int = 1000,
     *,
     skip_optimizations: bool = False,
+    use_copy: bool = False,
 ) -> ImportJob:
     """Process a voter history CSV file import.
 
     Reads the file in chunks, validates records, upserts voter history,
     tracks unmatched voters and duplicates, and handles re-import replacement.
 
+    With ``use_copy=True`` each chunk is streamed into a temporary staging
+    table with ``COPY`` and merged with a single set-based
+    ``INSERT ... SELECT DISTINCT ON ... ON CONFLICT``; the batch size is not
+    clamped and each chunk is committed on its own. The resulting rows are
+    identical to the default multi-row upsert path.
+
     Performance optimizations applied during import (unless skipped):
     - Drops non-essential indexes, rebuilds after
     - Sets synchronous_commit = off for the session
@@ -227,17 +351,19 @@ async def process_voter_history_import(
         skip_optimizations: If True, skip index drop/rebuild, autovacuum,
             and synchronous_commit changes. Use when calling within
             ``bulk_vh_import_context``.
+        use_copy: If True, load through COPY + staging-table merge.
 
     Returns:
         The updated ImportJob with final counts.
     """
     # Cap batch_size to the upsert sub-batch limit so a single chunk never
     # exceeds asyncpg's 32,767 parameter ceiling, regardless of config.
-    if batch_size > _UPSERT_SUB_BATCH:
+    # The COPY path sends no bind parameters per row, so it is not capped.
+    if not use_copy and batch_size > _UPSERT_SUB_BATCH:
         logger.info(f"Clamping batch_size from {batch_size} to {_UPSERT_SUB_BATCH} (asyncpg parameter limit)")
         batch_size = _UPSERT_SUB_BATCH
 
-    logger.info(f"Starting voter history import: {file_path.name}")
+    logger.info(f"Starting voter history import: {file_path.name} ({'copy' if use_copy else 'upsert'} loader)")
 
     job.status = "running"
     job.started_at = datetime.now(UTC)
@@ -247,6 +373,10 @@ async def process_voter_history_import(
     succeeded = 0
     failed = 0
     errors: list[dict] = []
+    # Years whose partition has been ensured during this import.
+    partition_years: set[int] = set()
+    # Election dates present in the file (their participation rollups go stale).
+    imported_dates: set[date] = set()
 
     try:
         import_start = time.monotonic()
@@ -282,7 +412,16 @@ async def process_voter_history_import(
             # Batch upsert voter history records
             chunk_succeeded = len(valid_records)
             if valid_records:
-                await _upsert_voter_history_batch(session, valid_records, job.id)
+                chunk_dates = {r["election_date"] for r in valid_records}
+                imported_dates |= chunk_dates
+                # Route new years into their own partition rather than DEFAULT.
+                for year in sorted({d.year for d in chunk_dates} - partition_years):
+                    await _ensure_vh_partition(session, year)
+                    partition_years.add(year)
+                if use_copy:
+                    await _copy_merge_voter_history_batch(session, valid_records, job.id)
+                else:
+                    await _upsert_voter_history_batch(session, valid_records, job.id)
                 succeeded += chunk_succeeded
 
             # Flush every chunk to keep data visible in session
@@ -291,7 +430,8 @@ async def process_voter_history_import(
             # Commit every N chunks to reduce transaction overhead.
             # Duplicates are handled by the DB unique constraint + ON CONFLICT,
             # so re-processing after a crash is safe (idempotent upsert).
-            if (chunk_idx + 1) % _COMMIT_INTERVAL_CHUNKS == 0:
+            # COPY chunks are already large, so each one is committed.
+            if use_copy or (chunk_idx + 1) % _COMMIT_INTERVAL_CHUNKS == 0:
                 job.last_processed_offset = chunk_idx + 1
                 await session.commit()
 
@@ -299,7 +439,8 @@ async def process_voter_history_import(
             logger.info(
                 f"Chunk {chunk_idx + 1}: {chunk_total} records "
                 f"({chunk_succeeded} valid, {chunk_failed} failed) "
-                f"({chunk_elapsed:.1f}s) | running total: {total} records"
+                f"({chunk_elapsed:.1f}s, {_rows_per_second(chunk_total, chunk_elapsed):,.0f} rows/s) "
+                f"| running total: {total} records"
             )
 
         # Update offset to reflect final chunk before the commit
@@ -311,10 +452,12 @@ async def process_voter_history_import(
 
         # Re-import replacement: clean up records from previous imports of same file
         replace_start = time.monotonic()
-        await _replace_previous_import(session, job)
+        replaced_years = await _replace_previous_import(session, job)
         replace_elapsed = time.monotonic() - replace_start
         logger.info(f"Re-import replacement completed in {replace_elapsed:.1f}s")
 
+        await mark_participation_stats_stale(session, election_dates=imported_dates, years=replaced_years)
+
         # Finalize job
         job.status = "completed"
         job.total_records = total
@@ -330,7 +473,8 @@ async def process_voter_history_import(
         import_elapsed = time.monotonic() - import_start
         logger.info(
             f"Voter history import completed in {import_elapsed:.1f}s: {total} total, "
-            f"{succeeded} succeeded, {failed} failed"
+            f"{succeeded} succeeded, {failed} failed "
+            f"({_rows_per_second(total, import_elapsed):,.0f} rows/s)"
         )
 
     except Exception:
@@ -421,19 +565,83 @@ async def _upsert_voter_history_batch(
         await session.execute(stmt)
 
 
+async def _copy_merge_voter_history_batch(
+    session: AsyncSession,
+    records: list[dict],
+    import_job_id: uuid.UUID,
+) -> None:
+    """Load a chunk of voter history records via COPY and a set-based merge.
+
+    Streams the records into an ``ON COMMIT DROP`` temporary staging table
+    using the asyncpg binary COPY protocol, then merges them into
+    voter_history in one statement. Duplicate keys within the chunk are
+    resolved by ``DISTINCT ON`` with the last occurrence winning, matching
+    :func:`_upsert_voter_history_batch`. The caller must commit after each
+    chunk so the staging table is dropped.
+
+    Args:
+        session: Database session.
+        records: List of validated record dicts.
+        import_job_id: The current import job ID.
+    """
+    await session.execute(text(_CREATE_VH_STAGING))
+
+    rows = [
+        (
+            seq,
+            r["voter_registration_number"],
+            r["county"],
+            r["election_date"],
+            r["election_type"],
+            r["normalized_election_type"],
+            r.get("party"),
+            r.get("ballot_style"),
+            r["absentee"],
+            r["provisional"],
+            r["supplemental"],
+        )
+        for seq, r in enumerate(records)
+    ]
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    asyncpg_connection = raw_connection.driver_connection
+    if asyncpg_connection is None:
+        msg = "COPY loader requires an open asyncpg connection"
+        raise RuntimeError(msg)
+    await asyncpg_connection.copy_records_to_table(
+        "voter_history_staging",
+        records=rows,
+        columns=list(_VH_STAGING_COLUMNS),
+    )
+
+    await session.execute(text(_MERGE_VH_STAGING), {"import_job_id": import_job_id})
+
+
+def _rows_per_second(rows: int, elapsed: float) -> float:
+    """Return throughput in rows per second (0 when no time has elapsed)."""
+    return rows / elapsed if elapsed > 0 else 0.0
+
+
 async def _replace_previous_import(
     session: AsyncSession,
     job: ImportJob,
-) -> None:
+) -> set[int]:
     """Replace records from previous imports of the same file.
 
     Finds previous completed import jobs with the same file_name and
     file_type='voter_history', deletes voter_history records still
     associated with those old jobs, and marks old jobs as 'superseded'.
 
+    Deletion is done one election year at a time with a date-range
+    predicate so each statement prunes to a single partition. A yearly
+    partition whose rows all belong to the old jobs is truncated instead.
+
     Args:
         session: Database session.
         job: The current (new) import job.
+
+    Returns:
+        Election years from which superseded rows were removed.
     """
     # Find previous completed jobs for the same file
     result = await session.execute(
@@ -447,15 +655,36 @@ async def _replace_previous_import(
     previous_jobs = list(result.scalars().all())
 
     if not previous_jobs:
-        return
+        return set()
+
+    prev_ids = [prev_job.id for prev_job in previous_jobs]
+    year_col = func.extract("year", VoterHistory.election_date)
+    stale_result = await session.execute(
+        select(year_col, func.count()).where(VoterHistory.import_job_id.in_(prev_ids)).group_by(year_col)
+    )
+    stale_by_year = {int(year): count for year, count in stale_result.all()}
+    partitions = set(await _list_vh_partitions(session)) if stale_by_year else set()
+
+    for year, stale_count in sorted(stale_by_year.items()):
+        lo, hi = date(year, 1, 1), date(year + 1, 1, 1)
+        in_year = and_(VoterHistory.election_date >= lo, VoterHistory.election_date < hi)
+        partition = f"voter_history_y{year}"
+        if partition in partitions:
+            total_result = await session.execute(select(func.count()).select_from(VoterHistory).where(in_year))
+            if total_result.scalar_one() == stale_count:
+                await session.execute(text(f"TRUNCATE {partition}"))
+                logger.info(f"Truncated fully superseded partition {partition} ({stale_count} rows)")
+                continue
+        # Delete voter_history records still pointing to the old jobs
+        await session.execute(delete(VoterHistory).where(in_year, VoterHistory.import_job_id.in_(prev_ids)))
+        logger.info(f"Deleted {stale_count} superseded voter_history rows for {year}")
 
     for prev_job in previous_jobs:
-        # Delete voter_history records still pointing to the old job
-        await session.execute(delete(VoterHistory).where(VoterHistory.import_job_id == prev_job.id))
         prev_job.status = "superseded"
         logger.info(f"Superseded previous import job: {prev_job.id}")
 
     await session.flush()
+    return set(stale_by_year)
 
 
 async def get_voter_history(
@@ -812,11 +1041,15 @@ def _apply_history_filters(
     return query, count_query
 
 
-async def get_participation_stats(
+async def compute_participation_stats(
     session: AsyncSession,
     election_id: uuid.UUID,
 ) -> ParticipationStatsResponse:
-    """Get aggregate participation statistics for an election.
+    """Compute aggregate participation statistics for an election from scratch.
+
+    Runs the full set of aggregate queries against voter_history. Callers
+    serving requests should use :func:`get_participation_stats`, which reads
+    the precomputed rollup.
 
     Args:
         session: Database session.
@@ -922,6 +1155,158 @@ async def get_participation_stats(
     )
 
 
+async def get_participation_stats(
+    session: AsyncSession,
+    election_id: uuid.UUID,
+    *,
+    force_refresh: bool = False,
+) -> ParticipationStatsResponse:
+    """Get participation statistics for an election from the rollup table.
+
+    Returns the stored rollup when it is present and not stale; otherwise
+    (or when ``force_refresh`` is set) recomputes and stores it.
+
+    Args:
+        session: Database session.
+        election_id: Election UUID.
+        force_refresh: If True, recompute even if a fresh rollup exists.
+
+    Returns:
+        ParticipationStatsResponse with totals and breakdowns.
+
+    Raises:
+        ValueError: If election not found.
+    """
+    if not force_refresh:
+        result = await session.execute(
+            select(ElectionParticipationStats).where(ElectionParticipationStats.election_id == election_id)
+        )
+        rollup = result.scalar_one_or_none()
+        if rollup is not None and not rollup.is_stale:
+            return ParticipationStatsResponse.model_validate(rollup.payload)
+
+    return await refresh_participation_stats(session, election_id)
+
+
+async def refresh_participation_stats(
+    session: AsyncSession,
+    election_id: uuid.UUID,
+) -> ParticipationStatsResponse:
+    """Recompute and store the participation rollup for one election.
+
+    Args:
+        session: Database session.
+        election_id: Election UUID.
+
+    Returns:
+        The freshly computed ParticipationStatsResponse.
+
+    Raises:
+        ValueError: If election not found.
+    """
+    start = time.monotonic()
+    stats = await compute_participation_stats(session, election_id)
+    stats.computed_at = datetime.now(UTC)
+
+    payload = stats.model_dump(mode="json")
+    stmt = pg_insert(ElectionParticipationStats).values(
+        election_id=election_id,
+        payload=payload,
+        is_stale=False,
+        computed_at=stats.computed_at,
+        stale_since=None,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ElectionParticipationStats.election_id],
+        set_={
+            "payload": stmt.excluded.payload,
+            "is_stale": False,
+            "computed_at": stmt.excluded.computed_at,
+            "stale_since": None,
+        },
+    )
+    await session.execute(stmt)
+    await session.commit()
+    logger.debug(f"Refreshed participation stats for election {election_id} in {time.monotonic() - start:.2f}s")
+    return stats
+
+
+async def mark_participation_stats_stale(
+    session: AsyncSession,
+    *,
+    election_ids: Iterable[uuid.UUID] | None = None,
+    election_dates: Iterable[date] | None = None,
+    years: Iterable[int] | None = None,
+) -> int:
+    """Flag participation rollups as stale so the next read recomputes them.
+
+    Selectors are OR-ed together; with no selector every rollup is marked.
+    Does not commit.
+
+    Args:
+        session: Database session.
+        election_ids: Specific elections to mark.
+        election_dates: Mark elections held on any of these dates.
+        years: Mark elections held in any of these calendar years.
+
+    Returns:
+        Number of rollup rows newly marked stale.
+    """
+    ids = list(election_ids) if election_ids is not None else None
+    dates = list(election_dates) if election_dates is not None else None
+    year_list = list(years) if years is not None else None
+    scoped = ids is not None or dates is not None or year_list is not None
+    if scoped and not (ids or dates or year_list):
+        return 0
+
+    selectors: list[ColumnElement[bool]] = []
+    if ids:
+        selectors.append(ElectionParticipationStats.election_id.in_(ids))
+    election_filters: list[ColumnElement[bool]] = []
+    if dates:
+        election_filters.append(Election.election_date.in_(dates))
+    if year_list:
+        election_filters.append(func.extract("year", Election.election_date).in_(year_list))
+    if election_filters:
+        selectors.append(ElectionParticipationStats.election_id.in_(select(Election.id).where(or_(*election_filters))))
+
+    stmt = (
+        update(ElectionParticipationStats)
+        .where(ElectionParticipationStats.is_stale.is_(False))
+        .values(is_stale=True, stale_since=func.now())
+    )
+    if selectors:
+        stmt = stmt.where(or_(*selectors))
+    result = await session.execute(stmt)
+    marked: int = result.rowcount  # type: ignore[attr-defined]
+    if marked:
+        logger.info(f"Marked {marked} participation stats rollups stale")
+    return marked
+
+
+async def refresh_stale_participation_stats(session: AsyncSession) -> int:
+    """Recompute every stale participation rollup.
+
+    Intended to run after a voter history import and election resolution so
+    the stats endpoint serves fresh rollups without on-request computation.
+
+    Args:
+        session: Database session.
+
+    Returns:
+        Number of rollups recomputed.
+    """
+    result = await session.execute(
+        select(ElectionParticipationStats.election_id).where(ElectionParticipationStats.is_stale.is_(True))
+    )
+    election_ids = list(result.scalars().all())
+    for election_id in election_ids:
+        await refresh_participation_stats(session, election_id)
+    refreshed = len(election_ids)
+    logger.info(f"Refreshed {refreshed} stale participation stats rollups")
+    return refreshed
+
+
 async def get_participation_summary(
     session: AsyncSession,
     voter_registration_number: str,
@@ -1114,7 +1499,16 @@ async def _build_election_match_conditions(
         return None
 
     # Check if any voter_history records have been resolved for this election
-    has_resolved = await session.execute(select(exists().where(VoterHistory.election_id == election.id)))
+    # Every predicate is scoped to the election date so PostgreSQL prunes the
+    # scan to a single yearly voter_history partition.
+    has_resolved = await session.execute(
+        select(
+            exists().where(
+                VoterHistory.election_date == election.election_date,
+                VoterHistory.election_id == election.id,
+            )
+        )
+    )
     if has_resolved.scalar_one():
         # Include both resolved rows AND still-unresolved rows on the same date.
         # Tier-2 district matching may leave some records with election_id IS NULL
@@ -1157,7 +1551,7 @@ async def _build_election_match_conditions(
         if district_filter is not None:
             resolved_condition = and_(resolved_condition, district_filter)
 
-        return [or_(resolved_condition, fallback)]
+        return [and_(VoterHistory.election_date == election.election_date, or_(resolved_condition, fallback))]
 
     # Fallback to date-based heuristic for fully-unresolved records
     count_result = await session.execute(
@@ -1,13 +1,16 @@
 """Voter service — multi-parameter search and detail retrieval."""
 
 import re
+import time
 import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ColumnElement, distinct, func, or_, select
+from loguru import logger
+from sqlalchemy import ColumnElement, Float, delete, func, insert, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute, selectinload
 
 from voter_api.lib.analyzer.comparator import (
     BOUNDARY_TYPE_TO_VOTER_FIELD,
@@ -16,12 +19,131 @@ from voter_api.lib.analyzer.comparator import (
     normalize_for_comparison,
 )
 from voter_api.lib.analyzer.spatial import find_boundaries_for_point
+from voter_api.lib.normalize import normalize_district_identifier, normalize_search_name
+from voter_api.lib.pagination import CountMode, count_total, decode_cursor, encode_cursor
 from voter_api.models.voter import Voter
+from voter_api.models.voter_filter_facet import VoterFilterFacet
 
 if TYPE_CHECKING:
     from voter_api.schemas.voter import BatchBoundaryCheckResponse
 
 
+@dataclass(frozen=True, slots=True)
+class VoterSearchFilters:
+    """Voter search filters, combined with AND logic.
+
+    Attributes:
+        q: Combined name search query (searches across first_name, last_name, middle_name).
+        voter_registration_number: Exact match on registration number.
+        first_name: Partial match (ILIKE) on first name.
+        last_name: Partial match (ILIKE) on last name.
+        county: Exact match on county.
+        residence_city: Exact match on city.
+        residence_zipcode: Exact match on zipcode.
+        status: Exact match on status.
+        congressional_district: Match ignoring zero-padding (canonical key).
+        state_senate_district: Match ignoring zero-padding (canonical key).
+        state_house_district: Match ignoring zero-padding (canonical key).
+        county_precinct: Exact match.
+        county_commission_district: Match ignoring zero-padding (canonical key).
+        school_board_district: Match ignoring zero-padding (canonical key).
+        present_in_latest_import: Filter by import presence.
+        has_district_mismatch: Filter by district mismatch flag.
+    """
+
+    q: str | None = None
+    voter_registration_number: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    county: str | None = None
+    residence_city: str | None = None
+    residence_zipcode: str | None = None
+    status: str | None = None
+    congressional_district: str | None = None
+    state_senate_district: str | None = None
+    state_house_district: str | None = None
+    county_precinct: str | None = None
+    county_commission_district: str | None = None
+    school_board_district: str | None = None
+    present_in_latest_import: bool | None = None
+    has_district_mismatch: bool | None = None
+
+    def conditions(self) -> list[ColumnElement[bool]]:
+        """Build the WHERE conditions for these filters."""
+        conditions: list[ColumnElement[bool]] = []
+
+        # Combined name search (q parameter)
+        if self.q:
+            # Normalize: split on whitespace and punctuation so "Smith, Jane" -> ["Smith", "Jane"]
+            words = [w for w in re.split(r"[\s,;.]+", self.q.strip()) if w]
+            for word in words:
+                # Escape SQL wildcard chars so user input is treated as literal text.
+                # Without this, "100%" becomes ILIKE '%100%%' and "_mith" matches any
+                # single character in that position rather than a literal underscore.
+                word_escaped = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                pattern = f"%{word_escaped}%"
+                # Each word must match at least one of the name fields
+                conditions.append(
+                    or_(
+                        Voter.first_name.ilike(pattern, escape="\\"),
+                        Voter.last_name.ilike(pattern, escape="\\"),
+                        Voter.middle_name.ilike(pattern, escape="\\"),
+                    )
+                )
+
+        # Exact match filters
+        if self.voter_registration_number:
+            conditions.append(Voter.voter_registration_number == self.voter_registration_number)
+
+        # Partial match (ILIKE) for name fields
+        if self.first_name:
+            conditions.append(Voter.first_name.ilike(f"%{self.first_name}%"))
+        if self.last_name:
+            conditions.append(Voter.last_name.ilike(f"%{self.last_name}%"))
+
+        # Exact match filters
+        if self.county:
+            conditions.append(Voter.county == self.county)
+        if self.residence_city:
+            conditions.append(Voter.residence_city == self.residence_city)
+        if self.residence_zipcode:
+            conditions.append(Voter.residence_zipcode == self.residence_zipcode)
+        if self.status:
+            conditions.append(Voter.status == self.status)
+
+        # District filters match on the canonical (zero-padding-insensitive) keys
+        if self.congressional_district:
+            key = normalize_district_identifier(self.congressional_district)
+            conditions.append(Voter.congressional_district_key == key)
+        if self.state_senate_district:
+            key = normalize_district_identifier(self.state_senate_district)
+            conditions.append(Voter.state_senate_district_key == key)
+        if self.state_house_district:
+            key = normalize_district_identifier(self.state_house_district)
+            conditions.append(Voter.state_house_district_key == key)
+        if self.county_precinct:
+            conditions.append(Voter.county_precinct == self.county_precinct)
+        if self.county_commission_district:
+            key = normalize_district_identifier(self.county_commission_district)
+            conditions.append(Voter.county_commission_district_key == key)
+        if self.school_board_district:
+            key = normalize_district_identifier(self.school_board_district)
+            conditions.append(Voter.school_board_district_key == key)
+
+        if self.present_in_latest_import is not None:
+            conditions.append(Voter.present_in_latest_import == self.present_in_latest_import)
+        if self.has_district_mismatch is not None:
+            conditions.append(Voter.has_district_mismatch == self.has_district_mismatch)
+
+        return conditions
+
+
+# Search results are ordered by name with the primary key as a tie-breaker,
+# so every row has a unique position and keyset cursors never skip or
+# repeat voters that share a name.
+_SEARCH_ORDER = (Voter.last_name, Voter.first_name, Voter.id)
+
+
 async def search_voters(
     session: AsyncSession,
     *,
@@ -46,6 +168,10 @@ async def search_voters(
 ) -> tuple[list[Voter], int]:
     """Search voters with multi-parameter filters using AND logic.
 
+    Runs an exact ``COUNT(*)`` and an ``OFFSET`` page. Both grow with the
+    size of the filtered set; :func:`search_voters_keyset` avoids them for
+    deep pages and broad filters.
+
     Args:
         session: Database session.
         q: Combined name search query (searches across first_name, last_name, middle_name).
@@ -56,12 +182,12 @@ async def search_voters(
         residence_city: Exact match on city.
         residence_zipcode: Exact match on zipcode.
         status: Exact match on status.
-        congressional_district: Exact match.
-        state_senate_district: Exact match.
-        state_house_district: Exact match.
+        congressional_district: Match ignoring zero-padding (canonical key).
+        state_senate_district: Match ignoring zero-padding (canonical key).
+        state_house_district: Match ignoring zero-padding (canonical key).
         county_precinct: Exact match.
-        county_commission_district: Exact match.
-        school_board_district: Exact match.
+        county_commission_district: Match ignoring zero-padding (canonical key).
+        school_board_district: Match ignoring zero-padding (canonical key).
         present_in_latest_import: Filter by import presence.
         has_district_mismatch: Filter by district mismatch flag.
         page: Page number.
@@ -70,125 +196,236 @@ async def search_voters(
     Returns:
         Tuple of (voters, total count).
     """
-    query = select(Voter)
-    count_query = select(func.count(Voter.id))
-
-    # Combined name search (q parameter)
-    if q:
-        # Normalize: split on whitespace and punctuation so "Smith, Jane" -> ["Smith", "Jane"]
-        words = [w for w in re.split(r"[\s,;.]+", q.strip()) if w]
-        for word in words:
-            # Escape SQL wildcard chars so user input is treated as literal text.
-            # Without this, "100%" becomes ILIKE '%100%%' and "_mith" matches any
-            # single character in that position rather than a literal underscore.
-            word_escaped = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-            pattern = f"%{word_escaped}%"
-            # Each word must match at least one of the name fields
-            word_condition = or_(
-                Voter.first_name.ilike(pattern, escape="\\"),
-                Voter.last_name.ilike(pattern, escape="\\"),
-                Voter.middle_name.ilike(pattern, escape="\\"),
-            )
-            query = query.where(word_condition)
-            count_query = count_query.where(word_condition)
-
-    # Exact match filters
-    if voter_registration_number:
-        query = query.where(Voter.voter_registration_number == voter_registration_number)
-        count_query = count_query.where(Voter.voter_registration_number == voter_registration_number)
-
-    # Partial match (ILIKE) for name fields
-    if first_name:
-        pattern = f"%{first_name}%"
-        query = query.where(Voter.first_name.ilike(pattern))
-        count_query = count_query.where(Voter.first_name.ilike(pattern))
-
-    if last_name:
-        pattern = f"%{last_name}%"
-        query = query.where(Voter.last_name.ilike(pattern))
-        count_query = count_query.where(Voter.last_name.ilike(pattern))
-
-    # Exact match filters
-    if county:
-        query = query.where(Voter.county == county)
-        count_query = count_query.where(Voter.county == county)
+    filters = VoterSearchFilters(
+        q=q,
+        voter_registration_number=voter_registration_number,
+        first_name=first_name,
+        last_name=last_name,
+        county=county,
+        residence_city=residence_city,
+        residence_zipcode=residence_zipcode,
+        status=status,
+        congressional_district=congressional_district,
+        state_senate_district=state_senate_district,
+        state_house_district=state_house_district,
+        county_precinct=county_precinct,
+        county_commission_district=county_commission_district,
+        school_board_district=school_board_district,
+        present_in_latest_import=present_in_latest_import,
+        has_district_mismatch=has_district_mismatch,
+    )
+    conditions = filters.conditions()
 
-    if residence_city:
-        query = query.where(Voter.residence_city == residence_city)
-        count_query = count_query.where(Voter.residence_city == residence_city)
+    count_query = select(func.count(Voter.id)).where(*conditions)
+    total = (await session.execute(count_query)).scalar_one()
+    offset = (page - 1) * page_size
+    query = select(Voter).where(*conditions).order_by(*_SEARCH_ORDER).offset(offset).limit(page_size)
+    result = await session.execute(query)
+    voters = list(result.scalars().all())
 
-    if residence_zipcode:
-        query = query.where(Voter.residence_zipcode == residence_zipcode)
-        count_query = count_query.where(Voter.residence_zipcode == residence_zipcode)
+    return voters, total
 
-    if status:
-        query = query.where(Voter.status == status)
-        count_query = count_query.where(Voter.status == status)
 
-    if congressional_district:
-        query = query.where(Voter.congressional_district == congressional_district)
-        count_query = count_query.where(Voter.congressional_district == congressional_district)
+@dataclass
+class VoterSearchPage:
+    """One page of keyset-paginated voter search results.
 
-    if state_senate_district:
-        query = query.where(Voter.state_senate_district == state_senate_district)
-        count_query = count_query.where(Voter.state_senate_district == state_senate_district)
+    Attributes:
+        voters: Voters on this page, in search order.
+        total: Matching voters, exact or approximate per ``total_is_exact``.
+        total_is_exact: False when ``total`` is a planner estimate or a cap.
+        next_cursor: Token for the following page, or None on the last page.
+    """
 
-    if state_house_district:
-        query = query.where(Voter.state_house_district == state_house_district)
-        count_query = count_query.where(Voter.state_house_district == state_house_district)
+    voters: list[Voter]
+    total: int
+    total_is_exact: bool
+    next_cursor: str | None
 
-    if county_precinct:
-        query = query.where(Voter.county_precinct == county_precinct)
-        count_query = count_query.where(Voter.county_precinct == county_precinct)
 
-    if county_commission_district:
-        query = query.where(Voter.county_commission_district == county_commission_district)
-        count_query = count_query.where(Voter.county_commission_district == county_commission_district)
+def encode_voter_cursor(voter: Voter) -> str:
+    """Encode a voter's search-order position as an opaque cursor token.
 
-    if school_board_district:
-        query = query.where(Voter.school_board_district == school_board_district)
-        count_query = count_query.where(Voter.school_board_district == school_board_district)
+    Args:
+        voter: The last voter on the current page.
 
-    if present_in_latest_import is not None:
-        query = query.where(Voter.present_in_latest_import == present_in_latest_import)
-        count_query = count_query.where(Voter.present_in_latest_import == present_in_latest_import)
+    Returns:
+        URL-safe token to pass back as ``cursor`` for the next page.
+    """
+    return encode_cursor([voter.last_name, voter.first_name, str(voter.id)])
 
-    if has_district_mismatch is not None:
-        query = query.where(Voter.has_district_mismatch == has_district_mismatch)
-        count_query = count_query.where(Voter.has_district_mismatch == has_district_mismatch)
 
-    total = (await session.execute(count_query)).scalar_one()
-    offset = (page - 1) * page_size
+def decode_voter_cursor(cursor: str) -> tuple[str, str, uuid.UUID]:
+    """Decode a token produced by :func:`encode_voter_cursor`.
+
+    Args:
+        cursor: The opaque cursor token.
+
+    Returns:
+        Tuple of (last_name, first_name, voter id).
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        last_name, first_name, voter_id = decode_cursor(cursor)
+        if not isinstance(last_name, str) or not isinstance(first_name, str):
+            raise TypeError("name fields must be strings")
+        return last_name, first_name, uuid.UUID(voter_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+async def search_voters_keyset(
+    session: AsyncSession,
+    filters: VoterSearchFilters,
+    *,
+    cursor: str | None = None,
+    page: int = 1,
+    page_size: int = 20,
+    count_mode: CountMode = "estimate",
+) -> VoterSearchPage:
+    """Search voters, paging by keyset cursor instead of ``OFFSET``.
+
+    With a ``cursor`` the page starts strictly after the encoded
+    ``(last_name, first_name, id)`` position, which the
+    ``ix_voters_name_search`` index serves without scanning skipped rows.
+    Without one, ``page`` is applied as an offset so the first page (or a
+    legacy page link) can be fetched before a cursor exists.
+
+    The total is computed per ``count_mode`` (see
+    :func:`~voter_api.lib.pagination.count_total`). When the first page
+    already holds every match, that page size is the exact total and no
+    count query runs.
+
+    Args:
+        session: Database session.
+        filters: Search filters.
+        cursor: ``next_cursor`` from a previous page.
+        page: Page number, used only when no cursor is given.
+        page_size: Items per page.
+        count_mode: How to compute the total.
+
+    Returns:
+        The page of voters with its total and next cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    conditions = filters.conditions()
+    query = select(Voter).where(*conditions).order_by(*_SEARCH_ORDER)
+    offset = 0
+    if cursor is not None:
+        position = decode_voter_cursor(cursor)
+        query = query.where(tuple_(*_SEARCH_ORDER) > tuple_(*position))
+    else:
+        offset = (page - 1) * page_size
+        query = query.offset(offset)
+
+    # Fetch one extra row to learn whether another page follows.
+    rows = list((await session.execute(query.limit(page_size + 1))).scalars().all())
+    has_more = len(rows) > page_size
+    voters = rows[:page_size]
+    next_cursor = encode_voter_cursor(voters[-1]) if has_more else None
+    seen = offset + len(voters)
+
+    if cursor is None and not has_more and (voters or offset == 0):
+        return VoterSearchPage(voters=voters, total=seen, total_is_exact=True, next_cursor=None)
+
+    total, total_is_exact = await count_total(
+        session, select(Voter.id).where(*conditions), count_mode=count_mode, seen=seen, has_more=has_more
+    )
+    return VoterSearchPage(voters=voters, total=total, total_is_exact=total_is_exact, next_cursor=next_cursor)
+
+
+async def lookup_voters_by_name(
+    session: AsyncSession,
+    q: str,
+    *,
+    county: str | None = None,
+    limit: int = 10,
+    min_token_length: int = 2,
+) -> list[tuple[Voter, float]]:
+    """Ranked, prefix-matching voter name lookup for type-ahead.
+
+    The query is normalized like ``voters.search_name``; every token must
+    start a word of the voter's first, middle, or last name, so "jo smi"
+    matches "JOHN Q SMITH". Matches are ordered by trigram word similarity
+    to the whole query through the GiST index, so only ``limit`` rows are
+    ranked and fetched.
+
+    Tokens shorter than ``min_token_length`` (typically initials) are too
+    unselective to drive an index scan; they narrow results only when the
+    query also has a longer token.
+
+    Args:
+        session: Database session.
+        q: Free-text name query.
+        county: Optional exact county filter.
+        limit: Maximum matches to return.
+        min_token_length: Shortest token that can drive the lookup.
+
+    Returns:
+        List of (voter, score) pairs, best first; score is in [0, 1].
+
+    Raises:
+        ValueError: If no token reaches ``min_token_length``.
+    """
+    tokens = normalize_search_name(q).split()
+    if not any(len(token) >= min_token_length for token in tokens):
+        raise ValueError(f"Name search requires at least one name of {min_token_length} or more letters or digits")
+
+    # Tokens hold only [a-z0-9], so they need no LIKE escaping.
+    conditions: list[ColumnElement[bool]] = [Voter.search_name.like(f"% {token}%") for token in tokens]
+    if county:
+        conditions.append(Voter.county == county)
+
+    distance = Voter.search_name.op("<->>", return_type=Float)(" ".join(tokens))
     query = (
-        query.options(selectinload(Voter.geocoded_locations))
-        .order_by(Voter.last_name, Voter.first_name)
-        .offset(offset)
-        .limit(page_size)
+        select(Voter, (1 - distance).label("score")).where(*conditions).order_by(distance, *_SEARCH_ORDER).limit(limit)
     )
     result = await session.execute(query)
-    voters = list(result.scalars().all())
-
-    return voters, total
+    return [(voter, float(score)) for voter, score in result.all()]
 
 
 async def get_voter_detail(
     session: AsyncSession,
     voter_id: uuid.UUID,
 ) -> Voter | None:
-    """Get a single voter by ID with eager-loaded relationships.
+    """Get a single voter by ID.
+
+    Geocoded locations are not loaded; the detail response only carries the
+    official location columns. Use ``geocoding_service.get_voter_locations``
+    for the full list.
 
     Args:
         session: Database session.
         voter_id: The voter's UUID.
 
     Returns:
-        Voter with geocoded_locations loaded, or None.
+        Voter, or None.
     """
-    query = select(Voter).options(selectinload(Voter.geocoded_locations)).where(Voter.id == voter_id)
+    query = select(Voter).where(Voter.id == voter_id)
     result = await session.execute(query)
     return result.scalar_one_or_none()
 
 
+# Filter dropdowns served from voter_filter_facets: (response key, facet column).
+_GLOBAL_FACETS: tuple[tuple[str, str], ...] = (
+    ("statuses", "status"),
+    ("counties", "county"),
+    ("congressional_districts", "congressional_district"),
+    ("state_senate_districts", "state_senate_district"),
+    ("state_house_districts", "state_house_district"),
+)
+_COUNTY_FACETS: tuple[tuple[str, str], ...] = (
+    ("county_precincts", "county_precinct"),
+    ("county_commission_districts", "county_commission_district"),
+    ("school_board_districts", "school_board_district"),
+)
+_FACET_COLUMNS: tuple[str, ...] = tuple(column for _, column in _GLOBAL_FACETS + _COUNTY_FACETS)
+
+
 async def get_voter_filter_options(
     session: AsyncSession,
     *,
@@ -196,9 +433,15 @@ async def get_voter_filter_options(
     county_precinct: str | None = None,
     county_commission_district: str | None = None,
     school_board_district: str | None = None,
-) -> dict[str, list[str] | None]:
+    with_counts: bool = False,
+) -> dict[str, Any]:
     """Return distinct non-null values for voter search filter dropdowns.
 
+    Reads the ``voter_filter_facets`` rollup (refreshed by voter imports
+    through :func:`refresh_voter_filter_facets`) rather than scanning
+    ``voters``: one ``GROUPING SETS`` query for the statewide lists and one
+    county-scoped query when ``county`` is given.
+
     Args:
         session: Database session.
         county: Optional county name to scope county-level filter options.
@@ -207,71 +450,97 @@ async def get_voter_filter_options(
             other county-scoped options.
         school_board_district: Optional school board district to narrow other
             county-scoped options.
+        with_counts: Also return voter counts per option under ``"counts"``.
 
     Returns:
         Dict mapping filter field names to sorted lists of distinct values.
-        County-scoped fields are None when no county is specified.
+        County-scoped fields are None when no county is specified. With
+        ``with_counts``, ``"counts"`` maps each field name to
+        ``{value: voter count}``.
 
     Cascading behavior: Each county-scoped filter narrows the *other*
     county-scoped lists but not its own, so the user can still change
     their selection in that dropdown.
     """
-
-    async def _distinct_sorted(
-        column: InstrumentedAttribute[str | None],
-        *,
-        filter_nulls: bool,
-        filters: list[ColumnElement[bool]] | None = None,
-    ) -> list[str]:
-        stmt = select(distinct(column))
-        if filter_nulls:
-            stmt = stmt.where(column.isnot(None))
-        for f in filters or []:
-            stmt = stmt.where(f)
-        stmt = stmt.order_by(column)
-        result = await session.execute(stmt)
-        return [row for (row,) in result.all()]
-
-    # status and county are non-nullable in the Voter model; district fields are nullable.
-    # Queries run sequentially — AsyncSession is not safe for concurrent use.
-    statuses = await _distinct_sorted(Voter.status, filter_nulls=False)
-    counties = await _distinct_sorted(Voter.county, filter_nulls=False)
-    congressional = await _distinct_sorted(Voter.congressional_district, filter_nulls=True)
-    state_senate = await _distinct_sorted(Voter.state_senate_district, filter_nulls=True)
-    state_house = await _distinct_sorted(Voter.state_house_district, filter_nulls=True)
-
-    options: dict[str, list[str] | None] = {
-        "statuses": statuses,
-        "counties": counties,
-        "congressional_districts": congressional,
-        "state_senate_districts": state_senate,
-        "state_house_districts": state_house,
-    }
+    columns = [getattr(VoterFilterFacet, column) for _, column in _GLOBAL_FACETS]
+    # Single-column grouping sets; ordering by every column keeps each set's
+    # rows sorted because the other columns are NULL within a set.
+    stmt = (
+        select(*columns, func.sum(VoterFilterFacet.voter_count))
+        .group_by(func.grouping_sets(*columns))
+        .order_by(*columns)
+    )
+    counts: dict[str, dict[str, int]] = {key: {} for key, _ in _GLOBAL_FACETS}
+    for row in (await session.execute(stmt)).all():
+        *values, voter_count = row
+        for (key, _), value in zip(_GLOBAL_FACETS, values, strict=True):
+            if value is not None:
+                counts[key][value] = int(voter_count)
+                break
 
     if county:
-        county_cond = Voter.county == county
-        precinct_cond = Voter.county_precinct == county_precinct if county_precinct else None
-        commission_cond = (
-            Voter.county_commission_district == county_commission_district if county_commission_district else None
+        selected = {
+            "county_precinct": county_precinct,
+            "county_commission_district": county_commission_district,
+            "school_board_district": school_board_district,
+        }
+        scoped_columns = [getattr(VoterFilterFacet, column) for _, column in _COUNTY_FACETS]
+        scoped_stmt = (
+            select(*scoped_columns, func.sum(VoterFilterFacet.voter_count))
+            .where(VoterFilterFacet.county == county)
+            .group_by(*scoped_columns)
         )
-        school_cond = Voter.school_board_district == school_board_district if school_board_district else None
+        combos = [
+            (dict(zip(selected, row[:-1], strict=True)), int(row[-1]))
+            for row in (await session.execute(scoped_stmt)).all()
+        ]
+        for key, column in _COUNTY_FACETS:
+            # Each field excludes its own condition so the user can still change that dropdown
+            others = {c: v for c, v in selected.items() if c != column and v}
+            field_counts: dict[str, int] = {}
+            for combo, voter_count in combos:
+                value = combo[column]
+                if value is not None and all(combo[c] == v for c, v in others.items()):
+                    field_counts[value] = field_counts.get(value, 0) + voter_count
+            counts[key] = dict(sorted(field_counts.items()))
+
+    options: dict[str, Any] = {key: list(values) for key, values in counts.items()}
+    if with_counts:
+        options["counts"] = counts
+    return options
 
-        # Each field excludes its own condition so the user can still change that dropdown
-        precinct_filters = [county_cond] + [c for c in [commission_cond, school_cond] if c is not None]
-        commission_filters = [county_cond] + [c for c in [precinct_cond, school_cond] if c is not None]
-        school_filters = [county_cond] + [c for c in [precinct_cond, commission_cond] if c is not None]
 
-        options["county_precincts"] = await _distinct_sorted(
-            Voter.county_precinct, filter_nulls=True, filters=precinct_filters
-        )
-        options["county_commission_districts"] = await _distinct_sorted(
-            Voter.county_commission_district, filter_nulls=True, filters=commission_filters
-        )
-        options["school_board_districts"] = await _distinct_sorted(
-            Voter.school_board_district, filter_nulls=True, filters=school_filters
-        )
+async def refresh_voter_filter_facets(session: AsyncSession, *, counties: Iterable[str] | None = None) -> int:
+    """Recompute the ``voter_filter_facets`` rollup from ``voters`` and commit.
 
-    return options
+    Args:
+        session: Database session.
+        counties: Replace only these counties' rows (the counties a voter
+            import touched); None rebuilds the whole table.
+
+    Returns:
+        Number of facet rows written.
+    """
+    start = time.monotonic()
+    voter_columns = [getattr(Voter, column) for column in _FACET_COLUMNS]
+    source = select(*voter_columns, func.count()).group_by(*voter_columns)
+    clear = delete(VoterFilterFacet)
+    if counties is not None:
+        county_list = sorted(set(counties))
+        if not county_list:
+            return 0
+        source = source.where(Voter.county.in_(county_list))
+        clear = clear.where(VoterFilterFacet.county.in_(county_list))
+
+    await session.execute(clear)
+    result = await session.execute(
+        insert(VoterFilterFacet).from_select([*_FACET_COLUMNS, "voter_count"], source, include_defaults=False)
+    )
+    await session.commit()
+    written: int = result.rowcount  # type: ignore[attr-defined]
+    scope = "all counties" if counties is None else f"{len(county_list)} counties"
+    logger.info(f"Refreshed {written} voter filter facets for {scope} in {time.monotonic() - start:.2f}s")
+    return written
 
 
 def build_voter_detail_dict(voter: Voter) -> dict:
@@ -5,6 +5,8 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from voter_api.lib.analyzer import BOUNDARY_TYPE_TO_VOTER_FIELD
+from voter_api.lib.analyzer.comparator import NUMERIC_DISTRICT_TYPES
+from voter_api.lib.normalize import normalize_district_identifier
 from voter_api.models.voter import Voter
 from voter_api.schemas.voter_stats import VoterRegistrationStatsResponse, VoterStatusCount
 
@@ -50,27 +52,14 @@ async def get_voter_stats_for_boundary(
         if voter_field is None:
             return None
 
-        voter_column = getattr(Voter, voter_field)
-
-        # Normalize numeric identifiers to handle zero-padding mismatches between
-        # boundary shapefiles and the voter CSV. Shapefile integer fields produce
-        # bare strings like "5", while the GA SOS voter CSV uses zero-padded forms
-        # like "005" or "0005". Trying all common padded forms with IN (...) lets
-        # PostgreSQL use the existing B-tree index on each equality check.
-        if boundary_identifier.isdigit():
-            num_val = int(boundary_identifier)
-            normalized_ids = list(  # NOSONAR - set literal used for deduplication
-                {
-                    boundary_identifier,
-                    str(num_val),
-                    str(num_val).zfill(2),
-                    str(num_val).zfill(3),
-                    str(num_val).zfill(4),
-                }
-            )
-            id_filter = voter_column.in_(normalized_ids)
+        # Numeric districts match on the canonical key column so zero-padding
+        # differences between boundary shapefiles ("5") and the voter CSV
+        # ("005") collapse to a single indexed equality.
+        if boundary_type in NUMERIC_DISTRICT_TYPES:
+            key_column = getattr(Voter, f"{voter_field}_key")
+            id_filter = key_column == normalize_district_identifier(boundary_identifier)
         else:
-            id_filter = voter_column == boundary_identifier
+            id_filter = getattr(Voter, voter_field) == boundary_identifier
 
         query = (
             select(Voter.status, func.count(Voter.id))
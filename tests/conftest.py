@@ -7,11 +7,18 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from voter_api.core.config import Settings
+from voter_api.core.principal_cache import principal_cache
 from voter_api.core.security import create_access_token, hash_password
 from voter_api.models.base import Base
 from voter_api.models.user import User
 
 
+@pytest.fixture(autouse=True)
+def _empty_principal_cache() -> None:
+    """Start every test without authenticated principals cached by earlier tests."""
+    principal_cache.clear()
+
+
 @pytest.fixture
 def settings() -> Settings:
     """Test application settings."""
@@ -39,6 +39,7 @@ from voter_api.models.totp import TOTPCredential
 from voter_api.models.user import User
 from voter_api.models.voter import Voter
 from voter_api.models.voter_history import VoterHistory
+from voter_api.services.voter_service import refresh_voter_filter_facets
 
 # ---------------------------------------------------------------------------
 # App & client
@@ -868,6 +869,8 @@ async def seed_database(app: FastAPI, settings: Settings) -> AsyncGenerator[None
         await session.execute(stmt)
 
         await session.commit()
+        # Seeded voters bypass the import pipeline that keeps facets current.
+        await refresh_voter_filter_facets(session)
 
     yield
 
@@ -914,6 +917,7 @@ async def seed_database(app: FastAPI, settings: Settings) -> AsyncGenerator[None
             delete(User).where(User.id.in_([ADMIN_USER_ID, ANALYST_USER_ID, VIEWER_USER_ID, TOTP_USER_ID]))
         )
         await session.commit()
+        await refresh_voter_filter_facets(session)
 
 
 @pytest.fixture(scope="session", autouse=True)
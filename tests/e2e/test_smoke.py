@@ -6,10 +6,11 @@ by the ``seed_database`` session fixture.
 """
 
 import uuid
+from pathlib import Path
 
 import httpx
 import pytest
-from sqlalchemy import delete
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.e2e.conftest import (
@@ -33,6 +34,9 @@ from tests.e2e.conftest import (
 )
 from voter_api.models.auth_tokens import UserInvite
 from voter_api.models.election import Election
+from voter_api.models.import_job import ImportJob
+from voter_api.models.voter import Voter
+from voter_api.models.voter_history import VoterHistory
 
 # All E2E tests and their fixtures share a single session-scoped event loop.
 # This must live in the test module (not conftest.py) for pytest-asyncio to
@@ -68,6 +72,17 @@ class TestHealth:
         assert "version" in body
         assert "environment" in body
 
+    async def test_server_timing_reports_queries(self, client: httpx.AsyncClient) -> None:
+        resp = await client.get(_url("/elections"))
+        assert resp.status_code == 200
+        timing = resp.headers["Server-Timing"]
+        assert timing.startswith("db;dur=")
+        assert 'desc="0 queries"' not in timing
+
+    async def test_metrics_disabled_by_default(self, client: httpx.AsyncClient) -> None:
+        resp = await client.get(_url("/metrics"))
+        assert resp.status_code == 404
+
 
 # ── Auth ───────────────────────────────────────────────────────────────────
 
@@ -599,6 +614,34 @@ class TestBoundaries:
         ids = [b["id"] for b in body]
         assert str(BOUNDARY_ID) in ids
 
+    async def test_bulk_upsert_is_idempotent(self, db_session: AsyncSession) -> None:
+        """Re-importing a layer updates rows in place instead of duplicating them."""
+        from shapely.geometry import MultiPolygon, Polygon
+
+        from voter_api.lib.boundary_loader import BoundaryData
+        from voter_api.models.boundary import Boundary
+        from voter_api.services.boundary_service import upsert_boundaries
+
+        square = MultiPolygon([Polygon([(-84.0, 33.0), (-83.9, 33.0), (-83.9, 33.1), (-84.0, 33.1)])])
+        layer = [
+            BoundaryData(name="E2E Bulk 1", boundary_identifier="e2e-bulk-1", geometry=square, properties={}),
+            BoundaryData(name="E2E Bulk 2", boundary_identifier="e2e-bulk-2", geometry=square, properties={}),
+        ]
+        try:
+            assert await upsert_boundaries(db_session, layer, "e2e_bulk", "state") == 2
+            layer[0] = BoundaryData(
+                name="E2E Bulk 1 renamed", boundary_identifier="e2e-bulk-1", geometry=square, properties={}
+            )
+            assert await upsert_boundaries(db_session, layer, "e2e_bulk", "state") == 2
+
+            rows = (
+                await db_session.execute(select(Boundary.name).where(Boundary.boundary_type == "e2e_bulk"))
+            ).scalars()
+            assert sorted(rows) == ["E2E Bulk 1 renamed", "E2E Bulk 2"]
+        finally:
+            await db_session.execute(delete(Boundary).where(Boundary.boundary_type == "e2e_bulk"))
+            await db_session.commit()
+
 
 # ── Elections ──────────────────────────────────────────────────────────────
 
@@ -1364,6 +1407,82 @@ class TestVoters:
         for item in body["items"]:
             assert item.get("has_district_mismatch") is True
 
+    async def test_search_voters_cursor_matches_pages(self, admin_client: httpx.AsyncClient) -> None:
+        """Following next_cursor yields the same voters as page 2, with a planner-estimated total."""
+        page_two = await admin_client.get(_url("/voters"), params={"page": 2, "page_size": 1})
+        first = await admin_client.get(_url("/voters"), params={"page_size": 1, "count": "estimate"})
+        assert page_two.status_code == 200
+        assert first.status_code == 200
+        cursor = first.json()["next_cursor"]
+        if cursor is None:
+            assert page_two.json()["items"] == []
+            return
+
+        second = await admin_client.get(_url("/voters"), params={"page_size": 1, "cursor": cursor, "count": "capped"})
+        assert second.status_code == 200
+        assert second.json()["items"] == page_two.json()["items"]
+
+    async def test_search_voters_invalid_cursor(self, admin_client: httpx.AsyncClient) -> None:
+        resp = await admin_client.get(_url("/voters"), params={"cursor": "bogus"})
+        assert resp.status_code == 400
+
+    async def test_voter_filter_options_with_counts(
+        self, admin_client: httpx.AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """Filter options come from the facet rollup and match the seeded voters."""
+        resp = await admin_client.get(_url("/voters/filters"), params={"include_counts": "true"})
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["counties"]
+        assert body["statuses"]
+        assert set(body["counts"]["statuses"]) == set(body["statuses"])
+
+        by_county = select(Voter.county, func.count()).group_by(Voter.county)
+        by_status = select(Voter.status, func.count()).group_by(Voter.status)
+        assert body["counts"]["counties"] == dict((await db_session.execute(by_county)).tuples().all())
+        assert body["counts"]["statuses"] == dict((await db_session.execute(by_status)).tuples().all())
+
+    async def test_lookup_voters_by_name(self, admin_client: httpx.AsyncClient) -> None:
+        """Ranked name lookup runs against the real search_name column and index."""
+        resp = await admin_client.get(_url("/voters/lookup"), params={"q": "smi j", "limit": 5})
+        assert resp.status_code == 200
+        scores = [item["score"] for item in resp.json()["items"]]
+        assert scores == sorted(scores, reverse=True)
+
+    async def test_lookup_voters_rejects_initials_only(self, admin_client: httpx.AsyncClient) -> None:
+        resp = await admin_client.get(_url("/voters/lookup"), params={"q": "j"})
+        assert resp.status_code == 422
+
+    async def test_voter_batches_issue_one_query(self, db_session: AsyncSession) -> None:
+        """Loading a voter batch and reading the analysis columns costs exactly one SELECT."""
+        from sqlalchemy import event
+        from sqlalchemy.orm import load_only
+
+        from voter_api.lib.analyzer.comparator import extract_registered_boundaries
+        from voter_api.services.analysis_service import _ANALYSIS_VOTER_COLUMNS
+
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, _params, _context, _executemany) -> None:  # noqa: ANN001
+            statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            result = await db_session.execute(
+                select(Voter).options(load_only(*_ANALYSIS_VOTER_COLUMNS)).order_by(Voter.id).limit(50)
+            )
+            voters = list(result.scalars().all())
+            for voter in voters:
+                extract_registered_boundaries(voter)
+                _ = voter.official_point
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _record)
+
+        assert voters, "E2E database has no voters — seed fixture may have failed"
+        assert len(statements) == 1
+        assert "geocoded_locations" not in statements[0]
+
     async def test_voter_not_found(self, admin_client: httpx.AsyncClient) -> None:
         resp = await admin_client.get(_url(f"/voters/{uuid.uuid4()}"))
         assert resp.status_code == 404
@@ -1999,6 +2118,56 @@ class TestVoterHistory:
             "Voter SHOULD appear with has_district_mismatch=false — latest result is a match"
         )
 
+    async def test_copy_loader_matches_upsert_loader(self, db_session: AsyncSession, tmp_path: Path) -> None:
+        """COPY + staging merge leaves the same rows as the multi-row upsert path."""
+        from voter_api.services.import_service import create_import_job
+        from voter_api.services.voter_history_service import process_voter_history_import
+
+        header = (
+            "County Name,Voter Registration Number,Election Date,"
+            "Election Type,Party,Ballot Style,Absentee,Provisional,Supplemental"
+        )
+        template = [
+            "FULTON,{p}01,11/02/1999,GENERAL ELECTION,NP,STD,N,N,N",
+            "FULTON,{p}02,11/02/1999,GENERAL ELECTION,NP,STD,Y,N,N",
+            "DEKALB,{p}01,11/02/1999,GENERAL ELECTION,NP,ALT,Y,N,N",
+            "FULTON,{p}03,05/18/1999,GENERAL PRIMARY,D,STD,N,N,N",
+            "COBB,{p}02,11/02/1999,GENERAL ELECTION,R,STD,N,N,Y",
+        ]
+        job_ids: list[uuid.UUID] = []
+        try:
+            for prefix, use_copy in (("9100", False), ("9200", True)):
+                csv_file = tmp_path / f"e2e_vh_{prefix}.csv"
+                csv_file.write_text(header + "\n" + "\n".join(r.format(p=prefix) for r in template) + "\n")
+                job = await create_import_job(db_session, file_name=csv_file.name, file_type="voter_history")
+                job_ids.append(job.id)
+                job = await process_voter_history_import(
+                    db_session, job, csv_file, batch_size=3, skip_optimizations=True, use_copy=use_copy
+                )
+                assert job.status == "completed"
+
+            loaded: dict[uuid.UUID, set[tuple]] = {}
+            for job_id in job_ids:
+                result = await db_session.execute(select(VoterHistory).where(VoterHistory.import_job_id == job_id))
+                loaded[job_id] = {
+                    (
+                        r.voter_registration_number[4:],
+                        r.county,
+                        r.election_date,
+                        r.election_type,
+                        r.ballot_style,
+                        r.absentee,
+                        r.supplemental,
+                    )
+                    for r in result.scalars()
+                }
+            assert len(loaded[job_ids[0]]) == 3
+            assert loaded[job_ids[0]] == loaded[job_ids[1]]
+        finally:
+            await db_session.rollback()
+            await db_session.execute(delete(ImportJob).where(ImportJob.id.in_(job_ids)))
+            await db_session.commit()
+
 
 # ── Absentee Ballot Applications ──────────────────────────────────────────
 
@@ -2017,6 +2186,21 @@ class TestAbsentee:
         assert "items" in data
         assert "pagination" in data
 
+    async def test_absentee_cursor_matches_pages(self, admin_client: httpx.AsyncClient) -> None:
+        """Following next_cursor yields the same applications as page 2."""
+        page_two = await admin_client.get(_url("/absentee"), params={"page": 2, "page_size": 1})
+        first = await admin_client.get(_url("/absentee"), params={"page_size": 1, "count": "estimate"})
+        assert page_two.status_code == 200
+        assert first.status_code == 200
+        cursor = first.json()["next_cursor"]
+        if cursor is None:
+            assert page_two.json()["items"] == []
+            return
+
+        second = await admin_client.get(_url("/absentee"), params={"page_size": 1, "cursor": cursor, "count": "capped"})
+        assert second.status_code == 200
+        assert second.json()["items"] == page_two.json()["items"]
+
     async def test_absentee_detail(self, admin_client: httpx.AsyncClient) -> None:
         resp = await admin_client.get(_url(f"/absentee/{ABSENTEE_RECORD_ID}"))
         assert resp.status_code == 200
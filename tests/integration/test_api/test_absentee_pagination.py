@@ -0,0 +1,130 @@
+"""Integration tests for absentee list pagination modes (page, cursor, count)."""
+
+import uuid
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+
+from voter_api.api.v1.absentee import absentee_router
+from voter_api.services.absentee_service import AbsenteePage, decode_absentee_cursor
+
+from .conftest import make_test_app
+
+_SERVICE = "voter_api.api.v1.absentee.absentee_service"
+
+
+@pytest.fixture
+def app(mock_session: AsyncMock) -> FastAPI:
+    """Minimal FastAPI app with absentee router (no auth override)."""
+    return make_test_app(absentee_router, mock_session)
+
+
+@pytest.fixture
+def admin_app(mock_session: AsyncMock, mock_admin_user: MagicMock) -> FastAPI:
+    """FastAPI app with admin auth."""
+    return make_test_app(absentee_router, mock_session, user=mock_admin_user)
+
+
+def _application() -> MagicMock:
+    record = MagicMock()
+    record.id = uuid.uuid4()
+    record.county = "FULTON"
+    record.voter_registration_number = "12345678"
+    record.created_at = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    record.application_date = date(2026, 9, 1)
+    for field in (
+        "last_name",
+        "first_name",
+        "middle_name",
+        "suffix",
+        "street_number",
+        "street_name",
+        "apt_unit",
+        "city",
+        "state",
+        "zip_code",
+        "mailing_street_number",
+        "mailing_street_name",
+        "mailing_apt_unit",
+        "mailing_city",
+        "mailing_state",
+        "mailing_zip_code",
+        "application_status",
+        "ballot_status",
+        "status_reason",
+        "ballot_issued_date",
+        "ballot_return_date",
+        "ballot_style",
+        "ballot_assisted",
+        "challenged_provisional",
+        "id_required",
+        "municipal_precinct",
+        "county_precinct",
+        "congressional_district",
+        "state_senate_district",
+        "state_house_district",
+        "judicial_district",
+        "combo",
+        "vote_center_id",
+        "ballot_id",
+        "party",
+        "import_job_id",
+    ):
+        setattr(record, field, None)
+    return record
+
+
+class TestPagePagination:
+    """The default page/page_size mode keeps its exact total."""
+
+    async def test_exposes_next_cursor_when_more_pages(self, admin_client) -> None:
+        records = [_application(), _application()]
+        with patch(f"{_SERVICE}.query_absentee_ballots", new_callable=AsyncMock, return_value=(records, 5)):
+            resp = await admin_client.get("/api/v1/absentee?page_size=2")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["pagination"] == {"total": 5, "page": 1, "page_size": 2, "total_pages": 3}
+        assert body["total_is_exact"] is True
+        assert decode_absentee_cursor(body["next_cursor"]) == (records[1].created_at, records[1].id)
+
+    async def test_last_page_has_no_cursor(self, admin_client) -> None:
+        with patch(f"{_SERVICE}.query_absentee_ballots", new_callable=AsyncMock, return_value=([_application()], 3)):
+            resp = await admin_client.get("/api/v1/absentee?page=2&page_size=2")
+
+        assert resp.json()["next_cursor"] is None
+
+
+class TestCursorPagination:
+    """A cursor or a non-exact count routes through the keyset query."""
+
+    async def test_cursor_passed_to_keyset_query(self, admin_client) -> None:
+        page = AbsenteePage(records=[_application()], total=900, total_is_exact=False, next_cursor="abc")
+        with (
+            patch(f"{_SERVICE}.query_absentee_ballots", new_callable=AsyncMock) as legacy,
+            patch(f"{_SERVICE}.query_absentee_ballots_keyset", new_callable=AsyncMock, return_value=page) as keyset,
+        ):
+            resp = await admin_client.get("/api/v1/absentee?cursor=xyz&count=capped&county=FULTON&page_size=1")
+
+        assert resp.status_code == 200
+        legacy.assert_not_called()
+        assert keyset.call_args.kwargs["county"] == "FULTON"
+        assert keyset.call_args.kwargs["cursor"] == "xyz"
+        assert keyset.call_args.kwargs["count_mode"] == "capped"
+        body = resp.json()
+        assert body["next_cursor"] == "abc"
+        assert body["total_is_exact"] is False
+        assert body["pagination"]["total"] == 900
+
+    async def test_invalid_cursor_returns_400(self, admin_client) -> None:
+        resp = await admin_client.get("/api/v1/absentee?cursor=not-a-cursor")
+
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "Invalid cursor"
+
+    async def test_rejects_unknown_count_mode(self, admin_client) -> None:
+        resp = await admin_client.get("/api/v1/absentee?count=sometimes")
+
+        assert resp.status_code == 422
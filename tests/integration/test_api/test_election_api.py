@@ -8,6 +8,7 @@ import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from voter_api.api.response_cache import results_cache
 from voter_api.api.v1.elections import elections_router
 from voter_api.core.dependencies import get_async_session, get_current_user
 from voter_api.models.election import Election, ElectionCountyResult, ElectionResult
@@ -121,6 +122,18 @@ def mock_session():
     return AsyncMock()
 
 
+@pytest.fixture(autouse=True)
+def results_version():
+    """Give every election a fresh results version and start with an empty cache."""
+    results_cache.clear()
+    with patch(
+        "voter_api.services.election_service.get_results_version",
+        side_effect=lambda _session, election_id: f"v1|{election_id}",
+    ) as mock_version:
+        yield mock_version
+    results_cache.clear()
+
+
 @pytest.fixture
 def mock_admin_user():
     user = MagicMock()
@@ -327,6 +340,145 @@ class TestGetElectionResults:
         assert resp.status_code == 404
 
 
+class TestResultsResponseCache:
+    @staticmethod
+    def _results(election_id: uuid.UUID, status: str = "active", n_counties: int = 0):
+        from voter_api.schemas.election import CountyResultSummary, ElectionResultsResponse
+
+        return ElectionResultsResponse(
+            election_id=election_id,
+            election_name="Test",
+            election_date=date(2026, 2, 17),
+            status=status,
+            last_refreshed_at=None,
+            candidates=[],
+            county_results=[CountyResultSummary(county_name=f"County {i}", candidates=[]) for i in range(n_counties)],
+        )
+
+    @pytest.mark.asyncio
+    async def test_second_request_served_from_cache(self, client):
+        election_id = uuid.uuid4()
+        with patch(
+            "voter_api.services.election_service.get_election_results",
+            return_value=self._results(election_id),
+        ) as mock_build:
+            first = await client.get(f"/api/v1/elections/{election_id}/results")
+            second = await client.get(f"/api/v1/elections/{election_id}/results")
+
+        assert mock_build.await_count == 1
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert first.headers["etag"] == second.headers["etag"]
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_returns_304(self, client):
+        election_id = uuid.uuid4()
+        with patch(
+            "voter_api.services.election_service.get_election_results",
+            return_value=self._results(election_id),
+        ):
+            first = await client.get(f"/api/v1/elections/{election_id}/results")
+            resp = await client.get(
+                f"/api/v1/elections/{election_id}/results",
+                headers={"If-None-Match": first.headers["etag"]},
+            )
+
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == first.headers["etag"]
+        assert resp.headers["cache-control"] == "public, max-age=60"
+
+    @pytest.mark.asyncio
+    async def test_version_change_rebuilds(self, client, results_version):
+        election_id = uuid.uuid4()
+        with patch(
+            "voter_api.services.election_service.get_election_results",
+            return_value=self._results(election_id),
+        ) as mock_build:
+            await client.get(f"/api/v1/elections/{election_id}/results")
+            results_version.side_effect = lambda _session, _election_id: "v2"
+            await client.get(f"/api/v1/elections/{election_id}/results")
+
+        assert mock_build.await_count == 2
+        assert results_cache.stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_version_probe_404_skips_build(self, client, results_version):
+        results_version.side_effect = None
+        results_version.return_value = None
+        with patch("voter_api.services.election_service.get_election_results") as mock_build:
+            resp = await client.get(f"/api/v1/elections/{uuid.uuid4()}/results")
+
+        assert resp.status_code == 404
+        mock_build.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_gzip_payload_for_large_results(self, client):
+        election_id = uuid.uuid4()
+        with patch(
+            "voter_api.services.election_service.get_election_results",
+            return_value=self._results(election_id, n_counties=159),
+        ):
+            resp = await client.get(
+                f"/api/v1/elections/{election_id}/results",
+                headers={"Accept-Encoding": "gzip"},
+            )
+
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert len(resp.json()["county_results"]) == 159
+
+    @pytest.mark.asyncio
+    async def test_views_cached_independently(self, client):
+        from voter_api.schemas.election import ElectionResultFeatureCollection
+
+        election_id = uuid.uuid4()
+        fc = ElectionResultFeatureCollection(
+            election_id=election_id,
+            election_name="Test",
+            election_date=date(2026, 2, 17),
+            status="active",
+            last_refreshed_at=None,
+            features=[],
+        )
+        with (
+            patch(
+                "voter_api.services.election_service.get_election_results",
+                return_value=self._results(election_id),
+            ),
+            patch("voter_api.services.election_service.get_election_results_geojson", return_value=fc),
+        ):
+            json_resp = await client.get(f"/api/v1/elections/{election_id}/results")
+            geo_resp = await client.get(f"/api/v1/elections/{election_id}/results/geojson")
+
+        assert json_resp.headers["content-type"] == "application/json"
+        assert geo_resp.headers["content-type"] == "application/geo+json"
+        assert results_cache.stats()["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_invalidates_cache(self, client, admin_client):
+        from voter_api.schemas.election import RefreshResponse
+
+        election_id = uuid.uuid4()
+        with patch(
+            "voter_api.services.election_service.get_election_results",
+            return_value=self._results(election_id),
+        ):
+            await client.get(f"/api/v1/elections/{election_id}/results")
+        assert results_cache.stats()["entries"] == 1
+
+        refresh = RefreshResponse(
+            election_id=election_id,
+            refreshed_at=datetime(2026, 2, 17, 12, 0, 0, tzinfo=UTC),
+            counties_updated=0,
+        )
+        with patch("voter_api.services.election_service.refresh_single_election", return_value=refresh):
+            resp = await admin_client.post(f"/api/v1/elections/{election_id}/refresh")
+
+        assert resp.status_code == 200
+        assert results_cache.stats()["entries"] == 0
+
+
 # --- FR-006: GET /elections/{id}/results/raw ---
 
 
@@ -64,9 +64,10 @@ def _patch_batch_create(mock_job: GeocodingJob):
             new_callable=AsyncMock,
             return_value=mock_job,
         ),
-        patch("voter_api.api.v1.geocoding.task_runner") as mock_runner,
+        patch("voter_api.api.v1.geocoding.get_task_runner") as mock_get_runner,
     ):
-        mock_runner.submit_task = MagicMock()
+        mock_runner = mock_get_runner.return_value
+        mock_runner.submit_job = AsyncMock(return_value=str(mock_job.id))
         yield mock_runner
 
 
@@ -207,10 +208,12 @@ class TestBatchGeocodingEndpoint:
 
     async def test_accepts_fallback_true(self, admin_client) -> None:
         """Batch endpoint accepts fallback=True and creates job."""
-        with _patch_batch_create(_make_geocoding_job()):
+        job = _make_geocoding_job()
+        with _patch_batch_create(job) as runner:
             resp = await admin_client.post("/api/v1/geocoding/batch", json={"provider": "census", "fallback": True})
 
         assert resp.status_code == 202
+        runner.submit_job.assert_awaited_once_with("geocoding", {"job_id": str(job.id), "fallback": True})
 
     async def test_accepts_county_filter(self, admin_client) -> None:
         """Batch endpoint accepts optional county filter."""
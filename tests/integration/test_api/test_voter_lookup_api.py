@@ -0,0 +1,75 @@
+"""Integration tests for the ranked voter name lookup endpoint."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+
+from voter_api.api.v1.voters import voters_router
+
+from .conftest import make_test_app
+
+
+@pytest.fixture
+def app(mock_session: AsyncMock) -> FastAPI:
+    """Minimal FastAPI app with voters router (no auth override)."""
+    return make_test_app(voters_router, mock_session)
+
+
+@pytest.fixture
+def admin_app(mock_session: AsyncMock, mock_admin_user: MagicMock) -> FastAPI:
+    """FastAPI app with admin auth."""
+    return make_test_app(voters_router, mock_session, user=mock_admin_user)
+
+
+def _voter() -> MagicMock:
+    voter = MagicMock()
+    voter.id = uuid.uuid4()
+    voter.county = "FULTON"
+    voter.voter_registration_number = "12345678"
+    voter.status = "ACTIVE"
+    voter.last_name = "SMITH"
+    voter.first_name = "JANE"
+    voter.middle_name = None
+    voter.residence_city = "ATLANTA"
+    voter.residence_zipcode = "30301"
+    voter.present_in_latest_import = True
+    voter.has_district_mismatch = None
+    return voter
+
+
+class TestVoterLookupEndpoint:
+    """Tests for GET /api/v1/voters/lookup."""
+
+    async def test_requires_auth(self, client) -> None:
+        resp = await client.get("/api/v1/voters/lookup?q=smith")
+        assert resp.status_code == 401
+
+    async def test_returns_ranked_matches(self, admin_client) -> None:
+        voter = _voter()
+        with patch(
+            "voter_api.api.v1.voters.lookup_voters_by_name",
+            new_callable=AsyncMock,
+            return_value=[(voter, 0.912345)],
+        ) as mock_lookup:
+            resp = await admin_client.get("/api/v1/voters/lookup?q=jane+smi&county=FULTON&limit=5")
+
+        assert resp.status_code == 200
+        items = resp.json()["items"]
+        assert items[0]["id"] == str(voter.id)
+        assert items[0]["score"] == 0.9123
+        assert mock_lookup.call_args.args[1] == "jane smi"
+        assert mock_lookup.call_args.kwargs["county"] == "FULTON"
+        assert mock_lookup.call_args.kwargs["limit"] == 5
+        assert mock_lookup.call_args.kwargs["min_token_length"] == 2
+
+    async def test_short_query_returns_422(self, admin_client) -> None:
+        resp = await admin_client.get("/api/v1/voters/lookup?q=j")
+
+        assert resp.status_code == 422
+        assert "at least one name" in resp.json()["detail"]
+
+    async def test_limit_is_bounded(self, admin_client) -> None:
+        resp = await admin_client.get("/api/v1/voters/lookup?q=smith&limit=500")
+        assert resp.status_code == 422
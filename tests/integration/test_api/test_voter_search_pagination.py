@@ -0,0 +1,107 @@
+"""Integration tests for voter search pagination modes (page, cursor, count)."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+
+from voter_api.api.v1.voters import voters_router
+from voter_api.services.voter_service import VoterSearchPage, decode_voter_cursor
+
+from .conftest import make_test_app
+
+
+@pytest.fixture
+def app(mock_session: AsyncMock) -> FastAPI:
+    """Minimal FastAPI app with voters router (no auth override)."""
+    return make_test_app(voters_router, mock_session)
+
+
+@pytest.fixture
+def admin_app(mock_session: AsyncMock, mock_admin_user: MagicMock) -> FastAPI:
+    """FastAPI app with admin auth."""
+    return make_test_app(voters_router, mock_session, user=mock_admin_user)
+
+
+def _voter(last_name: str = "SMITH", first_name: str = "JANE") -> MagicMock:
+    voter = MagicMock()
+    voter.id = uuid.uuid4()
+    voter.county = "FULTON"
+    voter.voter_registration_number = "12345678"
+    voter.status = "ACTIVE"
+    voter.last_name = last_name
+    voter.first_name = first_name
+    voter.middle_name = None
+    voter.residence_city = "ATLANTA"
+    voter.residence_zipcode = "30301"
+    voter.present_in_latest_import = True
+    voter.has_district_mismatch = None
+    return voter
+
+
+class TestPagePagination:
+    """The default page/page_size mode keeps its exact total."""
+
+    async def test_exposes_next_cursor_when_more_pages(self, admin_client) -> None:
+        voters = [_voter("ADAMS"), _voter("BAKER")]
+        with patch(
+            "voter_api.api.v1.voters.search_voters",
+            new_callable=AsyncMock,
+            return_value=(voters, 5),
+        ):
+            resp = await admin_client.get("/api/v1/voters?page_size=2")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["pagination"] == {"total": 5, "page": 1, "page_size": 2, "total_pages": 3}
+        assert body["total_is_exact"] is True
+        assert decode_voter_cursor(body["next_cursor"]) == ("BAKER", "JANE", voters[1].id)
+
+    async def test_last_page_has_no_cursor(self, admin_client) -> None:
+        with patch(
+            "voter_api.api.v1.voters.search_voters",
+            new_callable=AsyncMock,
+            return_value=([_voter()], 3),
+        ):
+            resp = await admin_client.get("/api/v1/voters?page=2&page_size=2")
+
+        assert resp.json()["next_cursor"] is None
+
+
+class TestCursorPagination:
+    """A cursor or a non-exact count routes through keyset search."""
+
+    async def test_cursor_passed_to_keyset_search(self, admin_client) -> None:
+        page = VoterSearchPage(voters=[_voter()], total=900, total_is_exact=False, next_cursor="abc")
+        with (
+            patch("voter_api.api.v1.voters.search_voters", new_callable=AsyncMock) as legacy,
+            patch(
+                "voter_api.api.v1.voters.search_voters_keyset",
+                new_callable=AsyncMock,
+                return_value=page,
+            ) as keyset,
+        ):
+            resp = await admin_client.get("/api/v1/voters?cursor=xyz&count=estimate&county=FULTON&page_size=1")
+
+        assert resp.status_code == 200
+        legacy.assert_not_called()
+        filters = keyset.call_args.args[1]
+        assert filters.county == "FULTON"
+        assert keyset.call_args.kwargs["cursor"] == "xyz"
+        assert keyset.call_args.kwargs["count_mode"] == "estimate"
+        body = resp.json()
+        assert body["next_cursor"] == "abc"
+        assert body["total_is_exact"] is False
+        assert body["pagination"]["total"] == 900
+
+    async def test_invalid_cursor_returns_400(self, admin_client) -> None:
+        resp = await admin_client.get("/api/v1/voters?cursor=not-a-cursor")
+
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "Invalid cursor"
+
+    async def test_rejects_unknown_count_mode(self, admin_client) -> None:
+        resp = await admin_client.get("/api/v1/voters?count=sometimes")
+
+        assert resp.status_code == 422
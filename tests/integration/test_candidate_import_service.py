@@ -6,7 +6,7 @@ following the same pattern as test_voter_history_import.py.
 
 import json
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +14,7 @@ import pytest
 
 from voter_api.models.import_job import ImportJob
 from voter_api.services.candidate_import_service import (
+    _resolve_election,
     process_candidate_import,
 )
 
@@ -390,3 +391,35 @@ class TestProcessCandidateImport:
         assert result.records_updated == 0
         # 25 records / 10 per batch = 3 upsert calls
         assert mock_upsert.await_count == 3
+
+
+class TestResolveElection:
+    """Tests for _resolve_election backfill of existing elections."""
+
+    async def test_backfilling_county_marks_participation_stats_stale(self) -> None:
+        existing = MagicMock(id=uuid.uuid4(), eligible_county=None, eligible_municipality=None)
+        session = _make_session_mock()
+        session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=existing))
+
+        with patch(
+            "voter_api.services.voter_history_service.mark_participation_stats_stale", new_callable=AsyncMock
+        ) as mark_stale:
+            election_id = await _resolve_election(
+                session, "US Senate", date(2026, 5, 19), "general_primary", {}, county="fulton"
+            )
+
+        assert election_id == existing.id
+        assert existing.eligible_county == "FULTON"
+        mark_stale.assert_awaited_once_with(session, election_ids=[existing.id])
+
+    async def test_already_scoped_election_is_not_marked_stale(self) -> None:
+        existing = MagicMock(id=uuid.uuid4(), eligible_county="FULTON", eligible_municipality=None)
+        session = _make_session_mock()
+        session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=existing))
+
+        with patch(
+            "voter_api.services.voter_history_service.mark_participation_stats_stale", new_callable=AsyncMock
+        ) as mark_stale:
+            await _resolve_election(session, "US Senate", date(2026, 5, 19), "general_primary", {}, county="FULTON")
+
+        mark_stale.assert_not_awaited()
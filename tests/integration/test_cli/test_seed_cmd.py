@@ -395,6 +395,67 @@ class TestSeedFullBootstrap:
         # Verify order: county_district, boundary, election, voter, voter_history
         assert order_log == ["county_district", "boundary", "election", "voter", "voter_history"]
 
+    def test_seed_imports_overlap_downloads(self, tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+        """County-districts import starts while the voter file is still downloading."""
+        import asyncio
+
+        import httpx
+
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+
+        county_content = b"county csv data"
+        voter_content = b"voter csv data"
+        manifest = _make_manifest(
+            [
+                {
+                    "filename": "Bibb.csv",
+                    "sha512": hashlib.sha512(voter_content).hexdigest(),
+                    "category": "voter",
+                    "size_bytes": len(voter_content),
+                },
+                {
+                    "filename": "counties.csv",
+                    "sha512": hashlib.sha512(county_content).hexdigest(),
+                    "category": "county_district",
+                    "size_bytes": len(county_content),
+                },
+            ]
+        )
+        county_imported = asyncio.Event()
+
+        async def slow_voter_file(request: httpx.Request) -> httpx.Response:
+            # Only completes once the county import has run, i.e. it must overlap.
+            await asyncio.wait_for(county_imported.wait(), timeout=5)
+            return httpx.Response(200, content=voter_content)
+
+        async def mock_county_districts(file_path: Path) -> None:
+            county_imported.set()
+
+        httpx_mock.add_response(url="https://test.example.com/manifest.json", text=manifest)
+        httpx_mock.add_response(url="https://test.example.com/counties.csv", content=county_content)
+        httpx_mock.add_callback(slow_voter_file, url="https://test.example.com/Bibb.csv")
+
+        with (
+            patch("voter_api.cli.seed_cmd._import_county_districts", side_effect=mock_county_districts),
+            patch("voter_api.cli.seed_cmd._import_voters_batch", new_callable=AsyncMock) as mock_voters,
+        ):
+            result = runner.invoke(
+                app,
+                [
+                    "seed",
+                    "--data-root",
+                    "https://test.example.com/",
+                    "--data-dir",
+                    str(data_dir),
+                    "--skip-elections",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        voter_paths = mock_voters.call_args.args[0]
+        assert [p.name for p in voter_paths] == ["Bibb.csv"]
+
 
 # ---------------------------------------------------------------------------
 # US2: Selective Import by Data Type
@@ -191,8 +191,9 @@ class TestImportVoterHistoryEndpoint:
                 new_callable=AsyncMock,
                 return_value=mock_job,
             ),
-            patch("voter_api.core.background.task_runner.submit_task"),
+            patch("voter_api.api.v1.imports.get_task_runner") as mock_get_runner,
         ):
+            mock_get_runner.return_value.submit_job = AsyncMock(return_value=str(mock_job.id))
             resp = await admin_client.post(
                 "/api/v1/imports/voter-history",
                 files={"file": ("voter_history.csv", b"header\nrow", "text/csv")},
@@ -728,6 +729,20 @@ class TestGetParticipationStats:
 
         assert resp.status_code == 401
 
+    async def test_refresh_param_forces_recompute(self, analyst_client: AsyncClient) -> None:
+        """refresh=true bypasses the stored rollup."""
+        eid = uuid.uuid4()
+        stats = ParticipationStatsResponse(election_id=eid, total_participants=3)
+        with patch(
+            "voter_api.services.voter_history_service.get_participation_stats",
+            new_callable=AsyncMock,
+            return_value=stats,
+        ) as mock_stats:
+            resp = await analyst_client.get(f"/api/v1/elections/{eid}/participation/stats?refresh=true")
+
+        assert resp.status_code == 200
+        assert mock_stats.call_args.kwargs["force_refresh"] is True
+
     async def test_empty_stats(self, analyst_client: AsyncClient) -> None:
         """Election with no participants returns zero counts and None eligible voters."""
         eid = uuid.uuid4()
@@ -113,6 +113,11 @@ def _patch_cli_deps(mock_job: MagicMock):
             new_callable=AsyncMock,
             return_value=MagicMock(tier1_updated=5, tier2_updated=2, unresolvable=0, elections_backfilled=0),
         ),
+        patch(
+            "voter_api.services.voter_history_service.refresh_stale_participation_stats",
+            new_callable=AsyncMock,
+            return_value=3,
+        ),
     )
 
 
@@ -131,13 +136,27 @@ class TestImportVoterHistoryCLI:
         mock_job = _make_completed_job()
         patches = _patch_cli_deps(mock_job)
 
-        with patches[0], patches[1], patches[2], patches[3], patches[4], patches[5], patches[6] as mock_resolve:
+        with (
+            patches[0],
+            patches[1],
+            patches[2],
+            patches[3],
+            patches[4],
+            patches[5] as mock_process,
+            patches[6] as mock_resolve,
+            patches[7] as mock_refresh,
+        ):
             result = runner.invoke(app, ["import", "voter-history", str(csv_file)])
 
         assert result.exit_code == 0
         assert "completed" in result.output.lower()
         assert "10" in result.output  # total records
         mock_resolve.assert_awaited_once()
+        mock_refresh.assert_awaited_once()
+        assert "Rollups refreshed: 3" in result.output
+        # COPY loader with its larger default batch size
+        assert mock_process.call_args[0][3] == 50_000
+        assert mock_process.call_args.kwargs["use_copy"] is True
 
     def test_file_not_found(self) -> None:
         """CLI shows error for non-existent file."""
@@ -164,6 +183,7 @@ class TestImportVoterHistoryCLI:
             patches[4],
             patches[5] as mock_process,
             patches[6] as mock_resolve,
+            patches[7],
         ):
             result = runner.invoke(app, ["import", "voter-history", str(csv_file), "--batch-size", "500"])
 
@@ -6,7 +6,7 @@ Covers:
 
 import uuid
 from collections.abc import Generator
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -211,6 +211,36 @@ class TestProcessVoterHistoryImport:
 
         assert result.records_unmatched == 0
 
+    @pytest.mark.asyncio
+    async def test_ensures_partition_once_per_year(self, tmp_path: Path) -> None:
+        """Each election year seen in the file gets its partition ensured exactly once."""
+        rows = [
+            "FULTON,12345678,11/05/2024,GENERAL ELECTION,NP,STD,N,N,N",
+            "FULTON,12345679,05/21/2024,GENERAL PRIMARY,D,STD,N,N,N",
+            "FULTON,12345678,11/08/2022,GENERAL ELECTION,NP,STD,N,N,N",
+        ]
+        csv_file = _write_csv(tmp_path, rows)
+        job = _make_import_job()
+        session = _make_session_mock()
+
+        with (
+            patch(
+                "voter_api.services.voter_history_service._ensure_vh_partition",
+                new_callable=AsyncMock,
+            ) as mock_ensure,
+            patch(
+                "voter_api.services.voter_history_service._upsert_voter_history_batch",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "voter_api.services.voter_history_service._replace_previous_import",
+                new_callable=AsyncMock,
+            ),
+        ):
+            await process_voter_history_import(session, job, csv_file, batch_size=2)
+
+        assert [c.args[1] for c in mock_ensure.await_args_list] == [2024, 2022]
+
     @pytest.mark.asyncio
     async def test_replace_previous_import_called(self, tmp_path: Path) -> None:
         """Re-import replacement is invoked after successful processing."""
@@ -393,3 +423,136 @@ class TestOptimizationLifecycle:
         mock_rebuild.assert_not_awaited()
         mock_disable_av.assert_not_awaited()
         mock_enable_av.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# COPY loader
+# ---------------------------------------------------------------------------
+
+_VH_KEY = ("voter_registration_number", "election_date", "election_type")
+_VH_VALUE_FIELDS = (
+    "voter_registration_number",
+    "county",
+    "election_date",
+    "election_type",
+    "normalized_election_type",
+    "party",
+    "ballot_style",
+    "absentee",
+    "provisional",
+    "supplemental",
+)
+
+
+class _FakeVoterHistoryTable:
+    """In-memory stand-in for voter_history that applies both load paths.
+
+    Multi-row upserts are replayed from their compiled bind parameters; the
+    COPY path is replayed by emulating ``DISTINCT ON ... ORDER BY seq DESC``
+    over the staged rows followed by ON CONFLICT DO UPDATE.
+    """
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple, dict] = {}
+        self.staged: list[tuple] = []
+        self.merge_count = 0
+
+    def _upsert(self, row: dict) -> None:
+        self.rows[tuple(row[k] for k in _VH_KEY)] = row
+
+    async def execute(self, stmt: object, params: dict | None = None) -> MagicMock:
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.sql.dml import Insert
+
+        if isinstance(stmt, Insert):
+            compiled = stmt.compile(dialect=postgresql.dialect()).params
+            n = sum(1 for k in compiled if k.startswith("voter_registration_number_m"))
+            for i in range(n):
+                self._upsert({f: compiled[f"{f}_m{i}"] for f in _VH_VALUE_FIELDS})
+        elif "FROM voter_history_staging" in str(stmt):
+            self.merge_count += 1
+            latest: dict[tuple, tuple] = {}
+            for staged in sorted(self.staged, key=lambda r: r[0]):
+                latest[(staged[1], staged[3], staged[4])] = staged
+            for staged in latest.values():
+                self._upsert(dict(zip(_VH_VALUE_FIELDS, staged[1:], strict=True)))
+            self.staged = []
+        return MagicMock()
+
+    async def copy_records_to_table(self, table: str, *, records: list[tuple], columns: list[str]) -> None:
+        assert table == "voter_history_staging"
+        assert columns[0] == "seq"
+        self.staged.extend(records)
+
+
+def _make_table_session(table: _FakeVoterHistoryTable) -> AsyncMock:
+    session = _make_session_mock()
+    session.execute = AsyncMock(side_effect=table.execute)
+    raw_connection = MagicMock()
+    raw_connection.driver_connection = table
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    session.connection = AsyncMock(return_value=connection)
+    return session
+
+
+@pytest.mark.usefixtures("_mock_vh_optimizations")
+class TestCopyVoterHistoryImport:
+    """Tests for the COPY + staging-table merge load path."""
+
+    _ROWS = [
+        "FULTON,12345678,11/05/2024,GENERAL ELECTION,NP,STD,N,N,N",
+        "FULTON,12345679,11/05/2024,GENERAL ELECTION,NP,STD,Y,N,N",
+        # Duplicate key within a chunk: last occurrence wins
+        "DEKALB,12345678,11/05/2024,GENERAL ELECTION,NP,ALT,Y,N,N",
+        "FULTON,12345680,05/21/2024,GENERAL PRIMARY,D,STD,N,N,N",
+        "FULTON,12345681,11/08/2022,GENERAL ELECTION,NP,STD,N,Y,N",
+        # Duplicate key across chunks
+        "COBB,12345679,11/05/2024,GENERAL ELECTION,R,STD,N,N,Y",
+        "FULTON,,11/05/2024,GENERAL ELECTION,NP,STD,N,N,N",
+    ]
+
+    async def _run(
+        self, tmp_path: Path, *, use_copy: bool, batch_size: int
+    ) -> tuple[_FakeVoterHistoryTable, MagicMock]:
+        csv_file = _write_csv(tmp_path, self._ROWS)
+        job = _make_import_job()
+        table = _FakeVoterHistoryTable()
+        session = _make_table_session(table)
+        with (
+            patch(
+                "voter_api.services.voter_history_service._ensure_vh_partition",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "voter_api.services.voter_history_service._replace_previous_import",
+                new_callable=AsyncMock,
+            ),
+        ):
+            result = await process_voter_history_import(
+                session, job, csv_file, batch_size=batch_size, use_copy=use_copy
+            )
+        return table, result
+
+    @pytest.mark.asyncio
+    async def test_copy_path_matches_upsert_path(self, tmp_path: Path) -> None:
+        """Both loaders leave identical rows, including duplicate-key resolution."""
+        upsert_table, upsert_job = await self._run(tmp_path, use_copy=False, batch_size=5)
+        copy_table, copy_job = await self._run(tmp_path, use_copy=True, batch_size=5)
+
+        assert copy_table.rows == upsert_table.rows
+        assert len(copy_table.rows) == 4
+        assert copy_table.rows[("12345678", date(2024, 11, 5), "GENERAL ELECTION")]["county"] == "DEKALB"
+        assert copy_table.rows[("12345679", date(2024, 11, 5), "GENERAL ELECTION")]["county"] == "COBB"
+        assert (copy_job.records_succeeded, copy_job.records_failed) == (
+            upsert_job.records_succeeded,
+            upsert_job.records_failed,
+        )
+
+    @pytest.mark.asyncio
+    async def test_copy_path_merges_once_per_chunk_without_clamp(self, tmp_path: Path) -> None:
+        """The COPY loader is not clamped to the upsert sub-batch and merges once per chunk."""
+        table, result = await self._run(tmp_path, use_copy=True, batch_size=100_000)
+
+        assert table.merge_count == 1
+        assert result.status == "completed"
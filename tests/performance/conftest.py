@@ -0,0 +1,182 @@
+"""Performance benchmark fixtures: synthetic dataset, PostGIS session, results.
+
+Benchmarks are opt-in. Tests marked ``benchmark`` are skipped unless
+``PERF_BENCHMARKS=1``; they need a migrated PostgreSQL/PostGIS database in
+``DATABASE_URL`` that is **dedicated to benchmarking** (the imports drop
+and rebuild indexes and rewrite the synthetic election-year partitions).
+
+Environment:
+
+- ``PERF_BENCHMARKS``: ``1`` to run the benchmarks.
+- ``PERF_SCALE``: ``small`` (default), ``medium``, ``large`` or a voter count.
+- ``PERF_RESULTS``: JSON results path
+  (default ``tests/performance/results/latest.json``).
+- ``PERF_BASELINE``: results file to compare against; the run fails when a
+  benchmark's median is slower than the baseline by more than
+  ``PERF_MAX_REGRESSION`` (a fraction, default ``0.25``).
+
+The synthetic dataset (see ``fixtures/dataset.py``) is purged before and
+after the session.
+"""
+
+import json
+import os
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from tests.performance.fixtures.dataset import PerfDataset, load_dataset, purge_dataset
+from tests.performance.fixtures.generators import PerfFiles, PerfScale, generate_dataset
+from tests.performance.fixtures.harness import BenchmarkRecorder, compare_to_baseline, format_comparisons
+
+_DEFAULT_RESULTS = Path(__file__).parent / "results" / "latest.json"
+_DEFAULT_MAX_REGRESSION = 0.25
+
+_recorder_key = pytest.StashKey[BenchmarkRecorder]()
+_summary_key = pytest.StashKey[list[str]]()
+
+
+def _benchmarks_enabled() -> bool:
+    return os.environ.get("PERF_BENCHMARKS", "").strip().lower() in {"1", "true", "yes"}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the ``benchmark`` marker."""
+    config.addinivalue_line("markers", "benchmark: performance benchmark (opt-in with PERF_BENCHMARKS=1)")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip benchmarks unless PERF_BENCHMARKS is set."""
+    if _benchmarks_enabled():
+        return
+    skip = pytest.mark.skip(reason="benchmarks are opt-in: set PERF_BENCHMARKS=1 and a dedicated PostGIS DATABASE_URL")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Write the results file and compare it with the baseline, if any."""
+    recorder = session.config.stash.get(_recorder_key, None)
+    if recorder is None or not recorder.results:
+        return
+
+    results_path = Path(os.environ.get("PERF_RESULTS") or _DEFAULT_RESULTS)
+    document = recorder.to_json()
+    recorder.write(results_path, document)
+
+    lines = [f"results written to {results_path}"]
+    baseline_path = os.environ.get("PERF_BASELINE")
+    if baseline_path:
+        tolerance = float(os.environ.get("PERF_MAX_REGRESSION", _DEFAULT_MAX_REGRESSION))
+        baseline = json.loads(Path(baseline_path).read_text())
+        comparisons = compare_to_baseline(document, baseline, tolerance=tolerance)
+        lines.append(f"baseline {baseline_path} (max regression {tolerance:.0%}):")
+        lines.extend(format_comparisons(comparisons))
+        if any(c.regressed for c in comparisons) and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    else:
+        lines.extend(f"{name}  {data['median_s']:9.3f}s" for name, data in document["results"].items())
+    session.config.stash[_summary_key] = lines
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    """Print the benchmark summary collected in :func:`pytest_sessionfinish`."""
+    lines = config.stash.get(_summary_key, None)
+    if not lines:
+        return
+    terminalreporter.section("performance benchmarks")
+    for line in lines:
+        terminalreporter.write_line(line)
+
+
+# ---------------------------------------------------------------------------
+# Scale, generated files, and results
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def perf_scale() -> PerfScale:
+    """Dataset scale from ``PERF_SCALE``."""
+    return PerfScale.from_env()
+
+
+@pytest.fixture(scope="session")
+def perf_files(perf_scale: PerfScale, tmp_path_factory: pytest.TempPathFactory) -> PerfFiles:
+    """Synthetic input files, generated once per session."""
+    return generate_dataset(tmp_path_factory.mktemp("perf-data"), perf_scale)
+
+
+@pytest.fixture(scope="session")
+def recorder(request: pytest.FixtureRequest, perf_scale: PerfScale) -> BenchmarkRecorder:
+    """Session-wide benchmark recorder; results are written at session end."""
+    rec = BenchmarkRecorder(scale=perf_scale.to_dict())
+    request.config.stash[_recorder_key] = rec
+    return rec
+
+
+# ---------------------------------------------------------------------------
+# App, database, and client
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+async def app() -> AsyncGenerator[FastAPI]:
+    """Create the FastAPI app and run its lifespan (initialises the DB engine)."""
+    from voter_api.main import create_app, lifespan
+
+    _app = create_app()
+    async with lifespan(_app):
+        yield _app
+
+
+@pytest.fixture(scope="session")
+def session_factory(app: FastAPI) -> async_sessionmaker[AsyncSession]:
+    """Session factory bound to the application engine."""
+    from voter_api.core.database import get_engine
+
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
+
+
+@pytest.fixture
+async def db_session(session_factory: async_sessionmaker[AsyncSession]) -> AsyncGenerator[AsyncSession]:
+    """Yield a real async DB session."""
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+async def client(app: FastAPI) -> AsyncGenerator[httpx.AsyncClient]:
+    """Unauthenticated HTTP client wired to the app via ASGI transport."""
+    async with httpx.AsyncClient(transport=ASGITransport(app=app), base_url="http://perf") as c:
+        yield c
+
+
+# ---------------------------------------------------------------------------
+# Loaded dataset
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+async def perf_dataset(
+    session_factory: async_sessionmaker[AsyncSession],
+    perf_files: PerfFiles,
+    perf_scale: PerfScale,
+) -> AsyncGenerator[PerfDataset]:
+    """Load the synthetic dataset once per session and purge it afterwards.
+
+    The initial load is not timed; import benchmarks measure re-imports
+    against this steady state.
+    """
+    async with session_factory() as session:
+        dataset = await load_dataset(session, perf_files, perf_scale)
+
+    yield dataset
+
+    async with session_factory() as session:
+        await purge_dataset(session)
@@ -0,0 +1,185 @@
+"""Load the synthetic dataset into PostGIS through the real import services.
+
+Every row lives in county ``PERFBENCH`` (boundaries use source
+``perf-bench``) so :func:`purge_dataset` can remove it without touching
+anything else in the database.
+"""
+
+import json
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.performance.fixtures.generators import (
+    PERF_BALLOT_ITEM_ID,
+    PERF_COUNTY,
+    PERF_COUNTY_FIPS,
+    PERF_COUNTY_GEOID,
+    PERF_ELECTION_DATE,
+    PerfFiles,
+    PerfScale,
+    county_geometry_wkt,
+    registration_numbers,
+    voter_locations,
+)
+
+PERF_BOUNDARY_SOURCE = "perf-bench"
+PERF_JOB_PREFIX = "perfbench-"
+PERF_ELECTION_NAME = "PERFBENCH General Election"
+
+_PURGE_STATEMENTS = (
+    "DELETE FROM voter_history WHERE county = :county",
+    "DELETE FROM voters WHERE county = :county",
+    "DELETE FROM voter_filter_facets WHERE county = :county",
+    "DELETE FROM import_jobs WHERE file_name LIKE :job_prefix",
+    "DELETE FROM analysis_runs WHERE notes = :source",
+    "DELETE FROM elections WHERE name = :election_name",
+    "DELETE FROM boundaries WHERE source = :source",
+    "DELETE FROM county_metadata WHERE geoid = :geoid",
+)
+
+_LOCATION_BATCH = 5000
+
+
+@dataclass(frozen=True)
+class PerfDataset:
+    """Identifiers of the loaded synthetic dataset."""
+
+    scale: PerfScale
+    files: PerfFiles
+    election_id: uuid.UUID
+
+
+async def purge_dataset(session: AsyncSession) -> None:
+    """Delete every synthetic row (safe to call when nothing is loaded)."""
+    params = {
+        "county": PERF_COUNTY,
+        "job_prefix": f"{PERF_JOB_PREFIX}%",
+        "source": PERF_BOUNDARY_SOURCE,
+        "election_name": PERF_ELECTION_NAME,
+        "geoid": PERF_COUNTY_GEOID,
+    }
+    for statement in _PURGE_STATEMENTS:
+        await session.execute(text(statement), params)
+    await session.commit()
+
+
+async def _load_boundaries(session: AsyncSession, files: PerfFiles) -> None:
+    from voter_api.lib.boundary_loader import load_boundaries
+    from voter_api.services.boundary_service import upsert_boundaries
+
+    for boundary_type, path in files.district_shapefiles.items():
+        await upsert_boundaries(session, load_boundaries(path), boundary_type, PERF_BOUNDARY_SOURCE)
+    await upsert_boundaries(session, load_boundaries(files.precinct_shapefile), "county_precinct", PERF_BOUNDARY_SOURCE)
+
+    # County outline + metadata for the county-level results GeoJSON join.
+    await session.execute(
+        text(
+            "INSERT INTO boundaries (id, name, boundary_type, boundary_identifier, source, geometry) "
+            "VALUES (gen_random_uuid(), :name, 'county', :geoid, :source, ST_GeomFromText(:wkt, 4326))"
+        ),
+        {
+            "name": f"{PERF_COUNTY} County",
+            "geoid": PERF_COUNTY_GEOID,
+            "source": PERF_BOUNDARY_SOURCE,
+            "wkt": county_geometry_wkt(),
+        },
+    )
+    await session.execute(
+        text(
+            "INSERT INTO county_metadata (id, geoid, fips_state, fips_county, name, name_lsad) "
+            "VALUES (gen_random_uuid(), :geoid, '13', :fips, :name, :name_lsad)"
+        ),
+        {
+            "geoid": PERF_COUNTY_GEOID,
+            "fips": PERF_COUNTY_FIPS,
+            "name": PERF_COUNTY,
+            "name_lsad": f"{PERF_COUNTY} County",
+        },
+    )
+    await session.commit()
+
+
+async def _load_voters(session: AsyncSession, files: PerfFiles, scale: PerfScale) -> None:
+    from voter_api.services.import_service import create_import_job, process_voter_import
+    from voter_api.services.voter_history_service import process_voter_history_import
+
+    job = await create_import_job(session, file_name=f"{PERF_JOB_PREFIX}voters.csv")
+    await process_voter_import(session, job, files.voters_csv)
+    job = await create_import_job(session, file_name=f"{PERF_JOB_PREFIX}voter_history.csv", file_type="voter_history")
+    await process_voter_history_import(session, job, files.history_csv)
+
+    # Primary geocoded location per voter, inside the voter's grid precinct.
+    locations = dict(zip(registration_numbers(scale), voter_locations(scale), strict=True))
+    ids = await session.execute(
+        text(
+            "SELECT id, voter_registration_number FROM voters WHERE county = :county ORDER BY voter_registration_number"
+        ),
+        {"county": PERF_COUNTY},
+    )
+    rows = [{"voter_id": voter_id, "lon": locations[reg][0], "lat": locations[reg][1]} for voter_id, reg in ids.all()]
+    for i in range(0, len(rows), _LOCATION_BATCH):
+        await session.execute(
+            text(
+                "INSERT INTO geocoded_locations "
+                "(id, voter_id, latitude, longitude, point, source_type, is_primary) "
+                "VALUES (gen_random_uuid(), :voter_id, :lat, :lon, "
+                "ST_SetSRID(ST_MakePoint(:lon, :lat), 4326), 'perf-bench', true)"
+            ),
+            rows[i : i + _LOCATION_BATCH],
+        )
+    # Promote it to the official location, as geocoding does.
+    await session.execute(
+        text(
+            "UPDATE voters v SET official_latitude = g.latitude, official_longitude = g.longitude, "
+            "official_point = g.point, official_source = g.source_type "
+            "FROM geocoded_locations g WHERE g.voter_id = v.id AND g.is_primary AND v.county = :county"
+        ),
+        {"county": PERF_COUNTY},
+    )
+    await session.commit()
+
+
+async def _load_election(session: AsyncSession, files: PerfFiles) -> uuid.UUID:
+    from voter_api.lib.election_tracker.ingester import ingest_election_results
+    from voter_api.lib.election_tracker.parser import parse_sos_feed
+    from voter_api.models.election import Election
+    from voter_api.services.election_service import persist_ingestion_result
+
+    election = Election(
+        name=PERF_ELECTION_NAME,
+        election_date=PERF_ELECTION_DATE,
+        election_type="general",
+        district="Statewide",
+        ballot_item_id=PERF_BALLOT_ITEM_ID,
+        source="sos_feed",
+    )
+    session.add(election)
+    await session.commit()
+
+    feed = parse_sos_feed(json.loads(files.results_feed.read_text()))
+    await persist_ingestion_result(session, election.id, ingest_election_results(feed, PERF_BALLOT_ITEM_ID))
+    await session.commit()
+    return election.id
+
+
+async def load_dataset(session: AsyncSession, files: PerfFiles, scale: PerfScale) -> PerfDataset:
+    """Purge any previous run, then load boundaries, voters, history, and results.
+
+    Args:
+        session: Database session (committed as it goes).
+        files: Generated input files.
+        scale: Scale the files were generated at.
+
+    Returns:
+        Identifiers of the loaded dataset.
+    """
+    await purge_dataset(session)
+    await _load_boundaries(session, files)
+    await _load_voters(session, files, scale)
+    election_id = await _load_election(session, files)
+    await session.execute(text("ANALYZE"))
+    await session.commit()
+    return PerfDataset(scale=scale, files=files, election_id=election_id)
@@ -0,0 +1,587 @@
+"""Deterministic synthetic GA SoS data at configurable scale.
+
+Every generator derives its output from a :class:`PerfScale` and a fixed
+seed, so two runs at the same scale produce byte-identical files and
+benchmark timings are comparable across commits.
+
+The synthetic county ``PERFBENCH`` (FIPS ``999``) is laid out as a grid
+of square precincts over a one-degree box in north Georgia. District
+layers are vertical strips of that grid, so a voter's registered
+districts follow from the precinct they live in; every twentieth voter
+is registered to the wrong state house district so boundary analysis
+produces a realistic mix of matches and mismatches.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+import os
+import random
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+PERF_COUNTY = "PERFBENCH"
+PERF_COUNTY_FIPS = "999"
+PERF_COUNTY_GEOID = f"13{PERF_COUNTY_FIPS}"
+PERF_ELECTION_DATE = date(2090, 11, 7)
+PERF_ELECTION_TYPE = "GENERAL ELECTION"
+PERF_BALLOT_ITEM_ID = "PERF-1"
+
+# Shape of the synthetic statewide general-election results feed.
+GA_COUNTY_COUNT = 159
+STATEWIDE_CONTESTS = 20
+DISTRICT_CONTESTS = 280
+_COUNTIES_PER_DISTRICT = 6
+
+# Bounding box of the synthetic county (lon/lat, EPSG:4326).
+_MIN_LON, _MIN_LAT, _MAX_LON, _MAX_LAT = -84.0, 33.0, -83.0, 34.0
+
+# Number of vertical strips per district layer.
+DISTRICT_STRIPS: dict[str, int] = {
+    "congressional": 2,
+    "state_senate": 4,
+    "state_house": 8,
+}
+
+_SCALE_PRESETS: dict[str, int] = {
+    "small": 5_000,
+    "medium": 50_000,
+    "large": 500_000,
+}
+
+_VOTERS_PER_PRECINCT = 500
+_MISMATCH_EVERY = 20
+_FIRST_REGISTRATION_NUMBER = 10_000_000
+
+_FIRST_NAMES = ["JAMES", "MARY", "JOHN", "PATRICIA", "ROBERT", "JENNIFER", "MICHAEL", "LINDA", "DAVID", "ELIZABETH"]
+_LAST_NAMES = ["SMITH", "JOHNSON", "WILLIAMS", "BROWN", "JONES", "GARCIA", "MILLER", "DAVIS", "WILSON", "TAYLOR"]
+_STREETS = ["PEACHTREE", "MAIN", "OAK", "PINE", "MAPLE", "CEDAR", "ELM", "MAGNOLIA"]
+_STREET_TYPES = ["ST", "RD", "AVE", "DR", "LN"]
+_RACES = ["WH", "BH", "HP", "AP", "OT", "U"]
+_STATUSES = ["ACTIVE"] * 9 + ["INACTIVE"]
+
+VOTER_CSV_HEADER = [
+    "County",
+    "Voter Registration #",
+    "Status",
+    "Status Reason",
+    "Last Name",
+    "First Name",
+    "Middle Name",
+    "Suffix",
+    "Birth Year",
+    "Residence Street Number",
+    "Residence Pre Direction",
+    "Residence Street Name",
+    "Residence Street Type",
+    "Residence Post Direction",
+    "Residence Apt/Unit Number",
+    "Residence City",
+    "Residence Zipcode",
+    "County Precinct",
+    "County Precinct Description",
+    "Municipal Precinct",
+    "Municipal Precinct Description",
+    "Congressional District",
+    "State Senate District",
+    "State House District",
+    "Judicial District",
+    "County Commission District",
+    "School Board District",
+    "Registration Date",
+    "Race",
+    "Gender",
+    "Last Modified Date",
+    "Date of Last Contact",
+    "Last Party Voted",
+    "Last Vote Date",
+    "Voter Created Date",
+]
+
+VOTER_HISTORY_CSV_HEADER = [
+    "County Name",
+    "Voter Registration Number",
+    "Election Date",
+    "Election Type",
+    "Party",
+    "Ballot Style",
+    "Absentee",
+    "Provisional",
+    "Supplemental",
+]
+
+
+@dataclass(frozen=True)
+class PerfScale:
+    """Size of the synthetic dataset.
+
+    Attributes:
+        voters: Number of voter registrations.
+        history_per_voter: Voter history rows per voter (one per election).
+        seed: Seed for all random choices.
+    """
+
+    voters: int
+    history_per_voter: int = 3
+    seed: int = 20240101
+
+    @classmethod
+    def from_env(cls) -> PerfScale:
+        """Build a scale from ``PERF_SCALE`` (a preset name or a voter count).
+
+        Presets: ``small`` (5k voters, the default), ``medium`` (50k) and
+        ``large`` (500k, roughly a mid-sized GA county).
+
+        Raises:
+            ValueError: If ``PERF_SCALE`` is neither a preset nor a positive integer.
+        """
+        raw = os.environ.get("PERF_SCALE", "small").strip().lower()
+        if raw in _SCALE_PRESETS:
+            return cls(voters=_SCALE_PRESETS[raw])
+        try:
+            voters = int(raw.replace("_", ""))
+        except ValueError:
+            voters = 0
+        if voters <= 0:
+            msg = f"PERF_SCALE must be one of {sorted(_SCALE_PRESETS)} or a positive integer, got {raw!r}"
+            raise ValueError(msg)
+        return cls(voters=voters)
+
+    @property
+    def grid_columns(self) -> int:
+        """Columns of the precinct grid (a multiple of the widest strip count)."""
+        strips = max(DISTRICT_STRIPS.values())
+        target = math.ceil(self.voters / _VOTERS_PER_PRECINCT)
+        return strips * max(1, math.ceil(math.sqrt(target) / strips))
+
+    @property
+    def grid_rows(self) -> int:
+        """Rows of the precinct grid."""
+        return max(1, math.ceil(self.voters / _VOTERS_PER_PRECINCT / self.grid_columns))
+
+    @property
+    def precincts(self) -> int:
+        """Number of precincts: a full grid of roughly 500 voters each."""
+        return self.grid_columns * self.grid_rows
+
+    @property
+    def history_rows(self) -> int:
+        """Total voter history rows."""
+        return self.voters * self.history_per_voter
+
+    def to_dict(self) -> dict[str, int]:
+        """Return the scale as a JSON-friendly dict (recorded with results)."""
+        return {
+            "voters": self.voters,
+            "history_per_voter": self.history_per_voter,
+            "precincts": self.precincts,
+            "seed": self.seed,
+        }
+
+
+@dataclass(frozen=True)
+class Precinct:
+    """One cell of the synthetic precinct grid."""
+
+    index: int
+    row: int
+    column: int
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
+
+    @property
+    def precinct_id(self) -> str:
+        """SoS precinct identifier (``County Precinct`` in the voter file)."""
+        return f"P{self.index + 1:04d}"
+
+    @property
+    def name(self) -> str:
+        """Human-readable precinct name."""
+        return f"PERF PRECINCT {self.index + 1}"
+
+
+def precinct_grid(scale: PerfScale) -> list[Precinct]:
+    """Lay out ``scale.precincts`` square-ish cells over the county box."""
+    columns, rows = scale.grid_columns, scale.grid_rows
+    width = (_MAX_LON - _MIN_LON) / columns
+    height = (_MAX_LAT - _MIN_LAT) / rows
+    precincts = []
+    for index in range(scale.precincts):
+        row, column = divmod(index, columns)
+        min_lon = _MIN_LON + column * width
+        min_lat = _MIN_LAT + row * height
+        precincts.append(Precinct(index, row, column, min_lon, min_lat, min_lon + width, min_lat + height))
+    return precincts
+
+
+def district_for_column(boundary_type: str, column: int, columns: int) -> str:
+    """Return the district identifier of a grid column for a district layer."""
+    strips = DISTRICT_STRIPS[boundary_type]
+    return str(column * strips // columns + 1)
+
+
+def _registration_number(index: int) -> str:
+    # No leading zeros: the history parser strips them.
+    return str(_FIRST_REGISTRATION_NUMBER + index)
+
+
+def iter_voter_rows(scale: PerfScale) -> Iterator[dict[str, str]]:
+    """Yield voter rows keyed by GA SoS CSV header."""
+    rng = random.Random(scale.seed)  # noqa: S311 - deterministic test data
+    precincts = precinct_grid(scale)
+    columns = scale.grid_columns
+    for i in range(scale.voters):
+        precinct = precincts[i % len(precincts)]
+        house = district_for_column("state_house", precinct.column, columns)
+        if i % _MISMATCH_EVERY == 0:
+            house = str(int(house) % DISTRICT_STRIPS["state_house"] + 1)
+        year = rng.randint(1940, 2006)
+        yield {
+            "County": PERF_COUNTY,
+            "Voter Registration #": _registration_number(i),
+            "Status": rng.choice(_STATUSES),
+            "Status Reason": "",
+            "Last Name": rng.choice(_LAST_NAMES),
+            "First Name": rng.choice(_FIRST_NAMES),
+            "Middle Name": rng.choice(_FIRST_NAMES) if rng.random() < 0.6 else "",
+            "Suffix": "",
+            "Birth Year": str(year),
+            "Residence Street Number": str(rng.randint(1, 9999)),
+            "Residence Pre Direction": "",
+            "Residence Street Name": rng.choice(_STREETS),
+            "Residence Street Type": rng.choice(_STREET_TYPES),
+            "Residence Post Direction": "",
+            "Residence Apt/Unit Number": "",
+            "Residence City": f"PERFCITY{precinct.column % 4 + 1}",
+            "Residence Zipcode": f"30{precinct.column % 90 + 10:02d}{precinct.row % 10}",
+            "County Precinct": precinct.precinct_id,
+            "County Precinct Description": precinct.name,
+            "Municipal Precinct": "",
+            "Municipal Precinct Description": "",
+            "Congressional District": district_for_column("congressional", precinct.column, columns),
+            "State Senate District": district_for_column("state_senate", precinct.column, columns),
+            "State House District": house,
+            "Judicial District": "PERF",
+            "County Commission District": str(precinct.row % 5 + 1),
+            "School Board District": str(precinct.row % 5 + 1),
+            "Registration Date": f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/{min(year + 18, 2024)}",
+            "Race": rng.choice(_RACES),
+            "Gender": rng.choice(["MALE", "FEMALE"]),
+            "Last Modified Date": "01/15/2024",
+            "Date of Last Contact": "01/15/2024",
+            "Last Party Voted": rng.choice(["", "DEMOCRAT", "REPUBLICAN"]),
+            "Last Vote Date": "11/08/2022",
+            "Voter Created Date": "01/01/2000",
+        }
+
+
+def voter_locations(scale: PerfScale) -> list[tuple[float, float]]:
+    """Return a deterministic (longitude, latitude) per voter, inside its precinct."""
+    rng = random.Random(scale.seed + 3)  # noqa: S311 - deterministic test data
+    precincts = precinct_grid(scale)
+    locations = []
+    for i in range(scale.voters):
+        precinct = precincts[i % len(precincts)]
+        # Keep points off the cell edges so the spatial match is unambiguous.
+        fx, fy = rng.uniform(0.1, 0.9), rng.uniform(0.1, 0.9)
+        locations.append(
+            (
+                precinct.min_lon + fx * (precinct.max_lon - precinct.min_lon),
+                precinct.min_lat + fy * (precinct.max_lat - precinct.min_lat),
+            )
+        )
+    return locations
+
+
+def registration_numbers(scale: PerfScale) -> list[str]:
+    """Return every synthetic registration number, in voter order."""
+    return [_registration_number(i) for i in range(scale.voters)]
+
+
+def write_voter_csv(path: Path, scale: PerfScale) -> Path:
+    """Write a GA SoS voter registration CSV."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=VOTER_CSV_HEADER)
+        writer.writeheader()
+        writer.writerows(iter_voter_rows(scale))
+    return path
+
+
+def history_election_dates(scale: PerfScale) -> list[date]:
+    """Election dates covered by the history file, newest first."""
+    return [date(PERF_ELECTION_DATE.year - 2 * n, 11, PERF_ELECTION_DATE.day) for n in range(scale.history_per_voter)]
+
+
+def write_voter_history_csv(path: Path, scale: PerfScale) -> Path:
+    """Write a GA SoS voter history CSV (one row per voter per election).
+
+    Roughly 70% of voters participate in each election; non-participants
+    are still written so the file size is a fixed function of the scale.
+    """
+    rng = random.Random(scale.seed + 1)  # noqa: S311 - deterministic test data
+    dates = history_election_dates(scale)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(VOTER_HISTORY_CSV_HEADER)
+        for i in range(scale.voters):
+            reg = _registration_number(i)
+            for election_date in dates:
+                writer.writerow(
+                    [
+                        PERF_COUNTY,
+                        reg,
+                        election_date.strftime("%m/%d/%Y"),
+                        PERF_ELECTION_TYPE,
+                        rng.choice(["", "DEMOCRAT", "REPUBLICAN"]),
+                        "",
+                        "Y" if rng.random() < 0.3 else "N",
+                        "Y" if rng.random() < 0.01 else "N",
+                        "N",
+                    ]
+                )
+    return path
+
+
+def build_results_feed(scale: PerfScale, *, candidates: int = 3) -> dict[str, Any]:
+    """Build a SoS results feed with one contest and precinct-level results.
+
+    The statewide and PERFBENCH county results carry the same ballot item;
+    the county item has one ``precinctResults`` entry per precinct.
+    """
+    rng = random.Random(scale.seed + 2)  # noqa: S311 - deterministic test data
+    precincts = precinct_grid(scale)
+    groups = ["Election Day", "Advance Voting", "Absentee by Mail", "Provisional"]
+
+    def option(n: int, *, with_precincts: bool) -> dict[str, Any]:
+        precinct_results = [
+            {
+                "id": p.precinct_id,
+                "name": p.name,
+                "reportingStatus": "Reported",
+                "voteCount": rng.randint(0, 300),
+                "groupResults": [{"groupName": g, "voteCount": rng.randint(0, 100)} for g in groups],
+            }
+            for p in precincts
+        ]
+        return {
+            "id": f"{PERF_BALLOT_ITEM_ID}-{n}",
+            "name": f"CANDIDATE {n}",
+            "ballotOrder": n,
+            "voteCount": sum(pr["voteCount"] for pr in precinct_results),
+            "politicalParty": ["Dem", "Rep", "Ind"][(n - 1) % 3],
+            "groupResults": [{"groupName": g, "voteCount": rng.randint(0, 10_000)} for g in groups],
+            "precinctResults": precinct_results if with_precincts else None,
+        }
+
+    def ballot_item(*, with_precincts: bool) -> dict[str, Any]:
+        return {
+            "id": PERF_BALLOT_ITEM_ID,
+            "name": "PERF CONTEST",
+            "voteFor": 1,
+            "precinctsParticipating": len(precincts),
+            "precinctsReporting": len(precincts),
+            "ballotOptions": [option(n, with_precincts=with_precincts) for n in range(1, candidates + 1)],
+        }
+
+    return {
+        "electionDate": PERF_ELECTION_DATE.isoformat(),
+        "electionName": "PERFBENCH General Election",
+        "createdAt": "2090-11-08T06:00:00Z",
+        "results": {"id": "GA", "name": "Georgia", "ballotItems": [ballot_item(with_precincts=False)]},
+        "localResults": [
+            {"id": PERF_COUNTY_FIPS, "name": f"{PERF_COUNTY} County", "ballotItems": [ballot_item(with_precincts=True)]}
+        ],
+    }
+
+
+def write_results_feed(path: Path, scale: PerfScale) -> Path:
+    """Write :func:`build_results_feed` as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(build_results_feed(scale)))
+    return path
+
+
+def build_statewide_results_feed(
+    scale: PerfScale,
+    *,
+    counties: int = GA_COUNTY_COUNT,
+    statewide_contests: int = STATEWIDE_CONTESTS,
+    district_contests: int = DISTRICT_CONTESTS,
+    candidates: int = 3,
+) -> dict[str, Any]:
+    """Build a statewide general-election results feed (no precinct detail).
+
+    Every county carries the statewide contests; each district contest
+    spans a run of neighbouring counties, so a county carries only a few
+    dozen of the district contests, like a real GA general-election file.
+    """
+    rng = random.Random(scale.seed + 4)  # noqa: S311 - deterministic test data
+    groups = ["Election Day", "Advance Voting", "Absentee by Mail", "Provisional"]
+    contest_ids = [f"S{n + 1}" for n in range(statewide_contests)] + [f"D{n + 1}" for n in range(district_contests)]
+    stride = max(1, counties // _COUNTIES_PER_DISTRICT)
+
+    def contest_counties(index: int) -> range | list[int]:
+        if index < statewide_contests:
+            return range(counties)
+        first = (index - statewide_contests) % stride * _COUNTIES_PER_DISTRICT
+        return [c % counties for c in range(first, first + _COUNTIES_PER_DISTRICT)]
+
+    def ballot_item(index: int, precincts: int, votes: int) -> dict[str, Any]:
+        contest_id = contest_ids[index]
+        return {
+            "id": contest_id,
+            "name": f"PERF CONTEST {contest_id}",
+            "voteFor": 1,
+            "precinctsParticipating": precincts,
+            "precinctsReporting": precincts,
+            "ballotOptions": [
+                {
+                    "id": f"{contest_id}-{n}",
+                    "name": f"CANDIDATE {contest_id}-{n} ({['Dem', 'Rep', 'Ind'][(n - 1) % 3]})",
+                    "ballotOrder": n,
+                    "voteCount": rng.randint(0, votes),
+                    "politicalParty": ["Dem", "Rep", "Ind"][(n - 1) % 3],
+                    "groupResults": [{"groupName": g, "voteCount": rng.randint(0, votes // 4)} for g in groups],
+                }
+                for n in range(1, candidates + 1)
+            ],
+        }
+
+    county_items: list[list[dict[str, Any]]] = [[] for _ in range(counties)]
+    for index in range(len(contest_ids)):
+        for county in contest_counties(index):
+            county_items[county].append(ballot_item(index, precincts=scale.precincts, votes=50_000))
+
+    return {
+        "electionDate": PERF_ELECTION_DATE.isoformat(),
+        "electionName": "PERFBENCH General Election",
+        "createdAt": "2090-11-08T06:00:00Z",
+        "results": {
+            "id": "GA",
+            "name": "Georgia",
+            "ballotItems": [
+                ballot_item(index, precincts=scale.precincts * len(contest_counties(index)), votes=5_000_000)
+                for index in range(len(contest_ids))
+            ],
+        },
+        "localResults": [
+            {"id": f"{county + 1:03d}", "name": f"PERF{county + 1:03d} County", "ballotItems": items}
+            for county, items in enumerate(county_items)
+        ],
+    }
+
+
+def write_statewide_results_feed(path: Path, scale: PerfScale) -> Path:
+    """Write :func:`build_statewide_results_feed` as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(build_statewide_results_feed(scale)))
+    return path
+
+
+def write_precinct_shapefile(path: Path, scale: PerfScale) -> Path:
+    """Write a GA SoS-style county precinct shapefile.
+
+    Attribute columns follow the statewide precinct file (DISTRICT,
+    CTYSOSID, FIPS, FIPS2, CTYNAME, CONTY, PRECINCT_I, PRECINCT_N, AREA)
+    so the import also exercises the precinct metadata upsert.
+    """
+    import geopandas as gpd
+    from shapely.geometry import box
+
+    precincts = precinct_grid(scale)
+    gdf = gpd.GeoDataFrame(
+        {
+            "DISTRICT": [f"{PERF_COUNTY_FIPS}{p.precinct_id}" for p in precincts],
+            "CTYSOSID": [f"{PERF_COUNTY_FIPS}{p.precinct_id}" for p in precincts],
+            "FIPS": [PERF_COUNTY_GEOID] * len(precincts),
+            "FIPS2": [PERF_COUNTY_FIPS] * len(precincts),
+            "CTYNAME": [PERF_COUNTY] * len(precincts),
+            "CONTY": ["999"] * len(precincts),
+            "PRECINCT_I": [p.precinct_id for p in precincts],
+            "PRECINCT_N": [p.name for p in precincts],
+            "AREA": [round((p.max_lon - p.min_lon) * (p.max_lat - p.min_lat), 8) for p in precincts],
+        },
+        geometry=[box(p.min_lon, p.min_lat, p.max_lon, p.max_lat) for p in precincts],
+        crs="EPSG:4326",
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    gdf.to_file(path, engine="pyogrio")
+    return path
+
+
+def write_district_shapefile(path: Path, scale: PerfScale, boundary_type: str) -> Path:
+    """Write a district layer whose strips cover whole precinct columns."""
+    import geopandas as gpd
+    from shapely.geometry import box
+
+    strips = DISTRICT_STRIPS[boundary_type]
+    columns = scale.grid_columns
+    column_width = (_MAX_LON - _MIN_LON) / columns
+    identifiers, geometries = [], []
+    for n in range(1, strips + 1):
+        first = [c for c in range(columns) if district_for_column(boundary_type, c, columns) == str(n)]
+        identifiers.append(f"{n:03d}")
+        geometries.append(
+            box(
+                _MIN_LON + first[0] * column_width,
+                _MIN_LAT,
+                _MIN_LON + (first[-1] + 1) * column_width,
+                _MAX_LAT,
+            )
+        )
+    gdf = gpd.GeoDataFrame(
+        {"DISTRICT": identifiers, "NAME": [f"PERF {boundary_type} {i}" for i in identifiers]},
+        geometry=geometries,
+        crs="EPSG:4326",
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    gdf.to_file(path, engine="pyogrio")
+    return path
+
+
+def county_geometry_wkt() -> str:
+    """WKT of the synthetic county outline (the whole grid box)."""
+    return (
+        f"MULTIPOLYGON((({_MIN_LON} {_MIN_LAT}, {_MAX_LON} {_MIN_LAT}, {_MAX_LON} {_MAX_LAT}, "
+        f"{_MIN_LON} {_MAX_LAT}, {_MIN_LON} {_MIN_LAT})))"
+    )
+
+
+@dataclass(frozen=True)
+class PerfFiles:
+    """Paths of one generated dataset."""
+
+    voters_csv: Path
+    history_csv: Path
+    results_feed: Path
+    statewide_results_feed: Path
+    precinct_shapefile: Path
+    district_shapefiles: dict[str, Path]
+
+
+def generate_dataset(directory: Path, scale: PerfScale) -> PerfFiles:
+    """Write every synthetic input for ``scale`` under ``directory``."""
+    return PerfFiles(
+        voters_csv=write_voter_csv(directory / "voters.csv", scale),
+        history_csv=write_voter_history_csv(directory / "voter_history.csv", scale),
+        results_feed=write_results_feed(directory / "results.json", scale),
+        statewide_results_feed=write_statewide_results_feed(directory / "statewide_results.json", scale),
+        precinct_shapefile=write_precinct_shapefile(directory / "precincts" / "precincts.shp", scale),
+        district_shapefiles={
+            boundary_type: write_district_shapefile(
+                directory / boundary_type / f"{boundary_type}.shp", scale, boundary_type
+            )
+            for boundary_type in DISTRICT_STRIPS
+        },
+    )
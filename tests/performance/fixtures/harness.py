@@ -0,0 +1,256 @@
+"""Benchmark timing, machine-readable results, and baseline comparison.
+
+Results are written as JSON (schema version 1)::
+
+    {
+      "schema": 1,
+      "created_at": "...",
+      "scale": {"voters": 20000, ...},
+      "environment": {"python": "3.13.1", "platform": "...", "git_sha": "..."},
+      "results": {
+        "parse_csv_chunks": {"median_s": 0.41, "min_s": ..., "rounds": 3, "rows": 20000, ...}
+      }
+    }
+
+Comparison only uses ``median_s``; the other fields are informational.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+RESULTS_SCHEMA = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings for one benchmark.
+
+    Attributes:
+        name: Benchmark name (unique within a run).
+        timings_s: Wall-clock seconds of each measured round.
+        rows: Work units processed per round (rows, features, ...), if any.
+        extra: Free-form details (e.g. query counts, feature counts).
+    """
+
+    name: str
+    timings_s: list[float]
+    rows: int | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def median_s(self) -> float:
+        """Median round time in seconds."""
+        return statistics.median(self.timings_s)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON representation of this result."""
+        data: dict[str, Any] = {
+            "median_s": round(self.median_s, 6),
+            "min_s": round(min(self.timings_s), 6),
+            "max_s": round(max(self.timings_s), 6),
+            "rounds": len(self.timings_s),
+            "timings_s": [round(t, 6) for t in self.timings_s],
+        }
+        if self.rows is not None:
+            data["rows"] = self.rows
+            data["rows_per_s"] = round(self.rows / self.median_s, 1) if self.median_s > 0 else None
+        if self.extra:
+            data["extra"] = self.extra
+        return data
+
+
+class BenchmarkRecorder:
+    """Times benchmark callables and collects their results for one run.
+
+    Args:
+        scale: Scale parameters recorded alongside the results; baselines
+            recorded at a different scale are not compared.
+    """
+
+    def __init__(self, scale: dict[str, Any]) -> None:
+        self.scale = scale
+        self.results: dict[str, BenchmarkResult] = {}
+
+    async def measure(
+        self,
+        name: str,
+        fn: Callable[[], Awaitable[Any]],
+        *,
+        rounds: int = 3,
+        warmup: int = 1,
+        rows: int | None = None,
+        setup: Callable[[], Awaitable[Any]] | None = None,
+    ) -> BenchmarkResult:
+        """Time an async callable.
+
+        Args:
+            name: Benchmark name.
+            fn: Zero-argument coroutine function to time.
+            rounds: Number of measured rounds.
+            warmup: Unmeasured rounds run first (fill caches, JIT plans).
+            rows: Work units per round, for throughput reporting.
+            setup: Optional coroutine function run (untimed) before every
+                round, e.g. to reset state between imports.
+
+        Returns:
+            The recorded result.
+        """
+        timings: list[float] = []
+        for i in range(warmup + rounds):
+            if setup is not None:
+                await setup()
+            start = time.perf_counter()
+            await fn()
+            elapsed = time.perf_counter() - start
+            if i >= warmup:
+                timings.append(elapsed)
+        return self.record(BenchmarkResult(name=name, timings_s=timings, rows=rows))
+
+    def measure_sync(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        *,
+        rounds: int = 3,
+        warmup: int = 1,
+        rows: int | None = None,
+    ) -> BenchmarkResult:
+        """Time a synchronous callable (see :meth:`measure`)."""
+        timings: list[float] = []
+        for i in range(warmup + rounds):
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            if i >= warmup:
+                timings.append(elapsed)
+        return self.record(BenchmarkResult(name=name, timings_s=timings, rows=rows))
+
+    def record(self, result: BenchmarkResult) -> BenchmarkResult:
+        """Store a result, rejecting duplicate names."""
+        if result.name in self.results:
+            msg = f"Duplicate benchmark name: {result.name}"
+            raise ValueError(msg)
+        self.results[result.name] = result
+        return result
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the machine-readable results document."""
+        return {
+            "schema": RESULTS_SCHEMA,
+            "created_at": datetime.now(UTC).isoformat(),
+            "scale": self.scale,
+            "environment": _environment(),
+            "results": {name: r.to_dict() for name, r in sorted(self.results.items())},
+        }
+
+    def write(self, path: Path, document: dict[str, Any] | None = None) -> None:
+        """Write the results document (built now unless given) to ``path``."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(document or self.to_json(), indent=2) + "\n")
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """One benchmark compared against its baseline.
+
+    Attributes:
+        name: Benchmark name.
+        current_s: Current median seconds.
+        baseline_s: Baseline median seconds, or None for a new benchmark.
+        ratio: ``current_s / baseline_s`` (None for new benchmarks).
+        regressed: True when the ratio exceeds ``1 + tolerance``.
+    """
+
+    name: str
+    current_s: float
+    baseline_s: float | None
+    ratio: float | None
+    regressed: bool
+
+
+def compare_to_baseline(current: dict[str, Any], baseline: dict[str, Any], *, tolerance: float) -> list[Comparison]:
+    """Compare a results document against a baseline document.
+
+    Args:
+        current: Results document from :meth:`BenchmarkRecorder.to_json`.
+        baseline: Previously saved results document.
+        tolerance: Allowed slowdown as a fraction (0.2 = 20% slower).
+
+    Returns:
+        One comparison per current benchmark, sorted by name.
+
+    Raises:
+        ValueError: If the documents use a different schema or scale.
+    """
+    if baseline.get("schema") != current.get("schema"):
+        msg = f"Baseline schema {baseline.get('schema')!r} does not match {current.get('schema')!r}"
+        raise ValueError(msg)
+    if baseline.get("scale") != current.get("scale"):
+        msg = f"Baseline scale {baseline.get('scale')!r} does not match {current.get('scale')!r}"
+        raise ValueError(msg)
+
+    baseline_results = baseline.get("results", {})
+    comparisons: list[Comparison] = []
+    for name, data in sorted(current.get("results", {}).items()):
+        current_s = data["median_s"]
+        base = baseline_results.get(name)
+        if base is None or not base.get("median_s"):
+            comparisons.append(Comparison(name, current_s, None, None, regressed=False))
+            continue
+        ratio = current_s / base["median_s"]
+        comparisons.append(Comparison(name, current_s, base["median_s"], ratio, regressed=ratio > 1 + tolerance))
+    return comparisons
+
+
+def format_comparisons(comparisons: list[Comparison]) -> list[str]:
+    """Render comparisons as aligned text lines for the terminal summary."""
+    width = max((len(c.name) for c in comparisons), default=0)
+    lines = []
+    for c in comparisons:
+        if c.baseline_s is None:
+            lines.append(f"{c.name:<{width}}  {c.current_s:9.3f}s  (new)")
+            continue
+        flag = "  REGRESSION" if c.regressed else ""
+        lines.append(f"{c.name:<{width}}  {c.current_s:9.3f}s  vs {c.baseline_s:9.3f}s  x{c.ratio:.2f}{flag}")
+    return lines
+
+
+def _environment() -> dict[str, Any]:
+    """Describe the machine and revision the benchmarks ran on."""
+    try:
+        sha = subprocess.run(  # noqa: S603
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        sha = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "git_sha": sha,
+    }
+
+
+__all__ = [
+    "BenchmarkRecorder",
+    "BenchmarkResult",
+    "Comparison",
+    "compare_to_baseline",
+    "format_comparisons",
+]
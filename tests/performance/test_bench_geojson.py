@@ -0,0 +1,74 @@
+"""GeoJSON endpoint benchmarks.
+
+Results GeoJSON is served from the version-keyed response cache, so each
+view is measured twice: the service call that builds it (a cache miss)
+and the HTTP endpoint on a warm cache.
+"""
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.performance.fixtures.dataset import PerfDataset
+from tests.performance.fixtures.generators import PERF_COUNTY
+from tests.performance.fixtures.harness import BenchmarkRecorder
+
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.benchmark]
+
+
+@pytest.mark.parametrize("boundary_type", ["county_precinct", "state_house"])
+async def test_boundaries_geojson(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, client: httpx.AsyncClient, boundary_type: str
+) -> None:
+    """``GET /api/v1/boundaries/geojson`` for one boundary layer."""
+    params = {"boundary_type": boundary_type}
+    if boundary_type == "county_precinct":
+        params["county"] = PERF_COUNTY
+
+    async def run() -> None:
+        response = await client.get("/api/v1/boundaries/geojson", params=params)
+        assert response.status_code == 200
+        assert response.json()["features"]
+
+    await recorder.measure(f"boundaries_geojson[{boundary_type}]", run, rounds=5)
+
+
+async def test_election_results_geojson_build(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession
+) -> None:
+    """County results GeoJSON assembly (cache miss)."""
+    from voter_api.services.election_service import get_election_results_geojson
+
+    async def run() -> None:
+        collection = await get_election_results_geojson(db_session, perf_dataset.election_id)
+        assert collection is not None
+
+    await recorder.measure("election_results_geojson[build]", run, rounds=5)
+
+
+async def test_election_precinct_results_geojson_build(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession
+) -> None:
+    """Precinct results GeoJSON assembly (cache miss)."""
+    from voter_api.services.election_service import get_election_precinct_results_geojson
+
+    async def run() -> None:
+        collection = await get_election_precinct_results_geojson(db_session, perf_dataset.election_id)
+        assert collection is not None
+        assert collection.features
+
+    await recorder.measure("election_precinct_results_geojson[build]", run, rounds=5, rows=perf_dataset.scale.precincts)
+
+
+@pytest.mark.parametrize("view", ["geojson", "geojson/precincts"])
+async def test_election_results_geojson_endpoint(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, client: httpx.AsyncClient, view: str
+) -> None:
+    """Results GeoJSON endpoints on a warm response cache."""
+    url = f"/api/v1/elections/{perf_dataset.election_id}/results/{view}"
+
+    async def run() -> None:
+        response = await client.get(url)
+        assert response.status_code == 200
+
+    await recorder.measure(f"election_results_{view.replace('/', '_')}[cached]", run, rounds=10)
@@ -0,0 +1,76 @@
+"""Import pipeline benchmarks: CSV parsing, voter and history imports, analysis.
+
+Imports run against the already-loaded dataset, so they measure the
+steady-state re-import of an unchanged county file (the common nightly
+case): every row is upserted and nothing is soft-deleted.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.performance.fixtures.dataset import PERF_BOUNDARY_SOURCE, PERF_JOB_PREFIX, PerfDataset
+from tests.performance.fixtures.generators import PERF_COUNTY, PerfFiles, PerfScale
+from tests.performance.fixtures.harness import BenchmarkRecorder
+
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.benchmark]
+
+
+async def test_parse_csv_chunks(recorder: BenchmarkRecorder, perf_files: PerfFiles, perf_scale: PerfScale) -> None:
+    """Parse and column-map the voter CSV without touching the database."""
+    from voter_api.lib.importer.parser import parse_csv_chunks
+
+    def parse() -> None:
+        for _ in parse_csv_chunks(perf_files.voters_csv, batch_size=5000):
+            pass
+
+    recorder.measure_sync("parse_csv_chunks", parse, rows=perf_scale.voters)
+
+
+async def test_process_voter_import(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession
+) -> None:
+    """Full voter import (index drop/rebuild, upsert, soft-delete, diff)."""
+    from voter_api.services.import_service import create_import_job, process_voter_import
+
+    async def run() -> None:
+        job = await create_import_job(db_session, file_name=f"{PERF_JOB_PREFIX}voters.csv")
+        job = await process_voter_import(db_session, job, perf_dataset.files.voters_csv)
+        assert job.status == "completed", job.error_log
+
+    await recorder.measure("process_voter_import", run, rounds=2, rows=perf_dataset.scale.voters)
+
+
+@pytest.mark.parametrize("use_copy", [False, True], ids=["upsert", "copy"])
+async def test_process_voter_history_import(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession, use_copy: bool
+) -> None:
+    """Voter history re-import, superseding the previous import of the file."""
+    from voter_api.services.import_service import create_import_job
+    from voter_api.services.voter_history_service import process_voter_history_import
+
+    async def run() -> None:
+        job = await create_import_job(
+            db_session, file_name=f"{PERF_JOB_PREFIX}voter_history.csv", file_type="voter_history"
+        )
+        job = await process_voter_history_import(
+            db_session, job, perf_dataset.files.history_csv, batch_size=5000, use_copy=use_copy
+        )
+        assert job.status == "completed", job.error_log
+
+    name = "process_voter_history_import[copy]" if use_copy else "process_voter_history_import"
+    await recorder.measure(name, run, rounds=2, rows=perf_dataset.scale.history_rows)
+
+
+async def test_process_analysis_run(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession
+) -> None:
+    """Spatial boundary analysis of every geocoded voter in the county."""
+    from voter_api.services.analysis_service import create_analysis_run, process_analysis_run
+
+    async def run() -> None:
+        analysis = await create_analysis_run(db_session, notes=PERF_BOUNDARY_SOURCE)
+        analysis = await process_analysis_run(db_session, analysis, county=PERF_COUNTY)
+        assert analysis.status == "completed"
+        assert analysis.mismatch_count
+
+    await recorder.measure("process_analysis_run", run, rounds=2, rows=perf_dataset.scale.voters)
@@ -0,0 +1,96 @@
+"""Read-path benchmarks: participation stats and voter search."""
+
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.performance.fixtures.dataset import PerfDataset
+from tests.performance.fixtures.generators import PERF_COUNTY
+from tests.performance.fixtures.harness import BenchmarkRecorder
+
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.benchmark]
+
+_SEARCHES: dict[str, dict[str, Any]] = {
+    "county": {"county": PERF_COUNTY},
+    "name": {"q": "SMITH JAMES", "county": PERF_COUNTY},
+    "last_name_prefix": {"last_name": "WIL"},
+    "district": {"state_house_district": "3", "status": "ACTIVE"},
+    "precinct_mismatch": {"county": PERF_COUNTY, "county_precinct": "P0002", "has_district_mismatch": True},
+    "deep_page": {"county": PERF_COUNTY, "page": 200, "page_size": 20},
+}
+
+
+@pytest.mark.parametrize("force_refresh", [True, False], ids=["compute", "rollup"])
+async def test_get_participation_stats(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession, force_refresh: bool
+) -> None:
+    """Participation stats, recomputed (``compute``) or read from the rollup."""
+    from voter_api.services.voter_history_service import get_participation_stats
+
+    async def run() -> None:
+        stats = await get_participation_stats(db_session, perf_dataset.election_id, force_refresh=force_refresh)
+        assert stats.total_participants > 0
+
+    name = "get_participation_stats[compute]" if force_refresh else "get_participation_stats[rollup]"
+    await recorder.measure(name, run, rounds=5)
+
+
+@pytest.mark.parametrize("case", list(_SEARCHES))
+async def test_search_voters(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession, case: str
+) -> None:
+    """Voter search with representative filter combinations."""
+    from voter_api.services.voter_service import search_voters
+
+    async def run() -> None:
+        await search_voters(db_session, **_SEARCHES[case])
+
+    await recorder.measure(f"search_voters[{case}]", run, rounds=5)
+
+
+@pytest.mark.parametrize("count_mode", ["exact", "estimate"])
+async def test_search_voters_keyset_deep_page(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession, count_mode: str
+) -> None:
+    """Keyset counterpart of ``search_voters[deep_page]``: page 200 reached by cursor."""
+    from voter_api.services.voter_service import VoterSearchFilters, encode_voter_cursor, search_voters_keyset
+
+    filters = VoterSearchFilters(county=PERF_COUNTY)
+    anchor = await search_voters_keyset(db_session, filters, page=199, page_size=20, count_mode="estimate")
+    assert anchor.voters
+    cursor = encode_voter_cursor(anchor.voters[-1])
+
+    async def run() -> None:
+        await search_voters_keyset(db_session, filters, cursor=cursor, page_size=20, count_mode=count_mode)
+
+    await recorder.measure(f"search_voters_keyset[deep_page,{count_mode}]", run, rounds=5)
+
+
+@pytest.mark.parametrize("q", ["smith james", "wil", "jam s"])
+async def test_lookup_voters_by_name(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession, q: str
+) -> None:
+    """Statewide ranked type-ahead lookup (target: well under 100 ms)."""
+    from voter_api.services.voter_service import lookup_voters_by_name
+
+    async def run() -> None:
+        assert await lookup_voters_by_name(db_session, q, limit=10)
+
+    await recorder.measure(f"lookup_voters_by_name[{q}]", run, rounds=10)
+
+
+@pytest.mark.parametrize("scoped", [False, True], ids=["statewide", "county"])
+async def test_get_voter_filter_options(
+    recorder: BenchmarkRecorder, perf_dataset: PerfDataset, db_session: AsyncSession, scoped: bool
+) -> None:
+    """Filter dropdown options from the facet rollup."""
+    from voter_api.services.voter_service import get_voter_filter_options
+
+    county = PERF_COUNTY if scoped else None
+
+    async def run() -> None:
+        options = await get_voter_filter_options(db_session, county=county, with_counts=True)
+        assert PERF_COUNTY in options["counties"]
+
+    await recorder.measure(f"get_voter_filter_options[{'county' if scoped else 'statewide'}]", run, rounds=10)
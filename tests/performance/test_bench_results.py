@@ -0,0 +1,57 @@
+"""Results file benchmarks: parsing and ingesting a statewide general-election feed.
+
+These need no database. The per-item variant is the pre-index extraction
+(one full feed scan per contest), kept as the reference the single-pass
+ingestion is measured against.
+"""
+
+import json
+
+import pytest
+
+from tests.performance.fixtures.generators import PerfFiles
+from tests.performance.fixtures.harness import BenchmarkRecorder
+
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.benchmark]
+
+
+async def test_load_statewide_results_file(recorder: BenchmarkRecorder, perf_files: PerfFiles) -> None:
+    """Load and validate the statewide feed."""
+    from voter_api.lib.results_importer import load_results_file
+
+    feed = load_results_file(perf_files.statewide_results_feed)
+    recorder.measure_sync(
+        "load_results_file[statewide]",
+        lambda: load_results_file(perf_files.statewide_results_feed),
+        rows=len(feed.results.ballotItems),
+    )
+
+
+async def test_stream_statewide_results_file(recorder: BenchmarkRecorder, perf_files: PerfFiles) -> None:
+    """Stream the statewide feed: header, then one validated county at a time."""
+    from voter_api.lib.results_importer import iter_local_results, load_results_header
+
+    def stream() -> None:
+        load_results_header(perf_files.statewide_results_feed)
+        for _ in iter_local_results(perf_files.statewide_results_feed):
+            pass
+
+    header = load_results_header(perf_files.statewide_results_feed)
+    recorder.measure_sync("stream_results_file[statewide]", stream, rows=len(header.results.ballotItems))
+
+
+async def test_iter_ballot_items_statewide(recorder: BenchmarkRecorder, perf_files: PerfFiles) -> None:
+    """Extract every contest of the statewide feed (single-pass ingestion)."""
+    from voter_api.lib.election_tracker.ingester import ingest_election_results
+    from voter_api.lib.election_tracker.parser import parse_sos_feed
+    from voter_api.lib.results_importer import iter_ballot_items
+
+    feed = parse_sos_feed(json.loads(perf_files.statewide_results_feed.read_text()))
+    contests = len(feed.results.ballotItems)
+
+    def per_item() -> None:
+        for ballot_item in feed.results.ballotItems:
+            ingest_election_results(feed, ballot_item_id=ballot_item.id)
+
+    recorder.measure_sync("ingest_election_results[statewide,per_item]", per_item, rows=contests)
+    recorder.measure_sync("iter_ballot_items[statewide]", lambda: iter_ballot_items(feed), rows=contests)
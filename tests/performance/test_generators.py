@@ -0,0 +1,124 @@
+"""Tests that the synthetic generators produce input the real parsers accept.
+
+These run in the normal suite (no database) so the benchmark inputs cannot
+silently drift from the formats the importers expect.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from tests.performance.fixtures.generators import (
+    DISTRICT_STRIPS,
+    PERF_BALLOT_ITEM_ID,
+    PERF_COUNTY,
+    PerfScale,
+    build_results_feed,
+    build_statewide_results_feed,
+    precinct_grid,
+    registration_numbers,
+    voter_locations,
+    write_district_shapefile,
+    write_precinct_shapefile,
+    write_voter_csv,
+    write_voter_history_csv,
+)
+
+SCALE = PerfScale(voters=1200, history_per_voter=2)
+
+
+class TestPerfScale:
+    """Tests for PerfScale.from_env."""
+
+    def test_default_is_small(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PERF_SCALE", raising=False)
+        assert PerfScale.from_env().voters == 5_000
+
+    @pytest.mark.parametrize(("raw", "voters"), [("medium", 50_000), ("LARGE", 500_000), ("25_000", 25_000)])
+    def test_presets_and_counts(self, monkeypatch: pytest.MonkeyPatch, raw: str, voters: int) -> None:
+        monkeypatch.setenv("PERF_SCALE", raw)
+        assert PerfScale.from_env().voters == voters
+
+    @pytest.mark.parametrize("raw", ["huge", "0", "-5"])
+    def test_rejects_invalid(self, monkeypatch: pytest.MonkeyPatch, raw: str) -> None:
+        monkeypatch.setenv("PERF_SCALE", raw)
+        with pytest.raises(ValueError, match="PERF_SCALE"):
+            PerfScale.from_env()
+
+    def test_grid_is_full_and_divisible_by_strips(self) -> None:
+        scale = PerfScale(voters=50_000)
+        assert scale.precincts == len(precinct_grid(scale))
+        assert all(scale.grid_columns % strips == 0 for strips in DISTRICT_STRIPS.values())
+
+
+class TestGenerators:
+    """Generated files round-trip through the production parsers."""
+
+    def test_voter_csv_parses(self, tmp_path: Path) -> None:
+        from voter_api.lib.importer.parser import parse_csv_chunks
+
+        path = write_voter_csv(tmp_path / "voters.csv", SCALE)
+        chunks = list(parse_csv_chunks(path, batch_size=500))
+
+        assert sum(len(c) for c in chunks) == SCALE.voters
+        first = chunks[0].iloc[0]
+        assert first["county"] == PERF_COUNTY
+        assert first["voter_registration_number"] == registration_numbers(SCALE)[0]
+
+    def test_voter_csv_is_deterministic(self, tmp_path: Path) -> None:
+        a = write_voter_csv(tmp_path / "a.csv", SCALE)
+        b = write_voter_csv(tmp_path / "b.csv", SCALE)
+        assert a.read_bytes() == b.read_bytes()
+
+    def test_voter_history_csv_parses(self, tmp_path: Path) -> None:
+        from voter_api.lib.voter_history.parser import parse_voter_history_chunks
+
+        path = write_voter_history_csv(tmp_path / "history.csv", SCALE)
+        records = [r for chunk in parse_voter_history_chunks(path, batch_size=1000) for r in chunk]
+
+        assert len(records) == SCALE.history_rows
+        assert all(r["_parse_error"] is None for r in records)
+        assert records[0]["voter_registration_number"] == registration_numbers(SCALE)[0]
+        assert records[0]["normalized_election_type"] == "general"
+
+    def test_results_feed_ingests(self) -> None:
+        from voter_api.lib.election_tracker.ingester import ingest_election_results
+        from voter_api.lib.election_tracker.parser import parse_sos_feed
+
+        feed = parse_sos_feed(build_results_feed(SCALE))
+        ingestion = ingest_election_results(feed, PERF_BALLOT_ITEM_ID)
+
+        assert len(ingestion.counties) == 1
+        assert ingestion.counties[0].county_name_normalized == PERF_COUNTY
+        option = feed.localResults[0].ballotItems[0].ballotOptions[0]
+        assert option.precinctResults is not None
+        assert len(option.precinctResults) == SCALE.precincts
+
+    def test_statewide_results_feed_ingests(self) -> None:
+        from voter_api.lib.election_tracker.parser import parse_sos_feed
+        from voter_api.lib.results_importer import iter_ballot_items
+
+        raw = build_statewide_results_feed(SCALE, counties=12, statewide_contests=2, district_contests=4)
+        contexts = iter_ballot_items(parse_sos_feed(raw))
+
+        assert [c.ballot_item_id for c in contexts] == ["S1", "S2", "D1", "D2", "D3", "D4"]
+        assert len(contexts[0].ingestion.counties) == 12
+        assert all(len(c.ingestion.counties) == 6 for c in contexts[2:])
+        assert contexts[0].candidates[0].party == "Democrat"
+
+    def test_shapefiles_load(self, tmp_path: Path) -> None:
+        from voter_api.lib.boundary_loader import load_boundaries
+
+        precincts = load_boundaries(write_precinct_shapefile(tmp_path / "p" / "p.shp", SCALE))
+        house = load_boundaries(write_district_shapefile(tmp_path / "h" / "h.shp", SCALE, "state_house"))
+
+        assert len(precincts) == SCALE.precincts
+        assert precincts[0].properties["PRECINCT_I"] == "P0001"
+        assert sorted(b.boundary_identifier for b in house) == [f"{n:03d}" for n in range(1, 9)]
+
+    def test_voter_locations_fall_in_their_precinct(self) -> None:
+        grid = precinct_grid(SCALE)
+        for i, (lon, lat) in enumerate(voter_locations(SCALE)[: len(grid) * 2]):
+            cell = grid[i % len(grid)]
+            assert cell.min_lon < lon < cell.max_lon
+            assert cell.min_lat < lat < cell.max_lat
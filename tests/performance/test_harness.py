@@ -0,0 +1,93 @@
+"""Tests for benchmark recording and baseline comparison."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.performance.fixtures.harness import (
+    BenchmarkRecorder,
+    BenchmarkResult,
+    compare_to_baseline,
+    format_comparisons,
+)
+
+SCALE = {"voters": 100}
+
+
+def _document(**medians: float) -> dict:
+    recorder = BenchmarkRecorder(scale=SCALE)
+    for name, median in medians.items():
+        recorder.record(BenchmarkResult(name=name, timings_s=[median]))
+    return recorder.to_json()
+
+
+class TestBenchmarkRecorder:
+    """Tests for BenchmarkRecorder."""
+
+    async def test_measure_skips_warmup_and_runs_setup(self) -> None:
+        calls: list[str] = []
+
+        async def setup() -> None:
+            calls.append("setup")
+
+        async def fn() -> None:
+            calls.append("fn")
+
+        recorder = BenchmarkRecorder(scale=SCALE)
+        result = await recorder.measure("x", fn, rounds=2, warmup=1, setup=setup, rows=10)
+
+        assert calls == ["setup", "fn"] * 3
+        assert len(result.timings_s) == 2
+        assert result.to_dict()["rows"] == 10
+
+    def test_rejects_duplicate_names(self) -> None:
+        recorder = BenchmarkRecorder(scale=SCALE)
+        recorder.measure_sync("x", lambda: None, rounds=1, warmup=0)
+        with pytest.raises(ValueError, match="Duplicate"):
+            recorder.measure_sync("x", lambda: None, rounds=1, warmup=0)
+
+    def test_write_produces_schema_document(self, tmp_path: Path) -> None:
+        recorder = BenchmarkRecorder(scale=SCALE)
+        recorder.record(BenchmarkResult(name="b", timings_s=[3.0, 1.0, 2.0]))
+        path = tmp_path / "out" / "results.json"
+
+        recorder.write(path)
+
+        data = json.loads(path.read_text())
+        assert data["schema"] == 1
+        assert data["scale"] == SCALE
+        assert data["results"]["b"]["median_s"] == 2.0
+        assert data["results"]["b"]["min_s"] == 1.0
+        assert "python" in data["environment"]
+
+
+class TestCompareToBaseline:
+    """Tests for compare_to_baseline."""
+
+    def test_flags_regressions_beyond_tolerance(self) -> None:
+        current = _document(fast=1.0, slow=1.5, new=2.0)
+        baseline = _document(fast=1.1, slow=1.0)
+
+        comparisons = {c.name: c for c in compare_to_baseline(current, baseline, tolerance=0.25)}
+
+        assert not comparisons["fast"].regressed
+        assert comparisons["slow"].regressed
+        assert comparisons["slow"].ratio == pytest.approx(1.5)
+        assert comparisons["new"].baseline_s is None
+        assert not comparisons["new"].regressed
+
+    def test_within_tolerance_passes(self) -> None:
+        comparisons = compare_to_baseline(_document(a=1.2), _document(a=1.0), tolerance=0.25)
+        assert not comparisons[0].regressed
+
+    def test_rejects_different_scale(self) -> None:
+        baseline = _document(a=1.0)
+        baseline["scale"] = {"voters": 5}
+        with pytest.raises(ValueError, match="scale"):
+            compare_to_baseline(_document(a=1.0), baseline, tolerance=0.1)
+
+    def test_format_marks_regressions(self) -> None:
+        lines = format_comparisons(compare_to_baseline(_document(a=2.0, b=1.0), _document(a=1.0), tolerance=0.1))
+        assert "REGRESSION" in lines[0]
+        assert "(new)" in lines[1]
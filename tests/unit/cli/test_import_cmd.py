@@ -0,0 +1,45 @@
+"""Unit tests for the voter-facets import CLI command."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from typer.testing import CliRunner
+
+from voter_api.cli.import_cmd import import_app
+
+runner = CliRunner()
+
+
+class TestVoterFacetsCommand:
+    """Verify voter-facets rebuilds the voter filter facets."""
+
+    def _invoke(self, args: list[str]) -> tuple[object, AsyncMock]:
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        with (
+            patch("voter_api.core.config.get_settings"),
+            patch("voter_api.core.database.init_engine"),
+            patch("voter_api.core.database.dispose_engine", new_callable=AsyncMock) as dispose,
+            patch("voter_api.core.database.get_session_factory", return_value=factory),
+            patch(
+                "voter_api.services.voter_service.refresh_voter_filter_facets", new_callable=AsyncMock, return_value=7
+            ) as refresh,
+        ):
+            result = runner.invoke(import_app, ["voter-facets", *args])
+        dispose.assert_awaited_once()
+        return result, refresh
+
+    def test_rebuilds_every_county_by_default(self) -> None:
+        """Without --county, every county's facets are rebuilt."""
+        result, refresh = self._invoke([])
+
+        assert result.exit_code == 0
+        assert refresh.call_args.kwargs["counties"] is None
+        assert "Rebuilt 7 voter filter facet(s) for all counties." in result.output
+
+    def test_rebuilds_selected_counties(self) -> None:
+        """Repeated --county options limit the rebuild to those counties."""
+        result, refresh = self._invoke(["--county", "BIBB", "--county", "FULTON"])
+
+        assert result.exit_code == 0
+        assert refresh.call_args.kwargs["counties"] == ["BIBB", "FULTON"]
@@ -52,3 +52,37 @@ class TestSeedDevExecution:
         assert result.exit_code == 0
         mock_asyncio.run.assert_called_once()
         mock_seed.assert_called_once()
+
+
+class TestSeedDevFacets:
+    """Verify seed-dev rebuilds the voter filter facets."""
+
+    async def test_seed_refreshes_all_filter_facets(self) -> None:
+        """Seeded voters bypass imports, so every county's facets are rebuilt after the commit."""
+        from voter_api.cli.seed_dev_cmd import _seed
+
+        session = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        calls = MagicMock()
+        session.commit.side_effect = lambda: calls.commit()
+
+        async def fake_refresh(*_args: object, **_kwargs: object) -> int:
+            calls.refresh()
+            return 1
+
+        with (
+            patch("voter_api.core.config.get_settings", return_value=MagicMock(password_bcrypt_rounds=5)),
+            patch("voter_api.cli.seed_dev_cmd.init_engine"),
+            patch("voter_api.cli.seed_dev_cmd.get_engine"),
+            patch("voter_api.cli.seed_dev_cmd.dispose_engine", new_callable=AsyncMock),
+            patch("voter_api.cli.seed_dev_cmd.async_sessionmaker", return_value=factory),
+            patch("voter_api.cli.seed_dev_cmd.hash_password", return_value="hashed") as hash_password,
+            patch("voter_api.cli.seed_dev_cmd.refresh_voter_filter_facets", side_effect=fake_refresh) as refresh,
+        ):
+            await _seed()
+
+        refresh.assert_awaited_once_with(session)
+        hash_password.assert_called_once_with("Dev-Password-2024!", rounds=5)
+        assert [c[0] for c in calls.mock_calls] == ["commit", "refresh"]
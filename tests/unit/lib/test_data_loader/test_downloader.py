@@ -1,7 +1,13 @@
 """Unit tests for the file downloader."""
 
 import hashlib
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from unittest.mock import patch
 
 import httpx
 import pytest
@@ -9,7 +15,9 @@ import pytest
 from voter_api.lib.data_loader.downloader import (
     _compute_sha512,
     _is_cached,
+    _sidecar_path,
     download_file,
+    download_files,
     resolve_download_path,
 )
 from voter_api.lib.data_loader.types import DataFileEntry, FileCategory
@@ -109,6 +117,40 @@ class TestIsCached:
         file = tmp_path / "nonexistent.zip"
         assert _is_cached(file, "a" * 128) is False
 
+    def test_records_digest_sidecar(self, tmp_path: Path) -> None:
+        content = b"test content"
+        file = tmp_path / "test.zip"
+        file.write_bytes(content)
+        expected = hashlib.sha512(content).hexdigest()
+
+        _is_cached(file, expected)
+
+        record = json.loads(_sidecar_path(file).read_text())
+        assert record["sha512"] == expected
+        assert record["size"] == len(content)
+
+    def test_valid_sidecar_skips_rehash(self, tmp_path: Path) -> None:
+        content = b"test content"
+        file = tmp_path / "test.zip"
+        file.write_bytes(content)
+        expected = hashlib.sha512(content).hexdigest()
+        _is_cached(file, expected)
+
+        with patch("voter_api.lib.data_loader.downloader._compute_sha512") as mock_hash:
+            assert _is_cached(file, expected) is True
+        mock_hash.assert_not_called()
+
+    def test_stale_sidecar_triggers_rehash(self, tmp_path: Path) -> None:
+        file = tmp_path / "test.zip"
+        file.write_bytes(b"old content")
+        _is_cached(file, "a" * 128)
+
+        file.write_bytes(b"new, longer content")
+        expected = hashlib.sha512(b"new, longer content").hexdigest()
+
+        assert _is_cached(file, expected) is True
+        assert json.loads(_sidecar_path(file).read_text())["sha512"] == expected
+
 
 @pytest.mark.asyncio
 class TestDownloadFile:
@@ -140,6 +182,8 @@ class TestDownloadFile:
         assert result.verified is True
         assert result.local_path == dest
         assert dest.read_bytes() == content
+        # The streamed digest is recorded so the next run skips re-hashing.
+        assert json.loads(_sidecar_path(dest).read_text())["sha512"] == sha
 
     async def test_checksum_mismatch_discards_file(
         self,
@@ -336,3 +380,107 @@ class TestDownloadFile:
 
         assert result.success is False
         assert "Download failed" in (result.error or "")
+
+
+class _SlowHandler(SimpleHTTPRequestHandler):
+    """Serves files from the server directory, tracking concurrent requests."""
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:  # type: ignore[attr-defined]
+            server.in_flight += 1  # type: ignore[attr-defined]
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)  # type: ignore[attr-defined]
+        try:
+            time.sleep(0.1)
+            super().do_GET()
+        finally:
+            with server.lock:  # type: ignore[attr-defined]
+                server.in_flight -= 1  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def file_server(tmp_path: Path) -> Iterator[tuple[str, ThreadingHTTPServer, Path]]:
+    """Local HTTP server standing in for the Data Root."""
+    root = tmp_path / "remote"
+    root.mkdir()
+
+    def handler(*args, **kwargs):  # type: ignore[no-untyped-def]
+        return _SlowHandler(*args, directory=str(root), **kwargs)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    server.in_flight = 0  # type: ignore[attr-defined]
+    server.max_in_flight = 0  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", server, root
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _publish(root: Path, name: str, content: bytes) -> DataFileEntry:
+    (root / name).write_bytes(content)
+    return DataFileEntry(
+        filename=name,
+        sha512=hashlib.sha512(content).hexdigest(),
+        category=FileCategory.VOTER,
+        size_bytes=len(content),
+    )
+
+
+@pytest.mark.asyncio
+class TestDownloadFiles:
+    """Tests for download_files() against a local HTTP server."""
+
+    async def test_downloads_in_parallel_up_to_limit(
+        self, tmp_path: Path, file_server: tuple[str, ThreadingHTTPServer, Path]
+    ) -> None:
+        base_url, server, root = file_server
+        entries = [_publish(root, f"f{i}.csv", f"content {i}".encode()) for i in range(4)]
+        jobs = [(e, f"{base_url}/{e.filename}", tmp_path / "out" / e.filename) for e in entries]
+
+        results = [r async for r in download_files(jobs, max_concurrency=2)]
+
+        assert len(results) == 4
+        assert all(r.success and r.downloaded for r in results)
+        assert server.max_in_flight == 2  # type: ignore[attr-defined]
+        assert (tmp_path / "out" / "f3.csv").read_bytes() == b"content 3"
+
+    async def test_rerun_uses_cache(self, tmp_path: Path, file_server: tuple[str, ThreadingHTTPServer, Path]) -> None:
+        base_url, _, root = file_server
+        entry = _publish(root, "voters.csv", b"voter rows")
+        jobs = [(entry, f"{base_url}/voters.csv", tmp_path / "voters.csv")]
+        [r async for r in download_files(jobs)]
+
+        with patch("voter_api.lib.data_loader.downloader._compute_sha512") as mock_hash:
+            results = [r async for r in download_files(jobs)]
+
+        assert results[0].success is True
+        assert results[0].downloaded is False
+        mock_hash.assert_not_called()
+
+    async def test_stop_on_error_skips_remaining(
+        self, tmp_path: Path, file_server: tuple[str, ThreadingHTTPServer, Path]
+    ) -> None:
+        base_url, _, root = file_server
+        missing = DataFileEntry(filename="missing.csv", sha512="a" * 128, category=FileCategory.VOTER, size_bytes=1)
+        present = _publish(root, "present.csv", b"rows")
+        jobs = [
+            (missing, f"{base_url}/missing.csv", tmp_path / "missing.csv"),
+            (present, f"{base_url}/present.csv", tmp_path / "present.csv"),
+        ]
+
+        results = [r async for r in download_files(jobs, max_concurrency=1, stop_on_error=True)]
+
+        assert [r.entry.filename for r in results] == ["missing.csv"]
+        assert results[0].success is False
+        assert not (tmp_path / "present.csv").exists()
+
+    async def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            [r async for r in download_files([], max_concurrency=0)]
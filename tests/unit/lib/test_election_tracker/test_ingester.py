@@ -9,6 +9,7 @@ from voter_api.lib.election_tracker.ingester import (
     _find_ballot_item,
     _normalize_county_name,
     detect_election_type,
+    ingest_all_election_results,
     ingest_election_results,
 )
 from voter_api.lib.election_tracker.parser import (
@@ -490,6 +491,48 @@ class TestIngestMultiRace:
         assert fulton.results_data[0]["voteCount"] == 200
 
 
+class TestIngestAllElectionResults:
+    """Tests for ingest_all_election_results()."""
+
+    def test_matches_per_item_extraction(self):
+        """Single-pass results equal one ingest_election_results() call per contest."""
+        feed = _make_multi_race_feed()
+        results = ingest_all_election_results(feed)
+
+        assert list(results) == ["S10", "S11", "S12"]
+        for ballot_item_id, result in results.items():
+            assert result == ingest_election_results(feed, ballot_item_id=ballot_item_id)
+
+    def test_county_without_contest_is_skipped(self):
+        results = ingest_all_election_results(_make_multi_race_feed())
+
+        assert [c.county_name for c in results["S12"].counties] == ["Fulton County"]
+
+    def test_county_only_ballot_item_is_ignored(self):
+        feed = _make_multi_race_feed()
+        feed.localResults[0].ballotItems.append(
+            BallotItem(id="LOCAL1", name="County Commission", ballotOptions=[BallotOption(id="x", name="X")])
+        )
+
+        assert "LOCAL1" not in ingest_all_election_results(feed)
+
+    def test_duplicate_county_ballot_item_uses_first(self):
+        feed = _make_multi_race_feed()
+        feed.localResults[1].ballotItems.append(
+            BallotItem(id="S10", name="PSC - District 2", ballotOptions=[BallotOption(id="c1", name="Dup")])
+        )
+
+        pulaski = ingest_all_election_results(feed)["S10"].counties[1]
+        assert pulaski.results_data[0]["voteCount"] == 30
+
+    def test_empty_county_name_is_skipped(self):
+        feed = _make_multi_race_feed()
+        feed.localResults[0].name = "   "
+
+        results = ingest_all_election_results(feed)
+        assert [c.county_name_normalized for c in results["S10"].counties] == ["Pulaski"]
+
+
 class TestDetectElectionType:
     """Tests for detect_election_type()."""
 
@@ -1,8 +1,14 @@
-"""Unit tests for the normalize_registration_number utility."""
+"""Unit tests for the voter data normalization utilities."""
 
 import pytest
 
-from voter_api.lib.normalize import normalize_registration_number
+from voter_api.lib.normalize import (
+    district_key_sql,
+    normalize_district_identifier,
+    normalize_registration_number,
+    normalize_search_name,
+    search_name_sql,
+)
 
 
 class TestNormalizeRegistrationNumber:
@@ -34,3 +40,62 @@ class TestNormalizeRegistrationNumber:
     def test_normalize(self, raw: str, expected: str) -> None:
         """Registration number is normalized correctly."""
         assert normalize_registration_number(raw) == expected
+
+
+class TestNormalizeDistrictIdentifier:
+    """Tests for canonical district keys."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("005", "5"),
+            ("5", "5"),
+            ("05", "5"),
+            (" 018 ", "18"),
+            ("000", "0"),
+            ("130", "130"),
+            ("HO7", "HO7"),
+            ("2A", "2A"),
+            ("", None),
+            ("   ", None),
+            (None, None),
+        ],
+    )
+    def test_normalize(self, raw: str | None, expected: str | None) -> None:
+        """Numeric identifiers lose padding; others are only trimmed."""
+        assert normalize_district_identifier(raw) == expected
+
+    def test_padded_forms_share_a_key(self) -> None:
+        """Every padding width of the same district produces one key."""
+        assert {normalize_district_identifier(v) for v in ("7", "07", "007", "0007")} == {"7"}
+
+    def test_sql_expression_references_column(self) -> None:
+        """The generated-column expression targets the given column."""
+        expr = district_key_sql("state_house_district")
+        assert "btrim(state_house_district)" in expr
+        assert "ltrim(" in expr
+
+
+class TestNormalizeSearchName:
+    """Tests for the search_name normalization."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("John Q. Smith", "john q smith"),
+            ("O'Neil-Smith, Jane", "o neil smith jane"),
+            ("  SMITH   JR ", "smith jr"),
+            ("Zoë", "zo"),
+            ("...", ""),
+        ],
+    )
+    def test_normalize(self, raw: str, expected: str) -> None:
+        """Lowercases and collapses non-alphanumeric runs to single spaces."""
+        assert normalize_search_name(raw) == expected
+
+    def test_sql_expression_mirrors_python(self) -> None:
+        """The generated-column expression uses the same character class and a leading space."""
+        expr = search_name_sql()
+        assert expr.startswith("' ' || ")
+        assert "'[^a-z0-9]+'" in expr
+        assert all(f"coalesce({column}, '')" in expr for column in ("first_name", "middle_name", "last_name"))
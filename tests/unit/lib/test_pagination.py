@@ -0,0 +1,66 @@
+"""Tests for the shared keyset pagination helpers."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from voter_api.lib.pagination import SEARCH_COUNT_CAP, count_total, decode_cursor, encode_cursor
+from voter_api.models.voter import Voter
+
+
+def _scalar(value: object) -> MagicMock:
+    return MagicMock(scalar_one=MagicMock(return_value=value))
+
+
+class TestCursor:
+    """Tests for encode_cursor / decode_cursor."""
+
+    def test_round_trip(self) -> None:
+        key = ["O'NEIL", "ÉMILE", "6f1c0c9e-0000-0000-0000-000000000001"]
+        token = encode_cursor(key)
+        assert "=" not in token
+        assert decode_cursor(token) == key
+
+    @pytest.mark.parametrize("token", ["bogus!", "e30", "MQ"])
+    def test_rejects_malformed_tokens(self, token: str) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(token)
+
+
+class TestCountTotal:
+    """Tests for count_total."""
+
+    @pytest.mark.asyncio
+    async def test_exact_counts_the_primary_key(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = _scalar(42)
+
+        total = await count_total(
+            session, select(Voter.id).where(Voter.county == "BIBB"), count_mode="exact", seen=20, has_more=True
+        )
+
+        assert total == (42, True)
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT count(voters.id) AS count_1 \nFROM voters \nWHERE voters.county =")
+
+    @pytest.mark.asyncio
+    async def test_capped_reports_cap_when_exceeded(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = _scalar(SEARCH_COUNT_CAP + 1)
+
+        assert await count_total(session, select(Voter.id), count_mode="capped", seen=20, has_more=True) == (
+            SEARCH_COUNT_CAP,
+            False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_estimate_never_below_rows_seen(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = _scalar([{"Plan": {"Plan Rows": 3}}])
+
+        assert await count_total(session, select(Voter.id), count_mode="estimate", seen=40, has_more=True) == (
+            41,
+            False,
+        )
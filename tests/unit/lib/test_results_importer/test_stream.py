@@ -0,0 +1,162 @@
+"""Unit tests for streaming results file loading."""
+
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from voter_api.lib.results_importer import iter_local_results, load_results_file, load_results_header
+from voter_api.lib.results_importer.stream import _JsonReader
+
+
+def _county(n: int) -> dict[str, Any]:
+    return {
+        "id": f"c{n}",
+        "name": f"County {n} County",
+        "ballotItems": [
+            {
+                "id": "S1",
+                "name": "Contest 1",
+                "ballotOptions": [
+                    {
+                        "id": "1",
+                        "name": "Candidate \\u00e9 (Rep)",
+                        "voteCount": 1000 + n,
+                        "politicalParty": "Rep",
+                        "precinctResults": [{"id": f"P{p}", "voteCount": p} for p in range(5)],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def _feed(**overrides: Any) -> dict[str, Any]:
+    feed: dict[str, Any] = {
+        "electionDate": "2024-11-05",
+        "electionName": "November 5, 2024 General Election",
+        "createdAt": "2024-11-20T12:00:00Z",
+        "results": {
+            "id": "GA",
+            "name": "Georgia",
+            "ballotItems": [{"id": "S1", "name": "Contest 1", "ballotOptions": [{"id": "1", "name": "Candidate"}]}],
+        },
+        "localResults": [_county(n) for n in range(4)],
+    }
+    feed.update(overrides)
+    return feed
+
+
+def _write(tmp_path: Path, data: Any) -> Path:
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+class TestJsonReader:
+    """Tests for the pull reader across buffer boundaries."""
+
+    @pytest.mark.parametrize("read_size", [1, 3, 7, 64])
+    def test_reads_nested_values_at_any_buffer_size(self, read_size: int) -> None:
+        doc = {"a": 12345, "b": [1, {"c": "x,}]"}, None], "d": -0.5e3, "e": [], "f": {}}
+        reader = _JsonReader(io.StringIO(json.dumps(doc, indent=1)), read_size=read_size)
+
+        values = {}
+        for key in reader.members():
+            if key == "b":
+                values[key] = list(reader.items())
+            else:
+                values[key] = reader.value()
+
+        assert values == doc
+
+    @pytest.mark.parametrize("read_size", [1, 2, 3, 7])
+    def test_numbers_split_at_any_boundary(self, read_size: int) -> None:
+        text = '{"a": 12.5, "b": 1, "c": [-2.5e10, 0.125, 1E-7, 3e+2, -0.0], "d": 98765.4321}'
+        reader = _JsonReader(io.StringIO(text), read_size=read_size)
+
+        values = {}
+        for key in reader.members():
+            values[key] = list(reader.items()) if key == "c" else reader.value()
+
+        assert values == json.loads(text)
+
+    def test_trailing_number_is_not_truncated(self) -> None:
+        reader = _JsonReader(io.StringIO('{"n": 1234567}'), read_size=8)
+        keys = reader.members()
+        assert next(keys) == "n"
+        assert reader.value() == 1234567
+
+    def test_null_array_is_empty(self) -> None:
+        reader = _JsonReader(io.StringIO("null"))
+        assert list(reader.items()) == []
+
+    def test_malformed_json_raises(self) -> None:
+        reader = _JsonReader(io.StringIO('{"a": 1 "b": 2}'), read_size=4)
+        keys = reader.members()
+        next(keys)
+        reader.value()
+        with pytest.raises(json.JSONDecodeError, match="','"):
+            next(keys)
+
+
+class TestLoadResultsHeader:
+    """Tests for load_results_header."""
+
+    def test_matches_full_load_without_counties(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, _feed())
+
+        header = load_results_header(path)
+
+        assert header.localResults == []
+        assert header.model_dump(exclude={"localResults"}) == load_results_file(path).model_dump(
+            exclude={"localResults"}
+        )
+
+    def test_counties_before_statewide_results(self, tmp_path: Path) -> None:
+        data = _feed()
+        reordered = {"localResults": data.pop("localResults"), **data}
+
+        header = load_results_header(_write(tmp_path, reordered))
+
+        assert header.results.ballotItems[0].id == "S1"
+
+    def test_missing_header_field_fails_validation(self, tmp_path: Path) -> None:
+        data = _feed()
+        del data["createdAt"]
+        with pytest.raises(ValidationError):
+            load_results_header(_write(tmp_path, data))
+
+    def test_file_not_found(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            load_results_header(tmp_path / "missing.json")
+
+    def test_invalid_json(self, tmp_path: Path) -> None:
+        path = tmp_path / "bad.json"
+        path.write_text("not json")
+        with pytest.raises(json.JSONDecodeError):
+            load_results_header(path)
+
+
+class TestIterLocalResults:
+    """Tests for iter_local_results."""
+
+    def test_matches_full_load(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, _feed())
+
+        assert list(iter_local_results(path)) == load_results_file(path).localResults
+
+    def test_null_local_results(self, tmp_path: Path) -> None:
+        assert list(iter_local_results(_write(tmp_path, _feed(localResults=None)))) == []
+
+    def test_malformed_county_fails_at_that_county(self, tmp_path: Path) -> None:
+        data = _feed()
+        del data["localResults"][2]["name"]
+        counties = iter_local_results(_write(tmp_path, data))
+
+        assert [c.id for c in (next(counties), next(counties))] == ["c0", "c1"]
+        with pytest.raises(ValidationError):
+            next(counties)
@@ -232,3 +232,29 @@ class TestGetVoterFilterOptions:
         assert "county_precincts" not in data
         assert "county_commission_districts" not in data
         assert "school_board_districts" not in data
+
+    async def test_include_counts(self, client: AsyncClient) -> None:
+        """include_counts is forwarded and per-option counts are serialized."""
+        options = {**_FILTER_OPTIONS, "counts": {"statuses": {"A": 9, "I": 1}}}
+        with patch(
+            "voter_api.api.v1.voters.get_voter_filter_options",
+            new_callable=AsyncMock,
+            return_value=options,
+        ) as mock_svc:
+            resp = await client.get("/api/v1/voters/filters?include_counts=true")
+
+        assert resp.status_code == 200
+        assert mock_svc.call_args.kwargs["with_counts"] is True
+        assert resp.json()["counts"] == {"statuses": {"A": 9, "I": 1}}
+
+    async def test_counts_omitted_by_default(self, client: AsyncClient) -> None:
+        """Counts are not part of the default response."""
+        with patch(
+            "voter_api.api.v1.voters.get_voter_filter_options",
+            new_callable=AsyncMock,
+            return_value=_FILTER_OPTIONS,
+        ) as mock_svc:
+            resp = await client.get("/api/v1/voters/filters")
+
+        assert mock_svc.call_args.kwargs["with_counts"] is False
+        assert "counts" not in resp.json()
@@ -1,10 +1,20 @@
 """Tests for the background task runner module."""
 
 import asyncio
+import uuid
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from voter_api.core.background import InProcessTaskRunner, JobStatus
+from voter_api.core.background import (
+    InProcessTaskRunner,
+    JobStatus,
+    QueuedTaskRunner,
+    get_task_runner,
+    task_runner,
+)
+from voter_api.services.job_tasks import JobTask
 
 
 class TestJobStatus:
@@ -101,3 +111,66 @@ class TestInProcessTaskRunner:
             assert runner.get_status(job_id) == JobStatus.COMPLETED
 
         assert sorted(results) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_submit_job_runs_registered_task(self) -> None:
+        runner = InProcessTaskRunner()
+        run = AsyncMock()
+        task = JobTask("exports", run, AsyncMock())
+
+        with patch("voter_api.services.job_tasks.get_job_task", return_value=task) as lookup:
+            job_id = await runner.submit_job("export", {"job_id": "abc"})
+            await asyncio.sleep(0.1)
+
+        lookup.assert_called_once_with("export")
+        run.assert_awaited_once_with({"job_id": "abc"})
+        assert runner.get_status(job_id) == JobStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_submit_job_unknown_task_raises(self) -> None:
+        runner = InProcessTaskRunner()
+
+        with pytest.raises(ValueError, match="Unknown background task"):
+            await runner.submit_job("nope", {})
+
+
+class TestQueuedTaskRunner:
+    """Tests for QueuedTaskRunner."""
+
+    @pytest.mark.asyncio
+    async def test_submit_job_enqueues(self) -> None:
+        session = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        queued = MagicMock(id=uuid.uuid4())
+
+        with (
+            patch("voter_api.core.database.get_session_factory", return_value=factory),
+            patch(
+                "voter_api.services.job_queue_service.enqueue_job", new_callable=AsyncMock, return_value=queued
+            ) as enqueue,
+            patch("voter_api.core.background.get_settings", return_value=MagicMock(job_max_attempts=4)),
+        ):
+            job_id = await QueuedTaskRunner().submit_job("geocoding", {"job_id": "abc"})
+
+        assert job_id == str(queued.id)
+        enqueue.assert_awaited_once_with(session, "geocoding", {"job_id": "abc"}, max_attempts=4)
+
+
+class TestGetTaskRunner:
+    """Tests for get_task_runner backend selection."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        get_task_runner.cache_clear()
+        yield
+        get_task_runner.cache_clear()
+
+    def test_inprocess_backend_returns_singleton(self) -> None:
+        with patch("voter_api.core.background.get_settings", return_value=MagicMock(task_backend="inprocess")):
+            assert get_task_runner() is task_runner
+
+    def test_queue_backend_returns_queued_runner(self) -> None:
+        with patch("voter_api.core.background.get_settings", return_value=MagicMock(task_backend="queue")):
+            assert isinstance(get_task_runner(), QueuedTaskRunner)
@@ -0,0 +1,87 @@
+"""Tests for the in-process LRU cache."""
+
+import pytest
+
+from voter_api.core.cache import LRUCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+
+    def test_get_missing_returns_none(self) -> None:
+        cache: LRUCache[str, int] = LRUCache()
+        assert cache.get("missing") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_set_and_get(self) -> None:
+        cache: LRUCache[str, int] = LRUCache()
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self) -> None:
+        clock = FakeClock()
+        cache: LRUCache[str, int] = LRUCache(ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_override(self) -> None:
+        clock = FakeClock()
+        cache: LRUCache[str, int] = LRUCache(ttl_seconds=100, clock=clock)
+        cache.set("short", 1, ttl_seconds=1)
+        clock.now = 2
+        assert cache.get("short") is None
+
+    def test_pop(self) -> None:
+        cache: LRUCache[str, int] = LRUCache()
+        cache.set("a", 1)
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+
+    def test_invalidate_where(self) -> None:
+        cache: LRUCache[tuple[str, int], int] = LRUCache()
+        cache.set(("x", 1), 1)
+        cache.set(("x", 2), 2)
+        cache.set(("y", 1), 3)
+
+        removed = cache.invalidate_where(lambda k: k[0] == "x")
+
+        assert removed == 2
+        assert cache.get(("y", 1)) == 3
+
+    def test_clear_resets_counters(self) -> None:
+        cache: LRUCache[str, int] = LRUCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.clear()
+        assert cache.stats() == {"entries": 0, "max_entries": 256, "hits": 0, "misses": 0}
+
+    def test_rejects_non_positive_size(self) -> None:
+        with pytest.raises(ValueError, match="max_entries"):
+            LRUCache(max_entries=0)
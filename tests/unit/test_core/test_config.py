@@ -25,13 +25,35 @@ class TestSettings:
         assert settings.jwt_algorithm == "HS256"
         assert settings.jwt_access_token_expire_minutes == 30
         assert settings.jwt_refresh_token_expire_days == 7
+        assert settings.password_bcrypt_rounds == 12
+        assert settings.password_hash_workers == 2
+        assert settings.password_hash_max_queue == 32
+        assert settings.auth_principal_cache_ttl_seconds == 30.0
         assert settings.geocoder_batch_size == 100
         assert settings.import_batch_size == 5000
+        assert settings.import_workers == 0
+        assert settings.import_queue_depth == 4
+        assert settings.results_stream_threshold_mb == 64
+        assert settings.name_search_min_token_length == 2
+        assert settings.task_backend == "queue"
+        assert settings.worker_concurrency_map == {"imports": 1, "geocoding": 1, "analysis": 1, "exports": 2}
+        assert settings.worker_heartbeat_interval == 15.0
+        assert settings.worker_stale_after == 120.0
+        assert settings.job_max_attempts == 3
+        assert settings.instrumentation_enabled is True
+        assert settings.server_timing_enabled is False
+        assert settings.slow_query_ms == 500
+        assert settings.n_plus_one_threshold == 25
+        assert settings.metrics_enabled is False
         assert settings.export_dir == "./exports"
         assert settings.log_level == "INFO"
         assert settings.cors_origins == ""
         assert settings.api_v1_prefix == "/api/v1"
         assert settings.rate_limit_per_minute == 200
+        assert settings.rate_limit_backend == "memory"
+        assert settings.rate_limit_max_clients == 100_000
+        assert settings.rate_limit_pool_size == 2
+        assert settings.rate_limit_db_timeout_ms == 250
 
     def test_cors_origin_list(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """CORS origins string is parsed into a list."""
@@ -94,3 +116,20 @@ class TestSettings:
         monkeypatch.setenv("DATABASE_SCHEMA", "42pr")
         with pytest.raises(ValidationError, match="Invalid database_schema"):
             Settings(_env_file=None)  # type: ignore[call-arg]
+
+    def test_worker_concurrency_map_parses_pairs(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """worker_concurrency parses queue:count pairs and drops disabled queues."""
+        monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://localhost/db")
+        monkeypatch.setenv("JWT_SECRET_KEY", "test-secret-key-that-is-at-least-32-characters-long")
+        monkeypatch.setenv("WORKER_CONCURRENCY", " imports:2, geocoding:0 ,exports:1,")
+        settings = Settings(_env_file=None)  # type: ignore[call-arg]
+        assert settings.worker_concurrency_map == {"imports": 2, "exports": 1}
+
+    def test_worker_concurrency_map_rejects_malformed_entry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """worker_concurrency entries must be queue:count."""
+        monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://localhost/db")
+        monkeypatch.setenv("JWT_SECRET_KEY", "test-secret-key-that-is-at-least-32-characters-long")
+        monkeypatch.setenv("WORKER_CONCURRENCY", "imports")
+        settings = Settings(_env_file=None)  # type: ignore[call-arg]
+        with pytest.raises(ValueError, match="expected queue:count"):
+            _ = settings.worker_concurrency_map
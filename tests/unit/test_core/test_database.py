@@ -85,6 +85,23 @@ class TestInitEngine:
             init_engine("sqlite+aiosqlite:///:memory:", echo=False)
             mock_create.assert_called_once_with("sqlite+aiosqlite:///:memory:", echo=False)
 
+    @pytest.mark.asyncio
+    async def test_slow_query_ms_instruments_engine(self) -> None:
+        """init_engine attaches SQL instrumentation when slow_query_ms is given."""
+        from sqlalchemy import text
+
+        from voter_api.core.instrumentation import start_request_stats, stop_request_stats
+
+        engine = init_engine("sqlite+aiosqlite:///:memory:", slow_query_ms=0)
+        stats, token = start_request_stats()
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        finally:
+            stop_request_stats(token)
+            await dispose_engine()
+        assert stats.count == 1
+
 
 class TestDisposeEngine:
     """Tests for dispose_engine."""
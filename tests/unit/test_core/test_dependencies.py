@@ -1,12 +1,90 @@
 """Tests for FastAPI dependency injection module."""
 
-from unittest.mock import MagicMock
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import HTTPException
 
-from voter_api.core.dependencies import filter_by_sensitivity, require_role
+from voter_api.core.config import Settings
+from voter_api.core.dependencies import filter_by_sensitivity, get_current_user, require_role
+from voter_api.core.principal_cache import principal_cache
+from voter_api.core.security import create_access_token
 from voter_api.core.sensitivity import SensitivityTier
+from voter_api.models.user import User
+
+_SECRET = "test-secret-key-not-for-production"
+
+
+def _settings(ttl: float = 30.0) -> Settings:
+    return Settings(
+        database_url="sqlite+aiosqlite:///:memory:",
+        jwt_secret_key=_SECRET,
+        auth_principal_cache_ttl_seconds=ttl,
+    )
+
+
+def _user(*, is_active: bool = True) -> User:
+    return User(
+        id=uuid.uuid4(),
+        username="alice",
+        email="alice@example.com",
+        hashed_password="x",
+        role="analyst",
+        is_active=is_active,
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+def _session(user: User | None) -> AsyncMock:
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=user))
+    return session
+
+
+class TestGetCurrentUser:
+    """Tests for get_current_user and its principal cache."""
+
+    async def test_repeat_token_is_served_from_cache(self) -> None:
+        token = create_access_token("alice", "analyst", _SECRET)
+        user = _user()
+        first_session, second_session = _session(user), _session(None)
+
+        first = await get_current_user(token, first_session, _settings())
+        second = await get_current_user(token, second_session, _settings())
+
+        assert first is user
+        second_session.execute.assert_not_awaited()
+        assert second is not user
+        assert (second.id, second.username, second.role, second.email) == (user.id, "alice", "analyst", user.email)
+
+    async def test_invalidation_forces_lookup(self) -> None:
+        token = create_access_token("alice", "analyst", _SECRET)
+        await get_current_user(token, _session(_user()), _settings())
+
+        principal_cache.invalidate("alice")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token, _session(_user(is_active=False)), _settings())
+        assert exc_info.value.status_code == 401
+
+    async def test_inactive_user_is_not_cached(self) -> None:
+        token = create_access_token("alice", "analyst", _SECRET)
+        with pytest.raises(HTTPException):
+            await get_current_user(token, _session(_user(is_active=False)), _settings())
+
+        assert principal_cache.stats()["entries"] == 0
+
+    async def test_zero_ttl_disables_cache(self) -> None:
+        token = create_access_token("alice", "analyst", _SECRET)
+        session = _session(_user())
+
+        await get_current_user(token, session, _settings(ttl=0))
+        await get_current_user(token, session, _settings(ttl=0))
+
+        assert session.execute.await_count == 2
+        assert principal_cache.stats()["entries"] == 0
 
 
 class TestRequireRole:
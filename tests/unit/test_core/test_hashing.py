@@ -0,0 +1,62 @@
+"""Tests for the off-loop password hasher."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from voter_api.core.hashing import PasswordHasher, PasswordHashingBusyError
+from voter_api.core.security import bcrypt_rounds, hash_password
+
+
+def _hasher(**overrides: int) -> PasswordHasher:
+    options = {"max_workers": 1, "max_queue": 0, "rounds": 4}
+    options.update(overrides)
+    return PasswordHasher(**options)
+
+
+class TestPasswordHasher:
+    """Tests for PasswordHasher."""
+
+    async def test_hash_and_verify_round_trip(self) -> None:
+        hasher = _hasher()
+
+        hashed = await hasher.hash("s3cret")
+
+        assert bcrypt_rounds(hashed) == 4
+        assert await hasher.verify("s3cret", hashed)
+        assert not await hasher.verify("wrong", hashed)
+        assert hasher.stats() == {"in_flight": 0, "completed": 3, "rejected": 0}
+
+    def test_needs_rehash_below_configured_rounds(self) -> None:
+        hasher = _hasher(rounds=5)
+
+        assert hasher.needs_rehash(hash_password("pw", rounds=4))
+        assert not hasher.needs_rehash(hash_password("pw", rounds=5))
+
+    async def test_full_backlog_rejects_fast(self) -> None:
+        hasher = _hasher(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        def blocking_verify(_password: str, _hashed: str) -> bool:
+            release.wait(timeout=5)
+            return True
+
+        with patch("voter_api.core.hashing.verify_password", side_effect=blocking_verify):
+            running = asyncio.ensure_future(hasher.verify("a", "x"))
+            queued = asyncio.ensure_future(hasher.verify("b", "x"))
+            await asyncio.sleep(0)
+
+            with pytest.raises(PasswordHashingBusyError):
+                await hasher.verify("c", "x")
+
+            release.set()
+            assert await running
+            assert await queued
+
+        assert hasher.stats() == {"in_flight": 0, "completed": 2, "rejected": 1}
+        metrics = hasher.render()
+        assert "voter_api_password_hash_rejected_total 1" in metrics
+        assert 'voter_api_password_hash_seconds_bucket{le="+Inf"} 2' in metrics
+        assert "voter_api_password_hash_wait_seconds_count 2" in metrics
@@ -0,0 +1,169 @@
+"""Tests for SQL instrumentation and request metrics."""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from voter_api.core.instrumentation import (
+    Histogram,
+    RequestMetrics,
+    RequestQueryStats,
+    current_request_stats,
+    instrument_engine,
+    normalize_statement,
+    start_request_stats,
+    stop_request_stats,
+)
+
+
+@pytest.fixture
+async def engine() -> AsyncGenerator[AsyncEngine]:
+    eng = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield eng
+    await eng.dispose()
+
+
+class TestNormalizeStatement:
+    """Tests for normalize_statement."""
+
+    def test_replaces_literals_and_binds(self) -> None:
+        sql = "SELECT * FROM voters WHERE county = 'BIBB' AND birth_year > 1980 AND id = $1 AND x = :name"
+        assert (
+            normalize_statement(sql) == "SELECT * FROM voters WHERE county = ? AND birth_year > ? AND id = ? AND x = ?"
+        )
+
+    def test_in_lists_of_any_length_collapse(self) -> None:
+        assert normalize_statement("SELECT 1 FROM t WHERE id IN ($1, $2, $3)") == normalize_statement(
+            "SELECT 1 FROM t WHERE id IN ($1)"
+        )
+
+    def test_values_rows_collapse(self) -> None:
+        sql = "INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4),\n ($5, $6)"
+        assert normalize_statement(sql) == "INSERT INTO t (a, b) VALUES (?...)"
+
+    def test_keeps_casts_and_identifiers(self) -> None:
+        sql = "SELECT t1.a::text FROM t1   WHERE  t1.b = $1"
+        assert normalize_statement(sql) == "SELECT t1.a::text FROM t1 WHERE t1.b = ?"
+
+
+class TestRequestQueryStats:
+    """Tests for RequestQueryStats."""
+
+    def test_record_and_repeated(self) -> None:
+        stats = RequestQueryStats()
+        for _ in range(5):
+            stats.record("SELECT * FROM voters WHERE id = $1", 0.01)
+        stats.record("SELECT 1", 0.02)
+
+        assert stats.count == 6
+        assert stats.total_seconds == pytest.approx(0.07)
+        assert stats.repeated(5) == [("SELECT * FROM voters WHERE id = ?", 5)]
+        assert stats.repeated(6) == []
+
+
+class TestInstrumentEngine:
+    """Tests for instrument_engine."""
+
+    async def test_statements_are_attributed_to_current_context(self, engine: AsyncEngine) -> None:
+        instrument_engine(engine, slow_query_ms=0)
+        stats, token = start_request_stats()
+        try:
+            assert current_request_stats() is stats
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+        finally:
+            stop_request_stats(token)
+
+        assert stats.count == 2
+        assert stats.statements["SELECT ?"] == 2
+        assert current_request_stats() is None
+
+    async def test_no_context_is_ignored(self, engine: AsyncEngine) -> None:
+        instrument_engine(engine, slow_query_ms=0)
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT 1"))
+        assert result.scalar_one() == 1
+
+    async def test_idempotent(self, engine: AsyncEngine) -> None:
+        instrument_engine(engine, slow_query_ms=0)
+        instrument_engine(engine, slow_query_ms=0)
+        stats, token = start_request_stats()
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        finally:
+            stop_request_stats(token)
+        assert stats.count == 1
+
+    async def test_failed_statement_does_not_skew_later_timings(self, engine: AsyncEngine) -> None:
+        instrument_engine(engine, slow_query_ms=0)
+        stats, token = start_request_stats()
+        try:
+            async with engine.connect() as conn:
+                with pytest.raises(OperationalError):
+                    await conn.execute(text("SELECT * FROM missing_table"))
+                await conn.execute(text("SELECT 1"))
+                raw = await conn.get_raw_connection()
+                assert not any("query_start" in str(key) for key in raw.info)
+        finally:
+            stop_request_stats(token)
+
+        assert stats.count == 1
+        assert stats.statements == {"SELECT ?": 1}
+
+    async def test_slow_query_logged_normalized(self, engine: AsyncEngine) -> None:
+        instrument_engine(engine, slow_query_ms=0.000001)
+        captured: list[str] = []
+        handler_id = logger.add(lambda msg: captured.append(str(msg)), level="WARNING", format="{message}")
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 'secret' AS v"))
+        finally:
+            logger.remove(handler_id)
+
+        assert any("Slow query" in line and "SELECT ? AS v" in line for line in captured)
+        assert not any("secret" in line for line in captured)
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_cumulative_buckets(self) -> None:
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(2.65)
+
+
+class TestRequestMetrics:
+    """Tests for RequestMetrics."""
+
+    def test_render_prometheus_text(self) -> None:
+        metrics = RequestMetrics()
+        stats = RequestQueryStats(count=3, total_seconds=0.02)
+        metrics.observe_request(
+            method="GET", route="/api/v1/voters/{voter_id}", status=200, duration_seconds=0.04, stats=stats
+        )
+
+        text_out = metrics.render()
+
+        assert "# TYPE voter_api_request_duration_seconds histogram" in text_out
+        labels = 'method="GET",route="/api/v1/voters/{voter_id}",status="200"'
+        assert f'voter_api_request_duration_seconds_bucket{{{labels},le="0.05"}} 1' in text_out
+        assert f'voter_api_request_db_queries_bucket{{{labels},le="2"}} 0' in text_out
+        assert f'voter_api_request_db_queries_bucket{{{labels},le="5"}} 1' in text_out
+        assert f"voter_api_request_db_queries_count{{{labels}}} 1" in text_out
+
+    def test_reset(self) -> None:
+        metrics = RequestMetrics()
+        metrics.observe_request(method="GET", route="/x", status=200, duration_seconds=0.01, stats=RequestQueryStats())
+        metrics.reset()
+        assert "route=" not in metrics.render()
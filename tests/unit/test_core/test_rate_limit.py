@@ -0,0 +1,197 @@
+"""Tests for the token-bucket rate limit backends."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+import voter_api.core.rate_limit as rate_limit_module
+from voter_api.core.rate_limit import (
+    MemoryRateLimitBackend,
+    PostgresRateLimitBackend,
+    _take_token_statement,
+    create_rate_limit_backend,
+    dispose_rate_limit_engine,
+    get_rate_limit_session_factory,
+    init_rate_limit_engine,
+)
+
+
+def _mock_factory(first_row: object = None) -> tuple[MagicMock, AsyncMock]:
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(first=MagicMock(return_value=first_row))
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory, session
+
+
+class TestMemoryRateLimitBackend:
+    """Tests for MemoryRateLimitBackend."""
+
+    async def test_allows_burst_up_to_limit(self) -> None:
+        backend = MemoryRateLimitBackend()
+
+        results = [await backend.hit("a", 3, 1000.0) for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    async def test_refills_at_limit_per_minute(self) -> None:
+        backend = MemoryRateLimitBackend()
+        for _ in range(60):
+            await backend.hit("a", 60, 1000.0)
+
+        assert await backend.hit("a", 60, 1000.5) is False
+        assert await backend.hit("a", 60, 1001.0) is True
+        assert await backend.hit("a", 60, 1001.0) is False
+
+    async def test_refill_capped_at_limit(self) -> None:
+        backend = MemoryRateLimitBackend()
+        await backend.hit("a", 2, 1000.0)
+
+        results = [await backend.hit("a", 2, 5000.0) for _ in range(3)]
+
+        assert results == [True, True, False]
+
+    async def test_rejected_hits_do_not_spend(self) -> None:
+        backend = MemoryRateLimitBackend()
+        await backend.hit("a", 1, 1000.0)
+        for _ in range(10):
+            assert await backend.hit("a", 1, 1030.0) is False
+
+        assert await backend.hit("a", 1, 1060.0) is True
+
+    async def test_clients_have_separate_buckets(self) -> None:
+        backend = MemoryRateLimitBackend()
+        await backend.hit("a", 1, 1000.0)
+
+        assert await backend.hit("a", 1, 1000.0) is False
+        assert await backend.hit("b", 1, 1000.0) is True
+
+    async def test_evicts_least_recently_seen_client(self) -> None:
+        backend = MemoryRateLimitBackend(max_clients=2)
+        for key in ("a", "b", "c"):
+            await backend.hit(key, 1, 1000.0)
+
+        assert backend.stats()["entries"] == 2
+        # "a" was evicted, so it starts again with a full bucket.
+        assert await backend.hit("a", 1, 1000.0) is True
+        assert await backend.hit("c", 1, 1000.0) is False
+
+
+class TestTakeTokenStatement:
+    """Tests for the shared-bucket UPSERT."""
+
+    def test_spends_only_when_a_token_is_left(self) -> None:
+        sql = str(_take_token_statement("203.0.113.1", 60, 1000.0).compile(dialect=postgresql.dialect()))
+
+        assert "INSERT INTO rate_limit_buckets" in sql
+        assert "ON CONFLICT (key) DO UPDATE SET tokens = (least(" in sql
+        assert "WHERE least(" in sql
+        assert "RETURNING rate_limit_buckets.tokens" in sql
+
+    def test_new_bucket_starts_with_one_token_spent(self) -> None:
+        params = _take_token_statement("203.0.113.1", 60, 1000.0).compile(dialect=postgresql.dialect()).params
+
+        assert params["key"] == "203.0.113.1"
+        assert params["tokens"] == 59.0
+        assert params["updated_at"] == 1000.0
+
+
+class TestRateLimitEngine:
+    """Tests for the rate limiter's dedicated engine."""
+
+    async def test_small_pool_with_short_timeouts(self) -> None:
+        engine = MagicMock(dispose=AsyncMock())
+        with patch("voter_api.core.rate_limit.create_async_engine", return_value=engine) as create:
+            init_rate_limit_engine("postgresql+asyncpg://db/voters", schema="pr_1", pool_size=3, timeout_ms=200)
+            try:
+                assert get_rate_limit_session_factory() is not None
+            finally:
+                await dispose_rate_limit_engine()
+
+        kwargs = create.call_args.kwargs
+        assert kwargs["pool_size"] == 3
+        assert kwargs["max_overflow"] == 0
+        assert kwargs["pool_timeout"] == 0.2
+        assert kwargs["connect_args"] == {
+            "timeout": 0.2,
+            "server_settings": {"statement_timeout": "200", "search_path": "pr_1,public"},
+        }
+        engine.dispose.assert_awaited_once()
+
+    async def test_engine_is_not_instrumented(self) -> None:
+        """Limiter queries stay out of the per-request SQL statistics."""
+        engine = init_rate_limit_engine("postgresql+asyncpg://db/voters")
+        try:
+            assert len(engine.sync_engine.dispatch.before_cursor_execute) == 0
+            assert len(engine.sync_engine.dispatch.after_cursor_execute) == 0
+        finally:
+            await dispose_rate_limit_engine()
+
+    def test_raises_when_not_initialized(self) -> None:
+        original_factory = rate_limit_module._session_factory
+        rate_limit_module._session_factory = None
+        try:
+            with pytest.raises(RuntimeError, match="Rate limit engine not initialized"):
+                get_rate_limit_session_factory()
+        finally:
+            rate_limit_module._session_factory = original_factory
+
+
+class TestPostgresRateLimitBackend:
+    """Tests for PostgresRateLimitBackend."""
+
+    async def test_row_returned_allows(self) -> None:
+        factory, session = _mock_factory(first_row=(59.0,))
+        with patch("voter_api.core.rate_limit.get_rate_limit_session_factory", return_value=factory):
+            assert await PostgresRateLimitBackend().hit("a", 60, 1000.0) is True
+        session.commit.assert_awaited_once()
+
+    async def test_no_row_rejects(self) -> None:
+        factory, _ = _mock_factory(first_row=None)
+        with patch("voter_api.core.rate_limit.get_rate_limit_session_factory", return_value=factory):
+            assert await PostgresRateLimitBackend().hit("a", 60, 1000.0) is False
+
+    async def test_purges_idle_buckets_once_a_minute(self) -> None:
+        factory, session = _mock_factory(first_row=(1.0,))
+        backend = PostgresRateLimitBackend()
+        with patch("voter_api.core.rate_limit.get_rate_limit_session_factory", return_value=factory):
+            await backend.hit("a", 60, 1000.0)
+            await backend.hit("a", 60, 1030.0)
+            await backend.hit("a", 60, 1061.0)
+
+        statements = [str(call.args[0]) for call in session.execute.await_args_list]
+        assert sum(s.startswith("DELETE FROM rate_limit_buckets") for s in statements) == 2
+
+    async def test_database_error_falls_back_to_memory(self) -> None:
+        factory, session = _mock_factory()
+        session.execute.side_effect = OperationalError("SELECT 1", {}, Exception("connection refused"))
+        backend = PostgresRateLimitBackend()
+        with patch("voter_api.core.rate_limit.get_rate_limit_session_factory", return_value=factory):
+            assert await backend.hit("a", 1, 1000.0) is True
+            assert await backend.hit("a", 1, 1000.0) is False
+
+    async def test_uninitialized_engine_falls_back_to_memory(self) -> None:
+        backend = PostgresRateLimitBackend()
+        with patch(
+            "voter_api.core.rate_limit.get_rate_limit_session_factory", side_effect=RuntimeError("not initialized")
+        ):
+            assert await backend.hit("a", 1, 1000.0) is True
+
+
+class TestCreateRateLimitBackend:
+    """Tests for create_rate_limit_backend."""
+
+    def test_memory_by_default(self) -> None:
+        settings = MagicMock(rate_limit_backend="memory", rate_limit_max_clients=10)
+        backend = create_rate_limit_backend(settings)
+        assert isinstance(backend, MemoryRateLimitBackend)
+        assert backend.stats()["max_entries"] == 10
+
+    def test_postgres_backend_keeps_memory_fallback(self) -> None:
+        settings = MagicMock(rate_limit_backend="postgres", rate_limit_max_clients=10)
+        backend = create_rate_limit_backend(settings)
+        assert isinstance(backend, PostgresRateLimitBackend)
+        assert isinstance(backend.fallback, MemoryRateLimitBackend)
@@ -3,6 +3,7 @@
 import pytest
 
 from voter_api.core.security import (
+    bcrypt_rounds,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -19,6 +20,11 @@ class TestPasswordHashing:
         hashed = hash_password("mypassword123")
         assert verify_password("mypassword123", hashed)
 
+    def test_rounds_are_configurable(self) -> None:
+        """The work factor is encoded in the hash."""
+        assert bcrypt_rounds(hash_password("pw", rounds=4)) == 4
+        assert bcrypt_rounds("not-a-bcrypt-hash") == 0
+
     def test_wrong_password_fails(self) -> None:
         """Wrong password fails verification."""
         hashed = hash_password("mypassword123")
@@ -43,6 +49,7 @@ class TestJWT:
         assert payload["sub"] == "testuser"
         assert payload["role"] == "admin"
         assert payload["type"] == "access"
+        assert isinstance(payload["iat"], int)
 
     def test_create_and_decode_refresh_token(self) -> None:
         """Refresh token can be created and decoded."""
@@ -0,0 +1,105 @@
+"""Unit tests for resuming an interrupted process_geocoding_job() from its checkpoint."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from voter_api.models.geocoding_job import GeocodingJob
+from voter_api.services.geocoding_service import process_geocoding_job
+
+
+def _make_job(**overrides: object) -> GeocodingJob:
+    """Create a running GeocodingJob with a saved checkpoint."""
+    job = GeocodingJob(
+        id=uuid.uuid4(),
+        provider="census",
+        status="running",
+        force_regeocode=overrides.pop("force_regeocode", False),
+        county=None,
+    )
+    for key, value in overrides.items():
+        setattr(job, key, value)
+    return job
+
+
+def _scalar(method: str, value: object) -> MagicMock:
+    result = MagicMock()
+    getattr(result, method).return_value = value
+    return result
+
+
+async def _run(job: GeocodingJob, results: list[MagicMock]) -> AsyncMock:
+    geocoder = MagicMock()
+    geocoder.provider_name = "census"
+    geocoder.rate_limit_delay = 0
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=results)
+    with (
+        patch("voter_api.services.geocoding_service.get_configured_providers", return_value=[geocoder]),
+        patch("voter_api.services.geocoding_service.get_settings", return_value=MagicMock()),
+    ):
+        await process_geocoding_job(session, job, batch_size=5)
+    return session
+
+
+def _empty_batch() -> MagicMock:
+    batch = MagicMock()
+    batch.scalars.return_value.all.return_value = []
+    return batch
+
+
+class TestResume:
+    """Tests for checkpoint resume in process_geocoding_job()."""
+
+    async def test_force_regeocode_resumes_from_keyset_cursor(self) -> None:
+        """A forced job restores its counters and seeks past the checkpointed voters."""
+        job = _make_job(
+            force_regeocode=True,
+            last_processed_voter_offset=10,
+            processed=10,
+            succeeded=8,
+            failed=2,
+            cache_hits=3,
+        )
+        cursor_id = uuid.uuid4()
+
+        session = await _run(
+            job,
+            [
+                _scalar("scalar_one", 20),
+                _scalar("scalar_one_or_none", cursor_id),
+                _scalar("scalar_one", "running"),
+                _empty_batch(),
+                _scalar("scalar_one", "running"),
+            ],
+        )
+
+        cursor_sql = str(session.execute.await_args_list[1].args[0])
+        assert "OFFSET" in cursor_sql
+        batch_stmt = session.execute.await_args_list[3].args[0]
+        assert cursor_id in batch_stmt.compile().params.values()
+        assert job.status == "completed"
+        assert (job.processed, job.succeeded, job.failed, job.cache_hits) == (10, 8, 2, 3)
+
+    async def test_incremental_job_restarts_on_remaining_voters(self) -> None:
+        """An incremental job keeps its successes and retries everything still ungeocoded."""
+        job = _make_job(
+            last_processed_voter_offset=10,
+            processed=10,
+            succeeded=8,
+            failed=2,
+            cache_hits=3,
+        )
+
+        session = await _run(
+            job,
+            [
+                _scalar("scalar_one", 12),
+                _scalar("scalar_one", "running"),
+                _empty_batch(),
+                _scalar("scalar_one", "running"),
+            ],
+        )
+
+        assert session.execute.await_count == 4
+        assert job.status == "completed"
+        assert (job.processed, job.succeeded, job.failed, job.cache_hits) == (8, 8, 0, 3)
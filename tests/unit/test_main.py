@@ -19,6 +19,7 @@ class TestCreateApp:
             mock_settings.return_value = Settings(
                 database_url="sqlite+aiosqlite:///:memory:",
                 jwt_secret_key="test-secret-key-not-for-production",
+                task_backend="inprocess",
             )
             return create_app()
 
@@ -40,6 +41,16 @@ class TestCreateApp:
         handler = app.exception_handlers.get(ValueError)
         assert handler is not None
 
+    async def test_hashing_busy_handler_returns_503(self, app) -> None:
+        """A full password hashing backlog is reported as retryable 503."""
+        from voter_api.core.hashing import PasswordHashingBusyError
+
+        handler = app.exception_handlers[PasswordHashingBusyError]
+        response = await handler(None, PasswordHashingBusyError("busy"))
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
 
 class TestRecoverStaleAnalysisRuns:
     """Tests for _recover_stale_analysis_runs."""
@@ -102,7 +113,7 @@ class TestAppLifespan:
 
     @pytest.mark.asyncio
     async def test_lifespan_init_and_dispose(self) -> None:
-        """Lifespan context manager initializes and disposes engine."""
+        """Lifespan context manager initializes and disposes engine and hash pool."""
         from voter_api.core.config import Settings
         from voter_api.main import lifespan
 
@@ -114,18 +125,78 @@ class TestAppLifespan:
             patch("voter_api.main.init_engine") as mock_init_engine,
             patch("voter_api.main.dispose_engine", new_callable=AsyncMock) as mock_dispose,
             patch("voter_api.main._recover_stale_analysis_runs", new_callable=AsyncMock) as mock_recover,
+            patch("voter_api.main.get_password_hasher") as mock_get_hasher,
         ):
             mock_get_settings.return_value = Settings(
                 database_url="sqlite+aiosqlite:///:memory:",
                 jwt_secret_key="test-secret-key-not-for-production",
+                task_backend="inprocess",
             )
 
             async with lifespan(mock_app):
                 mock_setup_logging.assert_called_once()
                 mock_init_engine.assert_called_once()
                 mock_recover.assert_awaited_once()
+                mock_get_hasher.return_value.shutdown.assert_not_called()
 
             mock_dispose.assert_awaited_once()
+            mock_get_hasher.return_value.shutdown.assert_called_once()
+            mock_get_hasher.cache_clear.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_lifespan_manages_rate_limit_engine(self) -> None:
+        """The postgres rate limit backend gets its own engine for the app's lifetime."""
+        from voter_api.core.config import Settings
+        from voter_api.main import lifespan
+
+        with (
+            patch("voter_api.main.get_settings") as mock_get_settings,
+            patch("voter_api.main.setup_logging"),
+            patch("voter_api.main.init_engine"),
+            patch("voter_api.main.dispose_engine", new_callable=AsyncMock),
+            patch("voter_api.main.init_rate_limit_engine") as mock_init_rate_limit,
+            patch("voter_api.main.dispose_rate_limit_engine", new_callable=AsyncMock) as mock_dispose_rate_limit,
+        ):
+            mock_get_settings.return_value = Settings(
+                database_url="postgresql+asyncpg://db/voters",
+                jwt_secret_key="test-secret-key-not-for-production",
+                task_backend="queue",
+                rate_limit_backend="postgres",
+                rate_limit_pool_size=3,
+                rate_limit_db_timeout_ms=100,
+            )
+
+            async with lifespan(AsyncMock()):
+                mock_init_rate_limit.assert_called_once_with(
+                    "postgresql+asyncpg://db/voters", schema=None, pool_size=3, timeout_ms=100
+                )
+
+            mock_dispose_rate_limit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_lifespan_teardown_does_not_create_hash_pool(self) -> None:
+        """Teardown only shuts down a hash pool that requests actually created."""
+        from voter_api.core.config import Settings
+        from voter_api.core.hashing import get_password_hasher
+        from voter_api.main import lifespan
+
+        get_password_hasher.cache_clear()
+        with (
+            patch("voter_api.main.get_settings") as mock_get_settings,
+            patch("voter_api.main.setup_logging"),
+            patch("voter_api.main.init_engine"),
+            patch("voter_api.main.dispose_engine", new_callable=AsyncMock),
+        ):
+            mock_get_settings.return_value = Settings(
+                database_url="sqlite+aiosqlite:///:memory:",
+                jwt_secret_key="test-secret-key-not-for-production",
+                task_backend="queue",
+            )
+
+            async with lifespan(AsyncMock()):
+                pass
+
+        assert get_password_hasher.cache_info().currsize == 0
 
     @pytest.mark.asyncio
     async def test_lifespan_continues_when_recovery_fails(self) -> None:
@@ -155,6 +226,7 @@ class TestAppLifespan:
             mock_get_settings.return_value = Settings(
                 database_url="sqlite+aiosqlite:///:memory:",
                 jwt_secret_key="test-secret-key-not-for-production",
+                task_backend="inprocess",
             )
 
             async with lifespan(mock_app):
@@ -165,3 +237,35 @@ class TestAppLifespan:
             warning_calls = [str(c) for c in mock_logger.warning.call_args_list]
             assert any("analysis runs" in c for c in warning_calls)
             assert any("geocoding jobs" in c for c in warning_calls)
+
+    @pytest.mark.asyncio
+    async def test_lifespan_leaves_queued_jobs_to_the_worker(self) -> None:
+        """With the queue backend, startup does not fail or repair jobs a worker may own."""
+        from voter_api.core.config import Settings
+        from voter_api.main import lifespan
+
+        mock_app = AsyncMock()
+
+        with (
+            patch("voter_api.main.get_settings") as mock_get_settings,
+            patch("voter_api.main.setup_logging"),
+            patch("voter_api.main.init_engine"),
+            patch("voter_api.main.dispose_engine", new_callable=AsyncMock),
+            patch("voter_api.main._recover_stale_analysis_runs", new_callable=AsyncMock) as mock_analysis,
+            patch("voter_api.main._recover_stale_geocoding_jobs", new_callable=AsyncMock) as mock_geocoding,
+            patch("voter_api.main._recover_stale_import_jobs", new_callable=AsyncMock) as mock_imports,
+            patch("voter_api.main._verify_import_db_state", new_callable=AsyncMock) as mock_verify,
+        ):
+            mock_get_settings.return_value = Settings(
+                database_url="sqlite+aiosqlite:///:memory:",
+                jwt_secret_key="test-secret-key-not-for-production",
+                task_backend="queue",
+            )
+
+            async with lifespan(mock_app):
+                pass
+
+        mock_analysis.assert_not_awaited()
+        mock_geocoding.assert_not_awaited()
+        mock_imports.assert_not_awaited()
+        mock_verify.assert_not_awaited()
@@ -150,6 +150,7 @@ class TestLifespanGeocodingRecovery:
             mock_get_settings.return_value = Settings(
                 database_url="sqlite+aiosqlite:///:memory:",
                 jwt_secret_key="test-secret-key-not-for-production",
+                task_backend="inprocess",
             )
 
             async with lifespan(mock_app):
@@ -186,6 +187,7 @@ class TestLifespanGeocodingRecovery:
             mock_get_settings.return_value = Settings(
                 database_url="sqlite+aiosqlite:///:memory:",
                 jwt_secret_key="test-secret-key-not-for-production",
+                task_backend="inprocess",
             )
 
             async with lifespan(mock_app):
@@ -1,4 +1,4 @@
-"""Tests for CORS, security headers, and rate limiting middleware."""
+"""Tests for CORS, security headers, rate limiting, and query instrumentation middleware."""
 
 import time
 from unittest.mock import patch
@@ -6,9 +6,17 @@ from unittest.mock import patch
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from loguru import logger
 from starlette.requests import Request
 
-from voter_api.api.middleware import RateLimitMiddleware, SecurityHeadersMiddleware, get_client_ip
+from voter_api.api.middleware import (
+    QueryInstrumentationMiddleware,
+    RateLimitMiddleware,
+    SecurityHeadersMiddleware,
+    get_client_ip,
+)
+from voter_api.core.instrumentation import RequestMetrics, current_request_stats
+from voter_api.core.rate_limit import MemoryRateLimitBackend
 
 
 def _create_test_app() -> FastAPI:
@@ -113,6 +121,28 @@ class TestRateLimitMiddleware:
             response = client.get("/test")
             assert response.status_code == 200
 
+    def test_backend_shared_between_apps(self) -> None:
+        """Workers sharing a backend share one limit per client."""
+        backend = MemoryRateLimitBackend()
+        clients = []
+        for _ in range(2):
+            app = _create_test_app()
+            app.add_middleware(RateLimitMiddleware, requests_per_minute=2, backend=backend)
+            clients.append(TestClient(app))
+
+        assert clients[0].get("/test").status_code == 200
+        assert clients[1].get("/test").status_code == 200
+        assert clients[0].get("/test").status_code == 429
+        assert clients[1].get("/test").status_code == 429
+
+    def test_zero_limit_disables(self) -> None:
+        app = _create_test_app()
+        app.add_middleware(RateLimitMiddleware, requests_per_minute=0)
+        client = TestClient(app)
+
+        for _ in range(10):
+            assert client.get("/test").status_code == 200
+
 
 def _make_request(headers: dict[str, str] | None = None, client_host: str | None = "127.0.0.1") -> Request:
     """Build a minimal Starlette Request with given headers and client address."""
@@ -230,3 +260,75 @@ class TestRateLimitMiddlewareProxyHeaders:
         # XFF client B should still be allowed
         resp = client.get("/test", headers={"X-Forwarded-For": "198.51.100.2, 10.0.0.1"})
         assert resp.status_code == 200
+
+
+class TestQueryInstrumentationMiddleware:
+    """Tests for QueryInstrumentationMiddleware."""
+
+    @pytest.fixture
+    def metrics(self) -> RequestMetrics:
+        return RequestMetrics()
+
+    @pytest.fixture
+    def client(self, metrics: RequestMetrics) -> TestClient:
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int) -> dict:
+            stats = current_request_stats()
+            assert stats is not None
+            # Stand-in for the engine hooks: one list query + one lookup per item.
+            stats.record("SELECT id FROM items", 0.001)
+            for _ in range(item_id):
+                stats.record("SELECT * FROM details WHERE item_id = $1", 0.001)
+            return {"id": item_id}
+
+        app.add_middleware(QueryInstrumentationMiddleware, n_plus_one_threshold=3, metrics=metrics, server_timing=True)
+        return TestClient(app)
+
+    def test_server_timing_header(self, client: TestClient) -> None:
+        response = client.get("/items/1")
+        header = response.headers["Server-Timing"]
+        assert header.startswith("db;dur=")
+        assert 'desc="2 queries"' in header
+        assert "app;dur=" in header
+
+    def test_server_timing_header_off_by_default(self, metrics: RequestMetrics) -> None:
+        app = FastAPI()
+
+        @app.get("/ping")
+        async def ping() -> dict:
+            return {"ok": True}
+
+        app.add_middleware(QueryInstrumentationMiddleware, metrics=metrics)
+        response = TestClient(app).get("/ping")
+
+        assert "Server-Timing" not in response.headers
+        assert 'route="/ping",status="200"' in metrics.render()
+
+    def test_metrics_use_route_template(self, client: TestClient, metrics: RequestMetrics) -> None:
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/nope")
+
+        rendered = metrics.render()
+        assert (
+            'voter_api_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2' in rendered
+        )
+        assert 'route="unmatched",status="404"' in rendered
+        assert "/items/1" not in rendered
+
+    def test_n_plus_one_warning(self, client: TestClient) -> None:
+        captured: list[str] = []
+        handler_id = logger.add(lambda msg: captured.append(str(msg)), level="WARNING", format="{message}")
+        try:
+            client.get("/items/2")
+            assert not captured
+            client.get("/items/3")
+        finally:
+            logger.remove(handler_id)
+
+        assert len(captured) == 1
+        assert "Possible N+1: GET /items/{item_id}" in captured[0]
+        assert "3 times" in captured[0]
+        assert "SELECT * FROM details WHERE item_id = ?" in captured[0]
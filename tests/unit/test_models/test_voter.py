@@ -0,0 +1,20 @@
+"""Unit tests for Voter model loading behavior."""
+
+from sqlalchemy import inspect
+
+from voter_api.models.geocoded_location import GeocodedLocation
+from voter_api.models.voter import Voter
+
+
+class TestVoterRelationshipLoading:
+    """Bulk voter queries must not fan out into relationship loads."""
+
+    def test_voter_has_no_eager_relationships(self) -> None:
+        """No Voter relationship is loaded implicitly with every SELECT."""
+        eager = {rel.key for rel in inspect(Voter).relationships if rel.lazy in ("selectin", "joined", "subquery")}
+        assert eager == set()
+
+    def test_geocoded_locations_must_be_opted_into(self) -> None:
+        """geocoded_locations raises on implicit access instead of lazy-loading."""
+        assert inspect(Voter).relationships["geocoded_locations"].lazy == "raise"
+        assert inspect(GeocodedLocation).relationships["voter"].lazy == "raise"
@@ -0,0 +1,315 @@
+"""Unit tests for the absentee ballot service: COPY loader, listing, and stats rollup."""
+
+import uuid
+from datetime import UTC, date, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from voter_api.lib.pagination import SEARCH_COUNT_CAP
+from voter_api.services.absentee_service import (
+    _copy_merge_absentee_batch,
+    _upsert_absentee_batch,
+    decode_absentee_cursor,
+    encode_absentee_cursor,
+    get_absentee_stats,
+    process_absentee_import,
+    query_absentee_ballots,
+    query_absentee_ballots_keyset,
+    refresh_absentee_stats,
+)
+
+_SERVICE = "voter_api.services.absentee_service"
+
+
+def _compile(stmt: object) -> str:
+    """Compile a statement for the PostgreSQL dialect (bind parameters left in place)."""
+    return str(stmt.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+def _copy_session(merged: list[int]) -> tuple[AsyncMock, AsyncMock]:
+    """Session whose raw connection records COPY calls; the merge returns ``merged`` is_insert flags."""
+    asyncpg_connection = AsyncMock()
+    connection = AsyncMock()
+    connection.get_raw_connection.return_value = MagicMock(driver_connection=asyncpg_connection)
+    session = AsyncMock()
+    session.connection.return_value = connection
+    session.execute.return_value = MagicMock(all=MagicMock(return_value=[MagicMock(is_insert=m) for m in merged]))
+    return session, asyncpg_connection
+
+
+class TestCopyLoader:
+    """Tests for the COPY + staging-table merge path."""
+
+    async def test_copies_chunk_and_merges_changed_rows(self) -> None:
+        session, asyncpg_connection = _copy_session(merged=[1, 0])
+        records = [
+            {"voter_registration_number": "1", "county": "FULTON", "party": "DEMOCRAT"},
+            {"voter_registration_number": "2", "county": "BIBB"},
+            {"voter_registration_number": "3", "county": "BIBB"},
+        ]
+        job_id = uuid.uuid4()
+
+        inserted, updated, duplicates = await _copy_merge_absentee_batch(session, records, job_id)
+
+        assert (inserted, updated, duplicates) == (1, 1, 0)
+        copy = asyncpg_connection.copy_records_to_table.call_args
+        assert copy.args == ("absentee_staging",)
+        columns = copy.kwargs["columns"]
+        assert columns[:4] == ["seq", "voter_registration_number", "application_date", "ballot_style"]
+        assert "import_job_id" not in columns
+        rows = copy.kwargs["records"]
+        assert [row[0] for row in rows] == [0, 1, 2]
+        assert rows[0][columns.index("party")] == "DEMOCRAT"
+        assert rows[1][columns.index("party")] is None
+
+        create, merge = (call.args[0].text for call in session.execute.await_args_list)
+        assert "CREATE TEMP TABLE absentee_staging ON COMMIT DROP" in create
+        assert "ORDER BY voter_registration_number, application_date, COALESCE(ballot_style, ''), seq DESC" in merge
+        assert "WHERE absentee_ballot_applications.row_hash IS DISTINCT FROM EXCLUDED.row_hash" in merge
+        assert session.execute.await_args_list[1].args[1] == {"import_job_id": job_id}
+
+    async def test_empty_chunk_skips_copy(self) -> None:
+        session, asyncpg_connection = _copy_session(merged=[])
+
+        assert await _copy_merge_absentee_batch(session, [], uuid.uuid4()) == (0, 0, 0)
+        asyncpg_connection.copy_records_to_table.assert_not_awaited()
+
+    async def test_counts_repeated_keys_in_chunk_as_duplicates(self) -> None:
+        session, _ = _copy_session(merged=[1, 1])
+        applied = date(2026, 10, 1)
+        records = [
+            {"voter_registration_number": "1", "application_date": applied, "ballot_style": None},
+            {"voter_registration_number": "1", "application_date": applied, "ballot_style": ""},
+            {"voter_registration_number": "1", "application_date": applied, "ballot_style": "MAIL"},
+            {"voter_registration_number": "2", "application_date": applied},
+        ]
+
+        assert await _copy_merge_absentee_batch(session, records, uuid.uuid4()) == (2, 0, 1)
+
+    async def test_upsert_path_clears_row_hash(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+
+        await _upsert_absentee_batch(session, [{"id": uuid.uuid4(), "voter_registration_number": "1", "county": "X"}])
+
+        compiled = session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        assert "row_hash = %(param_1)s" in str(compiled)
+        assert compiled.params["param_1"] is None
+
+    async def test_import_counts_unchanged_and_duplicate_rows_separately(self) -> None:
+        chunks = [[{"voter_registration_number": str(i), "county": "FULTON"} for i in range(5)]]
+        job = MagicMock(id=uuid.uuid4(), last_processed_offset=0)
+        with (
+            patch(f"{_SERVICE}.parse_absentee_csv_chunks", return_value=iter(chunks)),
+            patch(f"{_SERVICE}._copy_merge_absentee_batch", new_callable=AsyncMock, return_value=(1, 1, 2)) as merge,
+            patch(f"{_SERVICE}.refresh_absentee_stats", new_callable=AsyncMock),
+        ):
+            await process_absentee_import(AsyncMock(), job, Path("absentee.csv"), use_copy=True)
+
+        merge.assert_awaited_once()
+        assert (job.records_inserted, job.records_updated, job.records_skipped) == (1, 1, 1)
+        assert job.records_deduplicated == 2
+        assert job.records_succeeded == 5
+
+
+def _application(created_at: datetime | None = None) -> MagicMock:
+    record = MagicMock()
+    record.id = uuid.uuid4()
+    record.created_at = created_at or datetime(2026, 10, 19, 12, 30, tzinfo=UTC)
+    return record
+
+
+def _rows(records: list[MagicMock]) -> MagicMock:
+    return MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=records))))
+
+
+def _scalar(value: object) -> MagicMock:
+    return MagicMock(scalar_one=MagicMock(return_value=value))
+
+
+class TestQueryAbsenteeBallots:
+    """Tests for the offset and keyset listing queries."""
+
+    async def test_offset_page_orders_by_created_at_and_id(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [_scalar(7), _rows([_application()])]
+
+        records, total = await query_absentee_ballots(session, county="FULTON", page=3, page_size=2)
+
+        assert total == 7
+        assert len(records) == 1
+        sql = _compile(session.execute.call_args_list[1].args[0])
+        assert "ORDER BY absentee_ballot_applications.created_at DESC, absentee_ballot_applications.id DESC" in sql
+        assert "absentee_ballot_applications.county = %(county_1)s" in sql
+
+    def test_cursor_round_trip(self) -> None:
+        record = _application()
+
+        assert decode_absentee_cursor(encode_absentee_cursor(record)) == (record.created_at, record.id)
+
+    async def test_cursor_pages_after_position_without_offset(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [_rows([_application() for _ in range(3)]), _scalar(40)]
+        cursor = encode_absentee_cursor(_application())
+
+        page = await query_absentee_ballots_keyset(
+            session, county="FULTON", party="DEMOCRAT", cursor=cursor, page_size=2, count_mode="exact"
+        )
+
+        sql = _compile(session.execute.call_args_list[0].args[0])
+        assert (
+            "(absentee_ballot_applications.created_at, absentee_ballot_applications.id) < "
+            "(%(param_1)s::TIMESTAMP WITH TIME ZONE, %(param_2)s::UUID)" in sql
+        )
+        assert "OFFSET" not in sql
+        assert "LIMIT %(param_3)s" in sql
+        assert len(page.records) == 2
+        assert page.next_cursor == encode_absentee_cursor(page.records[-1])
+        assert (page.total, page.total_is_exact) == (40, True)
+
+    async def test_short_first_page_skips_count(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [_rows([_application()])]
+
+        page = await query_absentee_ballots_keyset(session, application_status="A", page_size=25)
+
+        assert session.execute.await_count == 1
+        assert (page.total, page.total_is_exact, page.next_cursor) == (1, True, None)
+
+    async def test_capped_count(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [_rows([_application() for _ in range(3)]), _scalar(SEARCH_COUNT_CAP + 1)]
+
+        page = await query_absentee_ballots_keyset(session, page_size=2, count_mode="capped")
+
+        assert (page.total, page.total_is_exact) == (SEARCH_COUNT_CAP, False)
+
+    async def test_estimate_floors_at_rows_seen(self) -> None:
+        session = AsyncMock()
+        plan = '[{"Plan": {"Plan Rows": 1}}]'
+        session.execute.side_effect = [_rows([_application() for _ in range(3)]), _scalar(plan)]
+
+        page = await query_absentee_ballots_keyset(session, county="FULTON", page=4, page_size=2)
+
+        explain = session.execute.call_args_list[1].args[0]
+        assert _compile(explain).startswith("EXPLAIN (FORMAT JSON) SELECT absentee_ballot_applications.id")
+        # Offset 6 + 2 returned + at least one more row.
+        assert (page.total, page.total_is_exact) == (9, False)
+
+    async def test_invalid_cursor_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await query_absentee_ballots_keyset(AsyncMock(), cursor="bogus")
+
+
+class TestGetAbsenteeStats:
+    """Tests for get_absentee_stats."""
+
+    async def test_reads_rollup_in_one_grouping_sets_query(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            all=MagicMock(
+                return_value=[
+                    (0b111, None, None, None, 30),
+                    (0b011, "FULTON", None, None, 20),
+                    (0b011, "BIBB", None, None, 10),
+                    (0b101, None, "A", None, 25),
+                    (0b101, None, None, None, 5),  # NULL status is left out
+                    (0b110, None, None, "DEMOCRAT", 12),
+                ]
+            )
+        )
+
+        stats = await get_absentee_stats(session)
+
+        assert stats == {
+            "total_applications": 30,
+            "by_county": {"FULTON": 20, "BIBB": 10},
+            "by_status": {"A": 25},
+            "by_party": {"DEMOCRAT": 12},
+        }
+        session.execute.assert_awaited_once()
+        sql = _compile(session.execute.call_args.args[0])
+        assert "FROM absentee_ballot_stats" in sql
+        assert "GROUPING SETS" in sql
+        assert "absentee_ballot_applications" not in sql
+
+    async def test_county_filter(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+
+        stats = await get_absentee_stats(session, county="BIBB")
+
+        assert stats["total_applications"] == 0
+        assert "WHERE absentee_ballot_stats.county =" in _compile(session.execute.call_args.args[0])
+
+    async def test_unmatched_county_returns_zeros(self) -> None:
+        # With no matching rows, only the grand-total set comes back (sum coalesced to 0).
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(all=MagicMock(return_value=[(0b111, None, None, None, 0)]))
+
+        stats = await get_absentee_stats(session, county="NOWHERE")
+
+        assert stats == {"total_applications": 0, "by_county": {}, "by_status": {}, "by_party": {}}
+        sql = _compile(session.execute.call_args.args[0])
+        assert "coalesce(sum(absentee_ballot_stats.application_count)," in sql
+
+
+class TestRefreshAbsenteeStats:
+    """Tests for refresh_absentee_stats."""
+
+    async def test_replaces_only_given_counties(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(rowcount=4)
+
+        written = await refresh_absentee_stats(session, counties={"FULTON", "BIBB"})
+
+        assert written == 4
+        clear, fill = (_compile(call.args[0]) for call in session.execute.await_args_list)
+        assert clear.startswith("DELETE FROM absentee_ballot_stats WHERE absentee_ballot_stats.county IN")
+        assert "INSERT INTO absentee_ballot_stats (county, application_status, party, application_count)" in fill
+        assert "WHERE absentee_ballot_applications.county IN" in fill
+        session.commit.assert_awaited_once()
+
+    async def test_no_counties_is_a_no_op(self) -> None:
+        session = AsyncMock()
+
+        assert await refresh_absentee_stats(session, counties=[]) == 0
+        session.execute.assert_not_awaited()
+
+
+class TestImportRefreshesStats:
+    """process_absentee_import keeps the rollup current."""
+
+    async def _import(self, *, offset: int = 0, refresh: AsyncMock | None = None) -> tuple[MagicMock, AsyncMock]:
+        chunks = [
+            [{"voter_registration_number": "1", "county": "FULTON"}],
+            [{"voter_registration_number": "2", "county": "BIBB"}],
+        ]
+        job = MagicMock(id=uuid.uuid4(), last_processed_offset=offset)
+        refresh = refresh or AsyncMock(return_value=1)
+        with (
+            patch(f"{_SERVICE}.parse_absentee_csv_chunks", return_value=iter(chunks)),
+            patch(f"{_SERVICE}._upsert_absentee_batch", new_callable=AsyncMock, return_value=(1, 0)),
+            patch(f"{_SERVICE}.refresh_absentee_stats", refresh),
+        ):
+            await process_absentee_import(AsyncMock(), job, Path("absentee.csv"))
+        return job, refresh
+
+    async def test_refreshes_imported_counties(self) -> None:
+        job, refresh = await self._import()
+
+        assert job.status == "completed"
+        assert refresh.call_args.kwargs["counties"] == {"FULTON", "BIBB"}
+
+    async def test_resumed_import_refreshes_all_counties(self) -> None:
+        _, refresh = await self._import(offset=1)
+
+        assert refresh.call_args.kwargs["counties"] is None
+
+    async def test_refresh_failure_does_not_fail_import(self) -> None:
+        job, _ = await self._import(refresh=AsyncMock(side_effect=RuntimeError("lock timeout")))
+
+        assert job.status == "completed"
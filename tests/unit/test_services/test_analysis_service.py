@@ -1,6 +1,7 @@
 """Tests for the analysis service module."""
 
 import uuid
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -332,6 +333,13 @@ def _mock_compare_session(
 class TestProcessAnalysisRun:
     """Tests for process_analysis_run."""
 
+    @pytest.fixture(autouse=True)
+    def mark_stale(self) -> Iterator[AsyncMock]:
+        with patch(
+            "voter_api.services.voter_history_service.mark_participation_stats_stale", new_callable=AsyncMock
+        ) as mark:
+            yield mark
+
     @pytest.mark.asyncio
     async def test_completes_with_no_voters(self) -> None:
         session = AsyncMock()
@@ -354,6 +362,21 @@ class TestProcessAnalysisRun:
         assert run.match_count == 0
         assert run.mismatch_count == 0
 
+    @pytest.mark.asyncio
+    async def test_marks_participation_stats_stale(self, mark_stale: AsyncMock) -> None:
+        """Participation rollups report mismatch counts from the latest run."""
+        session = AsyncMock()
+        run = _mock_analysis_run()
+        cursor_result = MagicMock()
+        cursor_result.scalar_one_or_none.return_value = None
+        select_result = MagicMock()
+        select_result.scalars.return_value.all.return_value = []
+        session.execute.side_effect = [cursor_result, select_result, MagicMock()]
+
+        await process_analysis_run(session, run)
+
+        mark_stale.assert_awaited_once_with(session)
+
     @pytest.mark.asyncio
     async def test_processes_voter_with_match(self) -> None:
         run = _mock_analysis_run()
@@ -387,6 +410,45 @@ class TestProcessAnalysisRun:
         assert run.match_count == 1
         assert run.total_voters_analyzed == 1
 
+    @pytest.mark.asyncio
+    async def test_one_voter_query_per_batch(self) -> None:
+        """A batch costs one lean voter SELECT regardless of its size (no per-voter loads)."""
+        run = _mock_analysis_run()
+        voters = [_mock_voter() for _ in range(3)]
+        session = AsyncMock()
+        batch_result = MagicMock()
+        batch_result.scalars.return_value.all.return_value = voters
+        cursor_result, _, flush_result, result_empty, bulk_update_result = (MagicMock() for _ in range(5))
+        cursor_result.scalar_one_or_none.return_value = None
+        result_empty.scalars.return_value.all.return_value = []
+        session.execute.side_effect = [cursor_result, batch_result, flush_result, result_empty, bulk_update_result]
+
+        comparison_result = MagicMock()
+        comparison_result.match_status = "match"
+        comparison_result.mismatch_details = None
+
+        with (
+            patch(
+                "voter_api.services.analysis_service.find_boundaries_for_point",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
+            patch(
+                "voter_api.services.analysis_service.compare_boundaries",
+                return_value=comparison_result,
+            ),
+        ):
+            await process_analysis_run(session, run, batch_size=10)
+
+        assert run.total_voters_analyzed == 3
+        # cursor, voter batch, results flush, empty batch, mismatch bulk update
+        assert session.execute.await_count == 5
+
+        sql = str(session.execute.await_args_list[1].args[0].compile())
+        assert "geocoded_locations" not in sql
+        assert "voters.residence_street_name" not in sql
+        assert "voters.state_house_district" in sql
+
     @pytest.mark.asyncio
     async def test_skips_voter_without_official_point(self) -> None:
         """Voters without official_point are excluded by the query filter, so 0 analyzed."""
@@ -7,6 +7,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from voter_api.core.config import Settings
+from voter_api.core.hashing import PasswordHashingBusyError
+from voter_api.core.principal_cache import principal_cache
 from voter_api.schemas.auth import TokenResponse, UserCreateRequest
 from voter_api.services.auth_service import (
     authenticate_user,
@@ -47,6 +49,15 @@ def _mock_user(**overrides: object) -> MagicMock:
     return user
 
 
+def _hasher(*, verify: bool = True, needs_rehash: bool = False) -> MagicMock:
+    """Create a mock PasswordHasher."""
+    hasher = MagicMock()
+    hasher.verify = AsyncMock(return_value=verify)
+    hasher.hash = AsyncMock(return_value="$2b$13$rehashed")
+    hasher.needs_rehash.return_value = needs_rehash
+    return hasher
+
+
 def _mock_session_with_result(scalar_result: object) -> AsyncMock:
     """Create mock session returning a specific scalar result."""
     session = AsyncMock()
@@ -70,19 +81,52 @@ class TestAuthenticateUser:
         totp_result.scalar_one_or_none.return_value = None
         session.execute.side_effect = [user_result, totp_result]
 
-        with patch("voter_api.services.auth_service.verify_password", return_value=True):
+        with patch("voter_api.services.auth_service.get_password_hasher", return_value=_hasher(verify=True)):
             result = await authenticate_user(session, "testuser", "password123")
 
         assert result is user
         assert user.last_login_at is not None
         session.commit.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_login_upgrades_weaker_hash(self) -> None:
+        user = _mock_user()
+        session = AsyncMock()
+        totp_result = MagicMock()
+        totp_result.scalar_one_or_none.return_value = None
+        session.execute.side_effect = [_mock_session_with_result(user).execute.return_value, totp_result]
+        hasher = _hasher(needs_rehash=True)
+
+        with patch("voter_api.services.auth_service.get_password_hasher", return_value=hasher):
+            result = await authenticate_user(session, "testuser", "password123")
+
+        assert result is user
+        hasher.hash.assert_awaited_once_with("password123")
+        assert user.hashed_password == "$2b$13$rehashed"  # NOSONAR
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_busy_pool_skips_upgrade_without_failing_login(self) -> None:
+        user = _mock_user()
+        session = AsyncMock()
+        totp_result = MagicMock()
+        totp_result.scalar_one_or_none.return_value = None
+        session.execute.side_effect = [_mock_session_with_result(user).execute.return_value, totp_result]
+        hasher = _hasher(needs_rehash=True)
+        hasher.hash.side_effect = PasswordHashingBusyError("busy")
+
+        with patch("voter_api.services.auth_service.get_password_hasher", return_value=hasher):
+            result = await authenticate_user(session, "testuser", "password123")
+
+        assert result is user
+        assert user.hashed_password == "$2b$12$hashed"  # NOSONAR
+
     @pytest.mark.asyncio
     async def test_wrong_password_returns_none(self) -> None:
         user = _mock_user()
         session = _mock_session_with_result(user)
 
-        with patch("voter_api.services.auth_service.verify_password", return_value=False):
+        with patch("voter_api.services.auth_service.get_password_hasher", return_value=_hasher(verify=False)):
             result = await authenticate_user(session, "testuser", "wrongpassword")
 
         assert result is None
@@ -91,7 +135,7 @@ class TestAuthenticateUser:
     async def test_nonexistent_user_returns_none(self) -> None:
         session = _mock_session_with_result(None)
 
-        with patch("voter_api.services.auth_service.verify_password", return_value=False):
+        with patch("voter_api.services.auth_service.get_password_hasher", return_value=_hasher(verify=False)):
             result = await authenticate_user(session, "nobody", "password")
 
         assert result is None
@@ -101,7 +145,7 @@ class TestAuthenticateUser:
         user = _mock_user(is_active=False)
         session = _mock_session_with_result(user)
 
-        with patch("voter_api.services.auth_service.verify_password", return_value=True):
+        with patch("voter_api.services.auth_service.get_password_hasher", return_value=_hasher(verify=True)):
             result = await authenticate_user(session, "testuser", "password123")
 
         assert result is None
@@ -125,7 +169,7 @@ class TestCreateUser:
             role="viewer",
         )
 
-        with patch("voter_api.services.auth_service.hash_password", return_value="hashed"):
+        with patch("voter_api.services.auth_service.get_password_hasher", return_value=_hasher()):
             await create_user(session, request)
 
         session.add.assert_called_once()
@@ -326,6 +370,14 @@ class TestUpdateUser:
         session.commit.assert_awaited_once()
         session.refresh.assert_awaited_once_with(user)
 
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_principal(self) -> None:
+        user = _mock_user()
+        with patch.object(principal_cache, "invalidate") as invalidate:
+            await update_user(AsyncMock(), user, {"role": "viewer"})
+
+        invalidate.assert_called_once_with("testuser")
+
     @pytest.mark.asyncio
     async def test_email_conflict_raises_error(self) -> None:
         user = _mock_user(email="original@example.com")
@@ -370,3 +422,10 @@ class TestDeleteUser:
 
         session.delete.assert_awaited_once_with(user)
         session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_principal(self) -> None:
+        with patch.object(principal_cache, "invalidate") as invalidate:
+            await delete_user(AsyncMock(), _mock_user())
+
+        invalidate.assert_called_once_with("testuser")
@@ -1,15 +1,19 @@
-"""Tests for boundary service hybrid county filter."""
+"""Tests for boundary service hybrid county filter and bulk upsert."""
 
-from unittest.mock import AsyncMock, MagicMock
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from shapely.geometry import MultiPolygon, Polygon
 from sqlalchemy.dialects import postgresql
 
+from voter_api.lib.boundary_loader import BoundaryData
 from voter_api.services.boundary_service import (
     _build_county_filter,
     _county_geometry_subquery,
     find_containing_boundaries,
     list_boundaries,
+    upsert_boundaries,
 )
 
 
@@ -231,3 +235,83 @@ class TestFindContainingBoundariesHybridCountyFilter:
         compiled = _compile_query(call[0][0])
         assert "st_contains" in compiled.lower()
         assert "county_districts" not in compiled.lower()
+
+
+def _bulk_session(id_rows: list[tuple] | None = None) -> tuple[AsyncMock, AsyncMock]:
+    """Mock session wired for the COPY staging path; returns (session, copy_mock)."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = id_rows or []
+    session.execute.return_value = result
+    copy_mock = AsyncMock()
+    raw_connection = MagicMock()
+    raw_connection.driver_connection.copy_records_to_table = copy_mock
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    session.connection = AsyncMock(return_value=connection)
+    return session, copy_mock
+
+
+def _square(x: float = 0.0) -> MultiPolygon:
+    return MultiPolygon([Polygon([(x, 0), (x + 1, 0), (x + 1, 1), (x, 1), (x, 0)])])
+
+
+class TestUpsertBoundaries:
+    """Tests for the set-based boundary upsert."""
+
+    @pytest.mark.asyncio
+    async def test_statement_count_is_independent_of_layer_size(self) -> None:
+        """A layer is staged with one COPY and merged with a fixed set of statements."""
+        data = [BoundaryData(name=f"D{i}", boundary_identifier=str(i), geometry=_square(i)) for i in range(50)]
+        session, copy_mock = _bulk_session()
+
+        count = await upsert_boundaries(session, data, "state_house", "state")
+
+        assert count == 50
+        copy_mock.assert_awaited_once()
+        assert len(copy_mock.await_args.kwargs["records"]) == 50
+        # CREATE staging, adopt legacy NULL-county rows, UPDATE, INSERT
+        assert session.execute.await_count == 4
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_keep_last_feature_and_county_from_properties(self) -> None:
+        """Features sharing (identifier, county) collapse to the last one; CTYNAME supplies the county."""
+        data = [
+            BoundaryData(name="First", boundary_identifier="1", geometry=_square(), properties={"CTYNAME": "BIBB"}),
+            BoundaryData(name="Second", boundary_identifier="1", geometry=_square(), properties={"CTYNAME": "BIBB"}),
+            BoundaryData(name="Other", boundary_identifier="1", geometry=_square(), properties={"CTYNAME": "JONES"}),
+        ]
+        session, copy_mock = _bulk_session()
+
+        count = await upsert_boundaries(session, data, "county_commission", "county")
+
+        assert count == 2
+        records = copy_mock.await_args.kwargs["records"]
+        assert [(r[0], r[1], r[2]) for r in records] == [("Second", "1", "BIBB"), ("Other", "1", "JONES")]
+        assert isinstance(records[0][3], bytes)
+
+    @pytest.mark.asyncio
+    async def test_empty_layer_is_a_no_op(self) -> None:
+        session, copy_mock = _bulk_session()
+
+        assert await upsert_boundaries(session, [], "congressional", "state") == 0
+        copy_mock.assert_not_awaited()
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_precinct_layer_upserts_metadata_in_bulk(self) -> None:
+        """county_precinct layers hand every (boundary_id, properties) pair to the batch upsert."""
+        props = {"PRECINCT_I": "SS01", "CTYNAME": "FULTON"}
+        data = [BoundaryData(name="SS01", boundary_identifier="121SS01", geometry=_square(), properties=props)]
+        boundary_id = uuid.uuid4()
+        session, _ = _bulk_session(id_rows=[(boundary_id, "121SS01", "FULTON")])
+
+        with patch(
+            "voter_api.services.precinct_metadata_service.upsert_precinct_metadata_batch",
+            new_callable=AsyncMock,
+            return_value=1,
+        ) as batch_mock:
+            await upsert_boundaries(session, data, "county_precinct", "state")
+
+        batch_mock.assert_awaited_once_with(session, [(boundary_id, props)])
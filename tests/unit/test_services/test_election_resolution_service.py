@@ -4,11 +4,14 @@ import uuid
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from voter_api.services.election_resolution_service import (
     ResolutionResult,
     _resolve_tier0_event_matching,
     _resolve_tier1_single_election,
     _resolve_tier2_district_matching,
+    _update_vh_by_district,
     _update_vh_by_psc_county,
     find_or_create_election_event,
     link_election_to_boundary,
@@ -256,6 +259,45 @@ class TestUpdateVhByPscCounty:
         assert result == 10
 
 
+class TestUpdateVhByDistrict:
+    """Tests for the _update_vh_by_district helper."""
+
+    async def test_matches_on_canonical_key_column(self) -> None:
+        """Zero-padded identifiers are normalized and compared against the *_key column."""
+        session = AsyncMock()
+        cursor = MagicMock()
+        cursor.rowcount = 7
+        session.execute.return_value = cursor
+
+        result = await _update_vh_by_district(
+            session,
+            election_id=uuid.uuid4(),
+            election_date=date(2024, 11, 5),
+            voter_column="state_senate_district",
+            district_identifier="018",
+            force=False,
+        )
+
+        assert result == 7
+        stmt, params = session.execute.call_args.args
+        assert "v.state_senate_district_key = :district_key" in str(stmt)
+        assert params["district_key"] == "18"
+
+    async def test_rejects_unknown_column(self) -> None:
+        """Column names outside the district allow-list raise ValueError."""
+        session = AsyncMock()
+        with pytest.raises(ValueError, match="Invalid voter column"):
+            await _update_vh_by_district(
+                session,
+                election_id=uuid.uuid4(),
+                election_date=date(2024, 11, 5),
+                voter_column="last_name",
+                district_identifier="1",
+                force=False,
+            )
+        session.execute.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # _resolve_tier2_district_matching — PSC path
 # ---------------------------------------------------------------------------
@@ -529,3 +571,25 @@ class TestLinkElectionToBoundaryCountyBackfill:
 
         assert result is True
         assert election.eligible_county is None  # no county to extract
+
+    async def test_boundary_lookup_uses_canonical_identifier_key(self) -> None:
+        """The boundary lookup compares the unpadded key instead of a zero-padded identifier."""
+        election = _make_election(
+            district="State Senate District 18",
+            district_type=None,
+            district_identifier=None,
+            district_party=None,
+            eligible_county=None,
+        )
+        boundary_id = uuid.uuid4()
+        session = AsyncMock()
+        boundary_result = MagicMock()
+        boundary_result.first.return_value = (boundary_id,)
+        session.execute.return_value = boundary_result
+
+        await link_election_to_boundary(session, election)
+
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(compile_kwargs={"literal_binds": True}))
+        assert "boundaries.boundary_identifier_key = '18'" in sql
+        assert election.boundary_id == boundary_id
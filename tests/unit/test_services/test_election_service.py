@@ -37,6 +37,7 @@ from voter_api.services.election_service import (
     get_election_precinct_results_geojson,
     get_election_results,
     get_raw_election_results,
+    get_results_version,
     list_elections,
     persist_ingestion_result,
     refresh_all_active_elections,
@@ -369,6 +370,45 @@ class TestGetElectionById:
         assert result is None
 
 
+class TestGetResultsVersion:
+    """Tests for get_results_version()."""
+
+    @pytest.mark.asyncio
+    async def test_token_tracks_refresh_update_and_status(self):
+        refreshed = datetime(2026, 2, 17, 12, 0, 0, tzinfo=UTC)
+        updated = datetime(2026, 2, 17, 12, 0, 1, tzinfo=UTC)
+        session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.first.return_value = (updated, refreshed, "active")
+        session.execute.return_value = mock_result
+
+        token = await get_results_version(session, uuid.uuid4())
+
+        assert token == f"{refreshed.isoformat()}|{updated.isoformat()}|active"
+
+    @pytest.mark.asyncio
+    async def test_never_refreshed(self):
+        session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.first.return_value = (datetime(2026, 2, 17, tzinfo=UTC), None, "finalized")
+        session.execute.return_value = mock_result
+
+        token = await get_results_version(session, uuid.uuid4())
+
+        assert token is not None
+        assert token.startswith("never|")
+        assert token.endswith("|finalized")
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_not_found(self):
+        session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.first.return_value = None
+        session.execute.return_value = mock_result
+
+        assert await get_results_version(session, uuid.uuid4()) is None
+
+
 # --- Tests for update_election ---
 
 
@@ -399,6 +439,35 @@ class TestUpdateElection:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_district_change_marks_participation_stats_stale(self):
+        election = _mock_election()
+        session = _mock_session_with_scalar(election)
+        request = MagicMock()
+        request.model_dump.return_value = {"district_type": "state_senate", "district_identifier": "18"}
+
+        with patch(
+            "voter_api.services.voter_history_service.mark_participation_stats_stale", new_callable=AsyncMock
+        ) as mark_stale:
+            await update_election(session, election.id, request)
+
+        mark_stale.assert_awaited_once_with(session, election_ids=[election.id])
+
+    @pytest.mark.asyncio
+    async def test_metadata_change_keeps_participation_stats(self):
+        election = _mock_election()
+        session = _mock_session_with_scalar(election)
+
+        from voter_api.schemas.election import ElectionUpdateRequest
+
+        request = ElectionUpdateRequest(name="Updated Name", description="Runoff")
+        with patch(
+            "voter_api.services.voter_history_service.mark_participation_stats_stale", new_callable=AsyncMock
+        ) as mark_stale:
+            await update_election(session, election.id, request)
+
+        mark_stale.assert_not_awaited()
+
 
 # --- Tests for get_election_results ---
 
@@ -725,7 +725,7 @@ class TestImportFeed:
                 side_effect=mock_elections,
             ),
             patch(
-                "voter_api.services.election_service.ingest_election_results",
+                "voter_api.services.election_service.ingest_all_election_results",
                 side_effect=ValueError("ingestion failed"),
             ),
         ):
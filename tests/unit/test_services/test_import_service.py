@@ -1,18 +1,29 @@
 """Tests for the import service module."""
 
+import multiprocessing
+import pickle
 import uuid
-from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, date, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pandas as pd
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from voter_api.services.import_service import (
+    ImportStageTimings,
     _prepare_records_for_db,
+    _upsert_voter_batch,
     cleanup_abandoned_jobs,
     create_import_job,
     get_import_diff,
     get_import_job,
     list_import_jobs,
+    prepare_voter_chunk,
+    process_voter_import,
+    repair_bulk_import_state,
 )
 
 
@@ -299,3 +310,265 @@ class TestCleanupAbandonedJobs:
         count = await cleanup_abandoned_jobs(session)
 
         assert count == 0
+
+
+def _voter_chunk(start: int, count: int, *, invalid: int = 0) -> pd.DataFrame:
+    """Build a parsed CSV chunk; the last ``invalid`` rows lack a last name."""
+    rows = []
+    for i in range(start, start + count):
+        rows.append(
+            {
+                "county": "BIBB",
+                "voter_registration_number": f"{i:08d}",
+                "status": "ACTIVE",
+                "last_name": "" if i >= start + count - invalid else "SMITH",
+                "first_name": "JANE",
+                "registration_date": "01/15/2020",
+                "birth_year": "1980",
+                "congressional_district": "2",
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+class TestRepairBulkImportState:
+    """Tests for repair_bulk_import_state."""
+
+    async def test_reenables_autovacuum_and_rebuilds_missing_indexes(self) -> None:
+        indexes = [
+            {"name": "ix_present", "create": "CREATE INDEX ix_present ON voters (a)"},
+            {"name": "ix_missing", "create": "CREATE INDEX ix_missing ON voters (b)"},
+        ]
+        session = AsyncMock()
+        session.execute.side_effect = [
+            MagicMock(first=MagicMock(return_value=(["autovacuum_enabled=false"],))),
+            None,  # ALTER TABLE
+            MagicMock(first=MagicMock(return_value=(1,))),
+            MagicMock(first=MagicMock(return_value=None)),
+            None,  # CREATE INDEX
+        ]
+
+        await repair_bulk_import_state(session, "voters", indexes)
+
+        executed = [str(call.args[0]) for call in session.execute.await_args_list]
+        assert "ALTER TABLE voters SET (autovacuum_enabled = true)" in executed
+        assert "CREATE INDEX ix_missing ON voters (b)" in executed
+        assert "CREATE INDEX ix_present ON voters (a)" not in executed
+
+    async def test_healthy_table_is_left_alone(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(first=MagicMock(return_value=(1,)))
+
+        await repair_bulk_import_state(session, "voters", [{"name": "ix", "create": "CREATE INDEX ix ON voters (a)"}])
+
+        session.commit.assert_not_awaited()
+
+
+class TestUpsertVoterBatch:
+    """Tests for _upsert_voter_batch."""
+
+    @pytest.mark.asyncio
+    async def test_collects_counties_voters_move_out_of(self) -> None:
+        session = AsyncMock()
+        moved = MagicMock(scalars=MagicMock(return_value=["FULTON", None]))
+        upserted = MagicMock(all=MagicMock(return_value=[MagicMock(is_insert=0)]))
+        session.execute.side_effect = [moved, upserted]
+        previous_counties: set[str] = set()
+
+        inserted, updated = await _upsert_voter_batch(
+            session, [{"voter_registration_number": "00000001", "county": "BIBB"}], previous_counties
+        )
+
+        assert (inserted, updated) == (0, 1)
+        assert previous_counties == {"FULTON"}
+        lookup = session.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect())
+        assert "voters.county NOT IN" in str(lookup)
+        assert lookup.params["county_1"] == ["BIBB"]
+
+    @pytest.mark.asyncio
+    async def test_skips_county_lookup_without_collector(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(all=MagicMock(return_value=[MagicMock(is_insert=1)]))
+
+        assert await _upsert_voter_batch(session, [{"voter_registration_number": "1", "county": "BIBB"}]) == (1, 0)
+        session.execute.assert_awaited_once()
+
+
+class TestPrepareVoterChunk:
+    """Tests for prepare_voter_chunk (the worker-side stage)."""
+
+    def test_prepares_valid_rows_and_collects_errors(self) -> None:
+        job_id = uuid.uuid4()
+        prepared = prepare_voter_chunk(_voter_chunk(0, 3, invalid=1), 7, job_id)
+
+        assert prepared.chunk_idx == 7
+        assert prepared.total == 3
+        assert prepared.county == "BIBB"
+        assert len(prepared.rows) == 2
+        assert prepared.errors == [
+            {"voter_registration_number": "00000002", "errors": ["Missing required field: last_name"]}
+        ]
+        assert prepared.registration_numbers() == {"00000000", "00000001"}
+        assert prepared.counties() == {"BIBB"}
+
+        record = prepared.records()[0]
+        assert record["registration_date"] == date(2020, 1, 15)
+        assert record["birth_year"] == 1980
+        assert record["congressional_district"] == "002"
+        assert record["last_seen_in_import_id"] == job_id
+
+    def test_result_is_picklable(self) -> None:
+        prepared = prepare_voter_chunk(_voter_chunk(0, 2), 0, uuid.uuid4())
+        assert pickle.loads(pickle.dumps(prepared)) == prepared  # noqa: S301
+
+    def test_empty_chunk(self) -> None:
+        prepared = prepare_voter_chunk(_voter_chunk(0, 1, invalid=1), 0, uuid.uuid4())
+        assert prepared.rows == []
+        assert prepared.columns == ()
+        assert prepared.registration_numbers() == set()
+        assert prepared.counties() == set()
+
+
+class TestProcessVoterImportPipeline:
+    """Tests for the pipelined chunk flow in process_voter_import."""
+
+    @staticmethod
+    async def _run(
+        chunks: list[pd.DataFrame], moved_from: set[str] | None = None, **kwargs: object
+    ) -> tuple[MagicMock, AsyncMock, AsyncMock, ImportStageTimings]:
+        session = AsyncMock()
+        job = _mock_import_job()
+        timings = ImportStageTimings()
+
+        async def fake_upsert(
+            _session: object, records: list[dict], previous_counties: set[str] | None = None
+        ) -> tuple[int, int]:
+            if previous_counties is not None:
+                previous_counties.update(moved_from or set())
+            return len(records), 0
+
+        with (
+            patch("voter_api.services.import_service.parse_csv_chunks", return_value=iter(chunks)),
+            patch("voter_api.services.import_service._upsert_voter_batch", side_effect=fake_upsert) as upsert,
+            patch(
+                "voter_api.services.import_service._soft_delete_absent_voters", new_callable=AsyncMock, return_value=0
+            ) as soft_delete,
+        ):
+            result = await process_voter_import(
+                session,
+                job,
+                Path("voters.csv"),
+                batch_size=3,
+                skip_optimizations=True,
+                stage_timings=timings,
+                **kwargs,  # type: ignore[arg-type]
+            )
+        return result, upsert, soft_delete, timings
+
+    async def test_writes_chunks_in_order_and_checkpoints(self) -> None:
+        chunks = [_voter_chunk(0, 3), _voter_chunk(3, 3, invalid=1), _voter_chunk(6, 2)]
+
+        job, upsert, soft_delete, timings = await self._run(chunks, queue_depth=1)
+
+        assert job.status == "completed"
+        assert job.total_records == 8
+        assert job.records_inserted == 7
+        assert job.records_failed == 1
+        assert job.last_processed_offset == 3
+        written = [r["voter_registration_number"] for call in upsert.call_args_list for r in call.args[1]]
+        assert written == [f"{i:08d}" for i in range(8) if i != 5]
+        imported = soft_delete.call_args.args[2]
+        assert len(imported) == 7
+        assert timings.chunks == 3
+
+    async def test_refreshes_filter_facets_for_imported_counties(self) -> None:
+        with patch("voter_api.services.voter_service.refresh_voter_filter_facets", new_callable=AsyncMock) as refresh:
+            job, _, _, _ = await self._run([_voter_chunk(0, 3)])
+
+        assert job.status == "completed"
+        assert refresh.call_args.kwargs["counties"] == {"BIBB"}
+
+    async def test_refreshes_filter_facets_for_counties_moved_out_of(self) -> None:
+        with patch("voter_api.services.voter_service.refresh_voter_filter_facets", new_callable=AsyncMock) as refresh:
+            await self._run([_voter_chunk(0, 3)], moved_from={"FULTON"})
+
+        assert refresh.call_args.kwargs["counties"] == {"BIBB", "FULTON"}
+
+    async def test_marks_participation_stats_stale(self) -> None:
+        with patch(
+            "voter_api.services.voter_history_service.mark_participation_stats_stale", new_callable=AsyncMock
+        ) as mark_stale:
+            job, _, _, _ = await self._run([_voter_chunk(0, 3)])
+
+        assert job.status == "completed"
+        mark_stale.assert_awaited_once()
+
+    async def test_facet_refresh_failure_does_not_fail_import(self) -> None:
+        with patch(
+            "voter_api.services.voter_service.refresh_voter_filter_facets",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("facets unavailable"),
+        ):
+            job, _, _, _ = await self._run([_voter_chunk(0, 3)])
+
+        assert job.status == "completed"
+
+    async def test_max_records_stops_early(self) -> None:
+        chunks = [_voter_chunk(i * 3, 3) for i in range(5)]
+
+        job, upsert, soft_delete, timings = await self._run(chunks, max_records=4)
+
+        assert job.total_records == 6
+        assert upsert.call_count == 2
+        soft_delete.assert_not_called()
+
+    async def test_resumes_after_checkpoint(self) -> None:
+        session = AsyncMock()
+        committed = [(f"{i:08d}", "BIBB") for i in range(6)]
+        session.execute.return_value = MagicMock(all=MagicMock(return_value=committed))
+        job = _mock_import_job(last_processed_offset=2)
+        chunks = [_voter_chunk(i * 3, 3) for i in range(3)]
+
+        with (
+            patch("voter_api.services.import_service.parse_csv_chunks", return_value=iter(chunks)),
+            patch(
+                "voter_api.services.import_service._upsert_voter_batch", new_callable=AsyncMock, return_value=(3, 0)
+            ) as upsert,
+            patch(
+                "voter_api.services.import_service._soft_delete_absent_voters", new_callable=AsyncMock, return_value=0
+            ) as soft_delete,
+            patch("voter_api.services.import_service._refresh_filter_facets", new_callable=AsyncMock),
+        ):
+            await process_voter_import(session, job, Path("voters.csv"), batch_size=3, skip_optimizations=True)
+
+        assert upsert.call_count == 1
+        assert upsert.call_args.args[1][0]["voter_registration_number"] == "00000006"
+        # Voters committed before the interruption are not soft-deleted on resume
+        seen = soft_delete.call_args.args[2]
+        assert {reg for reg, _ in committed} <= seen
+        assert job.total_records == 9
+        assert job.records_succeeded == 9
+
+    async def test_reader_error_marks_job_failed(self) -> None:
+        def broken_reader(*_args: object) -> object:
+            yield _voter_chunk(0, 3)
+            raise ValueError("unknown column")
+
+        session = AsyncMock()
+        job = _mock_import_job()
+        with (
+            patch("voter_api.services.import_service.parse_csv_chunks", side_effect=broken_reader),
+            patch("voter_api.services.import_service._upsert_voter_batch", new_callable=AsyncMock, return_value=(3, 0)),
+            pytest.raises(ValueError, match="unknown column"),
+        ):
+            await process_voter_import(session, job, Path("voters.csv"), batch_size=3, skip_optimizations=True)
+
+        assert job.status == "failed"
+
+    async def test_prepares_in_process_pool(self) -> None:
+        chunks = [_voter_chunk(0, 3), _voter_chunk(3, 3)]
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as pool:
+            job, _, _, timings = await self._run(chunks, executor=pool)
+
+        assert job.records_inserted == 6
+        assert timings.chunks == 2
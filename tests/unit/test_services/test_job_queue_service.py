@@ -0,0 +1,270 @@
+"""Unit tests for the background job queue and worker."""
+
+import asyncio
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from voter_api.services.job_queue_service import (
+    ClaimedJob,
+    Worker,
+    claim_job,
+    enqueue_job,
+    heartbeat_job,
+    release_job,
+)
+from voter_api.services.job_tasks import JobTask
+
+
+def _compile(stmt: object) -> str:
+    """Compile a statement for the PostgreSQL dialect (bind parameters left in place)."""
+    return str(stmt.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+def _claimed(**overrides: Any) -> ClaimedJob:
+    values: dict[str, Any] = {
+        "id": uuid.uuid4(),
+        "task": "export",
+        "payload": {"job_id": str(uuid.uuid4())},
+        "attempts": 1,
+        "max_attempts": 3,
+    }
+    values.update(overrides)
+    return ClaimedJob(**values)
+
+
+def _mock_factory() -> tuple[MagicMock, AsyncMock]:
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory, session
+
+
+def _worker(**overrides: Any) -> Worker:
+    options: dict[str, Any] = {
+        "poll_interval": 0.01,
+        "heartbeat_interval": 0.01,
+        "stale_after": 60,
+        "worker_id": "test-host:1",
+    }
+    options.update(overrides)
+    return Worker({"exports": 1}, **options)
+
+
+class TestEnqueueJob:
+    """Tests for enqueue_job."""
+
+    async def test_uses_the_task_queue(self) -> None:
+        session = AsyncMock()
+        session.add = MagicMock()
+
+        job = await enqueue_job(session, "geocoding", {"job_id": "abc"}, max_attempts=5)
+
+        assert job.queue == "geocoding"
+        assert job.task == "geocoding"
+        assert job.payload == {"job_id": "abc"}
+        assert job.max_attempts == 5
+        session.add.assert_called_once_with(job)
+        session.commit.assert_awaited_once()
+
+    async def test_unknown_task_raises(self) -> None:
+        session = AsyncMock()
+        with pytest.raises(ValueError, match="Unknown background task"):
+            await enqueue_job(session, "nope", {})
+        session.commit.assert_not_awaited()
+
+
+class TestClaimJob:
+    """Tests for claim_job."""
+
+    async def test_claims_with_skip_locked(self) -> None:
+        job_id = uuid.uuid4()
+        row = MagicMock(id=job_id, task="export", payload={"job_id": "x"}, attempts=1, max_attempts=3)
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(first=MagicMock(return_value=row))
+
+        claimed = await claim_job(session, "exports", "host:1", stale_after=120)
+
+        assert claimed == ClaimedJob(id=job_id, task="export", payload={"job_id": "x"}, attempts=1, max_attempts=3)
+        sql = _compile(session.execute.call_args.args[0])
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "background_jobs.heartbeat_at <" in sql
+        assert "attempts=(background_jobs.attempts +" in sql
+        assert "RETURNING" in sql
+        session.commit.assert_awaited_once()
+
+    async def test_empty_queue_returns_none(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(first=MagicMock(return_value=None))
+
+        assert await claim_job(session, "exports", "host:1", stale_after=120) is None
+
+
+class TestHeartbeatAndRelease:
+    """Tests for heartbeat_job and release_job."""
+
+    async def test_heartbeat_reports_lost_claim(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(rowcount=0)
+
+        assert await heartbeat_job(session, uuid.uuid4(), "host:1") is False
+
+    async def test_release_returns_job_without_counting_attempt(self) -> None:
+        session = AsyncMock()
+
+        await release_job(session, uuid.uuid4(), "host:1")
+
+        sql = _compile(session.execute.call_args.args[0])
+        assert "status=%(status)s" in sql
+        assert "attempts=(background_jobs.attempts -" in sql
+        assert "background_jobs.locked_by = %(locked_by_1)s" in sql
+
+
+class TestWorkerExecute:
+    """Tests for Worker.execute."""
+
+    async def _execute(self, worker: Worker, claimed: ClaimedJob, task: JobTask) -> dict[str, AsyncMock]:
+        factory, _ = _mock_factory()
+        with (
+            patch("voter_api.services.job_queue_service.get_session_factory", return_value=factory),
+            patch("voter_api.services.job_queue_service.get_job_task", return_value=task),
+            patch("voter_api.services.job_queue_service.finish_job", new_callable=AsyncMock) as finish,
+            patch("voter_api.services.job_queue_service.release_job", new_callable=AsyncMock) as release,
+            patch("voter_api.services.job_queue_service.heartbeat_job", new_callable=AsyncMock) as heartbeat,
+        ):
+            heartbeat.return_value = True
+            await worker.execute(claimed)
+        return {"finish": finish, "release": release, "heartbeat": heartbeat}
+
+    async def test_success_completes_job(self) -> None:
+        run = AsyncMock()
+        task = JobTask("exports", run, AsyncMock())
+        claimed = _claimed()
+
+        mocks = await self._execute(_worker(), claimed, task)
+
+        run.assert_awaited_once_with(claimed.payload)
+        mocks["finish"].assert_awaited_once()
+        assert mocks["finish"].call_args.kwargs["error"] is None
+
+    async def test_task_error_fails_job(self) -> None:
+        task = JobTask("exports", AsyncMock(side_effect=RuntimeError("disk full")), AsyncMock())
+
+        mocks = await self._execute(_worker(), _claimed(), task)
+
+        assert "disk full" in mocks["finish"].call_args.kwargs["error"]
+        mocks["release"].assert_not_awaited()
+
+    async def test_exhausted_attempts_abandon_without_running(self) -> None:
+        run, abandon = AsyncMock(), AsyncMock()
+        claimed = _claimed(attempts=4, max_attempts=3)
+
+        mocks = await self._execute(_worker(), claimed, JobTask("exports", run, abandon))
+
+        run.assert_not_awaited()
+        abandon.assert_awaited_once()
+        assert abandon.call_args.args[0] == claimed.payload
+        assert "3 attempt(s)" in mocks["finish"].call_args.kwargs["error"]
+
+    async def test_stop_releases_running_job(self) -> None:
+        started = asyncio.Event()
+        cancelled = False
+
+        async def long_task(_payload: dict[str, Any]) -> None:
+            nonlocal cancelled
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        worker = _worker()
+
+        async def stop_when_started() -> None:
+            await started.wait()
+            worker.stop()
+
+        stopper = asyncio.create_task(stop_when_started())
+        mocks = await self._execute(worker, _claimed(), JobTask("exports", long_task, AsyncMock()))
+        await stopper
+
+        assert cancelled
+        mocks["release"].assert_awaited_once()
+        mocks["finish"].assert_not_awaited()
+
+    async def test_lost_claim_cancels_task(self) -> None:
+        async def long_task(_payload: dict[str, Any]) -> None:
+            await asyncio.sleep(60)
+
+        worker = _worker()
+        factory, _ = _mock_factory()
+        with (
+            patch("voter_api.services.job_queue_service.get_session_factory", return_value=factory),
+            patch(
+                "voter_api.services.job_queue_service.get_job_task",
+                return_value=JobTask("exports", long_task, AsyncMock()),
+            ),
+            patch("voter_api.services.job_queue_service.finish_job", new_callable=AsyncMock) as finish,
+            patch("voter_api.services.job_queue_service.release_job", new_callable=AsyncMock) as release,
+            patch("voter_api.services.job_queue_service.heartbeat_job", new_callable=AsyncMock, return_value=False),
+        ):
+            await asyncio.wait_for(worker.execute(_claimed()), timeout=5)
+
+        finish.assert_not_awaited()
+        release.assert_not_awaited()
+
+    async def test_unknown_task_fails_job(self) -> None:
+        factory, _ = _mock_factory()
+        with (
+            patch("voter_api.services.job_queue_service.get_session_factory", return_value=factory),
+            patch("voter_api.services.job_queue_service.finish_job", new_callable=AsyncMock) as finish,
+        ):
+            await _worker().execute(_claimed(task="nope"))
+
+        assert "Unknown background task" in finish.call_args.kwargs["error"]
+
+
+class TestWorkerRun:
+    """Tests for Worker.run."""
+
+    async def test_idle_slots_exit_on_stop(self) -> None:
+        factory, _ = _mock_factory()
+        worker = Worker({"imports": 2, "exports": 1}, poll_interval=0.01, heartbeat_interval=1, stale_after=60)
+        with (
+            patch("voter_api.services.job_queue_service.get_session_factory", return_value=factory),
+            patch("voter_api.services.job_queue_service.claim_job", new_callable=AsyncMock, return_value=None) as claim,
+        ):
+            run = asyncio.create_task(worker.run())
+            await asyncio.sleep(0.05)
+            worker.stop()
+            await asyncio.wait_for(run, timeout=5)
+
+        polled = {call.args[1] for call in claim.await_args_list}
+        assert polled == {"imports", "exports"}
+
+    async def test_poll_error_does_not_stop_slot(self) -> None:
+        factory, _ = _mock_factory()
+        worker = Worker({"exports": 1}, poll_interval=0.01, heartbeat_interval=1, stale_after=60)
+        polls = 0
+
+        async def flaky_claim(*_args: object, **_kwargs: object) -> None:
+            nonlocal polls
+            polls += 1
+            if polls == 1:
+                raise ConnectionError("db down")
+
+        with (
+            patch("voter_api.services.job_queue_service.get_session_factory", return_value=factory),
+            patch("voter_api.services.job_queue_service.claim_job", side_effect=flaky_claim),
+        ):
+            run = asyncio.create_task(worker.run())
+            await asyncio.sleep(0.05)
+            worker.stop()
+            await asyncio.wait_for(run, timeout=5)
+
+        assert polls >= 2
@@ -0,0 +1,192 @@
+"""Unit tests for the background job task registry."""
+
+import asyncio
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from voter_api.services.job_tasks import JOB_TASKS, get_job_task
+
+
+def _mock_factory() -> tuple[MagicMock, AsyncMock]:
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory, session
+
+
+def _import_job(status: str = "pending") -> MagicMock:
+    job = MagicMock()
+    job.id = uuid.uuid4()
+    job.status = status
+    return job
+
+
+class TestRegistry:
+    """Tests for JOB_TASKS / get_job_task."""
+
+    def test_every_submitted_task_is_registered(self) -> None:
+        assert set(JOB_TASKS) == {
+            "voter_import",
+            "voter_history_import",
+            "candidate_import",
+            "election_results_import",
+            "absentee_import",
+            "geocoding",
+            "analysis",
+            "export",
+        }
+
+    def test_unknown_task_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown background task: nope"):
+            get_job_task("nope")
+
+
+class TestFileImportTasks:
+    """Tests for the upload-backed import tasks."""
+
+    async def _run(self, payload: dict, job: MagicMock | None, process: AsyncMock) -> None:
+        factory, _ = _mock_factory()
+        with (
+            patch("voter_api.services.job_tasks.get_session_factory", return_value=factory),
+            patch("voter_api.services.import_service.get_import_job", new_callable=AsyncMock, return_value=job),
+            patch("voter_api.services.absentee_service.process_absentee_import", process),
+        ):
+            await get_job_task("absentee_import").run(payload)
+
+    async def test_runs_import_and_discards_upload(self, tmp_path: Path) -> None:
+        upload = tmp_path / "upload.csv"
+        upload.write_text("a,b\n")
+        job = _import_job()
+        process = AsyncMock()
+
+        await self._run({"job_id": str(job.id), "file_path": str(upload)}, job, process)
+
+        process.assert_awaited_once()
+        assert process.call_args.args[1] is job
+        assert process.call_args.args[2] == upload
+        assert not upload.exists()
+
+    async def test_failed_import_discards_upload(self, tmp_path: Path) -> None:
+        upload = tmp_path / "upload.csv"
+        upload.write_text("a,b\n")
+        job = _import_job()
+
+        with pytest.raises(ValueError, match="bad header"):
+            await self._run(
+                {"job_id": str(job.id), "file_path": str(upload)}, job, AsyncMock(side_effect=ValueError("bad header"))
+            )
+
+        assert not upload.exists()
+
+    async def test_interrupted_import_keeps_upload_for_resume(self, tmp_path: Path) -> None:
+        upload = tmp_path / "upload.csv"
+        upload.write_text("a,b\n")
+        job = _import_job(status="running")
+
+        with pytest.raises(asyncio.CancelledError):
+            await self._run(
+                {"job_id": str(job.id), "file_path": str(upload)}, job, AsyncMock(side_effect=asyncio.CancelledError)
+            )
+
+        assert upload.exists()
+
+    async def test_finished_job_is_not_rerun(self, tmp_path: Path) -> None:
+        upload = tmp_path / "upload.csv"
+        upload.write_text("a,b\n")
+        job = _import_job(status="completed")
+        process = AsyncMock()
+
+        await self._run({"job_id": str(job.id), "file_path": str(upload)}, job, process)
+
+        process.assert_not_awaited()
+        assert not upload.exists()
+
+    async def test_voter_import_passes_batch_size(self, tmp_path: Path) -> None:
+        upload = tmp_path / "voters.csv"
+        upload.write_text("a\n")
+        job = _import_job()
+        factory, _ = _mock_factory()
+        with (
+            patch("voter_api.services.job_tasks.get_session_factory", return_value=factory),
+            patch("voter_api.services.import_service.get_import_job", new_callable=AsyncMock, return_value=job),
+            patch("voter_api.services.import_service.process_voter_import", new_callable=AsyncMock) as process,
+        ):
+            await get_job_task("voter_import").run({"job_id": str(job.id), "file_path": str(upload), "batch_size": 250})
+
+        assert process.call_args.args[3] == 250
+
+
+class TestAbandon:
+    """Tests for the abandon hooks."""
+
+    async def test_abandon_import_fails_job_and_discards_upload(self, tmp_path: Path) -> None:
+        upload = tmp_path / "upload.csv"
+        upload.write_text("a\n")
+        factory, session = _mock_factory()
+        with (
+            patch("voter_api.services.job_tasks.get_session_factory", return_value=factory),
+            patch("voter_api.services.import_service.repair_bulk_import_state", new_callable=AsyncMock),
+        ):
+            await get_job_task("voter_import").abandon(
+                {"job_id": str(uuid.uuid4()), "file_path": str(upload)}, "worker died"
+            )
+
+        stmt = session.execute.call_args.args[0]
+        assert stmt.table.name == "import_jobs"
+        session.commit.assert_awaited_once()
+        assert not upload.exists()
+
+    @pytest.mark.parametrize(
+        ("task", "repair"),
+        [
+            ("voter_import", "voter_api.services.import_service.repair_bulk_import_state"),
+            ("election_results_import", "voter_api.services.results_import_service.repair_results_import_state"),
+        ],
+    )
+    async def test_abandon_bulk_import_repairs_db_state(self, tmp_path: Path, task: str, repair: str) -> None:
+        upload = tmp_path / "upload.json"
+        upload.write_text("{}")
+        factory, session = _mock_factory()
+        with (
+            patch("voter_api.services.job_tasks.get_session_factory", return_value=factory),
+            patch(repair, new_callable=AsyncMock) as repair_state,
+        ):
+            await get_job_task(task).abandon({"job_id": str(uuid.uuid4()), "file_path": str(upload)}, "worker died")
+
+        repair_state.assert_awaited_once_with(session)
+        assert not upload.exists()
+
+    async def test_abandon_other_import_skips_repair(self, tmp_path: Path) -> None:
+        upload = tmp_path / "upload.csv"
+        upload.write_text("a\n")
+        factory, _ = _mock_factory()
+        with (
+            patch("voter_api.services.job_tasks.get_session_factory", return_value=factory),
+            patch("voter_api.services.import_service.repair_bulk_import_state", new_callable=AsyncMock) as repair,
+        ):
+            await get_job_task("candidate_import").abandon(
+                {"job_id": str(uuid.uuid4()), "file_path": str(upload)}, "worker died"
+            )
+
+        repair.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        ("task", "payload_key", "table"),
+        [
+            ("geocoding", "job_id", "geocoding_jobs"),
+            ("analysis", "run_id", "analysis_runs"),
+            ("export", "job_id", "export_jobs"),
+        ],
+    )
+    async def test_abandon_fails_domain_job(self, task: str, payload_key: str, table: str) -> None:
+        factory, session = _mock_factory()
+        with patch("voter_api.services.job_tasks.get_session_factory", return_value=factory):
+            await get_job_task(task).abandon({payload_key: str(uuid.uuid4())}, "worker died")
+
+        stmt = session.execute.call_args.args[0]
+        assert stmt.table.name == table
+        session.commit.assert_awaited_once()
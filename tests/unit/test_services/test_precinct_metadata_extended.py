@@ -7,8 +7,10 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from loguru import logger
+from sqlalchemy.dialects import postgresql
 
 from voter_api.services.precinct_metadata_service import (
+    _PRECINCT_UPSERT_BATCH,
     _build_precinct_indexes,
     _extract_precinct_fields,
     _normalize_precinct_name,
@@ -16,6 +18,7 @@ from voter_api.services.precinct_metadata_service import (
     get_precinct_metadata_by_boundary,
     get_precinct_metadata_by_county_multi_strategy,
     upsert_precinct_metadata,
+    upsert_precinct_metadata_batch,
 )
 
 
@@ -495,3 +498,48 @@ class TestGetPrecinctMetadataMultiStrategy:
         )
         assert result["P01"] is rec
         assert "X99" not in result
+
+
+class TestUpsertPrecinctMetadataBatch:
+    """Tests for upsert_precinct_metadata_batch."""
+
+    _PROPS = {
+        "DISTRICT": "123",
+        "FIPS": "13121",
+        "FIPS2": "121",
+        "CTYNAME": "FULTON",
+        "PRECINCT_I": "SS01",
+        "PRECINCT_N": "Sandy Springs 01",
+    }
+
+    @pytest.mark.asyncio
+    async def test_single_statement_for_whole_file(self) -> None:
+        session = AsyncMock()
+        items = [(uuid.uuid4(), self._PROPS) for _ in range(25)]
+
+        count = await upsert_precinct_metadata_batch(session, items)
+
+        assert count == 25
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0])
+        assert "ON CONFLICT ON CONSTRAINT uq_precinct_metadata_boundary DO UPDATE" in sql
+        assert "coalesce(excluded.sos_id, precinct_metadata.sos_id)" in sql
+
+    @pytest.mark.asyncio
+    async def test_full_batch_stays_under_bind_parameter_limit(self) -> None:
+        session = AsyncMock()
+        items = [(uuid.uuid4(), self._PROPS) for _ in range(_PRECINCT_UPSERT_BATCH + 1)]
+
+        await upsert_precinct_metadata_batch(session, items)
+
+        assert session.execute.await_count == 2
+        full_batch = session.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect())
+        assert len(full_batch.params) <= 32767
+
+    @pytest.mark.asyncio
+    async def test_skips_rows_missing_required_fields(self) -> None:
+        session = AsyncMock()
+        items = [(uuid.uuid4(), {"PRECINCT_I": "SS01"})]
+
+        assert await upsert_precinct_metadata_batch(session, items) == 0
+        session.execute.assert_not_awaited()
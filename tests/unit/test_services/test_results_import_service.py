@@ -0,0 +1,453 @@
+"""Unit tests for the election results import service."""
+
+import json
+import multiprocessing
+import pickle
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import MultipleResultsFound
+
+from voter_api.lib.district_parser.parser import ParsedDistrict
+from voter_api.services.election_service import get_results_version
+from voter_api.services.results_import_service import (
+    ResultsArchiveGroup,
+    _ElectionMatcher,
+    _KnownElection,
+    _upsert_candidates,
+    _upsert_results,
+    _write_plan,
+    bulk_results_import_context,
+    group_results_archive,
+    import_results_archive,
+    import_results_group,
+    prepare_results_file,
+    process_results_import,
+)
+
+_SERVICE = "voter_api.services.results_import_service"
+
+
+def _compile(stmt: object) -> str:
+    """Compile a statement for the PostgreSQL dialect (bind parameters left in place)."""
+    return str(stmt.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+def _option(vote_count: int) -> dict[str, Any]:
+    return {"id": "1", "name": "Jane Doe (Rep)", "voteCount": vote_count, "politicalParty": "Rep"}
+
+
+def _write_feed(tmp_path: Path, name: str = "results.json", election_date: str = "2024-11-05") -> Path:
+    feed = {
+        "electionDate": election_date,
+        "electionName": "November 5, 2024 General Election",
+        "createdAt": "2024-11-20T12:00:00Z",
+        "results": {
+            "id": "GA",
+            "name": "Georgia",
+            "ballotItems": [
+                {"id": "S1", "name": "Contest 1", "ballotOptions": [_option(300)]},
+                {"id": "S2", "name": "Contest 2", "ballotOptions": [_option(200)]},
+            ],
+        },
+        "localResults": [
+            {
+                "id": "1",
+                "name": "Bibb County",
+                "ballotItems": [
+                    {"id": "S1", "name": "Contest 1", "ballotOptions": [_option(100)]},
+                    {"id": "S2", "name": "Contest 2", "ballotOptions": [_option(50)]},
+                ],
+            },
+            {
+                "id": "2",
+                "name": "Fulton County",
+                "ballotItems": [{"id": "S1", "name": "Contest 1", "ballotOptions": [_option(200)]}],
+            },
+        ],
+    }
+    path = tmp_path / name
+    path.write_text(json.dumps(feed))
+    return path
+
+
+def _session() -> AsyncMock:
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+    savepoint = MagicMock()
+    savepoint.__aenter__ = AsyncMock(return_value=None)
+    savepoint.__aexit__ = AsyncMock(return_value=False)
+    session.begin_nested = MagicMock(return_value=savepoint)
+    return session
+
+
+class TestStreamingImport:
+    """Tests for process_results_import in streaming mode."""
+
+    async def _run(
+        self, tmp_path: Path, *, stream: bool | None, upsert_counties: AsyncMock, threshold_mb: int = 64
+    ) -> tuple[MagicMock, dict[str, uuid.UUID]]:
+        election_ids = {"S1": uuid.uuid4(), "S2": uuid.uuid4()}
+
+        async def match(_session: object, ctx: Any, _matcher: object) -> uuid.UUID:
+            return election_ids[ctx.ballot_item_id]
+
+        job = MagicMock(id=uuid.uuid4())
+        with (
+            patch(f"{_SERVICE}._match_election", side_effect=match),
+            patch(f"{_SERVICE}._upsert_candidates", new_callable=AsyncMock, return_value=(1, 0)),
+            patch(f"{_SERVICE}._upsert_county_results", upsert_counties),
+            patch(f"{_SERVICE}.get_settings", return_value=MagicMock(results_stream_threshold_mb=threshold_mb)),
+        ):
+            await process_results_import(_session(), job, _write_feed(tmp_path), stream=stream)
+        return job, election_ids
+
+    @staticmethod
+    def _county_batches(upsert_counties: AsyncMock) -> list[list[tuple[uuid.UUID, str]]]:
+        return [
+            [(election_id, county.county_name) for election_id, county in call.args[1]]
+            for call in upsert_counties.await_args_list
+            if call.args[1]
+        ]
+
+    async def test_counties_persisted_after_statewide_results(self, tmp_path: Path) -> None:
+        upsert_counties = AsyncMock(return_value=0)
+
+        job, election_ids = await self._run(tmp_path, stream=True, upsert_counties=upsert_counties)
+
+        assert job.status == "completed"
+        assert job.records_succeeded == 2
+        assert self._county_batches(upsert_counties) == [
+            [(election_ids["S1"], "Bibb County"), (election_ids["S2"], "Bibb County")],
+            [(election_ids["S1"], "Fulton County")],
+        ]
+
+    async def test_county_failure_is_reported_per_ballot_item(self, tmp_path: Path) -> None:
+        async def upsert_counties(_session: object, rows: list[tuple[uuid.UUID, Any]]) -> int:
+            if any(county.county_name == "Fulton County" for _, county in rows):
+                raise ValueError("boom")
+            return len(rows)
+
+        job, _ = await self._run(tmp_path, stream=True, upsert_counties=AsyncMock(side_effect=upsert_counties))
+
+        assert job.status == "completed"
+        assert job.records_failed == 1
+        assert job.error_log == [
+            {"ballot_item": "Contest 1", "ballot_item_id": "S1", "county": "Fulton County", "error": "boom"}
+        ]
+
+    @pytest.mark.parametrize("stream", [True, False])
+    async def test_import_changes_results_version(self, tmp_path: Path, stream: bool) -> None:
+        """Every imported election gets a new last_refreshed_at, hence a new cache version."""
+        election_ids = {"S1": uuid.uuid4(), "S2": uuid.uuid4()}
+
+        async def match(_session: object, ctx: Any, _matcher: object) -> uuid.UUID:
+            return election_ids[ctx.ballot_item_id]
+
+        session = _session()
+        with (
+            patch(f"{_SERVICE}._match_election", side_effect=match),
+            patch(f"{_SERVICE}._upsert_candidates", new_callable=AsyncMock, return_value=(1, 0)),
+            patch(f"{_SERVICE}.get_settings", return_value=MagicMock(results_stream_threshold_mb=64)),
+        ):
+            await process_results_import(session, MagicMock(id=uuid.uuid4()), _write_feed(tmp_path), stream=stream)
+
+        stamped: set[uuid.UUID] = set()
+        refreshed_at = None
+        for call in session.execute.await_args_list:
+            if not _compile(call.args[0]).startswith("UPDATE elections SET last_refreshed_at="):
+                continue
+            params = call.args[0].compile(dialect=postgresql.dialect()).params
+            stamped.update(params["id_1"])
+            refreshed_at = params["last_refreshed_at"]
+        assert stamped == set(election_ids.values())
+        assert refreshed_at is not None
+
+        updated_at = datetime(2024, 11, 1, tzinfo=UTC)
+        version_session = AsyncMock()
+        version_session.execute.return_value = MagicMock(first=MagicMock(return_value=(updated_at, None, "active")))
+        before = await get_results_version(version_session, election_ids["S1"])
+        version_session.execute.return_value.first.return_value = (updated_at, refreshed_at, "active")
+        assert await get_results_version(version_session, election_ids["S1"]) != before
+
+    @pytest.mark.parametrize(("threshold_mb", "streams"), [(0, True), (64, False)])
+    async def test_streams_by_file_size_by_default(self, tmp_path: Path, threshold_mb: int, streams: bool) -> None:
+        upsert_counties = AsyncMock(return_value=0)
+
+        await self._run(tmp_path, stream=None, upsert_counties=upsert_counties, threshold_mb=threshold_mb)
+
+        batch_sizes = [len(batch) for batch in self._county_batches(upsert_counties)]
+        assert batch_sizes == ([2, 1] if streams else [3])
+
+
+def _known(**overrides: Any) -> _KnownElection:
+    values: dict[str, Any] = {
+        "id": uuid.uuid4(),
+        "name": "General Election - State Senate - District 18",
+        "ballot_item_id": None,
+        "district_type": "state_senate",
+        "district_identifier": "18",
+        "district_party": None,
+        "eligible_county": None,
+    }
+    values.update(overrides)
+    return _KnownElection(**values)
+
+
+def _ctx(ballot_item_id: str = "SS18", event_name: str = "November 5, 2024 General Election") -> MagicMock:
+    return MagicMock(
+        ballot_item_id=ballot_item_id,
+        ballot_item_name="State Senate - District 18",
+        election_event_name=event_name,
+        election_date=date(2024, 11, 5),
+    )
+
+
+def _district(
+    district_type: str | None = "state_senate", identifier: str | None = "18", **overrides: Any
+) -> ParsedDistrict:
+    values: dict[str, Any] = {"party": None, "county": None, "raw": "State Senate - District 18"}
+    values.update(overrides)
+    return ParsedDistrict(district_type=district_type, district_identifier=identifier, **values)
+
+
+class TestElectionMatcher:
+    """Tests for in-memory tier 1/2 election matching."""
+
+    def test_tier1_matches_ballot_item_id(self) -> None:
+        election = _known(ballot_item_id="SS18")
+        matcher = _ElectionMatcher([election, _known()])
+
+        assert matcher.match(_ctx(), _district()) == election.id
+        assert matcher.resolved(_ctx()) == election.id
+        assert matcher.backfills == {}
+
+    def test_tier1_recount_prefers_recount_election(self) -> None:
+        original = _known(ballot_item_id="SS18")
+        recount = _known(ballot_item_id="SS18", name="General Election Recount - State Senate - District 18")
+        matcher = _ElectionMatcher([original, recount])
+
+        assert matcher.match(_ctx(event_name="November 5, 2024 General Election Recount"), _district()) == recount.id
+
+    def test_tier2_backfills_ballot_item_id(self) -> None:
+        election = _known()
+        matcher = _ElectionMatcher([election])
+
+        assert matcher.match(_ctx(), _district()) == election.id
+        assert matcher.backfills == {election.id: "SS18"}
+        # The backfilled ID now resolves through tier 1
+        assert matcher.match(_ctx(), _district(None, None)) == election.id
+
+    def test_tier2_narrows_by_county(self) -> None:
+        bibb = _known(district_type="county_commission", district_identifier="5", eligible_county="BIBB")
+        fulton = _known(district_type="county_commission", district_identifier="5", eligible_county="FULTON")
+        matcher = _ElectionMatcher([bibb, fulton])
+
+        assert matcher.match(_ctx(), _district("county_commission", "5", county="Fulton")) == fulton.id
+
+    def test_tier2_ambiguity_raises(self) -> None:
+        matcher = _ElectionMatcher([_known(), _known()])
+
+        with pytest.raises(MultipleResultsFound):
+            matcher.match(_ctx(), _district())
+
+    def test_no_match(self) -> None:
+        assert _ElectionMatcher([_known()]).match(_ctx(), _district("state_house", "18")) is None
+
+    async def test_prefetch_is_one_query_by_date(self) -> None:
+        election = _known(ballot_item_id="SS18")
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            all=MagicMock(return_value=[tuple(getattr(election, f) for f in _KnownElection.__slots__)])
+        )
+
+        matcher = await _ElectionMatcher.prefetch(session, date(2024, 11, 5))
+
+        session.execute.assert_awaited_once()
+        assert "elections.election_date =" in _compile(session.execute.call_args.args[0])
+        assert matcher.match(_ctx(), _district()) == election.id
+
+
+class TestBulkWrites:
+    """Tests for the bulk candidate/result writers and per-item fallback."""
+
+    def _plan(self) -> list[tuple[Any, uuid.UUID]]:
+        candidate = MagicMock(
+            full_name="Jane Doe",
+            party="Republican",
+            ballot_order=1,
+            is_incumbent=False,
+            sos_ballot_option_id="1",
+        )
+        ctx = MagicMock(ballot_item_id="S1", ballot_item_name="Contest 1", candidates=[candidate, candidate])
+        return [(ctx, uuid.uuid4())]
+
+    async def test_candidates_upserted_in_one_statement_with_flag_update(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(all=MagicMock(return_value=[MagicMock(is_insert=1)]))
+
+        inserted, updated = await _upsert_candidates(session, self._plan(), uuid.uuid4())
+
+        assert (inserted, updated) == (1, 0)
+        upsert, flags = (_compile(call.args[0]) for call in session.execute.await_args_list)
+        assert "ON CONFLICT ON CONSTRAINT uq_candidate_election_name DO UPDATE" in upsert
+        assert upsert.count("%(id_m") == 1  # duplicate (election, name) collapsed
+        assert "UPDATE candidates SET party=coalesce(candidates.party, flags.party)" in flags
+        assert "FROM candidacies, (VALUES" in flags
+
+    async def test_results_upserted_with_counties(self) -> None:
+        session = AsyncMock()
+        ctx, election_id = self._plan()[0]
+        county = MagicMock(county_name="Bibb County", county_name_normalized="Bibb")
+        ctx.ingestion = MagicMock(counties=[county, county])
+
+        written = await _upsert_results(session, [(ctx, election_id)])
+
+        assert written == 2
+        statewide, counties, refreshed = (_compile(call.args[0]) for call in session.execute.await_args_list)
+        assert "ON CONFLICT ON CONSTRAINT uq_election_results_election_id DO UPDATE" in statewide
+        assert "ON CONFLICT ON CONSTRAINT uq_election_county_results DO UPDATE" in counties
+        assert "UPDATE elections SET last_refreshed_at=" in refreshed
+
+    async def test_failed_bulk_write_falls_back_per_item(self) -> None:
+        good, bad = self._plan()[0], self._plan()[0]
+        bad[0].ballot_item_name = "Contest 2"
+        bad[0].ballot_item_id = "S2"
+
+        async def write(_session: object, plan: list[tuple[Any, uuid.UUID]], *_args: object) -> tuple[int, int, int]:
+            if any(ctx is bad[0] for ctx, _ in plan):
+                raise ValueError("bad row")
+            return 2, 1, 3
+
+        errors: list[dict] = []
+        with patch(f"{_SERVICE}._write_items", side_effect=write):
+            totals = await _write_plan(_session(), [good, bad], {}, uuid.uuid4(), errors)
+
+        assert totals == (1, 2, 1, 3)
+        assert errors == [{"ballot_item": "Contest 2", "ballot_item_id": "S2", "error": "bad row"}]
+
+
+class TestResultsArchive:
+    """Tests for bulk archive import."""
+
+    def test_groups_files_by_election_date(self, tmp_path: Path) -> None:
+        general = _write_feed(tmp_path, "general.json")
+        primary = _write_feed(tmp_path, "primary.json", election_date="2024-05-21")
+        recount = _write_feed(tmp_path, "recount.json")
+        broken = tmp_path / "broken.json"
+        broken.write_text("{")
+
+        groups, unreadable = group_results_archive([general, primary, recount, broken])
+
+        assert [(g.election_date, g.files) for g in groups] == [
+            ("2024-05-21", [primary]),
+            ("2024-11-05", [general, recount]),
+        ]
+        assert [path for path, _ in unreadable] == [broken]
+
+    async def _run_group(
+        self, tmp_path: Path, batch_size: int, executor: Executor | None = None
+    ) -> tuple[MagicMock, list[int]]:
+        files = [_write_feed(tmp_path, "a.json"), _write_feed(tmp_path, "b.json")]
+        bad = tmp_path / "c.json"
+        bad.write_text(json.dumps({"electionDate": "2024-11-05"}))
+        job = MagicMock(id=uuid.uuid4())
+
+        async def match(_session: object, _ctx: Any, _matcher: object) -> uuid.UUID:
+            return uuid.uuid4()
+
+        batches: list[int] = []
+
+        async def write_plan(_session: object, plan: list[Any], *_args: object) -> tuple[int, int, int, int]:
+            batches.append(len(plan))
+            return len(plan), 1, 0, 3
+
+        with (
+            patch(f"{_SERVICE}._match_election", side_effect=match),
+            patch(f"{_SERVICE}._write_plan", side_effect=write_plan),
+            patch(f"{_SERVICE}.get_settings", return_value=MagicMock(results_stream_threshold_mb=64)),
+        ):
+            group = ResultsArchiveGroup(election_date="2024-11-05", files=[*files, bad])
+            await import_results_group(_session(), job, group, batch_size=batch_size, executor=executor)
+        return job, batches
+
+    async def test_group_defers_writes_across_files(self, tmp_path: Path) -> None:
+        job, batches = await self._run_group(tmp_path, batch_size=1000)
+
+        assert batches == [4]
+        assert job.status == "completed"
+        assert job.total_records == 4
+        assert job.records_succeeded == 4
+        assert job.records_failed == 1
+        assert job.error_log[0]["file"] == "c.json"
+
+    async def test_group_flushes_at_batch_size(self, tmp_path: Path) -> None:
+        job, batches = await self._run_group(tmp_path, batch_size=2)
+
+        assert batches == [2, 2, 0]
+        assert job.records_inserted == 3
+
+    async def test_group_parses_files_in_process_pool(self, tmp_path: Path) -> None:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            job, batches = await self._run_group(tmp_path, batch_size=1000, executor=pool)
+
+        assert batches == [4]
+        assert job.records_failed == 1
+
+    def test_prepared_file_is_picklable(self, tmp_path: Path) -> None:
+        prepared = prepare_results_file(_write_feed(tmp_path), stream=False)
+
+        assert len(prepared.contexts) == 2
+        assert pickle.loads(pickle.dumps(prepared)) == prepared  # noqa: S301
+
+    async def test_archive_failed_group_does_not_stop_others(self) -> None:
+        session = _session()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        groups = [ResultsArchiveGroup(election_date=d, files=[Path(f"{d}.json")]) for d in ("2024-05-21", "2024-11-05")]
+
+        async def import_group(_session: object, job: MagicMock, group: ResultsArchiveGroup, **_kw: object) -> None:
+            if group.election_date == "2024-05-21":
+                raise ValueError("db gone")
+            job.status = "completed"
+
+        with (
+            patch(f"{_SERVICE}.get_session_factory", return_value=factory),
+            patch(
+                f"{_SERVICE}.create_results_import_job",
+                new_callable=AsyncMock,
+                side_effect=lambda *_a, **_k: MagicMock(),
+            ),
+            patch(f"{_SERVICE}.import_results_group", side_effect=import_group),
+        ):
+            await import_results_archive(groups, workers=4, batch_size=10)
+
+        assert groups[0].error == "db gone"
+        assert groups[1].error is None
+        assert groups[1].job.status == "completed"
+        assert factory.call_count == 2  # one session per worker, capped at the group count
+
+    async def test_bulk_context_targets_county_results(self) -> None:
+        session = AsyncMock()
+        helpers = "voter_api.services.import_service"
+        with (
+            patch(f"{helpers}._disable_autovacuum", new_callable=AsyncMock) as disable,
+            patch(f"{helpers}._drop_import_indexes", new_callable=AsyncMock) as drop,
+            patch(f"{helpers}._rebuild_import_indexes", new_callable=AsyncMock) as rebuild,
+            patch(f"{helpers}._enable_autovacuum_and_vacuum", new_callable=AsyncMock) as enable,
+        ):
+            async with bulk_results_import_context(session):
+                rebuild.assert_not_awaited()
+
+        disable.assert_awaited_once_with(session, "election_county_results")
+        enable.assert_awaited_once_with(session, "election_county_results")
+        dropped = {idx["name"] for idx in drop.call_args.args[1]}
+        assert dropped == {idx["name"] for idx in rebuild.call_args.args[1]}
+        assert "uq_election_county_results" not in dropped
@@ -1,7 +1,7 @@
 """Unit tests for voter history service query functions.
 
 Tests the query and aggregation functions using mocked sessions, covering
-get_voter_history, list_election_participants, get_participation_stats,
+get_voter_history, list_election_participants, compute_participation_stats,
 get_participation_summary, and _get_election_or_raise.
 """
 
@@ -16,7 +16,7 @@ from sqlalchemy.dialects import postgresql
 from voter_api.models.election import Election
 from voter_api.models.voter import Voter
 from voter_api.models.voter_history import VoterHistory
-from voter_api.schemas.voter_history import ParticipationFilters
+from voter_api.schemas.voter_history import ParticipationFilters, ParticipationStatsResponse
 from voter_api.services.voter_history_service import (
     MismatchFilterError,
     VoterLookupResult,
@@ -25,11 +25,13 @@ from voter_api.services.voter_history_service import (
     _get_election_or_raise,
     _latest_analysis_subquery,
     _replace_previous_import,
+    compute_participation_stats,
     get_participation_stats,
     get_participation_summary,
     get_voter_history,
     list_election_participants,
     lookup_voter_details,
+    mark_participation_stats_stale,
     resolve_election_ids,
 )
 
@@ -130,7 +132,7 @@ def _mock_join_session(election: MagicMock) -> AsyncMock:
 
 
 def _mock_stats_session(election: MagicMock) -> AsyncMock:
-    """Create a mock session pre-configured for get_participation_stats (7 execute calls)."""
+    """Create a mock session pre-configured for compute_participation_stats (7 execute calls)."""
     session = AsyncMock()
     election_result = MagicMock()
     election_result.scalar_one_or_none.return_value = election
@@ -536,12 +538,12 @@ class TestBuildMismatchFilter:
 
 
 # ---------------------------------------------------------------------------
-# get_participation_stats
+# compute_participation_stats
 # ---------------------------------------------------------------------------
 
 
-class TestGetParticipationStats:
-    """Tests for get_participation_stats aggregate function."""
+class TestComputeParticipationStats:
+    """Tests for compute_participation_stats aggregate function."""
 
     async def test_returns_stats(self) -> None:
         """Returns stats with breakdowns; no district info means eligible voters is None."""
@@ -581,7 +583,7 @@ class TestGetParticipationStats:
             precinct_result,
         ]
 
-        stats = await get_participation_stats(session, eid)
+        stats = await compute_participation_stats(session, eid)
 
         assert stats.election_id == eid
         assert stats.total_participants == 100
@@ -604,7 +606,7 @@ class TestGetParticipationStats:
         session.execute.return_value = not_found_result
 
         with pytest.raises(ValueError, match="Election not found"):
-            await get_participation_stats(session, uuid.uuid4())
+            await compute_participation_stats(session, uuid.uuid4())
 
     async def test_empty_stats(self) -> None:
         """Election with no participants returns zero counts and None eligible voters."""
@@ -636,7 +638,7 @@ class TestGetParticipationStats:
             precinct_result,
         ]
 
-        stats = await get_participation_stats(session, election.id)
+        stats = await compute_participation_stats(session, election.id)
 
         assert stats.total_participants == 0
         assert stats.total_eligible_voters is None
@@ -654,7 +656,7 @@ class TestGetParticipationStats:
         with patch(
             "voter_api.services.voter_stats_service.get_voter_stats_for_boundary",
         ) as mock_voter_stats:
-            stats = await get_participation_stats(session, eid)
+            stats = await compute_participation_stats(session, eid)
 
         mock_voter_stats.assert_not_called()
         assert stats.total_eligible_voters is None
@@ -712,7 +714,7 @@ class TestGetParticipationStats:
             new_callable=AsyncMock,
             return_value=mock_stats,
         ) as mock_fn:
-            stats = await get_participation_stats(session, eid)
+            stats = await compute_participation_stats(session, eid)
 
         mock_fn.assert_awaited_once_with(
             session,
@@ -737,12 +739,102 @@ class TestGetParticipationStats:
             new_callable=AsyncMock,
             return_value=None,
         ):
-            stats = await get_participation_stats(session, eid)
+            stats = await compute_participation_stats(session, eid)
 
         assert stats.total_eligible_voters is None
         assert stats.turnout_percentage is None
 
 
+# ---------------------------------------------------------------------------
+# Participation stats rollup
+# ---------------------------------------------------------------------------
+
+
+class TestParticipationStatsRollup:
+    """Tests for the rollup-backed get_participation_stats and staleness helpers."""
+
+    @staticmethod
+    def _session_with_rollup(rollup: MagicMock | None) -> AsyncMock:
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = rollup
+        session.execute.return_value = result
+        return session
+
+    async def test_fresh_rollup_served_without_recompute(self) -> None:
+        """A fresh rollup is returned as stored; no aggregate queries run."""
+        eid = uuid.uuid4()
+        rollup = MagicMock(is_stale=False, payload={"election_id": str(eid), "total_participants": 42})
+        session = self._session_with_rollup(rollup)
+
+        with patch(
+            "voter_api.services.voter_history_service.compute_participation_stats",
+            new_callable=AsyncMock,
+        ) as mock_compute:
+            stats = await get_participation_stats(session, eid)
+
+        assert stats.total_participants == 42
+        mock_compute.assert_not_awaited()
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.parametrize("rollup", [None, MagicMock(is_stale=True)])
+    async def test_missing_or_stale_rollup_is_recomputed(self, rollup: MagicMock | None) -> None:
+        """A missing or stale rollup is recomputed and stored."""
+        eid = uuid.uuid4()
+        session = self._session_with_rollup(rollup)
+        computed = ParticipationStatsResponse(election_id=eid, total_participants=7)
+
+        with patch(
+            "voter_api.services.voter_history_service.compute_participation_stats",
+            new_callable=AsyncMock,
+            return_value=computed,
+        ):
+            stats = await get_participation_stats(session, eid)
+
+        assert stats.total_participants == 7
+        assert stats.computed_at is not None
+        upsert = _compile_query(session.execute.call_args_list[-1][0][0])
+        assert "INSERT INTO election_participation_stats" in upsert
+        assert "ON CONFLICT (election_id) DO UPDATE" in upsert
+        session.commit.assert_awaited_once()
+
+    async def test_force_refresh_skips_rollup_lookup(self) -> None:
+        """force_refresh recomputes without reading the stored rollup."""
+        eid = uuid.uuid4()
+        session = AsyncMock()
+
+        with patch(
+            "voter_api.services.voter_history_service.compute_participation_stats",
+            new_callable=AsyncMock,
+            return_value=ParticipationStatsResponse(election_id=eid, total_participants=1),
+        ) as mock_compute:
+            await get_participation_stats(session, eid, force_refresh=True)
+
+        mock_compute.assert_awaited_once_with(session, eid)
+        session.execute.assert_awaited_once()  # only the upsert
+
+    async def test_mark_stale_by_dates_and_years(self) -> None:
+        """Date and year selectors are OR-ed against the elections table."""
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(rowcount=2)
+
+        marked = await mark_participation_stats_stale(session, election_dates=[date(2024, 11, 5)], years=[2022])
+
+        assert marked == 2
+        compiled = _compile_query(session.execute.call_args[0][0])
+        assert compiled.startswith("UPDATE election_participation_stats SET is_stale")
+        assert "elections.election_date IN" in compiled
+        assert "EXTRACT(year FROM elections.election_date) IN" in compiled
+        assert "election_participation_stats.is_stale IS false" in compiled
+
+    async def test_mark_stale_with_empty_selectors_is_noop(self) -> None:
+        """Explicitly empty selectors mark nothing rather than everything."""
+        session = AsyncMock()
+
+        assert await mark_participation_stats_stale(session, election_dates=set(), years=set()) == 0
+        session.execute.assert_not_awaited()
+
+
 # ---------------------------------------------------------------------------
 # get_participation_summary
 # ---------------------------------------------------------------------------
@@ -1304,3 +1396,44 @@ class TestReplacePreviousImport:
         # Only the initial SELECT was executed, no DELETE or flush
         assert session.execute.await_count == 1
         session.flush.assert_not_awaited()
+
+    @staticmethod
+    def _session_with_stale_rows(stale_by_year: list[tuple[int, int]], year_total: int) -> AsyncMock:
+        """Session returning one previous job, stale rows per year, the partition list, and a year total."""
+        prev_job = MagicMock()
+        prev_job.id = uuid.uuid4()
+        prev_result = MagicMock()
+        prev_result.scalars.return_value.all.return_value = [prev_job]
+        stale_result = MagicMock()
+        stale_result.all.return_value = stale_by_year
+        partitions_result = MagicMock()
+        partitions_result.scalars.return_value.all.return_value = ["voter_history_default", "voter_history_y2022"]
+        total_result = MagicMock()
+        total_result.scalar_one.return_value = year_total
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[prev_result, stale_result, partitions_result, total_result, None])
+        return session
+
+    async def test_truncates_fully_superseded_partition(self) -> None:
+        """A yearly partition holding only stale rows is truncated rather than deleted row by row."""
+        current_job = MagicMock(id=uuid.uuid4(), file_name="voter_history.csv")
+        session = self._session_with_stale_rows([(2022, 10)], year_total=10)
+
+        await _replace_previous_import(session, current_job)
+
+        last_stmt = session.execute.call_args_list[-1][0][0]
+        assert str(last_stmt) == "TRUNCATE voter_history_y2022"
+        session.flush.assert_awaited_once()
+
+    async def test_deletes_partially_superseded_partition_by_date_range(self) -> None:
+        """Partially stale partitions use a DELETE scoped to the year so it prunes to one partition."""
+        current_job = MagicMock(id=uuid.uuid4(), file_name="voter_history.csv")
+        session = self._session_with_stale_rows([(2022, 4)], year_total=10)
+
+        await _replace_previous_import(session, current_job)
+
+        compiled = _compile_query(session.execute.call_args_list[-1][0][0])
+        assert compiled.startswith("DELETE FROM voter_history")
+        assert "voter_history.election_date >=" in compiled
+        assert "voter_history.election_date <" in compiled
+        assert "voter_history.import_job_id IN" in compiled
@@ -6,7 +6,18 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from sqlalchemy.dialects import postgresql
 
-from voter_api.services.voter_service import get_voter_detail, get_voter_filter_options, search_voters
+from voter_api.lib.pagination import SEARCH_COUNT_CAP
+from voter_api.services.voter_service import (
+    VoterSearchFilters,
+    decode_voter_cursor,
+    encode_voter_cursor,
+    get_voter_detail,
+    get_voter_filter_options,
+    lookup_voters_by_name,
+    refresh_voter_filter_facets,
+    search_voters,
+    search_voters_keyset,
+)
 
 
 def _compile_query(stmt: object) -> str:
@@ -331,6 +342,134 @@ class TestSearchVoters:
         assert r"\_" in compiled  # escaped underscore
 
 
+def _rows_result(voters: list) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = voters
+    return result
+
+
+def _scalar_result(value: object) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one.return_value = value
+    return result
+
+
+class TestVoterCursor:
+    """Tests for cursor token encoding."""
+
+    def test_round_trip(self) -> None:
+        voter = _mock_voter(last_name="O'NEIL", first_name="ÉMILE")
+        token = encode_voter_cursor(voter)
+
+        assert "=" not in token
+        assert decode_voter_cursor(token) == ("O'NEIL", "ÉMILE", voter.id)
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "WzEsMiwzXQ", "eyJhIjoxfQ"])
+    def test_rejects_malformed_tokens(self, token: str) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_voter_cursor(token)
+
+
+class TestSearchVotersKeyset:
+    """Tests for search_voters_keyset with mocked session."""
+
+    async def test_cursor_uses_row_comparison_not_offset(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [_rows_result([_mock_voter()] * 3), _scalar_result(50)]
+        cursor = encode_voter_cursor(_mock_voter(last_name="JONES", first_name="AMY"))
+
+        page = await search_voters_keyset(
+            session, VoterSearchFilters(county="FULTON"), cursor=cursor, page_size=2, count_mode="exact"
+        )
+
+        compiled = _compile_query(session.execute.call_args_list[0][0][0])
+        assert "(voters.last_name, voters.first_name, voters.id) > ('JONES', 'AMY'" in compiled
+        assert "OFFSET" not in compiled
+        assert "ORDER BY voters.last_name, voters.first_name, voters.id" in compiled
+        assert "LIMIT 3" in compiled
+        assert len(page.voters) == 2
+        assert page.next_cursor == encode_voter_cursor(page.voters[-1])
+        assert page.total == 50
+        assert page.total_is_exact
+
+    async def test_short_first_page_skips_count(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [_rows_result([_mock_voter(), _mock_voter()])]
+
+        page = await search_voters_keyset(session, VoterSearchFilters(status="ACTIVE"), page_size=20)
+
+        assert session.execute.call_count == 1
+        assert page.total == 2
+        assert page.total_is_exact
+        assert page.next_cursor is None
+
+    async def test_capped_count(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [_rows_result([_mock_voter()] * 3), _scalar_result(SEARCH_COUNT_CAP + 1)]
+
+        page = await search_voters_keyset(session, VoterSearchFilters(), page_size=2, count_mode="capped")
+
+        compiled = _compile_query(session.execute.call_args_list[1][0][0])
+        assert f"LIMIT {SEARCH_COUNT_CAP + 1}" in compiled
+        assert page.total == SEARCH_COUNT_CAP
+        assert not page.total_is_exact
+
+    async def test_estimate_uses_explain_and_floors_at_rows_seen(self) -> None:
+        session = AsyncMock()
+        plan = '[{"Plan": {"Plan Rows": 1}}]'
+        session.execute.side_effect = [_rows_result([_mock_voter()] * 3), _scalar_result(plan)]
+
+        page = await search_voters_keyset(session, VoterSearchFilters(county="FULTON"), page=4, page_size=2)
+
+        explain = session.execute.call_args_list[1][0][0]
+        assert str(explain.compile(dialect=postgresql.dialect())).startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "OFFSET 6" in _compile_query(session.execute.call_args_list[0][0][0])
+        # Offset 6 + 2 returned + at least one more row.
+        assert page.total == 9
+        assert not page.total_is_exact
+
+    async def test_invalid_cursor_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await search_voters_keyset(AsyncMock(), VoterSearchFilters(), cursor="bogus")
+
+
+class TestLookupVotersByName:
+    """Tests for the ranked type-ahead name lookup."""
+
+    async def test_prefix_matches_each_token_and_orders_by_similarity(self) -> None:
+        session = AsyncMock()
+        voter = _mock_voter()
+        result = MagicMock()
+        result.all.return_value = [(voter, 0.8)]
+        session.execute.return_value = result
+
+        matches = await lookup_voters_by_name(session, "Smith, J", county="FULTON", limit=5)
+
+        assert matches == [(voter, 0.8)]
+        compiled = _compile_query(session.execute.call_args[0][0])
+        assert "voters.search_name LIKE '%% smith%%'" in compiled
+        assert "voters.search_name LIKE '%% j%%'" in compiled
+        assert "voters.county = 'FULTON'" in compiled
+        assert "ORDER BY voters.search_name <->> 'smith j'" in compiled
+        assert "LIMIT 5" in compiled
+
+    @pytest.mark.parametrize("q", ["J", "j. q.", "--"])
+    async def test_rejects_queries_without_a_long_token(self, q: str) -> None:
+        session = AsyncMock()
+
+        with pytest.raises(ValueError, match="at least one name of 2"):
+            await lookup_voters_by_name(session, q)
+        session.execute.assert_not_called()
+
+    async def test_min_token_length_is_configurable(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value.all = MagicMock(return_value=[])
+
+        with pytest.raises(ValueError, match="3 or more"):
+            await lookup_voters_by_name(session, "jo sm", min_token_length=3)
+        assert await lookup_voters_by_name(session, "jo sm", min_token_length=2) == []
+
+
 class TestGetVoterDetail:
     """Tests for get_voter_detail."""
 
@@ -357,23 +496,41 @@ class TestGetVoterDetail:
 
 
 class TestGetVoterFilterOptions:
-    """Tests for get_voter_filter_options."""
+    """Tests for get_voter_filter_options (served from the facet rollup)."""
 
-    def _make_execute_result(self, rows: list[str]) -> MagicMock:
+    def _make_execute_result(self, rows: list[tuple]) -> MagicMock:
         result = MagicMock()
-        result.all.return_value = [(v,) for v in rows]
+        result.all.return_value = rows
         return result
 
+    def _global_rows(self) -> list[tuple]:
+        # (status, county, congressional, senate, house, voter_count) per grouping set
+        return [
+            ("Active", None, None, None, None, 90),
+            ("Inactive", None, None, None, None, 10),
+            (None, "Cobb", None, None, None, 40),
+            (None, "Fulton", None, None, None, 60),
+            (None, None, "05", None, None, 70),
+            (None, None, "06", None, None, 30),
+            (None, None, None, "34", None, 100),
+            (None, None, None, None, "55", 100),
+            # NULL district values group to an all-NULL row and are skipped
+            (None, None, None, None, None, 5),
+        ]
+
+    def _county_rows(self) -> list[tuple]:
+        # (county_precinct, county_commission_district, school_board_district, voter_count)
+        return [
+            ("P1", "1", "3", 10),
+            ("P2", "1", "4", 20),
+            ("P3", "2", "4", 30),
+            ("P3", None, "4", 1),
+        ]
+
     @pytest.mark.asyncio
     async def test_returns_all_filter_keys(self) -> None:
         session = AsyncMock()
-        session.execute.side_effect = [
-            self._make_execute_result(["Active", "Inactive"]),
-            self._make_execute_result(["Cobb", "Fulton"]),
-            self._make_execute_result(["05", "06"]),
-            self._make_execute_result(["34", "35"]),
-            self._make_execute_result(["55", "56"]),
-        ]
+        session.execute.side_effect = [self._make_execute_result(self._global_rows())]
 
         options = await get_voter_filter_options(session)
 
@@ -388,13 +545,7 @@ class TestGetVoterFilterOptions:
     @pytest.mark.asyncio
     async def test_returns_correct_values(self) -> None:
         session = AsyncMock()
-        session.execute.side_effect = [
-            self._make_execute_result(["Active", "Inactive"]),
-            self._make_execute_result(["Cobb", "Fulton"]),
-            self._make_execute_result(["05", "06"]),
-            self._make_execute_result(["34"]),
-            self._make_execute_result(["55"]),
-        ]
+        session.execute.side_effect = [self._make_execute_result(self._global_rows())]
 
         options = await get_voter_filter_options(session)
 
@@ -407,13 +558,7 @@ class TestGetVoterFilterOptions:
     @pytest.mark.asyncio
     async def test_returns_empty_lists_when_no_data(self) -> None:
         session = AsyncMock()
-        session.execute.side_effect = [
-            self._make_execute_result([]),
-            self._make_execute_result([]),
-            self._make_execute_result([]),
-            self._make_execute_result([]),
-            self._make_execute_result([]),
-        ]
+        session.execute.side_effect = [self._make_execute_result([])]
 
         options = await get_voter_filter_options(session)
 
@@ -424,16 +569,79 @@ class TestGetVoterFilterOptions:
         assert options["state_house_districts"] == []
 
     @pytest.mark.asyncio
-    async def test_executes_five_queries(self) -> None:
+    async def test_single_grouping_sets_query_over_facets(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [self._make_execute_result([])]
+
+        await get_voter_filter_options(session)
+
+        assert session.execute.call_count == 1
+        compiled = _compile_query(session.execute.call_args[0][0])
+        assert "FROM voter_filter_facets GROUP BY GROUPING SETS" in compiled
+        assert "FROM voters" not in compiled
+
+    @pytest.mark.asyncio
+    async def test_county_scoped_options_cascade(self) -> None:
         session = AsyncMock()
         session.execute.side_effect = [
-            self._make_execute_result([]),
-            self._make_execute_result([]),
-            self._make_execute_result([]),
-            self._make_execute_result([]),
-            self._make_execute_result([]),
+            self._make_execute_result(self._global_rows()),
+            self._make_execute_result(self._county_rows()),
         ]
 
-        await get_voter_filter_options(session)
+        options = await get_voter_filter_options(session, county="Fulton", county_commission_district="1")
+
+        assert "voter_filter_facets.county = 'Fulton'" in _compile_query(session.execute.call_args_list[1][0][0])
+        # Commission district narrows precincts and school boards, but not its own list
+        assert options["county_precincts"] == ["P1", "P2"]
+        assert options["school_board_districts"] == ["3", "4"]
+        assert options["county_commission_districts"] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_with_counts(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [
+            self._make_execute_result(self._global_rows()),
+            self._make_execute_result(self._county_rows()),
+        ]
+
+        options = await get_voter_filter_options(session, county="Fulton", with_counts=True)
+
+        assert options["counts"]["statuses"] == {"Active": 90, "Inactive": 10}
+        assert options["counts"]["county_precincts"] == {"P1": 10, "P2": 20, "P3": 31}
+        assert options["counts"]["school_board_districts"] == {"3": 10, "4": 51}
+
+
+class TestRefreshVoterFilterFacets:
+    """Tests for refresh_voter_filter_facets."""
+
+    @pytest.mark.asyncio
+    async def test_replaces_only_imported_counties(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [MagicMock(), MagicMock(rowcount=12)]
+
+        written = await refresh_voter_filter_facets(session, counties={"FULTON", "COBB"})
+
+        assert written == 12
+        delete_sql = _compile_query(session.execute.call_args_list[0][0][0])
+        insert_sql = _compile_query(session.execute.call_args_list[1][0][0])
+        assert "DELETE FROM voter_filter_facets WHERE voter_filter_facets.county IN ('COBB', 'FULTON')" in delete_sql
+        assert insert_sql.startswith("INSERT INTO voter_filter_facets (status, county,")
+        assert "WHERE voters.county IN ('COBB', 'FULTON') GROUP BY voters.status" in insert_sql
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_full_rebuild_without_counties(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [MagicMock(), MagicMock(rowcount=3)]
+
+        await refresh_voter_filter_facets(session)
+
+        assert "WHERE" not in _compile_query(session.execute.call_args_list[0][0][0])
+        assert "WHERE" not in _compile_query(session.execute.call_args_list[1][0][0])
+
+    @pytest.mark.asyncio
+    async def test_empty_county_set_is_a_no_op(self) -> None:
+        session = AsyncMock()
 
-        assert session.execute.call_count == 5
+        assert await refresh_voter_filter_facets(session, counties=set()) == 0
+        session.execute.assert_not_called()
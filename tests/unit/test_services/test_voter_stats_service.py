@@ -128,6 +128,19 @@ class TestGetVoterStatsForBoundary:
         assert result.total == 3000
         session.execute.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_numeric_identifier_matches_canonical_key_column(self) -> None:
+        """Numeric identifiers compare a single canonical key instead of padded variants."""
+        session = _make_session([("A", 3000)])
+
+        await get_voter_stats_for_boundary(session, "state_senate", "005")
+
+        query = session.execute.call_args.args[0]
+        compiled = query.compile(compile_kwargs={"literal_binds": True})
+        sql = str(compiled)
+        assert "voters.state_senate_district_key = '5'" in sql
+        assert " IN " not in sql
+
     @pytest.mark.asyncio
     async def test_alphanumeric_identifier_uses_exact_match(self) -> None:
         """Non-numeric identifiers (e.g. precinct codes like '001A') use exact string comparison."""